@@ -0,0 +1,15 @@
+"""
+Benchmarks for the core admin paths, run standalone like the tests.
+
+Usage:
+    python runbenchmarks.py                          # 1M products, every scenario
+    python runbenchmarks.py --rows 20000 --repeat 5  # quick local run
+    python runbenchmarks.py --output results.json --baseline baseline.json
+
+The dataset is generated once per ``(rows, seed)`` into the benchmark
+database and reused by later runs. Scenarios run through the real list,
+export, autocomplete, dashboard, audit and MCP code paths. Each scenario
+records latency percentiles, query counts and peak Python memory, and the
+results are written as JSON. When a baseline is given, the run exits
+non-zero on regressions beyond the thresholds.
+"""
@@ -0,0 +1,86 @@
+"""Synthetic models for the benchmark dataset (see ``benchmarks.dataset``).
+
+``Category`` is a treebeard materialized-path tree when treebeard is
+installed and a plain adjacency list otherwise; ``Brand`` only exists with
+parler. The models have no migrations — ``runbenchmarks.py`` creates the
+tables with ``migrate --run-syncdb``.
+"""
+
+from django.conf import settings
+from django.db import models
+
+if settings.TREEBEARD_ENABLED:
+    from treebeard.mp_tree import MP_Node as CategoryBase
+else:
+    CategoryBase = models.Model
+
+
+class BenchDataset(models.Model):
+    """The ``(rows, seed)`` fingerprint of the generated dataset."""
+
+    rows = models.IntegerField()
+    seed = models.IntegerField()
+    version = models.IntegerField()
+    generated_at = models.DateTimeField(auto_now_add=True)
+
+
+class Supplier(models.Model):
+    name = models.CharField(max_length=100)
+    country = models.CharField(max_length=2, db_index=True)
+    email = models.EmailField()
+
+    def __str__(self):
+        return self.name
+
+
+class Category(CategoryBase):
+    name = models.CharField(max_length=100)
+    if not settings.TREEBEARD_ENABLED:
+        parent = models.ForeignKey(
+            "self", null=True, blank=True, on_delete=models.CASCADE
+        )
+
+    def __str__(self):
+        return self.name
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=50, unique=True)
+
+    def __str__(self):
+        return self.name
+
+
+class Product(models.Model):
+    class Status(models.TextChoices):
+        DRAFT = "draft", "Draft"
+        ACTIVE = "active", "Active"
+        DISCONTINUED = "discontinued", "Discontinued"
+        ARCHIVED = "archived", "Archived"
+
+    sku = models.CharField(max_length=20, unique=True)
+    name = models.CharField(max_length=200)
+    supplier = models.ForeignKey(Supplier, on_delete=models.CASCADE)
+    category = models.ForeignKey(Category, on_delete=models.CASCADE)
+    tags = models.ManyToManyField(Tag, blank=True, related_name="products")
+    status = models.CharField(max_length=20, choices=Status.choices, db_index=True)
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    stock = models.IntegerField()
+    created_at = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return f"{self.sku} {self.name}"
+
+
+if settings.PARLER_ENABLED:
+    from parler.models import TranslatableModel, TranslatedFields
+
+    class Brand(TranslatableModel):
+        code = models.CharField(max_length=20, unique=True)
+        translations = TranslatedFields(
+            name=models.CharField(max_length=100),
+            description=models.TextField(blank=True),
+        )
+
+        def __str__(self):
+            return self.safe_translation_getter("name", default=self.code)
@@ -0,0 +1,67 @@
+from django.conf import settings
+from django.contrib import admin
+from django.db.models import Count
+
+from django_smartbase_admin.admin.admin_base import SBAdmin
+from django_smartbase_admin.admin.site import sb_admin_site
+from django_smartbase_admin.engine.field import SBAdminField
+
+from benchmarks.bench_app.models import Category, Product, Supplier, Tag
+
+
+@admin.register(Supplier, site=sb_admin_site)
+class SupplierAdmin(SBAdmin):
+    model = Supplier
+    sbadmin_list_display = ("id", "name", "country", "email")
+    search_fields = ["name", "email"]
+
+
+@admin.register(Category, site=sb_admin_site)
+class CategoryAdmin(SBAdmin):
+    model = Category
+    sbadmin_list_display = ("id", "name")
+    search_fields = ["name"]
+
+
+@admin.register(Tag, site=sb_admin_site)
+class TagAdmin(SBAdmin):
+    model = Tag
+    sbadmin_list_display = ("id", "name")
+    search_fields = ["name"]
+
+
+@admin.register(Product, site=sb_admin_site)
+class ProductAdmin(SBAdmin):
+    model = Product
+    sbadmin_list_display = (
+        "id",
+        "sku",
+        "name",
+        "supplier",
+        "category",
+        "status",
+        "price",
+        "stock",
+        "created_at",
+        SBAdminField(
+            name="tag_count",
+            title="Tags",
+            annotate=Count("tags", distinct=True),
+            filter_disabled=True,
+        ),
+    )
+    sbadmin_list_filter = ("supplier", "category", "status", "created_at")
+    search_fields = ["sku", "name"]
+    ordering = ["-created_at"]
+
+
+if settings.PARLER_ENABLED:
+    from django_smartbase_admin.admin.admin_base import SBTranslatableAdmin
+
+    from benchmarks.bench_app.models import Brand
+
+    @admin.register(Brand, site=sb_admin_site)
+    class BrandAdmin(SBTranslatableAdmin):
+        model = Brand
+        sbadmin_list_display = ("id", "code", "name")
+        search_fields = ["code", "translations__name"]
@@ -0,0 +1,309 @@
+"""
+Deterministic synthetic dataset for the benchmarks.
+
+``generate(rows, seed)`` fills the benchmark models with ``rows`` products
+and proportional suppliers, a three-level category tree, tags, product-tag
+links, audit history (indexed when ``SB_ADMIN_AUDIT_OBJECT_INDEX`` is on)
+and — with parler installed — translated brands. Every value comes from
+``random.Random(seed)`` and primary keys are assigned explicitly, so the
+same ``(rows, seed)`` produces the same database on SQLite and Postgres.
+Rows are written in chunks so memory stays flat at 1M products.
+"""
+
+from __future__ import annotations
+
+import datetime
+import random
+from decimal import Decimal
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.db import transaction
+
+from benchmarks.bench_app.models import (
+    BenchDataset,
+    Category,
+    Product,
+    Supplier,
+    Tag,
+)
+from django_smartbase_admin.audit.models import AdminAuditLog
+
+DATASET_VERSION = 1
+CHUNK_SIZE = 10_000
+BENCH_USERNAME = "bench-admin"
+
+CATEGORY_ROOTS = 20
+CATEGORY_CHILDREN = 10
+CATEGORY_LEAVES = 5
+TAGS = 200
+MAX_TAGS_PER_PRODUCT = 3
+AUDITED_PRODUCT_EVERY = 10
+
+COUNTRIES = ("SK", "CZ", "DE", "AT", "PL", "HU", "US", "GB")
+ADJECTIVES = (
+    "Compact",
+    "Deluxe",
+    "Eco",
+    "Heavy",
+    "Light",
+    "Modular",
+    "Portable",
+    "Premium",
+    "Rugged",
+    "Smart",
+    "Solid",
+    "Ultra",
+)
+NOUNS = (
+    "Adapter",
+    "Bracket",
+    "Cable",
+    "Drill",
+    "Fan",
+    "Hammer",
+    "Lamp",
+    "Panel",
+    "Pump",
+    "Router",
+    "Sensor",
+    "Switch",
+    "Valve",
+    "Wrench",
+)
+STATUS_WEIGHTS = (
+    (Product.Status.ACTIVE, 70),
+    (Product.Status.DRAFT, 15),
+    (Product.Status.DISCONTINUED, 14),
+    (Product.Status.ARCHIVED, 1),
+)
+CREATED_FROM = datetime.datetime(2023, 1, 1, tzinfo=datetime.timezone.utc)
+CREATED_SPAN_SECONDS = 2 * 365 * 24 * 3600
+
+# treebeard's default materialized-path alphabet and step length.
+MP_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+MP_STEPLEN = 4
+
+
+def get_supplier_count(rows: int) -> int:
+    return max(10, rows // 100)
+
+
+def mp_step(position: int) -> str:
+    """Path segment of the ``position``-th (1-based) child."""
+    digits = ""
+    while position:
+        position, remainder = divmod(position, len(MP_ALPHABET))
+        digits = MP_ALPHABET[remainder] + digits
+    return digits.rjust(MP_STEPLEN, "0")
+
+
+def is_current(rows: int, seed: int) -> bool:
+    return BenchDataset.objects.filter(
+        rows=rows, seed=seed, version=DATASET_VERSION
+    ).exists()
+
+
+def clear():
+    # Content types and permissions are recreated by the post_migrate signal
+    # flush emits.
+    call_command("flush", interactive=False, verbosity=0)
+
+
+def generate(rows: int, seed: int, stdout=None):
+    """Regenerate the dataset unless ``(rows, seed)`` is already loaded."""
+    if is_current(rows, seed):
+        return False
+    rng = random.Random(seed)
+    clear()
+    user = ensure_user()
+    steps = (
+        ("suppliers", lambda: generate_suppliers(rng, get_supplier_count(rows))),
+        ("categories", lambda: generate_categories(rng)),
+        ("tags", lambda: generate_tags(rng)),
+        ("products", lambda: generate_products(rng, rows, stdout)),
+        ("audit history", lambda: generate_audit_history(rng, rows, user)),
+    )
+    if getattr(settings, "SB_ADMIN_AUDIT_OBJECT_INDEX", False):
+        steps += (("audit object index", index_audit_history),)
+    if settings.PARLER_ENABLED:
+        steps += (("brands", lambda: generate_brands(rng)),)
+    for label, step in steps:
+        if stdout:
+            stdout.write(f"Generating {label}...\n")
+        step()
+    BenchDataset.objects.create(rows=rows, seed=seed, version=DATASET_VERSION)
+    return True
+
+
+def ensure_user():
+    user_model = get_user_model()
+    user = user_model.objects.filter(username=BENCH_USERNAME).first()
+    if user is None:
+        user = user_model.objects.create_superuser(
+            username=BENCH_USERNAME, email="bench@example.com", password=None
+        )
+    return user
+
+
+def generate_suppliers(rng, count):
+    suppliers = [
+        Supplier(
+            pk=index,
+            name=f"Supplier {index:06d} {rng.choice(NOUNS)}",
+            country=rng.choice(COUNTRIES),
+            email=f"supplier{index}@example.com",
+        )
+        for index in range(1, count + 1)
+    ]
+    Supplier.objects.bulk_create(suppliers, batch_size=CHUNK_SIZE)
+
+
+def get_leaf_category_ids() -> list[int]:
+    first_leaf = CATEGORY_ROOTS + CATEGORY_ROOTS * CATEGORY_CHILDREN + 1
+    return list(
+        range(
+            first_leaf,
+            first_leaf + CATEGORY_ROOTS * CATEGORY_CHILDREN * CATEGORY_LEAVES,
+        )
+    )
+
+
+def generate_categories(rng):
+    """Roots, then children, then leaves — pks in breadth-first order."""
+    categories = []
+    next_pk = 1
+    levels = [[(None, "")]]
+    for depth, fan_out in enumerate(
+        (CATEGORY_ROOTS, CATEGORY_CHILDREN, CATEGORY_LEAVES), start=1
+    ):
+        level = []
+        for parent_pk, parent_path in levels[-1]:
+            for position in range(1, fan_out + 1):
+                path = parent_path + mp_step(position)
+                category = Category(
+                    pk=next_pk, name=f"{rng.choice(ADJECTIVES)} {next_pk}"
+                )
+                if settings.TREEBEARD_ENABLED:
+                    category.path = path
+                    category.depth = depth
+                    category.numchild = {
+                        1: CATEGORY_CHILDREN,
+                        2: CATEGORY_LEAVES,
+                    }.get(depth, 0)
+                else:
+                    category.parent_id = parent_pk
+                categories.append(category)
+                level.append((next_pk, path))
+                next_pk += 1
+        levels.append(level)
+    Category.objects.bulk_create(categories, batch_size=CHUNK_SIZE)
+
+
+def generate_tags(rng):
+    Tag.objects.bulk_create(
+        [Tag(pk=index, name=f"tag-{index:03d}") for index in range(1, TAGS + 1)]
+    )
+
+
+def generate_products(rng, rows, stdout=None):
+    supplier_count = get_supplier_count(rows)
+    leaf_ids = get_leaf_category_ids()
+    statuses = [status for status, _weight in STATUS_WEIGHTS]
+    weights = [weight for _status, weight in STATUS_WEIGHTS]
+    through = Product.tags.through
+    for chunk_start in range(1, rows + 1, CHUNK_SIZE):
+        chunk_end = min(chunk_start + CHUNK_SIZE, rows + 1)
+        products = []
+        links = []
+        for pk in range(chunk_start, chunk_end):
+            products.append(
+                Product(
+                    pk=pk,
+                    sku=f"SKU-{pk:08d}",
+                    name=f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {pk}",
+                    supplier_id=rng.randint(1, supplier_count),
+                    category_id=rng.choice(leaf_ids),
+                    status=rng.choices(statuses, weights)[0],
+                    price=Decimal(rng.randint(100, 100_000)) / 100,
+                    stock=rng.randint(0, 5000),
+                    created_at=CREATED_FROM
+                    + datetime.timedelta(seconds=rng.randrange(CREATED_SPAN_SECONDS)),
+                )
+            )
+            for tag_id in rng.sample(
+                range(1, TAGS + 1), rng.randint(0, MAX_TAGS_PER_PRODUCT)
+            ):
+                links.append(through(product_id=pk, tag_id=tag_id))
+        with transaction.atomic():
+            Product.objects.bulk_create(products, batch_size=CHUNK_SIZE)
+            through.objects.bulk_create(links, batch_size=CHUNK_SIZE)
+        if stdout and (chunk_end - 1) % (CHUNK_SIZE * 10) == 0:
+            stdout.write(f"  {chunk_end - 1} / {rows} products\n")
+
+
+def generate_audit_history(rng, rows, user):
+    """One ``update`` entry for every ``AUDITED_PRODUCT_EVERY``-th product,
+    with an FK change so the affected-object lookups have data."""
+    product_ct = ContentType.objects.get_for_model(Product)
+    supplier_count = get_supplier_count(rows)
+    supplier_label = Supplier._meta.label_lower
+    next_pk = 1
+    for chunk_start in range(1, rows + 1, CHUNK_SIZE * AUDITED_PRODUCT_EVERY):
+        chunk_end = min(chunk_start + CHUNK_SIZE * AUDITED_PRODUCT_EVERY, rows + 1)
+        logs = []
+        for product_pk in range(chunk_start, chunk_end, AUDITED_PRODUCT_EVERY):
+            old_supplier = rng.randint(1, supplier_count)
+            new_supplier = rng.randint(1, supplier_count)
+            logs.append(
+                AdminAuditLog(
+                    pk=next_pk,
+                    user=user,
+                    content_type=product_ct,
+                    object_id=str(product_pk),
+                    object_key_int=product_pk,
+                    object_repr=f"SKU-{product_pk:08d}",
+                    action_type=AdminAuditLog.ActionType.UPDATE,
+                    source="admin",
+                    changes={
+                        "stock": {
+                            "old": rng.randint(0, 5000),
+                            "new": rng.randint(0, 5000),
+                        },
+                        "supplier": {"old": old_supplier, "new": new_supplier},
+                    },
+                    summary_fields=["stock", "supplier"],
+                    change_count=2,
+                    affected_objects=[
+                        {"ct": supplier_label, "id": old_supplier, "repr": ""},
+                        {"ct": supplier_label, "id": new_supplier, "repr": ""},
+                    ],
+                )
+            )
+            next_pk += 1
+        AdminAuditLog.objects.bulk_create(logs, batch_size=CHUNK_SIZE)
+
+
+def index_audit_history():
+    call_command("sbadmin_audit_index_objects", batch_size=CHUNK_SIZE, verbosity=0)
+
+
+def generate_brands(rng):
+    from benchmarks.bench_app.models import Brand
+
+    translation_model = Brand._parler_meta.root_model
+    brands = [Brand(pk=index, code=f"BR{index:04d}") for index in range(1, 501)]
+    Brand.objects.bulk_create(brands)
+    translations = [
+        translation_model(
+            master_id=brand.pk,
+            language_code=language_code,
+            name=f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {brand.pk}",
+            description="",
+        )
+        for brand in brands
+        for language_code in ("en", "sk")
+    ]
+    translation_model.objects.bulk_create(translations, batch_size=CHUNK_SIZE)
@@ -0,0 +1,201 @@
+"""
+Runs benchmark scenarios and compares results against a baseline.
+
+Each scenario is timed ``repeat`` times after ``warmup`` untimed runs. The
+timed runs go through ``SBAdminInstrumentationService``, which gives
+the query counts and per-stage breakdown. Peak memory comes from one extra
+run under ``tracemalloc``, so its overhead does not skew the latencies.
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import platform
+import statistics
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+
+import django
+from django.db import connection
+
+from django_smartbase_admin.services.instrumentation import (
+    SBAdminInstrumentationService,
+)
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    runs: int
+    latency_ms: dict[str, float]
+    queries: int
+    query_ms: float
+    rows: int
+    peak_memory_kb: float
+    stages: dict[str, dict[str, float]] = field(default_factory=dict)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Linear interpolation between closest ranks."""
+    ordered = sorted(values)
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def run_scenario(name, scenario, repeat=10, warmup=1) -> ScenarioResult:
+    """``scenario`` is a callable running one iteration."""
+    for _ in range(warmup):
+        scenario()
+
+    measurements = []
+    for _ in range(repeat):
+        measurement = SBAdminInstrumentationService.start("benchmark", name, "run")
+        try:
+            scenario()
+        finally:
+            SBAdminInstrumentationService.finish(measurement)
+        measurements.append(measurement)
+
+    tracemalloc.start()
+    try:
+        scenario()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies = [measurement.wall_seconds * 1000 for measurement in measurements]
+    stage_names = {name for m in measurements for name in m.stages}
+    return ScenarioResult(
+        name=name,
+        runs=repeat,
+        latency_ms={
+            "min": min(latencies),
+            "mean": statistics.fmean(latencies),
+            **{f"p{pct}": percentile(latencies, pct) for pct in PERCENTILES},
+            "max": max(latencies),
+        },
+        # Query counts are deterministic for a given dataset; the last run
+        # is representative and keeps warm-cache effects out of the count.
+        queries=measurements[-1].query_count,
+        query_ms=statistics.fmean(m.query_seconds * 1000 for m in measurements),
+        rows=measurements[-1].rows,
+        peak_memory_kb=peak / 1024,
+        stages={
+            stage: {
+                "ms": statistics.fmean(
+                    m.get_stage(stage).seconds * 1000 for m in measurements
+                ),
+                "queries": measurements[-1].get_stage(stage).query_count,
+            }
+            for stage in sorted(stage_names)
+        },
+    )
+
+
+def build_report(results: list[ScenarioResult], rows: int, seed: int) -> dict:
+    return {
+        "meta": {
+            "rows": rows,
+            "seed": seed,
+            "database": connection.vendor,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        },
+        "scenarios": {result.name: asdict(result) for result in results},
+    }
+
+
+def write_report(report: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as output:
+        json.dump(report, output, indent=2, sort_keys=True)
+        output.write("\n")
+
+
+def load_report(path: str) -> dict:
+    with open(path, encoding="utf-8") as report:
+        return json.load(report)
+
+
+@dataclass
+class Regression:
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+
+    def __str__(self):
+        return (
+            f"{self.scenario}: {self.metric} {self.baseline:.2f} -> "
+            f"{self.current:.2f}"
+        )
+
+
+def compare(
+    report: dict,
+    baseline: dict,
+    latency_threshold: float = 0.2,
+    latency_metric: str = "p95",
+    query_threshold: int = 0,
+    memory_threshold: float = 0.25,
+) -> list[Regression]:
+    """Scenarios slower, chattier or hungrier than ``baseline`` beyond the
+    thresholds. Latency and memory thresholds are relative (``0.2`` = 20 %
+    worse); the query threshold is an absolute number of extra queries.
+    Scenarios missing from either report are skipped."""
+    if report["meta"].get("rows") != baseline["meta"].get("rows"):
+        raise ValueError(
+            "Baseline was recorded with a different dataset size "
+            f"({baseline['meta'].get('rows')} rows, not {report['meta'].get('rows')})."
+        )
+    regressions = []
+    for name, current in report["scenarios"].items():
+        previous = baseline["scenarios"].get(name)
+        if previous is None:
+            continue
+        checks = (
+            (
+                f"latency_ms.{latency_metric}",
+                previous["latency_ms"][latency_metric],
+                current["latency_ms"][latency_metric],
+                previous["latency_ms"][latency_metric] * (1 + latency_threshold),
+            ),
+            (
+                "queries",
+                previous["queries"],
+                current["queries"],
+                previous["queries"] + query_threshold,
+            ),
+            (
+                "peak_memory_kb",
+                previous["peak_memory_kb"],
+                current["peak_memory_kb"],
+                previous["peak_memory_kb"] * (1 + memory_threshold),
+            ),
+        )
+        for metric, before, after, limit in checks:
+            if after > limit:
+                regressions.append(Regression(name, metric, before, after))
+    return regressions
+
+
+def format_results(results: list[ScenarioResult]) -> str:
+    header = (
+        f"{'scenario':<32} {'p50 ms':>10} {'p95 ms':>10} {'queries':>8} "
+        f"{'rows':>8} {'peak KB':>10}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.name:<32} {result.latency_ms['p50']:>10.2f} "
+            f"{result.latency_ms['p95']:>10.2f} {result.queries:>8} "
+            f"{result.rows:>8} {result.peak_memory_kb:>10.0f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,39 @@
+"""SBAdmin configuration for the benchmarks: the stock role configuration
+plus a dashboard whose chart widget aggregates the product table."""
+
+from django.db.models import Count, F
+
+from django_smartbase_admin.engine.configuration import (
+    SBAdminConfigurationBase,
+    SBAdminRoleConfiguration,
+)
+from django_smartbase_admin.engine.dashboard import SBAdminDashboardChartWidget
+from django_smartbase_admin.views.dashboard_view import SBAdminDashboardView
+
+from benchmarks.bench_app.models import Product
+
+
+class ProductsByStatusWidget(SBAdminDashboardChartWidget):
+    widget_id = "products_by_status"
+    name = "Products by status"
+    model = Product
+    chart_type = "bar"
+    x_axis_annotate = F("status")
+    y_axis_annotate = Count("id")
+    order_by = "x_axis"
+
+
+class BenchRoleConfiguration(SBAdminRoleConfiguration):
+    pass
+
+
+config = BenchRoleConfiguration(
+    registered_views=[
+        SBAdminDashboardView(widgets=[ProductsByStatusWidget()], title="Dashboard"),
+    ],
+)
+
+
+class BenchSBAdminConfiguration(SBAdminConfigurationBase):
+    def get_configuration_for_roles(self, user_roles):
+        return config
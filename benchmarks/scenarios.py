@@ -0,0 +1,240 @@
+"""
+Benchmark scenarios: one callable per hot admin path.
+
+``build_scenarios()`` returns ``{name: callable}``; each callable runs one
+iteration against the generated dataset through the same entry points a
+real request uses (list action, xlsx export, autocomplete via the MCP
+tools, dashboard widget data, audit hooks, object-history filter).
+Scenarios needing parler or treebeard are only present when those
+packages are installed.
+"""
+
+from __future__ import annotations
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import F
+from django.test import RequestFactory
+from rest_framework.request import Request
+
+from benchmarks import dataset
+from benchmarks.bench_app.models import Category, Product, Supplier
+from django_smartbase_admin.admin.site import sb_admin_site
+from django_smartbase_admin.audit.sb_admin import ObjectHistoryFilterWidget
+from django_smartbase_admin.engine.const import (
+    FILTER_DATA_NAME,
+    SELECTED_ROWS_KWARG_NAME,
+    SELECTION_DATA_NAME,
+    TABLE_PARAMS_FULL_TEXT_SEARCH,
+    TABLE_PARAMS_NAME,
+    TABLE_PARAMS_PAGE_NAME,
+    TABLE_PARAMS_SIZE_NAME,
+    TABLE_PARAMS_SORT_NAME,
+)
+from django_smartbase_admin.engine.request import SBAdminViewRequestData
+from django_smartbase_admin.mcp.mcp import SBAdminTools
+from django_smartbase_admin.services.instrumentation import (
+    SBAdminInstrumentationService,
+)
+from django_smartbase_admin.services.thread_local import SBAdminThreadLocalService
+
+PAGE_SIZE = 25
+DEEP_PAGE = 400
+EXPORT_ROWS = 5000
+SEARCH_TERM = "Router"
+
+
+def build_request(user, view_id, action=None, modifier="template"):
+    """A GET request bootstrapped the way the admin views do it."""
+    request = RequestFactory().get("/sb-admin/")
+    request.user = user
+    request.session = {}
+    request.LANGUAGE_CODE = "en"
+    request_data = SBAdminViewRequestData.from_request_and_kwargs(
+        request, view=view_id, action=action, modifier=modifier
+    )
+    if request_data.selected_view is not None:
+        request_data.selected_view.init_view_dynamic(request, request_data)
+    SBAdminThreadLocalService.set_request(request)
+    return request
+
+
+def build_mcp_tools(user):
+    request = Request(RequestFactory().get("/mcp/"))
+    request.user = user
+    request.session = {}
+    request.LANGUAGE_CODE = "en"
+    return SBAdminTools(request=request)
+
+
+class BenchContext(object):
+    def __init__(self):
+        self.user = dataset.ensure_user()
+        self.product_view = sb_admin_site._registry[Product]
+        self.view_id = self.product_view.get_id()
+        self.supplier = Supplier.objects.order_by("pk").first()
+        self.leaf_category_id = dataset.get_leaf_category_ids()[0]
+        self.deep_page = max(1, min(DEEP_PAGE, Product.objects.count() // PAGE_SIZE))
+        self.export_pks = list(
+            Product.objects.order_by("pk").values_list("pk", flat=True)[:EXPORT_ROWS]
+        )
+
+    def list_data(self, filter_data=None, page=1, sort=None):
+        request = build_request(self.user, self.view_id, "action_list_json", "json")
+        table_params = {TABLE_PARAMS_PAGE_NAME: page, TABLE_PARAMS_SIZE_NAME: PAGE_SIZE}
+        if sort:
+            table_params[TABLE_PARAMS_SORT_NAME] = sort
+        action = self.product_view.sbadmin_list_action_class(
+            self.product_view,
+            request,
+            all_params={
+                self.view_id: {
+                    FILTER_DATA_NAME: filter_data or {},
+                    TABLE_PARAMS_NAME: table_params,
+                }
+            },
+        )
+        return action.get_data()
+
+
+def list_json(context):
+    return context.list_data()
+
+
+def list_json_deep_page(context):
+    return context.list_data(
+        page=context.deep_page, sort=[{"field": "name", "dir": "asc"}]
+    )
+
+
+def list_json_search(context):
+    return context.list_data(filter_data={TABLE_PARAMS_FULL_TEXT_SEARCH: SEARCH_TERM})
+
+
+def list_json_filtered(context):
+    return context.list_data(
+        filter_data={
+            "supplier": [{"value": context.supplier.pk, "label": str(context.supplier)}]
+        }
+    )
+
+
+def xlsx_export(context):
+    request = build_request(context.user, context.view_id, "action_xlsx_export")
+    action = context.product_view.sbadmin_list_action_class(
+        context.product_view,
+        request,
+        all_params={
+            context.view_id: {
+                SELECTION_DATA_NAME: {SELECTED_ROWS_KWARG_NAME: context.export_pks},
+            }
+        },
+    )
+    return action.get_xlsx_data(request)
+
+
+def autocomplete_search(context):
+    tools = build_mcp_tools(context.user)
+    if not hasattr(context, "supplier_widget_id"):
+        (admin,) = tools.list_admins(view_ids=[context.view_id])["admin_views"]
+        field = next(f for f in admin["fields"] if f["name"] == "supplier")
+        context.supplier_widget_id = field["filter"]["widget_id"]
+    options = tools.autocomplete(
+        context.view_id, context.supplier_widget_id, search="Supplier 0000"
+    )
+    SBAdminInstrumentationService.record_rows(len(options))
+    return options
+
+
+def dashboard_widget(context):
+    request = build_request(context.user, "dashboard")
+    dashboard = request.request_data.configuration.view_map["dashboard"]
+    return dashboard.widgets[0].get_data(request)
+
+
+def audit_bulk_update(context):
+    build_request(context.user, context.view_id, "action_list")
+    with transaction.atomic():
+        updated = Product.objects.filter(category_id=context.leaf_category_id).update(
+            stock=F("stock") + 1
+        )
+        transaction.set_rollback(True)
+    SBAdminInstrumentationService.record_rows(updated)
+    return updated
+
+
+def audit_object_history(context):
+    from django_smartbase_admin.audit.models import AdminAuditLog
+
+    request = build_request(context.user, context.view_id)
+    supplier_ct = ContentType.objects.get_for_model(Supplier)
+    history = AdminAuditLog.objects.filter(
+        ObjectHistoryFilterWidget()._filter_by_object_history(
+            request, [f"{supplier_ct.pk}:{context.supplier.pk}"]
+        )
+    ).order_by("-timestamp")[:50]
+    rows = list(history)
+    SBAdminInstrumentationService.record_rows(len(rows))
+    return rows
+
+
+def mcp_list_rows(context):
+    tools = build_mcp_tools(context.user)
+    result = tools.list_rows(
+        context.view_id,
+        fields=["sku", "name", "supplier", "status", "price", "tag_count"],
+        page_size=PAGE_SIZE,
+    )
+    # The tool records its rows on its own (nested) measurement.
+    SBAdminInstrumentationService.record_rows(len(result["data"]))
+    return result
+
+
+def tree_list(context):
+    """Children of every root — the treebeard materialized-path lookup."""
+    rows = 0
+    for root in Category.get_root_nodes():
+        rows += len(root.get_descendants().values_list("pk", flat=True))
+    SBAdminInstrumentationService.record_rows(rows)
+    return rows
+
+
+def translated_list(context):
+    from benchmarks.bench_app.models import Brand
+
+    rows = list(
+        Brand.objects.language("en")
+        .translated()
+        .order_by("translations__name")[:PAGE_SIZE]
+    )
+    SBAdminInstrumentationService.record_rows(len(rows))
+    return rows
+
+
+SCENARIOS = (
+    list_json,
+    list_json_deep_page,
+    list_json_search,
+    list_json_filtered,
+    xlsx_export,
+    autocomplete_search,
+    dashboard_widget,
+    audit_bulk_update,
+    audit_object_history,
+    mcp_list_rows,
+)
+
+
+def build_scenarios(names=None) -> dict:
+    context = BenchContext()
+    scenarios = list(SCENARIOS)
+    if settings.TREEBEARD_ENABLED:
+        scenarios.append(tree_list)
+    if settings.PARLER_ENABLED:
+        scenarios.append(translated_list)
+    return {
+        scenario.__name__: (lambda scenario=scenario: scenario(context))
+        for scenario in scenarios
+        if not names or scenario.__name__ in names
+    }
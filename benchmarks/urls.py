@@ -0,0 +1,5 @@
+from django.urls import path
+
+from django_smartbase_admin.admin.site import sb_admin_site
+
+urlpatterns = [path("sb-admin/", sb_admin_site.urls)]
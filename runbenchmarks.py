@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+Run the django-smartbase-admin benchmark suite.
+
+Usage:
+    python runbenchmarks.py                                     # 1M rows, all scenarios
+    python runbenchmarks.py --rows 50000 --repeat 5             # smaller dataset
+    python runbenchmarks.py --scenario list_json --scenario xlsx_export
+    python runbenchmarks.py --output results.json               # save a report
+    python runbenchmarks.py --baseline results.json             # fail on regressions
+
+The dataset is generated once per ``(rows, seed)`` into SQLite
+(``benchmarks/.data``) or the database in ``SBADMIN_BENCH_DATABASE_URL``.
+"""
+
+import argparse
+import os
+import sys
+
+import django
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument(
+        "--scenario", action="append", dest="scenarios", help="Run only these."
+    )
+    parser.add_argument("--output", help="Write the JSON report here.")
+    parser.add_argument("--baseline", help="Compare against this JSON report.")
+    parser.add_argument("--latency-threshold", type=float, default=0.2)
+    parser.add_argument(
+        "--latency-metric",
+        default="p95",
+        choices=["min", "mean", "p50", "p90", "p95", "p99", "max"],
+    )
+    parser.add_argument("--query-threshold", type=int, default=0)
+    parser.add_argument("--memory-threshold", type=float, default=0.25)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "benchmarks.settings")
+
+    # Ensure src/ is on the path so django_smartbase_admin is importable
+    root_dir = os.path.dirname(os.path.abspath(__file__))
+    src_dir = os.path.join(root_dir, "src")
+    for path in (src_dir, root_dir):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    django.setup()
+
+    from django.conf import settings
+    from django.core.management import call_command
+
+    from benchmarks import dataset, harness
+    from benchmarks.scenarios import build_scenarios
+
+    if settings.DATABASES["default"]["ENGINE"].endswith("sqlite3"):
+        os.makedirs(
+            os.path.dirname(settings.DATABASES["default"]["NAME"]), exist_ok=True
+        )
+    call_command("migrate", run_syncdb=True, interactive=False, verbosity=0)
+    dataset.generate(args.rows, args.seed, stdout=sys.stdout)
+
+    scenarios = build_scenarios(args.scenarios)
+    results = []
+    for name, scenario in scenarios.items():
+        sys.stdout.write(f"Running {name}...\n")
+        results.append(
+            harness.run_scenario(name, scenario, repeat=args.repeat, warmup=args.warmup)
+        )
+    sys.stdout.write("\n" + harness.format_results(results) + "\n")
+
+    report = harness.build_report(results, rows=args.rows, seed=args.seed)
+    if args.output:
+        harness.write_report(report, args.output)
+    if args.baseline:
+        regressions = harness.compare(
+            report,
+            harness.load_report(args.baseline),
+            latency_threshold=args.latency_threshold,
+            latency_metric=args.latency_metric,
+            query_threshold=args.query_threshold,
+            memory_threshold=args.memory_threshold,
+        )
+        if regressions:
+            sys.stdout.write("\nRegressions:\n")
+            for regression in regressions:
+                sys.stdout.write(f"  {regression}\n")
+            sys.exit(1)
+        sys.stdout.write("\nNo regressions against the baseline.\n")
+
+
+if __name__ == "__main__":
+    main()
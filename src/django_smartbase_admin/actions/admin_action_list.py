@@ -1,9 +1,11 @@
+import hashlib
 import json
 import logging
 import math
 from typing import Any, TYPE_CHECKING
 
 from django.contrib.admin.utils import lookup_spawns_duplicates
+from django.core.cache import cache
 from django.core.exceptions import FieldDoesNotExist, FieldError
 from django.db.models import Avg, Count, Field, Max, Min, Q, Sum, Value
 from django.utils import timezone
@@ -42,6 +44,10 @@ from django_smartbase_admin.engine.const import (
     MODIFIER_OBJECT_ID,
     SB_ADMIN_AJAX_NOTIFICATIONS_KEY,
 )
+from django_smartbase_admin.services.instrumentation import (
+    SBAdminInstrumentationService,
+)
+from django_smartbase_admin.services.http_cache import SBAdminHttpCacheService
 from django_smartbase_admin.services.views import SBAdminViewService
 from django_smartbase_admin.utils import import_with_injection
 
@@ -73,6 +79,9 @@ LIST_AGGREGATE_FUNCTIONS = {
     "count": Count,
 }
 
+# Cache key prefix of the ordered pk lists remembered for detail prev/next.
+LIST_PAGE_WINDOW_CACHE_PREFIX = "sbadmin_list_window"
+
 
 class SBAdminAction(object):
     view = None
@@ -369,65 +378,131 @@ class SBAdminListAction(SBAdminAction):
             values.extend(self.view.sbadmin_list_display_data)
         # Include fields required by active filters, ordering, and search, even if hidden
         values.extend([field.field for field in self.get_filter_fields_from_request()])
-        return values
+        page_only = {field.field for field in self.get_page_only_fields()}
+        return [value for value in values if value not in page_only]
+
+    def get_page_only_fields(self) -> list["SBAdminField"]:
+        """Visible columns with ``annotate_page_only`` that the request does
+        not filter, sort or search by; ``annotate_page_only_fields`` fills
+        them in after the page is fetched."""
+        request_fields = {
+            field.field for field in self.get_filter_fields_from_request()
+        }
+        return [
+            field
+            for field in self.get_visible_column_fields()
+            if field.annotate_page_only
+            and field.annotate is not None
+            and field.field not in request_fields
+        ]
+
+    def annotate_page_only_fields(self, data: list[dict[str, Any]]) -> None:
+        """One extra query computing the page-only columns for the fetched
+        rows' pks, so they are never evaluated for the whole filtered set."""
+        fields = self.get_page_only_fields()
+        pk_name = self.get_pk_field().name
+        pks = [row[pk_name] for row in data if pk_name in row]
+        if not fields or not pks:
+            return
+        values = [field.field for field in fields]
+        queryset = (
+            self.view.get_queryset(self.threadsafe_request)
+            .filter(**{f"{pk_name}__in": pks})
+            .order_by()
+            .annotate(**{field.field: field.annotate for field in fields})
+            .values(pk_name, *values)
+        )
+        computed = {row.pop(pk_name): row for row in queryset}
+        empty = dict.fromkeys(values)
+        for row in data:
+            if pk_name in row:
+                row.update(computed.get(row[pk_name], empty))
+
+    def get_search_engine(self, queryset):
+        """The admin's opt-in search engine, or ``None`` for the default
+        ``icontains`` lookups (also when the engine can't run on the
+        queryset's database)."""
+        get_engine = getattr(self.view, "get_sbadmin_search_engine", None)
+        engine = get_engine(self.threadsafe_request) if callable(get_engine) else None
+        if engine is None or not engine.is_available(queryset):
+            return None
+        return engine
+
+    def get_search_field_specs(self, request) -> list[tuple[str, str]]:
+        """``(prefix, lookup)`` per configured search field, with SBAdmin
+        field names mapped through ``filter_field`` to ORM lookups."""
+        search_field_map = {}
+        for field in self.get_search_fields(request):
+            filter_field = str(field.filter_field)
+            if _lookup_targets_bare_relation(self.view.model, filter_field):
+                search_field_map[field.name] = str(field.name)
+            else:
+                search_field_map[field.name] = filter_field
+        specs = []
+        for configured_search_field in self.view.get_search_fields(request) or []:
+            configured_search_field = str(configured_search_field)
+            if not configured_search_field:
+                continue
+            prefix = (
+                configured_search_field[0]
+                if configured_search_field[0] in "^=@"
+                else ""
+            )
+            raw_field_name = (
+                configured_search_field[1:] if prefix else configured_search_field
+            )
+            specs.append((prefix, search_field_map.get(raw_field_name, raw_field_name)))
+        return specs
+
+    @staticmethod
+    def get_search_terms(search_term) -> list[str]:
+        terms = []
+        for bit in smart_split(search_term):
+            if bit.startswith(('"', "'")) and bit[0] == bit[-1]:
+                bit = unescape_string_literal(bit)
+            terms.append(bit)
+        return terms
 
     def get_search_results(self, request, queryset, search_term):
         """
         Return a tuple containing a queryset to implement the search
         and a boolean indicating if the results may contain duplicates.
         """
-
-        def construct_search(field_name):
-            prefix = field_name[0] if field_name and field_name[0] in "^=@" else ""
-            raw_field_name = field_name[1:] if prefix else field_name
-            return self.view.get_search_lookup(request, raw_field_name, prefix)
-
-        search_fields = self.get_search_fields(request)
-        search_fields_definition = list(self.view.get_search_fields(request) or [])
-        if search_fields_definition and search_term:
-            search_field_map = {}
-            for field in search_fields:
-                filter_field = str(field.filter_field)
-                if _lookup_targets_bare_relation(self.view.model, filter_field):
-                    search_field_map[field.name] = str(field.name)
-                else:
-                    search_field_map[field.name] = filter_field
-            orm_lookups = []
-            for configured_search_field in search_fields_definition:
-                configured_search_field = str(configured_search_field)
-                if not configured_search_field:
-                    continue
-                prefix = (
-                    configured_search_field[0]
-                    if configured_search_field[0] in "^=@"
-                    else ""
-                )
-                raw_field_name = (
-                    configured_search_field[1:] if prefix else configured_search_field
-                )
-                lookup_field = search_field_map.get(raw_field_name, raw_field_name)
-                orm_lookups.append(construct_search(f"{prefix}{lookup_field}"))
-            term_queries = []
-            for bit in smart_split(search_term):
-                if bit.startswith(('"', "'")) and bit[0] == bit[-1]:
-                    bit = unescape_string_literal(bit)
-                or_queries = Q.create(
-                    [(orm_lookup, bit) for orm_lookup in orm_lookups],
-                    connector=Q.OR,
-                )
-                term_queries.append(or_queries)
-            queryset = queryset.filter(Q.create(term_queries))
-            if any(
-                lookup_spawns_duplicates(self.view.model._meta, search_spec)
-                for search_spec in orm_lookups
-            ):
-                logger.warning(
-                    "%s full-text search can duplicate rows because current "
-                    "search_fields traverse relations. Prefer SBAdmin field names "
-                    "(SBAdminField.name) in search_fields so SBAdmin can map them "
-                    "through filter_field to direct ORM lookups.",
-                    self.view.__class__.__name__,
-                )
+        search_field_specs = self.get_search_field_specs(request)
+        if not (search_field_specs and search_term):
+            return queryset
+        engine = self.get_search_engine(queryset)
+        if engine is not None:
+            return engine.filter_queryset(
+                self,
+                request,
+                queryset,
+                search_field_specs,
+                self.get_search_terms(search_term),
+            )
+        orm_lookups = [
+            self.view.get_search_lookup(request, lookup_field, prefix)
+            for prefix, lookup_field in search_field_specs
+        ]
+        term_queries = []
+        for bit in self.get_search_terms(search_term):
+            or_queries = Q.create(
+                [(orm_lookup, bit) for orm_lookup in orm_lookups],
+                connector=Q.OR,
+            )
+            term_queries.append(or_queries)
+        queryset = queryset.filter(Q.create(term_queries))
+        if any(
+            lookup_spawns_duplicates(self.view.model._meta, search_spec)
+            for search_spec in orm_lookups
+        ):
+            logger.warning(
+                "%s full-text search can duplicate rows because current "
+                "search_fields traverse relations. Prefer SBAdmin field names "
+                "(SBAdminField.name) in search_fields so SBAdmin can map them "
+                "through filter_field to direct ORM lookups.",
+                self.view.__class__.__name__,
+            )
         return queryset
 
     def is_search_query(self):
@@ -447,6 +522,28 @@ class SBAdminListAction(SBAdminAction):
         )
         return base_qs
 
+    def order_by_search_rank(self, base_qs):
+        """Let the search engine rank rows while a search is active and the
+        user hasn't picked a sort; the regular ordering breaks ties."""
+        full_text_search_query_value = self.filter_data.get(
+            TABLE_PARAMS_FULL_TEXT_SEARCH, None
+        )
+        if not full_text_search_query_value or self.table_params.get(
+            TABLE_PARAMS_SORT_NAME
+        ):
+            return base_qs
+        engine = self.get_search_engine(base_qs)
+        search_field_specs = self.get_search_field_specs(self.threadsafe_request)
+        if engine is None or not search_field_specs:
+            return base_qs
+        return engine.order_queryset(
+            self,
+            self.threadsafe_request,
+            base_qs,
+            search_field_specs,
+            self.get_search_terms(full_text_search_query_value),
+        )
+
     def build_final_data_count_queryset(
         self, additional_filter=None, apply_plugins=True
     ):
@@ -466,6 +563,7 @@ class SBAdminListAction(SBAdminAction):
                     self,
                     request=request,
                     qs=base_qs,
+                    additional_filter=additional_filter,
                 )
         return base_qs
 
@@ -501,6 +599,7 @@ class SBAdminListAction(SBAdminAction):
         )
         base_qs = self.search_in_queryset(base_qs)
         base_qs = base_qs.order_by(*self.get_order_by_from_request())
+        base_qs = self.order_by_search_rank(base_qs)
         if apply_plugins:
             for plugin in plugins:
                 base_qs = plugin.modify_data_queryset(
@@ -509,39 +608,75 @@ class SBAdminListAction(SBAdminAction):
                     qs=base_qs,
                     page_num=page_num,
                     page_size=page_size,
+                    additional_filter=additional_filter,
                 )
         return base_qs[from_item:to_item]
 
+    def get_page_num_from_request(self) -> int:
+        try:
+            page_num = int(self.table_params.get(TABLE_PARAMS_PAGE_NAME, 1))
+        except (TypeError, ValueError):
+            return 1
+        return max(page_num, 1)
+
+    def get_page_pks(self, rows) -> list[Any]:
+        """Ordered pks of a page as the data queryset returned it, before
+        plugins reshape the rows; rows without the pk are skipped."""
+        pk_name = self.get_pk_field().name
+        return [row[pk_name] for row in rows if pk_name in row]
+
+    def get_page_pks_from_queryset(self, page_qs) -> list[Any]:
+        """Ordered pks of a data queryset page. Plain row pages select only
+        the pk; pages a plugin turned into combined queries are read whole."""
+        pk_name = self.get_pk_field().name
+        query = page_qs.query
+        if query.combinator or pk_name not in query.values_select:
+            return self.get_page_pks(page_qs)
+        return list(page_qs.values_list(pk_name, flat=True))
+
     def get_data(self, page_num=None, page_size=None, additional_filter=None):
         additional_filter = additional_filter or Q()
 
-        page_num = page_num or int(self.table_params.get(TABLE_PARAMS_PAGE_NAME, 1))
+        page_num = page_num or self.get_page_num_from_request()
         page_size = page_size or self.page_size
 
-        total_count = self.build_final_data_count_queryset(additional_filter).count()
+        stage = SBAdminInstrumentationService.stage
+        with stage("queryset"):
+            count_qs = self.build_final_data_count_queryset(additional_filter)
+        with stage("count"):
+            total_count = count_qs.count()
+        with stage("queryset"):
+            data_qs = self.build_final_data_queryset(
+                page_num, page_size, additional_filter
+            )
 
-        data_qs = self.build_final_data_queryset(page_num, page_size, additional_filter)
-        data = list(data_qs)
         request = self.threadsafe_request
         plugins = list(request.request_data.configuration.plugins)
-        for plugin in plugins:
-            data = plugin.modify_raw_data(
-                self,
-                request=request,
-                data=data,
-            )
+        with stage("fetch"):
+            data = list(data_qs)
+            self.page_pks = self.get_page_pks(data)
+            # Plugins see the rows with every column filled in.
+            self.annotate_page_only_fields(data)
+            for plugin in plugins:
+                data = plugin.modify_raw_data(
+                    self,
+                    request=request,
+                    data=data,
+                )
+        SBAdminInstrumentationService.record_rows(len(data))
 
-        raw_rows_by_pk = {row[self.get_pk_field().name]: dict(row) for row in data}
-        self.inject_row_class(data)
-        self.process_final_data(data)
-        self.inject_row_actions(data, raw_rows_by_pk=raw_rows_by_pk)
+        with stage("format"):
+            raw_rows_by_pk = {row[self.get_pk_field().name]: dict(row) for row in data}
+            self.inject_row_class(data)
+            self.process_final_data(data)
+            self.inject_row_actions(data, raw_rows_by_pk=raw_rows_by_pk)
 
-        for plugin in plugins:
-            data = plugin.modify_final_data(
-                self,
-                request=request,
-                data=data,
-            )
+            for plugin in plugins:
+                data = plugin.modify_final_data(
+                    self,
+                    request=request,
+                    data=data,
+                )
 
         return {
             "last_page": math.ceil(total_count / page_size),
@@ -673,11 +808,57 @@ class SBAdminListAction(SBAdminAction):
             descriptor["sub_actions"] = sub_actions
         return descriptor
 
-    def get_json_data(self):
-        data = self.get_data()
+    def get_json_data(self, page_num=None, remember_page_window=True):
+        page_num = page_num or self.get_page_num_from_request()
+        data = self.get_data(page_num=page_num)
+        if remember_page_window and getattr(
+            self.view, "sbadmin_previous_next_buttons_enabled", False
+        ):
+            self.remember_page_window(page_num, self.page_pks, data["last_row"])
         self._strip_to_visible_keys(data.get("data") or [])
         return data
 
+    def get_list_state_hash(self) -> str:
+        """Hash of the params deciding which rows the list shows, in which
+        order and how they are split into pages."""
+        state = {
+            FILTER_DATA_NAME: self.filter_data,
+            ADVANCED_FILTER_DATA_NAME: self.advanced_filter_data,
+            TABLE_PARAMS_SORT_NAME: self.table_params.get(TABLE_PARAMS_SORT_NAME),
+            TABLE_PARAMS_SIZE_NAME: int(self.page_size),
+            "global_filter": self.threadsafe_request.request_data.global_filter,
+        }
+        return hashlib.sha1(
+            json.dumps(state, sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+    def get_page_window_cache_key(self, page_num: int) -> str:
+        user = self.threadsafe_request.request_data.user
+        # Writes to the model replace its watermark, so edits and deletes
+        # never leave a stale window behind.
+        model = self.view.model
+        version = ""
+        if SBAdminHttpCacheService.is_tracked(model):
+            (version,) = SBAdminHttpCacheService.get_versions([model]).values()
+        return (
+            f"{LIST_PAGE_WINDOW_CACHE_PREFIX}_{user.pk}_{self.view.get_id()}"
+            f"_{self.get_list_state_hash()}_{version}_{page_num}"
+        )
+
+    def remember_page_window(
+        self, page_num: int, pks: list[Any], total_count: int
+    ) -> None:
+        """Store the page's ordered pks so detail previous/next navigation
+        can find its neighbours without re-running the list query."""
+        cache.set(
+            self.get_page_window_cache_key(page_num),
+            {"pks": pks, "total_count": total_count},
+            timeout=getattr(self.view, "sbadmin_previous_next_cache_timeout", 600),
+        )
+
+    def get_page_window(self, page_num: int) -> dict[str, Any] | None:
+        return cache.get(self.get_page_window_cache_key(page_num))
+
     def _strip_to_visible_keys(self, rows: list[dict[str, Any]]) -> None:
         """Keep PK + visible columns + ``allowed_framework_keys``; drop the rest."""
         if not rows:
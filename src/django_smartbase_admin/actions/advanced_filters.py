@@ -1,11 +1,15 @@
 import copy
 import json
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from dataclasses import field as dataclass_field
-from typing import List, Optional, TYPE_CHECKING
+from typing import Any, List, Optional, TYPE_CHECKING
 
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
 from django.db import models
-from django.db.models import Q, Count
+from django.db.models import Count, Exists, OuterRef, Q
 from django.template.loader import render_to_string
 from django.utils.translation import gettext_lazy as _
 
@@ -127,6 +131,136 @@ class QueryBuilderFilter:
         )
 
 
+@dataclass(frozen=True)
+class AdvancedFilterRule:
+    """One rule of a compiled plan; its value is parsed per request."""
+
+    field: str
+    operator: str
+    rule: dict
+    empty_matches_null: bool = False
+    # Filter on an aggregate annotate, run as a correlated ``EXISTS``.
+    aggregate: bool = False
+    mergeable: bool = False
+
+
+@dataclass(frozen=True)
+class AdvancedFilterInRule:
+    """``equal`` rules on one field of an ``OR`` group, merged into ``__in``."""
+
+    field: str
+    values: tuple
+
+
+@dataclass(frozen=True)
+class AdvancedFilterGroup:
+    condition: str
+    children: tuple
+
+    def iter_rules(self):
+        for child in self.children:
+            if isinstance(child, AdvancedFilterGroup):
+                yield from child.iter_rules()
+            else:
+                yield child
+
+
+@dataclass(frozen=True)
+class AdvancedFilterPlan:
+    """A QueryBuilder rule tree compiled against a view's column fields.
+
+    Holds field keys and raw rule values only, so one plan is reused across
+    requests; ``to_q`` parses the values and builds the ``Q`` per request.
+    """
+
+    root: AdvancedFilterGroup
+    # Column fields the resulting ``WHERE`` clause filters on.
+    fields: tuple
+
+    def to_q(self, request, column_fields: dict, service) -> Q:
+        """``service`` is the (possibly injected) ``QueryBuilderService``
+        building the leaf queries."""
+        return self._group_q(request, column_fields, service, self.root)
+
+    def _group_q(self, request, column_fields, service, group) -> Q:
+        queries = []
+        for child in group.children:
+            if isinstance(child, AdvancedFilterGroup):
+                queries.append(self._group_q(request, column_fields, service, child))
+                continue
+            field = column_fields.get(child.field)
+            if field is None:
+                continue
+            if isinstance(child, AdvancedFilterInRule):
+                queries.append(service.build_in_rule_q(request, child, field))
+            else:
+                queries.append(service.build_rule_q(request, child, field))
+        if group.condition == Conditions.AND.value:
+            return Q(*queries)
+        return Q(*queries, _connector=Q.OR)
+
+    def describe(self) -> dict[str, Any]:
+        """JSON-serializable form of the plan for the debug output."""
+        return asdict(self)
+
+
+# ``(view id, column fields, normalized rule JSON)`` -> ``AdvancedFilterPlan``;
+# process-local LRU bounded by ``SB_ADMIN_ADVANCED_FILTER_PLAN_CACHE_SIZE``.
+_plan_cache: "OrderedDict[tuple, AdvancedFilterPlan]" = OrderedDict()
+_plan_cache_lock = threading.Lock()
+
+
+def clear_plan_cache() -> None:
+    with _plan_cache_lock:
+        _plan_cache.clear()
+
+
+def _is_aggregate_filter(field) -> bool:
+    """Whether filtering ``field`` would filter on an aggregate annotate —
+    ``HAVING`` over a grouped list query unless rewritten."""
+    return (
+        field.filter_field == field.field
+        and field.annotate is not None
+        and getattr(field.annotate, "contains_aggregate", False)
+    )
+
+
+def _aggregate_exists(field, q: Q) -> Exists:
+    """``q`` on an aggregate annotate, evaluated for the outer row alone."""
+    model = field.view.model
+    return Exists(
+        model._base_manager.filter(pk=OuterRef("pk"))
+        .order_by()
+        .annotate(**field.get_field_annotates([field.field]))
+        .filter(q)
+    )
+
+
+def _merge_equal_rules(children: list) -> list:
+    """Merge the mergeable ``equal`` rules of an ``OR`` group by field."""
+    merged = []
+    by_field: dict[str, list[AdvancedFilterRule]] = {}
+    for child in children:
+        if isinstance(child, AdvancedFilterRule) and child.mergeable:
+            by_field.setdefault(child.field, []).append(child)
+    for child in children:
+        same_field = (
+            by_field.get(child.field)
+            if isinstance(child, AdvancedFilterRule) and child.mergeable
+            else None
+        )
+        if not same_field or len(same_field) < 2:
+            merged.append(child)
+        elif child is same_field[0]:
+            merged.append(
+                AdvancedFilterInRule(
+                    field=child.field,
+                    values=tuple(rule.rule["value"] for rule in same_field),
+                )
+            )
+    return merged
+
+
 @dataclass
 class QueryBuilderData:
     filters: Optional[List[QueryBuilderFilter]] = dataclass_field(default_factory=list)
@@ -197,30 +331,10 @@ class QueryBuilderService:
         column_fields: dict,
         query: dict,
     ) -> list:
-        all_fields = []
-
-        # Recursively build the Q object
-        def build_q(rules, condition):
-            for rule in rules:
-                if "condition" in rule:
-                    # Nested group of rules
-                    build_q(rule["rules"], rule["condition"])
-                    continue
-
-                if rule["field"] is None or "value" not in rule:
-                    # rule is not valid skip
-                    continue
-
-                # Single rule
-                field_name = rule["field"].replace(f"{view_id}-", "")
-                field = column_fields.get(field_name)
-                if field is None:
-                    continue
-
-                all_fields.append(field)
-
-        build_q(query["rules"], query["condition"])
-        return all_fields
+        """Column fields the compiled filter needs annotated on the list
+        queryset; aggregates filtered through ``EXISTS`` are left out."""
+        plan = cls.get_plan(view_id, column_fields, query)
+        return [column_fields[name] for name in plan.fields if name in column_fields]
 
     @classmethod
     def querybuilder_to_django_filter(
@@ -230,94 +344,159 @@ class QueryBuilderService:
         column_fields: dict,
         query: dict,
     ) -> Q:
-        # Recursively build the Q object
-        def build_q(rules, condition):
-            queries = []
+        plan = cls.get_plan(view_id, column_fields, query)
+        return plan.to_q(request, column_fields, cls)
+
+    @classmethod
+    def get_plan(cls, view_id: str, column_fields: dict, query: dict):
+        """Compiled plan of ``query``, cached per ``(view, normalized rules)``."""
+        # Column fields can differ per user; a plan only covers the set it
+        # was compiled against.
+        key = (
+            view_id,
+            tuple(sorted(column_fields)),
+            json.dumps(query, sort_keys=True, default=str),
+        )
+        with _plan_cache_lock:
+            plan = _plan_cache.get(key)
+            if plan is not None:
+                _plan_cache.move_to_end(key)
+                return plan
+        plan = cls.compile_plan(view_id, column_fields, query)
+        with _plan_cache_lock:
+            _plan_cache[key] = plan
+            max_size = getattr(
+                settings, "SB_ADMIN_ADVANCED_FILTER_PLAN_CACHE_SIZE", 512
+            )
+            while len(_plan_cache) > max_size:
+                _plan_cache.popitem(last=False)
+        return plan
+
+    @classmethod
+    def compile_plan(cls, view_id: str, column_fields: dict, query: dict):
+        from django_smartbase_admin.engine.filter_widgets import (
+            SBAdminFilterWidget,
+            StringFilterWidget,
+        )
+
+        def is_mergeable(field, operator):
+            # Widgets rewriting the query per value keep their own lookups.
+            return (
+                operator == AllOperators.EQUAL.value
+                and field.filter_widget is not None
+                and not _is_aggregate_filter(field)
+                and type(field.filter_widget).get_advanced_filter_query_for_parsed_value
+                is SBAdminFilterWidget.get_advanced_filter_query_for_parsed_value
+            )
+
+        def compile_rule(rule):
+            field = column_fields.get(rule["field"].replace(f"{view_id}-", ""))
+            if field is None:
+                return None
+            operator = rule["operator"]
+            return AdvancedFilterRule(
+                field=field.field,
+                operator=operator,
+                rule=rule,
+                empty_matches_null=isinstance(field.filter_widget, StringFilterWidget)
+                and operator
+                in (AllOperators.IS_EMPTY.value, AllOperators.IS_NOT_EMPTY.value),
+                aggregate=_is_aggregate_filter(field),
+                mergeable=is_mergeable(field, operator),
+            )
+
+        def compile_group(rules, condition):
+            children = []
             for rule in rules:
                 if "condition" in rule:
                     # Nested group of rules
-                    sub_q = build_q(rule["rules"], rule["condition"])
-                    queries.append(sub_q)
+                    children.append(compile_group(rule["rules"], rule["condition"]))
                     continue
-
                 if rule["field"] is None or "value" not in rule:
                     # rule is not valid skip
                     continue
+                compiled = compile_rule(rule)
+                if compiled is not None:
+                    children.append(compiled)
+            if condition != Conditions.AND.value:
+                children = _merge_equal_rules(children)
+            return AdvancedFilterGroup(condition=condition, children=tuple(children))
+
+        root = compile_group(query["rules"], query["condition"])
+        fields = []
+        for node in root.iter_rules():
+            if not getattr(node, "aggregate", False) and node.field not in fields:
+                fields.append(node.field)
+        return AdvancedFilterPlan(root=root, fields=tuple(fields))
 
-                # Single rule
-                field_name = rule["field"].replace(f"{view_id}-", "")
-                field = column_fields.get(field_name)
-                operator = rule["operator"]
-                if field is None:
-                    continue
-
-                if operator in cls.ZERO_INPUTS_OPERATORS:
-                    value = None
-                    filter_value = (
-                        True
-                        if operator in [AllOperators.IS_NULL, AllOperators.IS_NOT_NULL]
-                        else ""
-                    )
-                    if field.annotate and isinstance(field.annotate, Count):
-                        filter_value = 0
-                    q = Q(
-                        **{
-                            f"{field.filter_field}{cls.OPERATOR_MAP[operator]}": filter_value,
-                        }
-                    )
-                    from django_smartbase_admin.engine.filter_widgets import (
-                        StringFilterWidget,
-                    )
-
-                    if isinstance(
-                        field.filter_widget, StringFilterWidget
-                    ) and operator in [
-                        AllOperators.IS_EMPTY,
-                        AllOperators.IS_NOT_EMPTY,
-                    ]:
-                        q = q | Q(
-                            **{
-                                f"{field.filter_field}{cls.OPERATOR_MAP[AllOperators.IS_NULL]}": True
-                            }
-                        )
-                else:
-                    value = field.filter_widget.parse_value_from_input(
-                        request, rule["value"]
-                    )
-                    if operator not in cls.LIST_OPERATORS and isinstance(value, list):
-                        value = value[0]
-                    if operator in [
-                        AllOperators.BETWEEN.value,
-                        AllOperators.NOT_BETWEEN.value,
-                    ]:
-                        q = Q()
-                        if value[0] is not None:
-                            q &= Q(**{f"{field.filter_field}__gte": value[0]})
-                        if value[1] is not None:
-                            q &= Q(**{f"{field.filter_field}__lte": value[1]})
-                    else:
-                        q = Q(
-                            **{
-                                f"{field.filter_field}{cls.OPERATOR_MAP[operator]}": value
-                            }
-                        )
-
-                if operator in cls.NEGATIVE_OPERATORS:
-                    q = ~q
-                q = field.filter_widget.get_advanced_filter_query_for_parsed_value(
-                    request,
-                    value,
-                    q,
-                    rule,
+    @classmethod
+    def build_rule_q(cls, request, rule: "AdvancedFilterRule", field) -> Q:
+        operator = rule.operator
+        if operator in cls.ZERO_INPUTS_OPERATORS:
+            value = None
+            filter_value = (
+                True
+                if operator in [AllOperators.IS_NULL, AllOperators.IS_NOT_NULL]
+                else ""
+            )
+            if field.annotate and isinstance(field.annotate, Count):
+                filter_value = 0
+            q = Q(
+                **{
+                    f"{field.filter_field}{cls.OPERATOR_MAP[operator]}": filter_value,
+                }
+            )
+            if rule.empty_matches_null:
+                q = q | Q(
+                    **{
+                        f"{field.filter_field}{cls.OPERATOR_MAP[AllOperators.IS_NULL]}": True
+                    }
                 )
-                queries.append(q)
-
-            if condition == Conditions.AND.value:
-                return Q(*queries)
-            else:  # condition == "OR"
-                return Q(*queries, _connector=Q.OR)
+        else:
+            value = field.filter_widget.parse_value_from_input(
+                request, rule.rule["value"]
+            )
+            if operator not in cls.LIST_OPERATORS and isinstance(value, list):
+                value = value[0]
+            if operator in [
+                AllOperators.BETWEEN.value,
+                AllOperators.NOT_BETWEEN.value,
+            ]:
+                q = Q()
+                if value[0] is not None:
+                    q &= Q(**{f"{field.filter_field}__gte": value[0]})
+                if value[1] is not None:
+                    q &= Q(**{f"{field.filter_field}__lte": value[1]})
+            else:
+                q = Q(**{f"{field.filter_field}{cls.OPERATOR_MAP[operator]}": value})
+
+        if operator in cls.NEGATIVE_OPERATORS:
+            q = ~q
+        q = field.filter_widget.get_advanced_filter_query_for_parsed_value(
+            request,
+            value,
+            q,
+            rule.rule,
+        )
+        if rule.aggregate:
+            q = Q(_aggregate_exists(field, q))
+        return q
 
-        return build_q(query["rules"], query["condition"])
+    @classmethod
+    def build_in_rule_q(cls, request, rule: "AdvancedFilterInRule", field) -> Q:
+        values = []
+        for raw_value in rule.values:
+            value = field.filter_widget.parse_value_from_input(request, raw_value)
+            if isinstance(value, list):
+                value = value[0]
+            values.append(value)
+        if None in values:
+            # ``IN`` never matches NULL; keep the exact lookups.
+            return Q(
+                *[Q(**{f"{field.filter_field}__exact": value}) for value in values],
+                _connector=Q.OR,
+            )
+        return Q(**{f"{field.filter_field}__in": values})
 
     @classmethod
     def get_filters_for_list_action(cls, list_action):
@@ -348,6 +527,31 @@ class QueryBuilderService:
         )
         return fields
 
+    @classmethod
+    def is_debug_enabled(cls, request) -> bool:
+        return bool(
+            getattr(settings, "SB_ADMIN_ADVANCED_FILTER_DEBUG", settings.DEBUG)
+            and getattr(request.user, "is_superuser", False)
+        )
+
+    @classmethod
+    def get_debug_data_for_list_action(cls, list_action) -> dict[str, Any]:
+        """The compiled plan of the current advanced filter and the SQL of the
+        list count query it produces."""
+        querybuilder_filters = list_action.advanced_filter_data
+        plan = None
+        if querybuilder_filters:
+            plan = cls.get_plan(
+                list_action.view.get_id(),
+                {field.field: field for field in list_action.column_fields},
+                querybuilder_filters,
+            ).describe()
+        try:
+            sql = str(list_action.build_final_data_count_queryset().query)
+        except EmptyResultSet:
+            sql = None
+        return {"plan": plan, "sql": sql}
+
     @classmethod
     def get_all_operators_for_query_builder(cls):
         all_operators = {
@@ -61,6 +61,7 @@ from django_smartbase_admin.audit.views import (
 from django_smartbase_admin.engine.actions import SBAdminCustomAction, sbadmin_action
 from django_smartbase_admin.engine.fake_inline import SBAdminFakeInlineMixin
 from django_smartbase_admin.engine.inline_pagination import (
+    DeferredFormSetBase,
     TabularInlinePaginated,
     get_inline_admin_formset_by_prefix,
     get_inline_partial_prefix,
@@ -69,6 +70,7 @@ from django_smartbase_admin.engine.dynamic_forms import (
     SBADMIN_DYNAMIC_REGION_PREFIX_PARAM,
     SBADMIN_DYNAMIC_REGION_PARAM,
     SBAdminDynamicFormMixin,
+    SBDynamicRegionGraph,
     dynamic_region_initial_from_data,
 )
 from django_smartbase_admin.services.thread_local import SBAdminThreadLocalService
@@ -153,6 +155,7 @@ from django_smartbase_admin.admin.widgets import (
     SBAdminColorWidget,
     SBAdminFilerFileWidget,
     SBAdminDateTimeRangeWidget,
+    SBAdminAutocompleteWidget,
 )
 from django_smartbase_admin.engine.admin_base_view import (
     SBAdminBaseListView,
@@ -177,6 +180,9 @@ from django_smartbase_admin.services.views import SBAdminViewService
 
 logger = logging.getLogger(__name__)
 
+# Request attribute holding the region-scoped all-base-fields forms, by view.
+ALL_BASE_FIELDS_FORMS_REQUEST_ATTR = "_sbadmin_all_base_fields_forms"
+
 
 class SBAdminFormFieldWidgetsMixin:
     formfield_widgets = {
@@ -537,6 +543,10 @@ class SBAdminInlineAndAdminCommon(SBAdminFormFieldWidgetsMixin):
     sbadmin_fieldsets = None
     sbadmin_fake_inlines = None
     all_base_fields_form = None
+    # Build dynamic-region fragments from a form limited to the requested
+    # regions' fields. Region callbacks reading other fields must list them
+    # in ``SBDynamicRegion(depends_on=...)``.
+    sbadmin_dynamic_region_scoped = False
 
     def get_view_on_site_url(self, obj=None):
         if obj is None or not self.view_on_site:
@@ -617,7 +627,9 @@ class SBAdminInlineAndAdminCommon(SBAdminFormFieldWidgetsMixin):
         )
 
     def get_form(self, request, obj=None, **kwargs):
-        self.initialize_all_base_fields_form(request)
+        self.initialize_all_base_fields_form(
+            request, kwargs.pop("all_base_fields", "__all__")
+        )
         form = super().get_form(request, obj, **kwargs)
         form = self.get_dynamic_form_class(form)
         self.initialize_form_class(form, request)
@@ -651,9 +663,61 @@ class SBAdminInlineAndAdminCommon(SBAdminFormFieldWidgetsMixin):
             fieldsets.append((fieldset[0], fieldset_dict))
         return fieldsets
 
-    def get_dynamic_region_object(self, request, modifier, object_id=None):
+    def get_dynamic_region_graph(self, request, object_id=None) -> SBDynamicRegionGraph:
+        fieldsets = self.get_sbadmin_fieldsets(request, object_id)
+        graphs = self.__dict__.setdefault("_sbadmin_dynamic_region_graphs", {})
+        graph = graphs.get(self.form)
+        # Rebuilt only when the view hands out a different fieldsets object.
+        if graph is None or graph.fieldsets is not fieldsets:
+            graph = graphs[self.form] = SBDynamicRegionGraph(fieldsets)
+        return graph
+
+    def get_dynamic_region_scope(self, request, region_name, object_id=None):
+        """Regions a scoped dynamic-region request builds its form for, or
+        ``None`` to build the full form."""
+        if not self.sbadmin_dynamic_region_scoped:
+            return None
+        graph = self.get_dynamic_region_graph(request, object_id)
+        region = graph.get_region(region_name)
+        if region is None:
+            return None
+        related_regions = graph.regions_for_request(region, request)
+        return (region, *(item for item in related_regions if item is not region))
+
+    def get_dynamic_region_model_field_names(
+        self, field_names, *, editable=False
+    ) -> list[str]:
+        model_field_names = []
+        for field_name in field_names:
+            try:
+                field = self.model._meta.get_field(field_name)
+            except FieldDoesNotExist:
+                continue
+            if editable:
+                if getattr(field, "editable", False) and not field.auto_created:
+                    model_field_names.append(field.name)
+            elif field.concrete and not field.many_to_many:
+                model_field_names.append(field.name)
+        return model_field_names
+
+    def get_dynamic_region_object(
+        self, request, modifier, object_id=None, field_names=None
+    ):
         if object_id is None:
             return None
+        if field_names is not None:
+            only_fields = [
+                self.model._meta.pk.name,
+                *self.get_dynamic_region_model_field_names(field_names),
+            ]
+            # select_related() cannot follow a relation deferred by only().
+            queryset = (
+                self.get_queryset(request).select_related(None).only(*only_fields)
+            )
+            try:
+                return queryset.get(pk=unquote(object_id))
+            except (self.model.DoesNotExist, ValidationError, ValueError):
+                return None
         if hasattr(self, "get_object"):
             return self.get_object(request, object_id)
         try:
@@ -661,8 +725,18 @@ class SBAdminInlineAndAdminCommon(SBAdminFormFieldWidgetsMixin):
         except self.model.DoesNotExist:
             return None
 
-    def get_dynamic_region_form_class(self, request, obj=None):
-        return self.get_form(request, obj=obj, change=bool(obj))
+    def get_dynamic_region_form_class(self, request, obj=None, fields=None):
+        if fields is None:
+            return self.get_form(request, obj=obj, change=bool(obj))
+        return self.get_form(
+            request,
+            obj=obj,
+            change=bool(obj),
+            fields=fields,
+            all_base_fields=self.get_dynamic_region_model_field_names(
+                fields, editable=True
+            ),
+        )
 
     def get_dynamic_region_form_kwargs(self, request, form_class, data, obj=None):
         form_kwargs = {}
@@ -685,11 +759,23 @@ class SBAdminInlineAndAdminCommon(SBAdminFormFieldWidgetsMixin):
         if not region_name:
             return HttpResponseBadRequest(f"Missing {SBADMIN_DYNAMIC_REGION_PARAM}.")
 
-        obj = self.get_dynamic_region_object(request, modifier, object_id)
+        scoped_regions = self.get_dynamic_region_scope(request, region_name, object_id)
+        if scoped_regions is None:
+            obj = self.get_dynamic_region_object(request, modifier, object_id)
+        else:
+            field_names = SBDynamicRegionGraph.get_field_names(scoped_regions)
+            obj = self.get_dynamic_region_object(
+                request, modifier, object_id, field_names=field_names
+            )
         if object_id is not None and obj is None:
             return HttpResponse("", status=404)
 
-        form_class = self.get_dynamic_region_form_class(request, obj)
+        if scoped_regions is None:
+            form_class = self.get_dynamic_region_form_class(request, obj)
+        else:
+            form_class = self.get_dynamic_region_form_class(
+                request, obj, fields=field_names
+            ).scoped_to_dynamic_regions(scoped_regions)
         data = request.POST
         form_kwargs = self.get_dynamic_region_form_kwargs(
             request, form_class, data, obj
@@ -735,13 +821,23 @@ class SBAdminInlineAndAdminCommon(SBAdminFormFieldWidgetsMixin):
                 form_kwargs["instance"] = obj
         return dynamic_region_initial_from_data(form_class, data, form_kwargs, files)
 
-    def initialize_all_base_fields_form(self, request) -> None:
+    def initialize_all_base_fields_form(self, request, fields="__all__") -> None:
         params = {
             "form": self.form,
-            "fields": "__all__",
+            "fields": fields,
             "formfield_callback": partial(self.formfield_for_dbfield, request=request),
         }
-        self.all_base_fields_form = modelform_factory(self.model, **params)
+        form = modelform_factory(self.model, **params)
+        if fields == "__all__":
+            self.all_base_fields_form = form
+            return
+        # The view instance is shared by every request; a narrowed form only
+        # lives on the request that asked for it.
+        request.__dict__.setdefault(ALL_BASE_FIELDS_FORMS_REQUEST_ATTR, {})[self] = form
+
+    def get_all_base_fields_form(self, request=None):
+        forms = getattr(request, ALL_BASE_FIELDS_FORMS_REQUEST_ATTR, {})
+        return forms.get(self, self.all_base_fields_form)
 
 
 class SBAdminThirdParty(SBAdminInlineAndAdminCommon, SBAdminBaseView):
@@ -836,21 +932,14 @@ class SBAdminTranslationStatusMixin:
             )
         result = f"<a href='{translations_edit_url}' class='btn btn-small absolute top-24 right-24'>{_('Edit')}</a>"
         languages = SBAdminTranslationsService.get_all_languages()
-        translations = (
-            SBAdminTranslationsService.annotate_queryset_with_translations_count(
-                self.model.objects.filter(id=obj.id),
-                self.model,
-                [lang[0] for lang in languages],
-            )
-            .values()
-            .first()
+        filled_counts = SBAdminTranslationsService.get_translations_count(
+            self.model, [obj.pk], [lang[0] for lang in languages]
         )
         translation_counts = {}
-        for key, value in translations.items():
-            if key.endswith("_count"):
-                for lang in languages:
-                    if key.endswith(f"{lang[0]}_count"):
-                        translation_counts[lang[0]] = value
+        for (_model, _object_id, lang_code), filled_count in filled_counts.items():
+            translation_counts[lang_code] = (
+                translation_counts.get(lang_code, 0) + filled_count
+            )
         main_lang_code = SBAdminTranslationsService.get_main_lang_code()
         for index, lang in enumerate(languages):
             result += render_to_string(
@@ -926,6 +1015,7 @@ class SBAdmin(
     object_history_template = "sb_admin/actions/object_history.html"
 
     sbadmin_previous_next_buttons_enabled = False
+    sbadmin_previous_next_cache_timeout = 60 * 10
     sbadmin_tabs = None
     request_data = None
     menu_label = None
@@ -1050,63 +1140,116 @@ class SBAdmin(
             request, object_id
         )
 
-        view_id = self.get_id()
-        try:
-            page_num = int(list_action.table_params.get(TABLE_PARAMS_PAGE_NAME, 1))
-        except (TypeError, ValueError):
-            page_num = 1
-        page_size = list_action.page_size
-
-        ordering = list(list_action.get_order_by_from_request() or ["pk"])
-
-        # Page window + one row of overhang on each side so prev/next crosses
-        # the page boundary without a second query.
-        from_item = max(0, (page_num - 1) * page_size - 1)
-        to_item = page_num * page_size + 1
-        base_qs = list_action.build_final_data_count_queryset(
-            additional_filter, apply_plugins=False
-        )
-        window_pks = list(
-            base_qs.order_by(*ordering).values_list("pk", flat=True)[from_item:to_item]
-        )
-
+        page_num = list_action.get_page_num_from_request()
         try:
             current_pk = self.model._meta.pk.to_python(object_id)
-            local_idx = window_pks.index(current_pk)
-        except (ValidationError, ValueError, TypeError):
+        except ValidationError:
             return {}
 
-        def neighbor_url(target_idx):
-            if not 0 <= target_idx < len(window_pks):
-                return None
-            target_page = (from_item + target_idx) // page_size + 1
-            view_params = all_params.get(view_id, {})
-            new_all_params = {
-                **all_params,
-                view_id: {
-                    **view_params,
-                    TABLE_PARAMS_NAME: {
-                        **view_params.get(TABLE_PARAMS_NAME, {}),
-                        TABLE_PARAMS_PAGE_NAME: target_page,
-                    },
-                },
-            }
-            new_filters = urllib.parse.urlencode(
-                {
-                    "params": SBAdminViewService.json_dumps_for_url(
-                        new_all_params, request
-                    )
-                }
+        # The list JSON endpoint remembers the ordered pks of every page it
+        # served; the detail reuses them and queries only when the cache
+        # misses or the user walks off the end of a remembered page.
+        page_window = (
+            None if additional_filter else list_action.get_page_window(page_num)
+        )
+        if page_window is None or current_pk not in page_window["pks"]:
+            page_window = self.fetch_previous_next_window(
+                list_action, page_num, additional_filter
             )
-            return f"{self.get_detail_url(window_pks[target_idx])}?_changelist_filters={new_filters}"
+        if current_pk not in page_window["pks"]:
+            return {}
+
+        page_pks = page_window["pks"]
+        total_count = page_window["total_count"]
+        local_idx = page_pks.index(current_pk)
+
+        previous_target = None
+        if local_idx > 0:
+            previous_target = (page_pks[local_idx - 1], page_num)
+        elif page_num > 1:
+            previous_pks = self.get_previous_next_page_pks(
+                list_action, page_num - 1, additional_filter, total_count
+            )
+            if previous_pks:
+                previous_target = (previous_pks[-1], page_num - 1)
+
+        next_target = None
+        if local_idx < len(page_pks) - 1:
+            next_target = (page_pks[local_idx + 1], page_num)
+        elif page_num * list_action.page_size < total_count:
+            next_pks = self.get_previous_next_page_pks(
+                list_action, page_num + 1, additional_filter, total_count
+            )
+            if next_pks:
+                next_target = (next_pks[0], page_num + 1)
 
         return {
-            "previous_url": neighbor_url(local_idx - 1),
-            "next_url": neighbor_url(local_idx + 1),
-            "current_index": from_item + local_idx + 1,
-            "all_objects_count": base_qs.count(),
+            "previous_url": self.get_previous_next_url(
+                request, all_params, previous_target
+            ),
+            "next_url": self.get_previous_next_url(request, all_params, next_target),
+            "current_index": (page_num - 1) * list_action.page_size + local_idx + 1,
+            "all_objects_count": total_count,
         }
 
+    def fetch_previous_next_window(
+        self, list_action, page_num, additional_filter=None, total_count=None
+    ) -> dict[str, Any]:
+        """Query the ordered pks of one list page (and the total count unless
+        already known); remembered for the next detail page when the
+        navigation is not narrowed by an additional filter.
+
+        The page comes from the list's own data queryset, so search ranking
+        and the list plugins order it exactly like the list JSON; only its
+        pks are selected."""
+        page_qs = list_action.build_final_data_queryset(
+            page_num, list_action.page_size, additional_filter
+        )
+        if total_count is None:
+            total_count = list_action.build_final_data_count_queryset(
+                additional_filter
+            ).count()
+        page_window = {
+            "pks": list_action.get_page_pks_from_queryset(page_qs),
+            "total_count": total_count,
+        }
+        if not additional_filter:
+            list_action.remember_page_window(page_num, **page_window)
+        return page_window
+
+    def get_previous_next_page_pks(
+        self, list_action, page_num, additional_filter, total_count
+    ) -> list[Any]:
+        page_window = (
+            None if additional_filter else list_action.get_page_window(page_num)
+        )
+        if page_window is None:
+            page_window = self.fetch_previous_next_window(
+                list_action, page_num, additional_filter, total_count
+            )
+        return page_window["pks"]
+
+    def get_previous_next_url(self, request, all_params, target) -> str | None:
+        if target is None:
+            return None
+        target_pk, target_page = target
+        view_id = self.get_id()
+        view_params = all_params.get(view_id, {})
+        new_all_params = {
+            **all_params,
+            view_id: {
+                **view_params,
+                TABLE_PARAMS_NAME: {
+                    **view_params.get(TABLE_PARAMS_NAME, {}),
+                    TABLE_PARAMS_PAGE_NAME: target_page,
+                },
+            },
+        }
+        new_filters = urllib.parse.urlencode(
+            {"params": SBAdminViewService.json_dumps_for_url(new_all_params, request)}
+        )
+        return f"{self.get_detail_url(target_pk)}?_changelist_filters={new_filters}"
+
     def add_view(self, request, form_url="", extra_context=None):
         extra_context = extra_context or {}
         extra_context.update(self.get_global_context(request, None))
@@ -1139,6 +1282,9 @@ class SBAdmin(
             return partial_response
 
         context["media"] += self.get_change_view_widget_media(request, obj)
+        SBAdminAutocompleteWidget.prefetch_selected_options(
+            request, self.get_change_form_forms(context)
+        )
 
         if context.get("sbadmin_is_modal"):
             media = context["media"]
@@ -1155,6 +1301,25 @@ class SBAdmin(
             request, context, add=add, change=change, form_url=form_url, obj=obj
         )
 
+    @classmethod
+    def get_change_form_forms(cls, context):
+        """Main form plus the forms of every rendered (non-deferred) inline,
+        nested inlines included."""
+        adminform = context.get("adminform")
+        if adminform is not None:
+            yield adminform.form
+        formsets = [
+            inline_admin_formset.formset
+            for inline_admin_formset in context.get("inline_admin_formsets", ())
+        ]
+        while formsets:
+            formset = formsets.pop(0)
+            if getattr(formset, "is_deferred", False):
+                continue
+            for form in formset.forms:
+                yield form
+                formsets.extend(getattr(form, "nested_formsets", None) or [])
+
     def _render_inline_partial_for_htmx(self, request, context):
         inline_prefix = get_inline_partial_prefix(request)
         if not inline_prefix:
@@ -1347,6 +1512,10 @@ class SBAdminInline(
     sb_admin_add_modal = False
     validate_min = False
     validate_max = False
+    # render a placeholder on the change form and load the rows through an
+    # HTMX partial once the inline scrolls into view
+    sbadmin_deferred = False
+    sbadmin_deferred_count_cache_timeout = 60
 
     def get_instance_label(self, request, obj: Model | None = None) -> str | None:
         if obj:
@@ -1564,8 +1733,17 @@ class SBAdminInline(
         self.threadsafe_request = request
         self.parent_instance = obj
 
-    def get_dynamic_region_form_class(self, request, obj=None):
-        return self.get_formset(request, None).form
+    def get_dynamic_region_form_class(self, request, obj=None, fields=None):
+        if fields is None:
+            return self.get_formset(request, None).form
+        return self.get_formset(
+            request,
+            None,
+            fields=fields,
+            all_base_fields=self.get_dynamic_region_model_field_names(
+                fields, editable=True
+            ),
+        ).form
 
     def formfield_for_dbfield(self, db_field, request, **kwargs):
         formfield = super().formfield_for_dbfield(db_field, request, **kwargs)
@@ -1574,9 +1752,17 @@ class SBAdminInline(
         return formfield
 
     def get_formset(self, request, obj=None, **kwargs):
-        self.initialize_all_base_fields_form(request)
+        self.initialize_all_base_fields_form(
+            request, kwargs.pop("all_base_fields", "__all__")
+        )
         kwargs.update(validate_min=self.validate_min, validate_max=self.validate_max)
         formset = super().get_formset(request, obj, **kwargs)
+        if self.get_sbadmin_deferred(request):
+            formset = type(
+                f"Deferred{formset.__name__}", (DeferredFormSetBase, formset), {}
+            )
+            formset.request = request
+            formset.count_cache_timeout = self.sbadmin_deferred_count_cache_timeout
         formset.parent_change = bool(obj)
         form_class = formset.form
         form_class = self.get_dynamic_form_class(form_class)
@@ -1584,6 +1770,9 @@ class SBAdminInline(
         formset.form = form_class
         return formset
 
+    def get_sbadmin_deferred(self, request) -> bool:
+        return self.sbadmin_deferred and not is_modal(request)
+
     # Restricted inline-data batch read (used by MCP) lives in
     # ``django_smartbase_admin.mcp.service.SBAdminMCPDetailService`` so the
     # API-only plumbing stays out of normal admin flow.
@@ -1,12 +1,13 @@
 import json
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 from django import forms
 from django.apps import apps as django_apps
 from django.contrib.auth.models import Permission
-from django.core.exceptions import ImproperlyConfigured
+from django.core.exceptions import EmptyResultSet, ImproperlyConfigured
+from django.db.models import Count, Max
 from django.utils.text import capfirst
-from django.utils.translation import gettext_lazy as _
+from django.utils.translation import get_language, gettext_lazy as _
 
 from django_smartbase_admin.admin.widgets import SBAdminBaseWidget
 
@@ -168,6 +169,31 @@ class PermissionRenderSection:
     def has_custom_permissions(self):
         return any(model.has_custom_permissions for model in self.models)
 
+    @property
+    def selected_ids_json(self):
+        return json.dumps(
+            sorted(
+                {
+                    permission_id
+                    for model in self.models
+                    for row in [*model.standard_perms.values(), *model.custom_perms]
+                    if row is not None and row.selected
+                    for permission_id in row.permission_ids
+                }
+            )
+        )
+
+
+# ``(db alias, queryset SQL)`` -> ``{"version", "permissions", "sections"}``.
+# Process-local; ``version`` (row count + max id of the queryset) catches
+# permissions added elsewhere, signals (see ``apps.py``) clear it on
+# ``post_migrate`` and Permission writes in this process.
+_permission_catalogue_cache = {}
+
+
+def invalidate_permission_catalogue(**kwargs):
+    _permission_catalogue_cache.clear()
+
 
 class SBAdminPermissionWidget(SBAdminBaseWidget, forms.Widget):
     """Collapsible, searchable permission tree widget for ``auth.Permission``.
@@ -185,6 +211,11 @@ class SBAdminPermissionWidget(SBAdminBaseWidget, forms.Widget):
     Unbound forms select no permissions by default. Pass ``preselect_all=True``
     only when a new object should intentionally start with every queryset
     permission selected.
+
+    The permission catalogue and its grouped tree are cached per process,
+    so a render only overlays the selected ids. ``lazy_sections=True``
+    renders sections collapsed and builds their rows in the browser on
+    first expand (or search), for trees too large to initialise eagerly.
     """
 
     template_name = "sb_admin/widgets/permission_tree.html"
@@ -201,6 +232,7 @@ class SBAdminPermissionWidget(SBAdminBaseWidget, forms.Widget):
         groups=None,
         queryset=None,
         preselect_all=False,
+        lazy_sections=False,
     ):
         super().__init__(
             form_field,
@@ -209,6 +241,7 @@ class SBAdminPermissionWidget(SBAdminBaseWidget, forms.Widget):
         self._groups = groups or []
         self.queryset = queryset
         self.preselect_all = preselect_all
+        self.lazy_sections = lazy_sections
 
     # ------------------------------------------------------------------
     # Context building
@@ -216,14 +249,21 @@ class SBAdminPermissionWidget(SBAdminBaseWidget, forms.Widget):
 
     def get_context(self, name, value, attrs):
         context = super().get_context(name, value, attrs)
-        permissions = self._get_permission_data()
+        catalogue = self._get_catalogue()
+        permissions = catalogue["permissions"] if catalogue else []
         selected = self._parse_selected_permission_ids(value)
         if value is None and self.preselect_all:
             selected = self._get_default_selected_ids(permissions)
 
-        sections = self._build_group_context(selected, permissions)
+        if catalogue is None:
+            sections = self._build_group_context(selected, permissions)
+        else:
+            sections = self._apply_selection(
+                self._get_cached_sections(catalogue), selected
+            )
 
         context["widget"]["permission_sections"] = sections
+        context["widget"]["lazy_sections"] = self.lazy_sections
         context["widget"]["standard_action_headers"] = [
             {"action": action, "label": STANDARD_ACTION_LABELS[action]}
             for action in STANDARD_ACTIONS
@@ -352,6 +392,62 @@ class SBAdminPermissionWidget(SBAdminBaseWidget, forms.Widget):
         )
         return sections
 
+    def _get_groups_key(self):
+        return tuple(
+            (
+                str(group.label),
+                str(group.help_text),
+                tuple(
+                    (str(option.label), tuple(option.codenames), str(option.help_text))
+                    for option in group.options
+                ),
+            )
+            for group in self._groups
+        )
+
+    def _get_cached_sections(self, catalogue):
+        """Unselected render tree for this widget's groups in the active
+        language, built once per catalogue version."""
+        key = (get_language(), self._get_groups_key())
+        sections = catalogue["sections"].get(key)
+        if sections is None:
+            sections = self._build_group_context(set(), catalogue["permissions"])
+            catalogue["sections"][key] = sections
+        return sections
+
+    @staticmethod
+    def _apply_selection(sections, selected):
+        """Copy of the cached ``sections`` with ``selected`` overlaid; the
+        cached rows themselves are never mutated."""
+
+        def select(row):
+            if row is None:
+                return None
+            return replace(
+                row,
+                selected=all(
+                    permission_id in selected for permission_id in row.permission_ids
+                ),
+            )
+
+        return [
+            replace(
+                section,
+                models=[
+                    replace(
+                        model,
+                        standard_perms={
+                            action: select(row)
+                            for action, row in model.standard_perms.items()
+                        },
+                        custom_perms=[select(row) for row in model.custom_perms],
+                    )
+                    for model in section.models
+                ],
+            )
+            for section in sections
+        ]
+
     @staticmethod
     def _app_verbose_name(app_label):
         try:
@@ -384,6 +480,26 @@ class SBAdminPermissionWidget(SBAdminBaseWidget, forms.Widget):
             return choices_field.queryset
         return Permission.objects.none()
 
+    def _get_catalogue(self):
+        """Cached ``{"permissions", "sections"}`` entry for the widget
+        queryset, or ``None`` when the queryset can't match anything."""
+        qs = self._get_permission_queryset()
+        try:
+            sql, params = qs.query.sql_with_params()
+        except EmptyResultSet:
+            return None
+        key = (qs.db, sql, tuple(map(str, params)))
+        version = qs.order_by().aggregate(count=Count("pk"), max_id=Max("pk"))
+        catalogue = _permission_catalogue_cache.get(key)
+        if catalogue is None or catalogue["version"] != version:
+            catalogue = {
+                "version": version,
+                "permissions": self._get_permission_data(),
+                "sections": {},
+            }
+            _permission_catalogue_cache[key] = catalogue
+        return catalogue
+
     def _get_permission_data(self):
         qs = (
             self._get_permission_queryset()
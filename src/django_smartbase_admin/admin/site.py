@@ -143,6 +143,7 @@ class SBAdminSite(admin.AdminSite):
             PasswordChangeView,
             PasswordChangeDoneView,
         )
+        from django_smartbase_admin.views.metrics_view import SBAdminMetricsView
         from django_smartbase_admin.views.user_config_view import ColorSchemeView
         from django_smartbase_admin.views.view_on_site_redirect_view import (
             ViewOnSiteRedirectView,
@@ -224,6 +225,11 @@ class SBAdminSite(admin.AdminSite):
                     self.admin_view(GlobalFilterView.as_view()),
                     name="global_filter",
                 ),
+                path(
+                    "metrics/",
+                    self.admin_view(SBAdminMetricsView.as_view(), public=True),
+                    name="metrics",
+                ),
                 path(
                     "color-scheme/",
                     self.admin_view(ColorSchemeView.as_view()),
@@ -13,6 +13,7 @@ from django.contrib.admin.widgets import (
 from django.contrib.auth.forms import ReadOnlyPasswordHashWidget
 from django.contrib.postgres.forms import RangeWidget
 from django.core.exceptions import (
+    EmptyResultSet,
     FieldDoesNotExist,
     ImproperlyConfigured,
     PermissionDenied,
@@ -48,6 +49,8 @@ from django_smartbase_admin.engine.filter_widgets import (
 from django_smartbase_admin.services.request_cache import (
     RequestCacheKey,
     cache_on_request,
+    get_cached_on_request,
+    set_on_request,
 )
 from django_smartbase_admin.services.thread_local import SBAdminThreadLocalService
 from django_smartbase_admin.templatetags.sb_admin_tags import (
@@ -995,52 +998,151 @@ class SBAdminAutocompleteWidget(
             self.get_value_field(),
         )
 
+    def load_selected_option_items(self, request, values):
+        """``{str(value): item}`` for ``values``; values without a row map to
+        ``None`` so callers can tell "not found" from "never asked"."""
+        items_by_value = dict.fromkeys((str(value) for value in values), None)
+        if values:
+            for item in self.get_queryset(request).filter(
+                **{f"{self.get_value_field()}__in": values}
+            ):
+                items_by_value[str(self.get_value(request, item))] = item
+        return items_by_value
+
+    def get_selected_option_values(self, request, form):
+        field = form.fields.get(self.field_name)
+        if field is None or not isinstance(field.widget, SBAdminAutocompleteWidget):
+            return []
+        return field.widget.parse_value_list_from_input(
+            request, form[self.field_name].value()
+        )
+
     def get_selected_option_items_from_cache(self, request, parsed_value):
         formset = getattr(getattr(self, "bound_form", None), "_sbadmin_formset", None)
-        if formset is None:
+        if formset is None and not self.initialised:
             return None
+        cache_key = self.get_selected_option_cache_key(request)
+        if formset is None:
+            # Only set by prefetch_selected_options for the main form.
+            items_by_value = get_cached_on_request(cache_key, request=request)
+            if items_by_value is None:
+                return None
+        else:
 
-        def load_items_by_value():
-            values = []
-            value_set = set()
-            for form in formset.forms:
-                field = form.fields.get(self.field_name)
-                if field is None or not isinstance(
-                    field.widget, SBAdminAutocompleteWidget
-                ):
-                    continue
-                raw_value = form[self.field_name].value()
-                for value in field.widget.parse_value_list_from_input(
-                    request, raw_value
-                ):
-                    value_key = str(value)
-                    if value_key in value_set:
-                        continue
-                    value_set.add(value_key)
-                    values.append(value)
-
-            items_by_value = {}
-            if values:
-                for item in self.get_queryset(request).filter(
-                    **{f"{self.get_value_field()}__in": values}
-                ):
-                    items_by_value[str(self.get_value(request, item))] = item
-            return items_by_value
-
-        items_by_value = cache_on_request(
-            self.get_selected_option_cache_key(request),
-            load_items_by_value,
-            request=request,
-        )
+            def load_items_by_value():
+                values = []
+                value_set = set()
+                for form in formset.forms:
+                    for value in self.get_selected_option_values(request, form):
+                        value_key = str(value)
+                        if value_key in value_set:
+                            continue
+                        value_set.add(value_key)
+                        values.append(value)
+                return self.load_selected_option_items(request, values)
+
+            items_by_value = cache_on_request(
+                cache_key, load_items_by_value, request=request
+            )
         parsed_values = (
             parsed_value if isinstance(parsed_value, list) else [parsed_value]
         )
+        if any(str(value) not in items_by_value for value in parsed_values):
+            # The value changed after the batch was loaded.
+            return None
         return [
             items_by_value[str(value)]
             for value in parsed_values
-            if str(value) in items_by_value
+            if items_by_value[str(value)] is not None
         ]
 
+    def get_prefetch_group_key(self, request):
+        """Widgets sharing this key resolve their values with one query, or
+        ``None`` when the widget's queryset can't be batched."""
+        try:
+            sql, params = self.get_queryset(request).query.sql_with_params()
+        except EmptyResultSet:
+            return None
+        return (
+            self.model,
+            self.get_value_field(),
+            self.value_lambda,
+            sql,
+            tuple(map(str, params)),
+        )
+
+    def prepare_prefetch_values(self, values):
+        """Values coerced by the value field; ``None`` when one can't be,
+        leaving the widget to its own query (and its create-value handling)."""
+        try:
+            model_field = self.model._meta.get_field(self.get_value_field())
+            for value in values:
+                model_field.get_prep_value(value)
+        except (FieldDoesNotExist, ValueError, TypeError, ValidationError):
+            return None
+        return values
+
+    @classmethod
+    def iter_form_widgets(cls, forms):
+        for form in forms:
+            for field in form.fields.values():
+                widget = field.widget
+                if isinstance(widget, cls) and widget.initialised:
+                    yield form, widget
+
+    @classmethod
+    def prefetch_selected_options(cls, request, forms):
+        """Resolve the selected values of every autocomplete widget in
+        ``forms`` (main form and inline forms alike) with one query per
+        target queryset, seeding the request cache ``get_context`` reads.
+
+        Non-pk values are also registered for ``add_related_buttons_urls``,
+        which then resolves all related pks of a model in one query."""
+        groups = {}
+        related_values = {}
+        for form, widget in cls.iter_form_widgets(forms):
+            values = widget.prepare_prefetch_values(
+                widget.get_selected_option_values(request, form)
+            )
+            if not values:
+                continue
+            group_key = widget.get_prefetch_group_key(request)
+            if group_key is None:
+                continue
+            group = groups.setdefault(group_key, {"widgets": [], "values": {}})
+            group["widgets"].append(widget)
+            for value in values:
+                group["values"].setdefault(str(value), value)
+            value_field = widget.get_value_field()
+            if value_field != widget.model._meta.pk.name:
+                model_values = related_values.setdefault(
+                    (widget.model._meta.label_lower, value_field), {}
+                )
+                for value in values:
+                    model_values.setdefault(str(value), value)
+
+        for group in groups.values():
+            widget = group["widgets"][0]
+            try:
+                items_by_value = widget.load_selected_option_items(
+                    request, list(group["values"].values())
+                )
+            except (ValueError, TypeError):
+                continue
+            for group_widget in group["widgets"]:
+                set_on_request(
+                    group_widget.get_selected_option_cache_key(request),
+                    items_by_value,
+                    request=request,
+                )
+
+        for (model_label, value_field), values in related_values.items():
+            set_on_request(
+                RequestCacheKey.autocomplete_related_values(model_label, value_field),
+                values,
+                request=request,
+            )
+
     def get_context(self, name, value, attrs):
         context = super().get_context(name, value, attrs)
         self.input_id = (
@@ -1164,18 +1266,12 @@ class SBAdminAutocompleteWidget(
                         related_model_admin.get_detail_url(parsed_value)
                     )
                 else:
-                    try:
-                        related_row = (
-                            related_model_admin.get_queryset(request)
-                            .filter(**{value_field: parsed_value})
-                            .values("pk")
-                            .first()
-                        )
-                    except (ValueError, TypeError):
-                        related_row = None
-                    if related_row is not None:
+                    related_pk = self.get_related_object_pk(
+                        request, related_model_admin, parsed_value
+                    )
+                    if related_pk is not None:
                         context["widget"]["attrs"]["related_edit_url"] = (
-                            related_model_admin.get_detail_url(related_row["pk"])
+                            related_model_admin.get_detail_url(related_pk)
                         )
             if related_model_admin.has_add_permission(request):
                 context["widget"]["attrs"]["related_add_url"] = (
@@ -1184,6 +1280,47 @@ class SBAdminAutocompleteWidget(
         except NotRegistered:
             pass
 
+    def get_related_object_pk(self, request, related_model_admin, parsed_value):
+        value_field = self.get_value_field()
+        model_label = self.model._meta.label_lower
+        prefetched_values = get_cached_on_request(
+            RequestCacheKey.autocomplete_related_values(model_label, value_field),
+            request=request,
+        )
+        if prefetched_values and str(parsed_value) in prefetched_values:
+
+            def load_pks_by_value():
+                pks_by_value = {}
+                try:
+                    rows = (
+                        related_model_admin.get_queryset(request)
+                        .filter(**{f"{value_field}__in": prefetched_values.values()})
+                        .values_list(value_field, "pk")
+                    )
+                    for value, pk in rows:
+                        pks_by_value.setdefault(str(value), pk)
+                except (ValueError, TypeError):
+                    return None
+                return pks_by_value
+
+            pks_by_value = cache_on_request(
+                RequestCacheKey.autocomplete_related_pks(model_label, value_field),
+                load_pks_by_value,
+                request=request,
+            )
+            if pks_by_value is not None:
+                return pks_by_value.get(str(parsed_value))
+        try:
+            related_row = (
+                related_model_admin.get_queryset(request)
+                .filter(**{value_field: parsed_value})
+                .values("pk")
+                .first()
+            )
+        except (ValueError, TypeError):
+            return None
+        return related_row["pk"] if related_row is not None else None
+
     def is_multiselect(self):
         if self.multiselect is not None:
             return self.multiselect
@@ -17,6 +17,20 @@ class SBAdminConfig(AppConfig):
         if settings.SB_ADMIN_CONFIGURATION:
             autodiscover_modules("sb_admin", register_to=sb_admin_site)
 
+        from django_smartbase_admin.services.db_routing import (
+            SBAdminDatabaseRoutingService,
+        )
+        from django_smartbase_admin.services.http_cache import (
+            SBAdminHttpCacheService,
+        )
+        from django_smartbase_admin.services.write_signals import (
+            install_queryset_write_signals,
+        )
+
+        install_queryset_write_signals()
+        SBAdminDatabaseRoutingService.connect_write_signals()
+        SBAdminHttpCacheService.track_registered_views(sb_admin_site)
+
         # Register Django system checks (sbadmin.W001..W003). Imported after
         # autodiscover so the checks see every registered admin.
         from . import checks  # noqa: F401
@@ -30,3 +44,24 @@ class SBAdminConfig(AppConfig):
             SBAdminThreadLocalService.clear_request,
             dispatch_uid="sbadmin_clear_request_contextvar",
         )
+
+        from django.contrib.auth.models import Permission
+        from django.db.models.signals import post_delete, post_migrate, post_save
+        from django_smartbase_admin.admin.permission_widget import (
+            invalidate_permission_catalogue,
+        )
+
+        post_migrate.connect(
+            invalidate_permission_catalogue,
+            dispatch_uid="sbadmin_permission_catalogue_post_migrate",
+        )
+        post_save.connect(
+            invalidate_permission_catalogue,
+            sender=Permission,
+            dispatch_uid="sbadmin_permission_catalogue_post_save",
+        )
+        post_delete.connect(
+            invalidate_permission_catalogue,
+            sender=Permission,
+            dispatch_uid="sbadmin_permission_catalogue_post_delete",
+        )
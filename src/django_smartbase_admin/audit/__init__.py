@@ -13,4 +13,13 @@ Usage:
 
     Then run migrations:
         python manage.py migrate sb_admin_audit
+
+    Optional normalized object index (indexed history lookups on any
+    database, instead of JSON containment over ``affected_objects``):
+        SB_ADMIN_AUDIT_OBJECT_INDEX = True
+        python manage.py sbadmin_audit_index_objects  # backfill existing logs
+
+    Retention (optionally archiving to gzip JSONL first):
+        SB_ADMIN_AUDIT_RETENTION_DAYS = 365
+        python manage.py sbadmin_prune_logs --archive-dir /var/archive/sbadmin
 """
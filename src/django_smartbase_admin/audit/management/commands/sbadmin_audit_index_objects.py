@@ -0,0 +1,66 @@
+"""
+Backfill the normalized affected-object index (``AdminAuditLogObject``)
+for audit log entries written before ``SB_ADMIN_AUDIT_OBJECT_INDEX`` was
+enabled.
+
+Usage:
+    python manage.py sbadmin_audit_index_objects
+    python manage.py sbadmin_audit_index_objects --batch-size 5000 --from-id 100000
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from django_smartbase_admin.audit.models import AdminAuditLog
+from django_smartbase_admin.audit.utils.object_index import index_audit_logs
+
+
+class Command(BaseCommand):
+    help = "Build the audit affected-object index for existing log entries."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Log entries indexed per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            "--from-id",
+            type=int,
+            default=0,
+            help="Start at this log id, e.g. to resume an interrupted run.",
+        )
+
+    def handle(self, *args, batch_size, from_id, **options):
+        batch_size = max(1, batch_size)
+        last_id = from_id - 1
+        logs_count = rows_count = 0
+        fields = (
+            "id",
+            "content_type_id",
+            "object_id",
+            "parent_content_type_id",
+            "parent_object_id",
+            "affected_objects",
+        )
+        while True:
+            logs = list(
+                AdminAuditLog.objects.filter(id__gt=last_id)
+                .order_by("id")
+                .only(*fields)[:batch_size]
+            )
+            if not logs:
+                break
+            # Rows of a batch are replaced, so re-running is safe.
+            with transaction.atomic():
+                rows_count += index_audit_logs(logs)
+            logs_count += len(logs)
+            last_id = logs[-1].id
+            if options["verbosity"] > 1:
+                self.stdout.write(f"Indexed up to log id {last_id}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Indexed {logs_count} audit log entries ({rows_count} index rows)."
+            )
+        )
@@ -0,0 +1,62 @@
+"""
+Backfill the typed object keys (``object_key_int`` / ``object_key_uuid``)
+of audit log entries written before they existed.
+
+Usage:
+    python manage.py sbadmin_audit_object_keys
+    python manage.py sbadmin_audit_object_keys --batch-size 5000 --from-id 100000
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from django_smartbase_admin.audit.models import AdminAuditLog
+from django_smartbase_admin.audit.utils.object_keys import OBJECT_KEY_FIELDS
+
+
+class Command(BaseCommand):
+    help = "Compute the typed object keys of existing audit log entries."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Log entries read per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            "--from-id",
+            type=int,
+            default=0,
+            help="Start at this log id, e.g. to resume an interrupted run.",
+        )
+
+    def handle(self, *args, batch_size, from_id, **options):
+        batch_size = max(1, batch_size)
+        last_id = from_id - 1
+        keyed_count = 0
+        while True:
+            logs = list(
+                AdminAuditLog.objects.filter(
+                    id__gt=last_id,
+                    object_key_int__isnull=True,
+                    object_key_uuid__isnull=True,
+                )
+                .exclude(object_id="")
+                .order_by("id")
+                .only("id", "content_type_id", "object_id")[:batch_size]
+            )
+            if not logs:
+                break
+            keyed_logs = [log for log in logs if log.set_object_keys()]
+            with transaction.atomic():
+                AdminAuditLog.objects.bulk_update(keyed_logs, OBJECT_KEY_FIELDS)
+            keyed_count += len(keyed_logs)
+            last_id = logs[-1].id
+            if options["verbosity"] > 1:
+                self.stdout.write(f"Keyed up to log id {last_id}")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Stored object keys of {keyed_count} audit log entries."
+            )
+        )
@@ -0,0 +1,60 @@
+"""
+Backfill the list summary columns (``summary_fields``, ``change_count``)
+of audit log entries written before they existed.
+
+Usage:
+    python manage.py sbadmin_audit_summarize
+    python manage.py sbadmin_audit_summarize --batch-size 5000 --from-id 100000
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from django_smartbase_admin.audit.models import AdminAuditLog
+from django_smartbase_admin.audit.utils.diff import summarize_changes
+
+
+class Command(BaseCommand):
+    help = "Compute the list summary columns of existing audit log entries."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Log entries updated per transaction (default: 1000).",
+        )
+        parser.add_argument(
+            "--from-id",
+            type=int,
+            default=0,
+            help="Start at this log id, e.g. to resume an interrupted run.",
+        )
+
+    def handle(self, *args, batch_size, from_id, **options):
+        batch_size = max(1, batch_size)
+        last_id = from_id - 1
+        logs_count = 0
+        while True:
+            # Entries written with the columns already have a change count.
+            logs = list(
+                AdminAuditLog.objects.filter(id__gt=last_id, change_count=0)
+                .order_by("id")
+                .only("id", "changes")[:batch_size]
+            )
+            if not logs:
+                break
+            for log in logs:
+                for field_name, value in summarize_changes(log.changes).items():
+                    setattr(log, field_name, value)
+            with transaction.atomic():
+                AdminAuditLog.objects.bulk_update(
+                    logs, ["summary_fields", "change_count"]
+                )
+            logs_count += len(logs)
+            last_id = logs[-1].id
+            if options["verbosity"] > 1:
+                self.stdout.write(f"Summarized up to log id {last_id}")
+        self.stdout.write(
+            self.style.SUCCESS(f"Summarized {logs_count} audit log entries.")
+        )
@@ -13,6 +13,7 @@ from django_smartbase_admin.audit.utils.diff import (
     compute_bulk_diff,
     compute_bulk_snapshot,
     compute_diff,
+    summarize_changes,
 )
 from django_smartbase_admin.audit.utils.serialization import serialize_instance
 
@@ -111,9 +112,12 @@ def _should_audit_model(model) -> bool:
         return False
 
     # Never audit the audit log itself to prevent infinite recursion
-    from django_smartbase_admin.audit.models import AdminAuditLog
+    from django_smartbase_admin.audit.models import (
+        AdminAuditLog,
+        AdminAuditLogObject,
+    )
 
-    if model == AdminAuditLog:
+    if model in (AdminAuditLog, AdminAuditLogObject):
         return False
 
     # Skip models in the skip list
@@ -310,7 +314,11 @@ def _create_audit_log(
     affected_objects: list | None = None,
 ):
     """Create an audit log entry. Uses transaction.atomic() to not break main transaction."""
-    from django_smartbase_admin.audit.models import AdminAuditLog
+    from django_smartbase_admin.audit.models import AdminAuditLog, AdminAuditLogObject
+    from django_smartbase_admin.audit.utils.object_index import (
+        build_index_rows,
+        is_object_index_enabled,
+    )
 
     # Wrap everything in transaction.atomic() so any DB error (ContentType lookup,
     # _extract_fk_affected, _get_parent_context, or the INSERT itself)
@@ -354,6 +362,7 @@ def _create_audit_log(
                 "source": source,
                 "snapshot_before": snapshot_before or {},
                 "changes": changes or {},
+                **summarize_changes(changes),
                 "is_bulk": is_bulk,
                 "bulk_count": bulk_count,
             }
@@ -378,7 +387,9 @@ def _create_audit_log(
                 audit_kwargs["parent_object_id"] = parent_id
                 audit_kwargs["parent_object_repr"] = parent_repr
 
-            AdminAuditLog.objects.create(**audit_kwargs)
+            log = AdminAuditLog.objects.create(**audit_kwargs)
+            if is_object_index_enabled():
+                AdminAuditLogObject.objects.bulk_create(build_index_rows(log))
 
     except Exception:
         logger.exception(
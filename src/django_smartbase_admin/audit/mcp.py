@@ -81,7 +81,11 @@ def get_admin_history(
     )
     total = qs.count()
     offset = max(0, (page - 1) * page_size)
-    rows = qs[offset : offset + page_size].select_related("user")
+    rows = (
+        qs[offset : offset + page_size]
+        .select_related("user")
+        .defer("snapshot_before", "affected_objects")
+    )
 
     return {
         "data": [
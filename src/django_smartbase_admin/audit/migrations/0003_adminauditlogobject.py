@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('sb_admin_audit', '0002_adminauditlog_source'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AdminAuditLogObject',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('object_id', models.CharField(max_length=255)),
+                ('role', models.CharField(choices=[('object', 'Object'), ('parent', 'Parent'), ('affected', 'Affected')], max_length=16)),
+                ('content_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='contenttypes.contenttype')),
+                ('log', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='indexed_objects', to='sb_admin_audit.adminauditlog')),
+            ],
+            options={
+                'verbose_name': 'Admin Audit Log Object',
+                'verbose_name_plural': 'Admin Audit Log Objects',
+                'db_table': 'sb_admin_audit_log_object',
+                'indexes': [models.Index(fields=['content_type', 'object_id', 'role', 'log'], name='sb_admin_au_content_1f16a0_idx')],
+            },
+        ),
+    ]
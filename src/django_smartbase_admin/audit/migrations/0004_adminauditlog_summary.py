@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 21:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sb_admin_audit', '0003_adminauditlogobject'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='adminauditlog',
+            name='change_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='adminauditlog',
+            name='summary_fields',
+            field=models.JSONField(blank=True, default=list),
+        ),
+    ]
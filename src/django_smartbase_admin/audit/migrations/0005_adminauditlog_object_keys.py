@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:33
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('sb_admin_audit', '0004_adminauditlog_summary'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='adminauditlog',
+            name='object_key_int',
+            field=models.BigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='adminauditlog',
+            name='object_key_uuid',
+            field=models.UUIDField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='adminauditlog',
+            index=models.Index(fields=['content_type', 'object_key_int'], name='sb_admin_au_content_d4d128_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adminauditlog',
+            index=models.Index(fields=['content_type', 'object_key_uuid'], name='sb_admin_au_content_dbb8ff_idx'),
+        ),
+    ]
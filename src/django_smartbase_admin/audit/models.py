@@ -3,6 +3,9 @@ from django.contrib.contenttypes.models import ContentType
 from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
+# Potentially large JSON columns, only read by the log entry detail view.
+AUDIT_PAYLOAD_FIELDS = ("snapshot_before", "changes", "affected_objects")
+
 
 class AdminAuditLog(models.Model):
     """Complete audit log for admin operations."""
@@ -38,6 +41,9 @@ class AdminAuditLog(models.Model):
         related_name="+",
     )
     object_id = models.TextField(blank=True)
+    # ``object_id`` of integer/UUID pk models, see ``utils.object_keys``.
+    object_key_int = models.BigIntegerField(null=True, blank=True)
+    object_key_uuid = models.UUIDField(null=True, blank=True)
     object_repr = models.CharField(max_length=255)
 
     # ─── Parent context (for inline edits) ───
@@ -63,6 +69,11 @@ class AdminAuditLog(models.Model):
     snapshot_before = models.JSONField(default=dict, blank=True)
     changes = models.JSONField(default=dict, blank=True)
 
+    # ─── List summary (written with ``changes``, read by the list view) ───
+    # First changed field names and their total, see ``summarize_changes``.
+    summary_fields = models.JSONField(default=list, blank=True)
+    change_count = models.PositiveIntegerField(default=0)
+
     # ─── Bulk operation ───
     is_bulk = models.BooleanField(default=False, db_index=True)
     bulk_count = models.IntegerField(default=0)
@@ -72,6 +83,9 @@ class AdminAuditLog(models.Model):
     # Allows tracking multiple types of affected objects
     affected_objects = models.JSONField(default=list, blank=True)
 
+    # Days to keep, see ``SBAdminRetentionService`` / ``sbadmin_prune_logs``.
+    sbadmin_retention_days_setting = "SB_ADMIN_AUDIT_RETENTION_DAYS"
+
     class Meta:
         app_label = "sb_admin_audit"
         db_table = "sb_admin_audit_log"
@@ -80,6 +94,8 @@ class AdminAuditLog(models.Model):
         ordering = ["-timestamp"]
         indexes = [
             models.Index(fields=["content_type", "object_id"]),
+            models.Index(fields=["content_type", "object_key_int"]),
+            models.Index(fields=["content_type", "object_key_uuid"]),
             models.Index(fields=["parent_content_type", "parent_object_id"]),
             GinIndex(fields=["affected_objects"]),  # Fast JSON contains queries
             models.Index(fields=["user", "timestamp"]),
@@ -90,3 +106,72 @@ class AdminAuditLog(models.Model):
         return (
             f"{self.timestamp} - {self.user} - {self.action_type} - {self.object_repr}"
         )
+
+    def save(self, *args, **kwargs):
+        if self.object_key_int is None and self.object_key_uuid is None:
+            self.set_object_keys()
+        super().save(*args, **kwargs)
+
+    def set_object_keys(self) -> bool:
+        """Fill the typed key of ``object_id``; ``False`` if it has none."""
+        from django_smartbase_admin.audit.utils.object_keys import build_object_keys
+
+        if not self.object_id or not self.content_type_id:
+            return False
+        model = ContentType.objects.get_for_id(self.content_type_id).model_class()
+        object_keys = build_object_keys(model, self.object_id)
+        for field_name, value in object_keys.items():
+            setattr(self, field_name, value)
+        return bool(object_keys)
+
+    @classmethod
+    def sbadmin_after_archive_import(cls, logs) -> None:
+        """Index entries loaded back by ``SBAdminRetentionService.import_archive``,
+        in the same transaction as their batch."""
+        from django_smartbase_admin.audit.utils.object_index import (
+            index_audit_logs,
+            is_object_index_enabled,
+        )
+
+        if is_object_index_enabled():
+            index_audit_logs(logs)
+
+
+class AdminAuditLogObject(models.Model):
+    """Normalized ``(log, content type, object id, role)`` rows for history
+    lookups, written next to each log entry when
+    ``SB_ADMIN_AUDIT_OBJECT_INDEX`` is enabled.
+
+    The composite btree index serves object history on any database,
+    without JSON containment over ``affected_objects``.
+    """
+
+    class Role(models.TextChoices):
+        OBJECT = "object", "Object"
+        PARENT = "parent", "Parent"
+        AFFECTED = "affected", "Affected"
+
+    log = models.ForeignKey(
+        AdminAuditLog,
+        on_delete=models.CASCADE,
+        related_name="indexed_objects",
+    )
+    content_type = models.ForeignKey(
+        ContentType,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    object_id = models.CharField(max_length=255)
+    role = models.CharField(max_length=16, choices=Role.choices)
+
+    class Meta:
+        app_label = "sb_admin_audit"
+        db_table = "sb_admin_audit_log_object"
+        verbose_name = "Admin Audit Log Object"
+        verbose_name_plural = "Admin Audit Log Objects"
+        indexes = [
+            models.Index(fields=["content_type", "object_id", "role", "log"]),
+        ]
+
+    def __str__(self):
+        return f"{self.log_id} - {self.role} - {self.content_type_id}:{self.object_id}"
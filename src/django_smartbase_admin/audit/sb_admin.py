@@ -16,7 +16,6 @@ from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 
 from django_smartbase_admin.admin.admin_base import SBAdmin
-from django_smartbase_admin.engine.actions import sbadmin_action
 from django_smartbase_admin.engine.const import DETAIL_STRUCTURE_RIGHT_CLASS
 from django_smartbase_admin.engine.field import SBAdminField
 from django_smartbase_admin.engine.field_formatter import BadgeType, format_badge
@@ -29,7 +28,19 @@ from django_smartbase_admin.engine.filter_widgets import (
     SBAdminFilterWidget,
 )
 
-from django_smartbase_admin.audit.models import AdminAuditLog
+from django_smartbase_admin.audit.models import AUDIT_PAYLOAD_FIELDS, AdminAuditLog
+from django_smartbase_admin.audit.utils.diff import (
+    SUMMARY_FIELDS_LIMIT,
+    summarize_changes,
+)
+from django_smartbase_admin.audit.utils.object_index import (
+    get_object_history_q,
+    is_object_index_enabled,
+)
+from django_smartbase_admin.audit.utils.object_keys import (
+    build_object_keys,
+    get_object_key_field,
+)
 
 
 def _content_type_filter(request, search_term, forward_data):
@@ -54,6 +65,9 @@ class ObjectHistoryFilterWidget(AutocompleteParseMixin, SBAdminFilterWidget):
     - Parent context (parent_content_type + parent_object_id)
     - Affected objects (affected_objects JSON contains)
 
+    With ``SB_ADMIN_AUDIT_OBJECT_INDEX`` all three come from a single
+    lookup on the ``AdminAuditLogObject`` index instead.
+
     Value format: [{"value": "10:3", "label": "user_config.queuebundle #3"}]
     The value encodes content_type_id:object_id
     """
@@ -95,15 +109,21 @@ class ObjectHistoryFilterWidget(AutocompleteParseMixin, SBAdminFilterWidget):
         if not parsed_values:
             return Q()
 
-        q = Q()
+        objects = []
         for value in parsed_values:
             content_type_id, object_id = self.parse_filter_value(value)
-            if content_type_id is None:
-                continue
+            if content_type_id is not None:
+                objects.append((content_type_id, object_id))
+
+        if is_object_index_enabled():
+            # Direct, parent and affected rows all live in the index.
+            return get_object_history_q(objects)
 
+        q = Q()
+        for content_type_id, object_id in objects:
             # Get content type label for JSON query
             try:
-                ct = ContentType.objects.get(pk=content_type_id)
+                ct = ContentType.objects.get_for_id(content_type_id)
                 ct_label = f"{ct.app_label}.{ct.model}"
             except ContentType.DoesNotExist:
                 continue
@@ -117,10 +137,19 @@ class ObjectHistoryFilterWidget(AutocompleteParseMixin, SBAdminFilterWidget):
             # OR filter: direct changes, parent context, or affected.
             # JSON ``__contains`` on ``affected_objects`` is Postgres-only
             # — skip on other backends; direct + parent clauses cover the
-            # common cases.
+            # common cases (enable ``SB_ADMIN_AUDIT_OBJECT_INDEX`` to
+            # include affected objects everywhere).
             from django.db import connection
 
-            clause = Q(content_type_id=content_type_id, object_id=str(object_id)) | Q(
+            object_q = Q(content_type_id=content_type_id, object_id=str(object_id))
+            object_keys = build_object_keys(ct.model_class(), object_id)
+            if object_keys:
+                # Entries not backfilled yet have no typed key; match their text.
+                (key_field,) = object_keys
+                object_q = Q(content_type_id=content_type_id, **object_keys) | (
+                    object_q & Q(**{f"{key_field}__isnull": True})
+                )
+            clause = object_q | Q(
                 parent_content_type_id=content_type_id,
                 parent_object_id=str(object_id),
             )
@@ -173,7 +202,9 @@ class AdminAuditLogAdmin(SBAdmin):
                 "summary_parent_obj_id": F("parent_object_id"),
                 "summary_ct_id": F("content_type_id"),
                 "summary_obj_id": F("object_id"),
-                "summary_changes": F("changes"),
+                # Stored summary columns; ``changes`` stays out of the list.
+                "summary_changed_fields": F("summary_fields"),
+                "summary_change_count": F("change_count"),
             },
             filter_disabled=True,
         ),
@@ -424,7 +455,7 @@ class AdminAuditLogAdmin(SBAdmin):
         restriction_q = Q()
         for ct_id in content_type_ids:
             try:
-                ct = ContentType.objects.get(pk=ct_id)
+                ct = ContentType.objects.get_for_id(ct_id)
                 model_class = ct.model_class()
                 if not model_class:
                     continue
@@ -436,11 +467,18 @@ class AdminAuditLogAdmin(SBAdmin):
                 allowed_ids = restricted_qs.annotate(
                     _pk_str=Cast("pk", output_field=TextField())
                 ).values("_pk_str")
-
-                restriction_q |= Q(
-                    content_type_id=ct_id,
-                    object_id__in=Subquery(allowed_ids),
-                )
+                text_q = Q(content_type_id=ct_id, object_id__in=Subquery(allowed_ids))
+
+                key_field = get_object_key_field(model_class)
+                if key_field:
+                    # Typed key: a native pk comparison both sides can index.
+                    # Entries not backfilled yet still compare as text.
+                    restriction_q |= Q(
+                        content_type_id=ct_id,
+                        **{f"{key_field}__in": restricted_qs.values("pk")},
+                    ) | (text_q & Q(**{f"{key_field}__isnull": True}))
+                    continue
+                restriction_q |= text_q
             except Exception:
                 pass
 
@@ -603,6 +641,7 @@ class AdminAuditLogAdmin(SBAdmin):
             AdminAuditLog.objects.filter(request_id=obj.request_id)
             .exclude(pk=obj.pk)
             .select_related("content_type")
+            .defer(*AUDIT_PAYLOAD_FIELDS)
             .order_by("timestamp")
         )
         total = qs.count()
@@ -648,17 +687,11 @@ class AdminAuditLogAdmin(SBAdmin):
 
     _OBJECT_HISTORY_FILTER_CACHE_KEY = "_audit_object_history_filter"
 
-    @sbadmin_action(permission="view")
-    def action_list_json(self, request, modifier, object_id=None, page_size=None):
+    def get_list_json_data(self, request, page_size=None):
         """Override to ensure object_history filter is cached before processing rows."""
         # Ensure filter is parsed and cached (may already be done by get_queryset)
         self._parse_and_cache_object_history_filter(request)
-        return super().action_list_json(
-            request,
-            modifier,
-            object_id=object_id,
-            page_size=page_size,
-        )
+        return super().get_list_json_data(request, page_size=page_size)
 
     def _get_object_history_widget(self):
         """Get the ObjectHistoryFilterWidget instance from sbadmin_list_display."""
@@ -673,7 +706,7 @@ class AdminAuditLogAdmin(SBAdmin):
         """Get cached object_history filter value.
 
         Returns tuple (content_type_id, object_id) or None if not filtered.
-        Cached by _parse_and_cache_object_history_filter (called from get_queryset / action_list_json).
+        Cached by _parse_and_cache_object_history_filter (called from get_queryset / get_list_json_data).
         """
         try:
             from django_smartbase_admin.services.thread_local import (
@@ -703,7 +736,8 @@ class AdminAuditLogAdmin(SBAdmin):
         obj_repr,
         is_bulk,
         bulk_count,
-        changes,
+        changed_fields,
+        change_count,
         parent_model="",
         parent_repr="",
         hide_obj=False,
@@ -723,11 +757,11 @@ class AdminAuditLogAdmin(SBAdmin):
         elif action == "delete":
             msg = f"Deleted {subject.strip()}."
         else:
-            changed_fields = list(changes.keys()) if isinstance(changes, dict) else []
+            changed_fields = changed_fields[:SUMMARY_FIELDS_LIMIT]
             if changed_fields:
-                fields_str = ", ".join(f.replace("_", " ") for f in changed_fields[:5])
-                if len(changed_fields) > 5:
-                    fields_str += f" (+{len(changed_fields) - 5} more)"
+                fields_str = ", ".join(f.replace("_", " ") for f in changed_fields)
+                if change_count > len(changed_fields):
+                    fields_str += f" (+{change_count - len(changed_fields)} more)"
                 msg = f"Changed {subject}— {fields_str}."
             else:
                 msg = f"Changed {subject.strip()}."
@@ -748,7 +782,8 @@ class AdminAuditLogAdmin(SBAdmin):
             obj_repr=escape(value or ""),
             is_bulk=additional_data.get("summary_is_bulk", False),
             bulk_count=additional_data.get("summary_bulk_count", 0),
-            changes=additional_data.get("summary_changes") or {},
+            changed_fields=additional_data.get("summary_changed_fields") or [],
+            change_count=additional_data.get("summary_change_count") or 0,
             parent_model=additional_data.get("summary_parent_model") or "",
             parent_repr=escape(additional_data.get("summary_parent_repr") or ""),
             hide_obj=self._filter_matches(
@@ -774,6 +809,7 @@ class AdminAuditLogAdmin(SBAdmin):
         if not obj:
             return "-"
 
+        summary = summarize_changes(obj.changes)
         msg, parent_context = self._build_summary(
             action=obj.action_type,
             model=(
@@ -784,7 +820,8 @@ class AdminAuditLogAdmin(SBAdmin):
             obj_repr=obj.object_repr or f"#{obj.object_id}",
             is_bulk=obj.is_bulk,
             bulk_count=obj.bulk_count or 0,
-            changes=obj.changes,
+            changed_fields=summary["summary_fields"],
+            change_count=summary["change_count"],
             parent_model=(
                 obj.parent_content_type.model if obj.parent_content_type else ""
             ),
@@ -0,0 +1,110 @@
+"""Normalized affected-object index (``SB_ADMIN_AUDIT_OBJECT_INDEX``):
+rows written next to each log entry, history lookups through the index
+on any backend, and the backfill command for existing entries.
+"""
+
+from io import StringIO
+
+from django.contrib.auth.models import Group, Permission, User
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import override_settings
+
+from django_smartbase_admin.audit.models import AdminAuditLog, AdminAuditLogObject
+from django_smartbase_admin.audit.sb_admin import ObjectHistoryFilterWidget
+from django_smartbase_admin.audit.tests.test_audit_integration import (
+    BaseAuditTest,
+    MockModelAdmin,
+    MockSBAdminContext,
+    NoAdminContext,
+)
+
+
+class ObjectIndexTestBase(BaseAuditTest):
+    def setUp(self):
+        super().setUp()
+        self.request = self.factory.post("/admin/")
+        self.request.user = self.admin_user
+        self.ct_user = ContentType.objects.get_for_model(User)
+        self.ct_group = ContentType.objects.get_for_model(Group)
+        self.ct_permission = ContentType.objects.get_for_model(Permission)
+        with NoAdminContext():
+            self.permission = Permission.objects.create(
+                codename="index_fk", name="Index FK", content_type=self.ct_user
+            )
+        AdminAuditLog.objects.all().delete()
+
+    def change_permission_content_type(self):
+        self.permission.content_type = self.ct_group
+        with MockSBAdminContext(
+            user=self.admin_user,
+            parent_model=User,
+            parent_object_id=str(self.admin_user.pk),
+        ):
+            MockModelAdmin(Permission).save_model(
+                self.request, self.permission, form=None, change=True
+            )
+        return AdminAuditLog.objects.get(action_type="update")
+
+    def history(self, content_type, object_id):
+        widget = ObjectHistoryFilterWidget()
+        return AdminAuditLog.objects.filter(
+            widget._filter_by_object_history(
+                self.request, [f"{content_type.pk}:{object_id}"]
+            )
+        )
+
+
+@override_settings(SB_ADMIN_AUDIT_OBJECT_INDEX=True)
+class TestObjectIndexWrites(ObjectIndexTestBase):
+    def test_log_entry_indexes_object_parent_and_affected(self):
+        log = self.change_permission_content_type()
+
+        self.assertEqual(
+            set(log.indexed_objects.values_list("content_type", "object_id", "role")),
+            {
+                (self.ct_permission.pk, str(self.permission.pk), "object"),
+                (self.ct_user.pk, str(self.admin_user.pk), "parent"),
+                (self.ct_contenttype_pk(), str(self.ct_user.pk), "affected"),
+                (self.ct_contenttype_pk(), str(self.ct_group.pk), "affected"),
+            },
+        )
+
+    def ct_contenttype_pk(self):
+        return ContentType.objects.get_for_model(ContentType).pk
+
+    def test_history_uses_index_for_every_role(self):
+        log = self.change_permission_content_type()
+        ct_contenttype = ContentType.objects.get_for_model(ContentType)
+
+        for content_type, object_id in (
+            (self.ct_permission, self.permission.pk),
+            (self.ct_user, self.admin_user.pk),
+            (ct_contenttype, self.ct_group.pk),
+        ):
+            with self.assertNumQueries(1):
+                self.assertEqual(list(self.history(content_type, object_id)), [log])
+        self.assertFalse(self.history(ct_contenttype, 0).exists())
+
+    def test_index_rows_are_not_audited(self):
+        self.change_permission_content_type()
+        self.assertEqual(AdminAuditLog.objects.count(), 1)
+
+
+class TestObjectIndexBackfill(ObjectIndexTestBase):
+    def test_backfill_indexes_existing_entries_idempotently(self):
+        log = self.change_permission_content_type()
+        self.assertFalse(AdminAuditLogObject.objects.exists())
+
+        out = StringIO()
+        call_command("sbadmin_audit_index_objects", batch_size=1, stdout=out)
+        call_command("sbadmin_audit_index_objects", stdout=StringIO())
+
+        self.assertIn("Indexed 1 audit log entries (4 index rows).", out.getvalue())
+        self.assertEqual(log.indexed_objects.count(), 4)
+        with override_settings(SB_ADMIN_AUDIT_OBJECT_INDEX=True):
+            self.assertEqual(list(self.history(self.ct_group, "x")), [])
+            ct_contenttype = ContentType.objects.get_for_model(ContentType)
+            self.assertEqual(
+                list(self.history(ct_contenttype, self.ct_group.pk)), [log]
+            )
@@ -0,0 +1,114 @@
+"""Typed object keys: chosen by the pk type, written with each entry,
+used by the restriction filter and backfilled by
+``sbadmin_audit_object_keys``."""
+
+import uuid
+from io import StringIO
+
+from django.contrib.auth.models import Group
+from django.contrib.sessions.models import Session
+from django.core.management import call_command
+from django.db import models
+from django.test import SimpleTestCase
+
+from django_smartbase_admin.audit.models import AdminAuditLog
+from django_smartbase_admin.audit.sb_admin import ObjectHistoryFilterWidget
+from django_smartbase_admin.audit.tests.test_audit_permissions import (
+    BasePermissionsTest,
+)
+from django_smartbase_admin.audit.utils.object_keys import (
+    OBJECT_KEY_INT,
+    OBJECT_KEY_UUID,
+    build_object_keys,
+    get_object_key_field,
+)
+
+
+class UUIDKeyedModel(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+
+    class Meta:
+        app_label = "sb_admin_audit"
+        managed = False
+
+
+class TestObjectKeyFields(SimpleTestCase):
+    def test_key_field_follows_pk_type(self):
+        self.assertEqual(get_object_key_field(Group), OBJECT_KEY_INT)
+        self.assertEqual(get_object_key_field(UUIDKeyedModel), OBJECT_KEY_UUID)
+        self.assertIsNone(get_object_key_field(Session))
+
+    def test_invalid_ids_have_no_key(self):
+        key = uuid.uuid4()
+        self.assertEqual(build_object_keys(Group, "12"), {OBJECT_KEY_INT: 12})
+        self.assertEqual(
+            build_object_keys(UUIDKeyedModel, str(key)), {OBJECT_KEY_UUID: key}
+        )
+        self.assertEqual(build_object_keys(Group, "abc"), {})
+        self.assertEqual(build_object_keys(Session, "abc"), {})
+
+
+class TestTypedKeyRestriction(BasePermissionsTest):
+    def setUp(self):
+        super().setUp()
+        self.entry_g1 = self._create_entry(
+            self.superuser, self.group_ct, self.group1.pk
+        )
+        self.entry_g2 = self._create_entry(
+            self.superuser, self.group_ct, self.group2.pk
+        )
+        self.entry_user = self._create_entry(
+            self.superuser, self.user_ct, self.user_a.pk
+        )
+
+    def test_entries_store_typed_key(self):
+        self.assertEqual(self.entry_g1.object_key_int, self.group1.pk)
+        self.assertIsNone(self.entry_g1.object_key_uuid)
+
+    def test_restriction_compares_typed_keys(self):
+        filter_data = {
+            "content_type": [{"value": str(self.group_ct.pk), "label": "auth.group"}],
+        }
+        request = self._build_request(
+            self.superuser,
+            filter_data,
+            lambda qs, model, **kwargs: (
+                qs.filter(pk=self.group1.pk) if model == Group else qs
+            ),
+        )
+        self.assertEqual(self._get_pks(request), {self.entry_g1.pk, self.entry_user.pk})
+        sql = str(self._get_queryset(request).query)
+
+        self.assertIn('"object_key_int" IN (SELECT', sql)
+        # Only entries without a typed key are compared as text.
+        self.assertIn('"object_key_int" IS NULL', sql)
+
+    def test_entries_without_typed_key_still_match(self):
+        # Written before the typed key columns and not backfilled yet.
+        AdminAuditLog.objects.update(object_key_int=None)
+        request = self._build_request(
+            self.superuser,
+            {"content_type": [{"value": str(self.group_ct.pk), "label": "auth.group"}]},
+            lambda qs, model, **kwargs: (
+                qs.filter(pk=self.group1.pk) if model == Group else qs
+            ),
+        )
+        self.assertEqual(self._get_pks(request), {self.entry_g1.pk, self.entry_user.pk})
+
+        history_q = ObjectHistoryFilterWidget()._filter_by_object_history(
+            request, [f"{self.group_ct.pk}:{self.group2.pk}"]
+        )
+        self.assertEqual(
+            set(AdminAuditLog.objects.filter(history_q).values_list("pk", flat=True)),
+            {self.entry_g2.pk},
+        )
+
+    def test_backfill_stores_keys_of_existing_entries(self):
+        AdminAuditLog.objects.update(object_key_int=None)
+
+        out = StringIO()
+        call_command("sbadmin_audit_object_keys", batch_size=2, stdout=out)
+
+        self.assertIn("Stored object keys of 3 audit log entries.", out.getvalue())
+        self.entry_g2.refresh_from_db()
+        self.assertEqual(self.entry_g2.object_key_int, self.group2.pk)
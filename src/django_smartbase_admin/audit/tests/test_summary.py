@@ -0,0 +1,93 @@
+"""Write-time summary columns of log entries: computed with ``changes``,
+read by the list view instead of ``changes``, and backfilled by
+``sbadmin_audit_summarize``."""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from django_smartbase_admin.admin.site import sb_admin_site
+from django_smartbase_admin.audit.models import AdminAuditLog
+from django_smartbase_admin.audit.sb_admin import AdminAuditLogAdmin
+from django_smartbase_admin.audit.tests.test_audit_integration import NoAdminContext
+from django_smartbase_admin.audit.tests.test_object_index import ObjectIndexTestBase
+from django_smartbase_admin.engine.const import (
+    FILTER_DATA_NAME,
+    TABLE_PARAMS_NAME,
+    TABLE_PARAMS_PAGE_NAME,
+    TABLE_PARAMS_SIZE_NAME,
+)
+from django_smartbase_admin.tests import test_previous_next_window
+
+MANY_CHANGES = {f"field_{index}": {"old": index, "new": None} for index in range(7)}
+
+
+class TestAuditSummary(ObjectIndexTestBase):
+    # Same request fixture as the previous/next window tests.
+    build_request = test_previous_next_window.PreviousNextWindowTests.build_request
+
+    def setUp(self):
+        super().setUp()
+        self.view = AdminAuditLogAdmin(AdminAuditLog, sb_admin_site)
+        self.user = self.admin_user
+
+    def create_unsummarized_log(self):
+        with NoAdminContext():
+            return AdminAuditLog.objects.create(
+                user=self.admin_user,
+                content_type=self.ct_permission,
+                object_id=str(self.permission.pk),
+                object_repr="Legacy",
+                action_type=AdminAuditLog.ActionType.UPDATE,
+                changes=MANY_CHANGES,
+            )
+
+    def load_summaries(self):
+        action = self.view.sbadmin_list_action_class(
+            self.view,
+            self.build_request(),
+            all_params={
+                self.view.get_id(): {
+                    FILTER_DATA_NAME: {},
+                    TABLE_PARAMS_NAME: {
+                        TABLE_PARAMS_PAGE_NAME: 1,
+                        TABLE_PARAMS_SIZE_NAME: 10,
+                    },
+                }
+            },
+        )
+        with CaptureQueriesContext(connection) as queries:
+            rows = action.get_data()["data"]
+        return [row["summary_display"] for row in rows], queries
+
+    def test_summary_columns_are_written_with_the_entry(self):
+        log = self.change_permission_content_type()
+
+        self.assertEqual(log.summary_fields, ["content_type"])
+        self.assertEqual(log.change_count, 1)
+
+    def test_list_reads_summary_columns_without_changes(self):
+        self.change_permission_content_type()
+
+        summaries, queries = self.load_summaries()
+
+        self.assertIn("— content type.", summaries[0])
+        for query in queries:
+            self.assertNotIn('"changes"', query["sql"])
+            self.assertNotIn('"snapshot_before"', query["sql"])
+
+    def test_backfill_summarizes_existing_entries(self):
+        log = self.create_unsummarized_log()
+        self.assertEqual(log.change_count, 0)
+
+        out = StringIO()
+        call_command("sbadmin_audit_summarize", batch_size=1, stdout=out)
+
+        log.refresh_from_db()
+        self.assertIn("Summarized 1 audit log entries.", out.getvalue())
+        self.assertEqual(log.summary_fields, list(MANY_CHANGES)[:5])
+        self.assertEqual(log.change_count, 7)
+        summaries, _queries = self.load_summaries()
+        self.assertIn("field 4 (+2 more).", summaries[0])
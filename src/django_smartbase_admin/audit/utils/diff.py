@@ -7,6 +7,9 @@ from typing import Any
 
 from django_smartbase_admin.audit.utils.serialization import _json_safe
 
+# Changed field names named in a log entry summary.
+SUMMARY_FIELDS_LIMIT = 5
+
 
 def compute_diff(
     before: dict[str, Any],
@@ -60,6 +63,24 @@ def compute_diff(
     return changes
 
 
+def summarize_changes(changes: Any) -> dict[str, Any]:
+    """
+    Compute the summary metadata stored next to ``changes``.
+
+    Args:
+        changes: The ``changes`` value of a log entry.
+
+    Returns:
+        Dictionary with the ``summary_fields`` (first changed field names)
+        and ``change_count`` model field values.
+    """
+    changed_fields = list(changes) if isinstance(changes, dict) else []
+    return {
+        "summary_fields": changed_fields[:SUMMARY_FIELDS_LIMIT],
+        "change_count": len(changed_fields),
+    }
+
+
 def compute_bulk_diff(
     objects_before: list[dict[str, Any]],
     update_values: dict[str, Any],
@@ -0,0 +1,54 @@
+"""
+Typed object keys for audit log entries.
+
+``object_id`` is text so it can hold any pk. Entries of models with an
+integer or UUID pk also store it in ``object_key_int`` /
+``object_key_uuid``, indexed together with ``content_type``, so history
+and restricted-queryset filters compare native values instead of casting
+every pk to text. ``AdminAuditLog.save()`` and archive imports fill them;
+entries written before the columns existed are filled by the
+``sbadmin_audit_object_keys`` management command. Until then the filters
+match those entries (typed key ``NULL``) on ``object_id``.
+"""
+
+from django.core.exceptions import ValidationError
+from django.db import models
+
+OBJECT_KEY_INT = "object_key_int"
+OBJECT_KEY_UUID = "object_key_uuid"
+OBJECT_KEY_FIELDS = (OBJECT_KEY_INT, OBJECT_KEY_UUID)
+
+
+def _get_pk_field(model):
+    pk = model._meta.pk
+    # Multi-table inheritance / one-to-one pks hold the target's pk type.
+    while pk.is_relation:
+        pk = pk.target_field
+    return pk
+
+
+def get_object_key_field(model) -> str | None:
+    """Name of the typed key column for ``model`` entries, or ``None``."""
+    if model is None:
+        return None
+    pk = _get_pk_field(model)
+    if isinstance(pk, models.UUIDField):
+        return OBJECT_KEY_UUID
+    if isinstance(pk, models.IntegerField):
+        return OBJECT_KEY_INT
+    return None
+
+
+def build_object_keys(model, object_id) -> dict:
+    """``{key field: value}`` for an entry of ``model``; empty when the pk
+    has no typed column or ``object_id`` is not a valid pk."""
+    key_field = get_object_key_field(model)
+    if key_field is None or object_id in (None, ""):
+        return {}
+    try:
+        value = _get_pk_field(model).to_python(object_id)
+    except (ValidationError, TypeError, ValueError):
+        return {}
+    if value is None:
+        return {}
+    return {key_field: value}
@@ -45,12 +45,18 @@ Currently checked:
   ``filter_field`` is unset, the rule is ``ordering == name``. Anything
   else makes sort and filter point at different ORM columns.
 
+* ``sbadmin.W006`` — an admin opts into ``sbadmin_http_cache`` while the
+  default cache is process-local (``LocMemCache``). The change watermarks
+  live in that cache and never expire, so a write in one worker never
+  reaches the others, which keep serving 304s and stale bodies.
+
 All warnings rather than errors; misconfigured admins still render, just with
 the symptoms above.
 """
 
 from __future__ import annotations
 
+from django.conf import settings
 from django.core.checks import Tags, Warning, register
 
 from django_smartbase_admin.admin.site import sb_admin_site
@@ -357,12 +363,40 @@ def check_admin_display_ordering_filter_field_for_admin(admin):
     return warnings
 
 
+PROCESS_LOCAL_CACHE_BACKENDS = ("django.core.cache.backends.locmem.LocMemCache",)
+
+
+def check_http_cache_backend_for_admin(admin):
+    """W006: ``sbadmin_http_cache`` with a process-local default cache."""
+    if not getattr(admin, "sbadmin_http_cache", False):
+        return []
+    backend = settings.CACHES.get("default", {}).get("BACKEND")
+    if backend not in PROCESS_LOCAL_CACHE_BACKENDS:
+        return []
+    return [
+        Warning(
+            f"{admin.__class__.__name__} sets sbadmin_http_cache but the "
+            f"default cache ({backend}) is local to each process. Writes in "
+            "one worker never replace the watermarks of the others, which "
+            "keep answering 304 with stale data.",
+            hint=(
+                "Use a cache shared by all workers (Redis, Memcached, "
+                "database) as CACHES['default'], or leave sbadmin_http_cache "
+                "off."
+            ),
+            obj=admin.__class__,
+            id="sbadmin.W006",
+        )
+    ]
+
+
 _PER_ADMIN_CHECKS = (
     check_duplicate_filter_field_for_admin,
     check_view_config_filter_keys_for_admin,
     check_ordering_columns_for_admin,
     check_fake_inline_filter_override_for_admin,
     check_admin_display_ordering_filter_field_for_admin,
+    check_http_cache_backend_for_admin,
 )
 
 
@@ -27,6 +27,13 @@ def sbadmin_action(func=None, **kwargs):
       the current request.
     - ``mcp_description`` (str): Optional description emitted with the MCP
       action schema.
+    - ``max_queries`` (int): Query budget for one call of the action. Going
+      over it logs a warning, or fails under the test runner (see
+      ``services.instrumentation``). Views without a decorator budget fall
+      back to ``sbadmin_query_budgets``.
+    - ``read_only`` (bool): The action only reads, so its queries may go to
+      the read replica (see ``services.db_routing``). Views without the
+      attribute fall back to ``sbadmin_read_only_actions``.
 
     An overriding method replaces the base method's decorator metadata. It
     must therefore redeclare ``mcp_components`` when it should remain exposed.
@@ -1,23 +1,26 @@
 import json
 import urllib.parse
-from collections import defaultdict
 from collections.abc import Iterable
 from copy import copy
 from typing import Any, TYPE_CHECKING
 
 from django import forms
+from django.apps import apps
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.admin.actions import delete_selected
 from django.core.exceptions import ImproperlyConfigured, PermissionDenied
-from django.db.models import F, Q
+from django.db.models import Q
 from django.http import HttpResponse, JsonResponse, HttpRequest, Http404
 from django.shortcuts import redirect
 from django.template.response import TemplateResponse
 from django.urls import NoReverseMatch, reverse
 from django.utils.translation import gettext_lazy as _
 
-from django_smartbase_admin.actions.admin_action_list import SBAdminListAction
+from django_smartbase_admin.actions.admin_action_list import (
+    QueryBuilderService,
+    SBAdminListAction,
+)
 from django_smartbase_admin.engine.actions import (
     SBAdminCustomAction,
     SBAdminRowAction,
@@ -47,10 +50,18 @@ from django_smartbase_admin.engine.const import (
     ACTION_AUTOCOMPLETE_MODIFIER_SEPARATOR,
 )
 from django_smartbase_admin.audit.views import should_link_history_to_audit
+from django_smartbase_admin.engine.reorder import (
+    SBAdminRankReorderEngine,
+    SBAdminReorderEngine,
+)
 from django_smartbase_admin.engine.inline_pagination import SBADMIN_INLINE_PREFIX_HEADER
 from django_smartbase_admin.services.configuration import (
     SBAdminUserConfigurationService,
 )
+from django_smartbase_admin.services.http_cache import SBAdminHttpCacheService
+from django_smartbase_admin.services.instrumentation import (
+    SBAdminInstrumentationService,
+)
 from django_smartbase_admin.services.views import SBAdminViewService
 from django_smartbase_admin.services.xlsx_export import (
     SBAdminXLSXExportService,
@@ -76,6 +87,8 @@ SBADMIN_RELOAD_ON_SAVE_VAR = "sbadmin_reload_on_save"
 
 class SBAdminBaseView(object):
     global_filter_data_map = None
+    sbadmin_query_budgets: dict[str, int] | None = None
+    sbadmin_read_only_actions: tuple[str, ...] | None = None
     sbadmin_detail_actions = None
     menu_label: str | None = None
     add_label: str | None = None
@@ -83,6 +96,10 @@ class SBAdminBaseView(object):
     delete_confirmation_template = "sb_admin/actions/delete_confirmation.html"
     widgets = None
     widget_views = None
+    # Conditional list JSON / autocomplete responses (``services.http_cache``).
+    sbadmin_http_cache = False
+    # Further models (or ``"app_label.Model"``) the list rows read from.
+    sbadmin_http_cache_models: tuple = ()
 
     def init_view_static(self, configuration, model, admin_site):
         self.init_widgets_static(configuration)
@@ -90,9 +107,29 @@ class SBAdminBaseView(object):
     def get_id(self):
         raise NotImplementedError
 
+    def get_sbadmin_http_cache_models(self) -> list:
+        """Models whose changes invalidate this view's cached responses. Read
+        once at startup to connect the watermark signals, so no request."""
+        if not self.sbadmin_http_cache:
+            return []
+        return [
+            apps.get_model(model) if isinstance(model, str) else model
+            for model in (self.model, *self.sbadmin_http_cache_models)
+        ]
+
     def get_menu_label(self) -> str:
         return self.menu_label or self.model._meta.verbose_name_plural
 
+    def get_sbadmin_query_budget(self, request, action_name) -> int | None:
+        """``max_queries`` for ``action_name`` when the action itself does
+        not declare one via ``@sbadmin_action(max_queries=...)``."""
+        return (self.sbadmin_query_budgets or {}).get(action_name)
+
+    def is_sbadmin_read_only_action(self, request, action_name) -> bool:
+        """Whether ``action_name`` may read from the replica when the action
+        does not declare ``@sbadmin_action(read_only=...)`` itself."""
+        return action_name in (self.sbadmin_read_only_actions or ())
+
     def has_permission(self, request, obj=None, permission=None) -> bool:
         return SBAdminViewService.has_permission(
             request=request, view=self, model=self.model, obj=obj, permission=permission
@@ -403,7 +440,7 @@ class SBAdminBaseView(object):
             action_id or getattr(target_view, "action_id", None) or target_view.__name__
         )
 
-    @sbadmin_action(permission="view")
+    @sbadmin_action(permission="view", read_only=True)
     def action_autocomplete(self, request, modifier, object_id=None):
         amap = request.request_data.autocomplete_map
         autocomplete_view = amap.get(modifier)
@@ -419,7 +456,15 @@ class SBAdminBaseView(object):
         if autocomplete_view is None:
             raise Http404
         autocomplete_view.init_view_dynamic(request, request.request_data)
-        return autocomplete_view.action_autocomplete(request, modifier, object_id)
+        cache_models = []
+        if self.sbadmin_http_cache:
+            cache_models = [getattr(autocomplete_view, "model", None)]
+        return SBAdminHttpCacheService.respond(
+            request,
+            self,
+            cache_models,
+            lambda: autocomplete_view.action_autocomplete(request, modifier, object_id),
+        )
 
     def auto_create_field_from_model_field(self, model_field):
         from django_smartbase_admin.engine.field import SBAdminField
@@ -667,12 +712,14 @@ class SBAdminBaseListView(SBAdminBaseView):
     sbadmin_table_history_enabled = True
     sbadmin_list_history_enabled = True
     sbadmin_list_reorder_field = None
+    sbadmin_list_reorder_engine: SBAdminReorderEngine | None = None
     sbadmin_nested: dict | None = None
     sbadmin_list_sticky_header_and_footer = None
     search_field_placeholder = _("Search...")
     filters_version = None
     sbadmin_actions_initialized = False
     sbadmin_list_action_class = SBAdminListAction
+    sbadmin_search_engine = None
     pg_unaccent_ext_cache = {}
 
     def get_list_view_media(self, request):
@@ -768,39 +815,28 @@ class SBAdminBaseListView(SBAdminBaseView):
     def is_reorder_available(self, request) -> str | None:
         return self.sbadmin_list_reorder_field
 
+    def get_sbadmin_list_reorder_engine(self, request) -> SBAdminReorderEngine:
+        return self.sbadmin_list_reorder_engine or SBAdminRankReorderEngine()
+
     @sbadmin_action
     def action_table_reorder(self, request, modifier, object_id=None) -> JsonResponse:
         self.activate_reorder(request)
         qs = self.get_queryset(request)
-        pk_field = SBAdminViewService.get_pk_field_for_model(self.model).name
-        old_order = dict(
-            qs.values_list(pk_field, self.sbadmin_list_reorder_field).order_by(
-                *self.get_list_ordering(request)
-            )
+        pk_field = SBAdminViewService.get_pk_field_for_model(self.model)
+        current_row_id = pk_field.to_python(
+            json.loads(request.POST.get("currentRowId", ""))
+        )
+        replaced_row_id = json.loads(request.POST.get("replacedRowId", "null"))
+        replaced_row_id = (
+            pk_field.to_python(replaced_row_id) if replaced_row_id else None
+        )
+        self.get_sbadmin_list_reorder_engine(request).move(
+            qs,
+            self.sbadmin_list_reorder_field,
+            current_row_id,
+            replaced_row_id,
+            ordering=list(self.get_list_ordering(request)),
         )
-        current_row_id = json.loads(request.POST.get("currentRowId", ""))
-        replaced_row_id = json.loads(request.POST.get("replacedRowId", ""))
-        old_order_ids = list(old_order.keys())
-        current_row_index = old_order_ids.index(current_row_id)
-        new_order_ids = [*old_order_ids]
-        del new_order_ids[current_row_index]
-        if not replaced_row_id:
-            new_order_ids.append(current_row_id)
-        else:
-            replaced_row_index = new_order_ids.index(replaced_row_id)
-            new_order_ids.insert(replaced_row_index, current_row_id)
-        diff_dict = defaultdict(list)
-        for position, item_id in enumerate(new_order_ids):
-            old_position = old_order[item_id]
-            diff = (position + 1) - int(old_position)
-            diff_dict[diff].append(item_id)
-        for diff, item_ids in diff_dict.items():
-            qs.filter(**{f"{pk_field}__in": item_ids}).update(
-                **{
-                    self.sbadmin_list_reorder_field: F(self.sbadmin_list_reorder_field)
-                    + int(diff)
-                }
-            )
         return JsonResponse({"message": request.POST})
 
     def get_table_data_edit_form(self, request, data=None):
@@ -942,6 +978,11 @@ class SBAdminBaseListView(SBAdminBaseView):
             return super().get_search_fields(request)
         return getattr(self, "search_fields", [])
 
+    def get_sbadmin_search_engine(self, request):
+        """Opt-in search engine (see ``engine/search.py``); ``None`` keeps
+        the default per-field ``icontains`` lookups."""
+        return self.sbadmin_search_engine
+
     def get_search_lookup(self, request, field_name: str, prefix: str = "") -> str:
         if prefix == "^":
             return f"{field_name}__istartswith"
@@ -1094,6 +1135,16 @@ class SBAdminBaseListView(SBAdminBaseView):
                 ]
             except Exception:
                 pass
+        if QueryBuilderService.is_debug_enabled(request):
+            list_actions = [
+                *list_actions,
+                SBAdminCustomAction(
+                    title=_("Advanced filter SQL"),
+                    view=self,
+                    action_id=Action.ADVANCED_FILTER_PLAN.value,
+                    open_in_new_tab=True,
+                ),
+            ]
         return self.process_list_actions(
             request,
             list_actions,
@@ -1178,12 +1229,31 @@ class SBAdminBaseListView(SBAdminBaseView):
         )
         return self.sbadmin_xlsx_options
 
-    @sbadmin_action(permission="view")
+    @sbadmin_action(permission="view", read_only=True)
     def action_xlsx_export(self, request, modifier, object_id=None) -> HttpResponse:
         action = self.sbadmin_list_action_class(self, request)
         data = action.get_xlsx_data(request)
         return SBAdminXLSXExportService.create_workbook_http_respone(*data)
 
+    @sbadmin_action(permission="view", read_only=True)
+    def action_advanced_filter_plan(
+        self, request, modifier, object_id=None
+    ) -> JsonResponse:
+        """Debug output of the current advanced filter: its compiled plan and
+        the generated list SQL. Superusers only, behind
+        ``SB_ADMIN_ADVANCED_FILTER_DEBUG`` (defaults to ``DEBUG``)."""
+        if not QueryBuilderService.is_debug_enabled(request):
+            raise PermissionDenied
+        action = self.sbadmin_list_action_class(self, request)
+        response = JsonResponse(
+            QueryBuilderService.get_debug_data_for_list_action(action),
+            json_dumps_params={"indent": 2},
+        )
+        response["Content-Disposition"] = (
+            f'inline; filename="{self.get_id()}-advanced-filter.json"'
+        )
+        return response
+
     @sbadmin_action(permission="delete")
     def action_bulk_delete(self, request, modifier, object_id=None):
         action = self.sbadmin_list_action_class(self, request)
@@ -1307,16 +1377,42 @@ class SBAdminBaseListView(SBAdminBaseView):
             extra_context,
         )
 
-    @sbadmin_action(permission="view")
+    def get_list_json_data(self, request, page_size=None) -> dict[str, Any]:
+        """Row payload of ``action_list_json`` as plain Python, shared with
+        in-process callers (MCP) that don't need the HTTP round trip."""
+        action = self.sbadmin_list_action_class(self, request, page_size=page_size)
+        return action.get_json_data()
+
+    @sbadmin_action(permission="view", read_only=True)
     def action_list_json(
         self, request, modifier, object_id=None, page_size=None
     ) -> JsonResponse:
-        action = self.sbadmin_list_action_class(self, request, page_size=page_size)
-        data = action.get_json_data()
-        notifications_html = render_notifications_if_any(request)
-        if notifications_html:
-            data[SB_ADMIN_AJAX_NOTIFICATIONS_KEY] = notifications_html
-        return JsonResponse(data=data, safe=False)
+
+        def build_response():
+            data = self.get_list_json_data(request, page_size=page_size)
+            notifications_html = render_notifications_if_any(request)
+            if notifications_html:
+                data[SB_ADMIN_AJAX_NOTIFICATIONS_KEY] = notifications_html
+            with SBAdminInstrumentationService.stage("serialize"):
+                return JsonResponse(data=data, safe=False)
+
+        # An in-process ``page_size`` is not part of the request params.
+        cache_models = self.get_sbadmin_http_cache_models() if page_size is None else []
+        return SBAdminHttpCacheService.respond(
+            request, self, cache_models, build_response
+        )
+
+    @sbadmin_action(permission="view", read_only=True)
+    def action_list_json_children(
+        self, request, modifier, object_id=None
+    ) -> JsonResponse:
+        """One page of the rows under a lazily expanded tree row. The list
+        plugins (``TabulatorNestedPlugin``) narrow the pipeline to them and
+        page by keyset, so the page number is always the first one."""
+        action = self.sbadmin_list_action_class(self, request)
+        data = action.get_json_data(page_num=1, remember_page_window=False)
+        with SBAdminInstrumentationService.stage("serialize"):
+            return JsonResponse(data=data, safe=False)
 
     def get_sbadmin_list_filter(self, request) -> Iterable | None:
         return self.sbadmin_list_filter
@@ -1,6 +1,11 @@
+import hashlib
+import json
+
+from django.conf import settings
 from django.contrib.auth import get_permission_codename
 from django.contrib.auth.views import LoginView
 from django.db.models import Q
+from django.utils.translation import get_language
 
 from django_smartbase_admin.admin.site import sb_admin_site
 from django_smartbase_admin.engine.actions import SBAdminCustomAction
@@ -8,6 +13,7 @@ from django_smartbase_admin.engine.const import (
     GLOBAL_FILTER_DATA_KEY,
     FilterVersions,
 )
+from django_smartbase_admin.engine.view_map import SBAdminViewMap
 from django_smartbase_admin.models import (
     ColorScheme,
     SBAdminListViewConfiguration,
@@ -277,14 +283,9 @@ class SBAdminRoleConfiguration(metaclass=Singleton):
         )
 
     def init_registered_views(self):
-        registered_views = []
-        for view in self.registered_views:
-            registered_views.append(view)
-            view.init_view_static(self, None, sb_admin_site)
-            sub_views = view.get_sub_views(self)
-            if sub_views:
-                registered_views.extend(sub_views)
-        self.registered_views = registered_views
+        # Sub views join ``registered_views`` when their parent is initialized.
+        for view in list(self.registered_views):
+            self.view_map.register(view, with_sub_views=True)
 
     def init_menu_items(self):
         for menu_item in self.menu_items:
@@ -322,14 +323,13 @@ class SBAdminRoleConfiguration(metaclass=Singleton):
         return None
 
     def init_view_map(self):
-        self.view_map.update({view.get_id(): view for view in self.registered_views})
-        self.view_map.update(
-            {
-                view.get_id(): view
-                for model, view in sb_admin_site._registry.items()
-                if hasattr(view, "get_id")
-            }
-        )
+        if not isinstance(self.view_map, SBAdminViewMap):
+            self.view_map = SBAdminViewMap(self)
+        for view in self.registered_views:
+            self.view_map.register(view)
+        for model, view in sb_admin_site._registry.items():
+            if hasattr(view, "get_id"):
+                self.view_map.register(view, model)
         try:
             from cms.plugin_pool import plugin_pool
 
@@ -345,14 +345,13 @@ class SBAdminRoleConfiguration(metaclass=Singleton):
                 ):
                     continue
                 view_instance = view(view.model, sb_admin_site)
-                self.view_map[view_instance.get_id()] = view_instance
-                view_instance.init_view_static(self, view_instance.model, sb_admin_site)
+                self.view_map.register(view_instance, view_instance.model)
         except ImportError:
             pass
 
     def init_model_admin_view_map(self):
         for model, admin_view in sb_admin_site._registry.items():
-            admin_view.init_view_static(self, model, sb_admin_site)
+            self.view_map.register(admin_view, model)
 
     def get_global_filter_form_class(self, request):
         return self.global_filter_form
@@ -376,11 +375,15 @@ class SBAdminRoleConfiguration(metaclass=Singleton):
         self.init_menu_items_dynamic(request, request_data)
 
     def init_configuration_static(self):
-        self.view_map = {}
+        """Register the views lazily; each view's ``init_view_static`` runs on
+        its first lookup (see ``engine.view_map``)."""
+        self.view_map = SBAdminViewMap(self)
         self.init_registered_views()
         self.init_view_map()
         self.init_model_admin_view_map()
         self.init_menu_items()
+        if getattr(settings, "SB_ADMIN_VIEW_WARM_UP", False):
+            self.view_map.warm_up()
 
     def dynamically_register_autocomplete_view(self, view):
         """Register into the current request map when a request is active."""
@@ -417,6 +420,43 @@ class SBAdminRoleConfiguration(metaclass=Singleton):
 
         return {"view_id": view_id, "object_id": str(object_id)}
 
+    def get_mcp_schema_cache_key(self, request):
+        """Key under which MCP discovery reuses the permission-filtered admin
+        schema; ``None`` disables reuse for the request.
+
+        Users share a key when they share roles and effective permissions.
+        Override when ``has_permission`` depends on anything else.
+        """
+        user = getattr(request, "user", None)
+        if not getattr(user, "is_authenticated", False):
+            return None
+        if user.is_superuser:
+            permissions = ["*"]
+        else:
+            permissions = sorted(user.get_all_permissions())
+        fingerprint = [
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            get_language(),
+            bool(user.is_staff),
+            self.is_mcp_readonly_request(request),
+            sorted(user.groups.values_list("name", flat=True)),
+            permissions,
+        ]
+        return hashlib.sha1(json.dumps(fingerprint, default=str).encode()).hexdigest()
+
+    def get_http_cache_fingerprint(self, request):
+        """What the user may see, as part of list and autocomplete ETags
+        (see ``services.http_cache``); ``None`` disables conditional
+        responses for the request.
+
+        Per user by default, since ``restrict_queryset`` may narrow rows by
+        user; override to share responses between users of the same roles.
+        """
+        permissions_key = self.get_mcp_schema_cache_key(request)
+        if permissions_key is None:
+            return None
+        return f"{request.user.pk}:{permissions_key}"
+
     def restrict_queryset(
         self,
         qs,
@@ -7,6 +7,7 @@ class Action(Enum):
     TABLE_REORDER_ACTION = "action_table_reorder"
     ENTER_REORDER = "action_enter_reorder"
     LIST_JSON_REORDER = "action_list_json_reorder"
+    LIST_JSON_CHILDREN = "action_list_json_children"
     TABLE_DATA_EDIT = "action_table_data_edit"
     DASHBOARD = "dashboard"
     DETAIL = "detail"
@@ -14,6 +15,7 @@ class Action(Enum):
     CONFIG = "action_config"
     XLSX_EXPORT = "action_xlsx_export"
     BULK_DELETE = "action_bulk_delete"
+    ADVANCED_FILTER_PLAN = "action_advanced_filter_plan"
 
 
 class Formatter(Enum):
@@ -65,6 +67,7 @@ BASE_PARAMS_NAME = "params"
 AUTOCOMPLETE_SEARCH_NAME = "__search_term__"
 AUTOCOMPLETE_FORWARD_NAME = "__forward_data__"
 AUTOCOMPLETE_PAGE_NUM = "__requestedPage__"
+AUTOCOMPLETE_CURSOR_NAME = "__cursor__"
 ACTION_AUTOCOMPLETE_MODIFIER_SEPARATOR = "::"
 GLOBAL_FILTER_DATA_KEY = "global_filter_data"
 GLOBAL_FILTER_ALIAS_WIDGET_ID = "global_alias"
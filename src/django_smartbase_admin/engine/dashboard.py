@@ -24,6 +24,9 @@ from django_smartbase_admin.engine.filter_widgets import (
     DateFilterWidget,
     RadioChoiceFilterWidget,
 )
+from django_smartbase_admin.services.instrumentation import (
+    SBAdminInstrumentationService,
+)
 from django_smartbase_admin.services.views import SBAdminViewService
 from django_smartbase_admin.utils import to_list
 
@@ -128,7 +131,7 @@ class SBAdminDashboardWidget(SBAdminView):
             request, queryset, [parent_instance_id]
         )
 
-    @sbadmin_action(permission="view")
+    @sbadmin_action(permission="view", read_only=True)
     def action_get_data(self, request, modifier, object_id=None):
         return JsonResponse(data={"data": self.get_cached_data(request)})
 
@@ -196,7 +199,8 @@ class SBAdminDashboardWidget(SBAdminView):
             return_data = cache.get(cache_key)
         if return_data:
             return return_data
-        return_data = self.get_data(request)
+        with SBAdminInstrumentationService.measure("widget", self.get_id(), "get_data"):
+            return_data = self.get_data(request)
         if self.cache_enabled:
             cache.set(cache_key, return_data, timeout=60 * 60)
         return return_data
@@ -853,6 +857,6 @@ class SbAdminCalendarWidget(SBAdminDashboardWidget):
         js=("sb_admin/js/fullcalendar.min.js", "sb_admin/dist/calendar.js"),
     )
 
-    @sbadmin_action(permission="view")
+    @sbadmin_action(permission="view", read_only=True)
     def action_get_data(self, request, modifier, object_id=None):
         return JsonResponse(data=self.get_cached_data(request), safe=False)
@@ -0,0 +1,261 @@
+"""Distinct-values search for ``FromValuesAutocompleteWidget``.
+
+The widget offers the distinct values of one (possibly annotated) column.
+Matches are served in two phases: values starting with the search term
+first, then values containing it elsewhere, each ordered by value. Every
+phase is a ``SELECT DISTINCT ... ORDER BY`` continued with a keyset cursor
+(``value > last``) rather than ``GROUP BY`` plus ``OFFSET``, so later pages
+cost the same as the first one.
+
+The prefix phase uses ``prefix_lookup`` (``istartswith`` by default). With
+``prefix_lookup="startswith"`` and a ``varchar_pattern_ops`` index (or an
+index on ``Upper(column)`` for ``istartswith`` on PostgreSQL) it is an index
+range scan.
+
+Low-cardinality columns can be served from a per-field value dictionary::
+
+    FromValuesAutocompleteWidget(
+        distinct_values_engine=SBAdminDistinctValuesEngine(value_dictionary=True),
+    )
+
+The dictionary holds every distinct value visible to the user and lives in
+the default cache. It is rebuilt after ``SB_ADMIN_DISTINCT_VALUES_TIMEOUT``
+seconds and, when the admin opts into ``sbadmin_http_cache``, as soon as a
+write replaces the watermark of one of its models. Columns with more than
+``SB_ADMIN_DISTINCT_VALUES_MAX`` values keep using SQL.
+
+Settings:
+
+- ``SB_ADMIN_DISTINCT_VALUES_TIMEOUT``: seconds a value dictionary is kept
+  (default ``300``)
+- ``SB_ADMIN_DISTINCT_VALUES_MAX``: largest dictionary kept
+  (default ``1000``)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+
+from django_smartbase_admin.services.http_cache import SBAdminHttpCacheService
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+VALUE_DICTIONARY_CACHE_KEY = "sb_admin_distinct_values:{widget_id}:{digest}"
+
+PHASE_ALL = "all"
+PHASE_PREFIX = "prefix"
+PHASE_CONTAINS = "contains"
+
+# Cached in place of a dictionary for columns over the size limit, so the
+# limit is not re-checked on every keystroke.
+_TOO_MANY_VALUES = "__too_many__"
+
+
+@dataclass
+class SBAdminDistinctValuesPage:
+    values: list = field(default_factory=list)
+    # Opaque continuation token; ``None`` on the last page.
+    next_cursor: str | None = None
+
+
+class SBAdminDistinctValuesEngine:
+    """Pages through the distinct values of ``field_name`` matching a term."""
+
+    prefix_lookup = "istartswith"
+    contains_lookup = "icontains"
+
+    def __init__(
+        self,
+        value_dictionary: bool = False,
+        prefix_lookup: str | None = None,
+        max_values: int | None = None,
+        timeout: int | None = None,
+    ) -> None:
+        self.value_dictionary = value_dictionary
+        self.prefix_lookup = prefix_lookup or self.prefix_lookup
+        self.max_values = max_values
+        self.timeout = timeout
+
+    def get_max_values(self) -> int:
+        if self.max_values is not None:
+            return self.max_values
+        return getattr(settings, "SB_ADMIN_DISTINCT_VALUES_MAX", 1000)
+
+    def get_timeout(self) -> int:
+        if self.timeout is not None:
+            return self.timeout
+        return getattr(settings, "SB_ADMIN_DISTINCT_VALUES_TIMEOUT", 300)
+
+    # ─── Cursors ───
+
+    @classmethod
+    def encode_cursor(cls, phase: str, value: Any) -> str:
+        return json.dumps([phase, value], cls=DjangoJSONEncoder)
+
+    @classmethod
+    def decode_cursor(cls, cursor: str | None) -> tuple[str | None, Any]:
+        if not cursor:
+            return None, None
+        try:
+            phase, value = json.loads(cursor)
+        except (TypeError, ValueError):
+            return None, None
+        if phase not in (PHASE_ALL, PHASE_PREFIX, PHASE_CONTAINS):
+            return None, None
+        return phase, value
+
+    # ─── Search ───
+
+    def get_phases(self, field_name: str, search_term: str) -> list[tuple[str, Q]]:
+        if not search_term:
+            return [(PHASE_ALL, Q())]
+        prefix = Q(**{f"{field_name}__{self.prefix_lookup}": search_term})
+        contains = Q(**{f"{field_name}__{self.contains_lookup}": search_term})
+        return [(PHASE_PREFIX, prefix), (PHASE_CONTAINS, contains & ~prefix)]
+
+    def search(
+        self,
+        queryset: "QuerySet",
+        field_name: str,
+        search_term: str,
+        page_size: int,
+        cursor: str | None = None,
+        offset: int = 0,
+    ) -> SBAdminDistinctValuesPage:
+        """One page of matching values, resumed from ``cursor``. ``offset``
+        is only honoured without a cursor, for clients that page by number."""
+        search_term = search_term or ""
+        phases = self.get_phases(field_name, search_term)
+        cursor_phase, after = self.decode_cursor(cursor)
+        phase_names = [name for name, _q in phases]
+        if cursor_phase not in phase_names:
+            cursor_phase, after = None, None
+        else:
+            offset = 0
+            phases = phases[phase_names.index(cursor_phase) :]
+        queryset = queryset.filter(**{f"{field_name}__isnull": False})
+        rows = []
+        for phase, q in phases:
+            qs = queryset.filter(q)
+            if phase == cursor_phase and after is not None:
+                qs = qs.filter(**{f"{field_name}__gt": after})
+            qs = qs.order_by(field_name).values_list(field_name, flat=True).distinct()
+            if offset:
+                # Page-number clients only: skip whole phases by their size.
+                phase_size = qs.count()
+                if offset >= phase_size:
+                    offset -= phase_size
+                    continue
+            needed = page_size + 1 - len(rows)
+            rows.extend((phase, value) for value in qs[offset : offset + needed])
+            offset = 0
+            if len(rows) > page_size:
+                break
+        return self.build_page(rows, page_size)
+
+    def build_page(self, rows: list, page_size: int) -> SBAdminDistinctValuesPage:
+        page = SBAdminDistinctValuesPage(values=[value for _phase, value in rows])
+        if len(rows) > page_size:
+            page.values = page.values[:page_size]
+            page.next_cursor = self.encode_cursor(*rows[page_size - 1])
+        return page
+
+    # ─── Value dictionaries ───
+
+    def get_dictionary_cache_key(self, request, widget) -> str | None:
+        """``None`` when the values cannot be shared between requests."""
+        configuration = request.request_data.configuration
+        fingerprint = configuration.get_http_cache_fingerprint(request)
+        if fingerprint is None:
+            return None
+        models = []
+        get_models = getattr(widget.view, "get_sbadmin_http_cache_models", None)
+        if callable(get_models):
+            models = list(get_models())
+        if models and all(SBAdminHttpCacheService.is_tracked(m) for m in models):
+            versions = sorted(SBAdminHttpCacheService.get_versions(models).items())
+        else:
+            versions = []
+        digest = hashlib.sha1(
+            json.dumps(
+                [fingerprint, request.request_data.global_filter, versions],
+                sort_keys=True,
+                default=str,
+            ).encode()
+        ).hexdigest()
+        return VALUE_DICTIONARY_CACHE_KEY.format(
+            widget_id=widget.get_id(), digest=digest
+        )
+
+    def get_value_dictionary(
+        self, request, widget, queryset: "QuerySet", field_name: str
+    ) -> list | None:
+        """Every distinct value of ``field_name`` in order, or ``None`` when
+        the column is served from SQL."""
+        if not self.value_dictionary:
+            return None
+        cache_key = self.get_dictionary_cache_key(request, widget)
+        if cache_key is None:
+            return None
+        values = cache.get(cache_key)
+        if values is None:
+            max_values = self.get_max_values()
+            values = list(
+                queryset.filter(**{f"{field_name}__isnull": False})
+                .order_by(field_name)
+                .values_list(field_name, flat=True)
+                .distinct()[: max_values + 1]
+            )
+            if len(values) > max_values:
+                values = _TOO_MANY_VALUES
+            cache.set(cache_key, values, self.get_timeout())
+        if values == _TOO_MANY_VALUES:
+            return None
+        return values
+
+    def matches(self, phase: str, value: Any, search_term: str) -> bool:
+        text = str(value)
+        if self.prefix_lookup == "startswith":
+            is_prefix = text.startswith(search_term)
+        else:
+            is_prefix = text.casefold().startswith(search_term.casefold())
+        if phase == PHASE_ALL:
+            return True
+        if phase == PHASE_PREFIX:
+            return is_prefix
+        return not is_prefix and search_term.casefold() in text.casefold()
+
+    def search_dictionary(
+        self,
+        values: list,
+        search_term: str,
+        page_size: int,
+        cursor: str | None = None,
+        offset: int = 0,
+    ) -> SBAdminDistinctValuesPage | None:
+        """``search`` over a value dictionary; same order and cursors.
+        ``None`` when ``cursor`` is not in the dictionary (it was rebuilt
+        since), so the caller resumes in SQL."""
+        search_term = search_term or ""
+        phase_names = [name for name, _q in self.get_phases("value", search_term)]
+        rows = [
+            (phase, value)
+            for phase in phase_names
+            for value in values
+            if self.matches(phase, value, search_term)
+        ]
+        if cursor:
+            cursors = [self.encode_cursor(*row) for row in rows]
+            if cursor not in cursors:
+                return None
+            offset = cursors.index(cursor) + 1
+        return self.build_page(rows[offset : offset + page_size + 1], page_size)
@@ -60,6 +60,10 @@ def field_items_from_layout(layout: Iterable[Any]) -> tuple[str | tuple[str, ...
     return tuple(fields)
 
 
+def dynamic_region_matches_trigger(trigger_name: str, field_name: str) -> bool:
+    return trigger_name == field_name or trigger_name.endswith(f"-{field_name}")
+
+
 def dynamic_region_initial_from_data(
     form_class: type[forms.Form],
     data: Any,
@@ -152,6 +156,7 @@ class SBDynamicRegion:
         inactive_field_policy: SBInactiveFieldPolicy = SBInactiveFieldPolicy.PRESERVE,
         template: str | None = None,
         defer_trigger: str | None = None,
+        depends_on: Iterable[str] = (),
     ) -> None:
         self.name = name
         self.trigger_fields = tuple(trigger_fields)
@@ -161,6 +166,8 @@ class SBDynamicRegion:
         self.inactive_field_policy = inactive_field_policy
         self.template = template
         self.defer_trigger = defer_trigger
+        # Extra form fields read by the callbacks, kept in region-scoped forms.
+        self.depends_on = tuple(depends_on)
 
     def is_visible(self, form: forms.Form, request: HttpRequest | None = None) -> bool:
         if self.is_visible_callback is None:
@@ -174,6 +181,18 @@ class SBDynamicRegion:
             return self.fields
         return self.get_active_fields_callback(form, request, self)
 
+    def get_scope_field_names(self) -> tuple[str, ...]:
+        """Fields a form needs to resolve and render this region."""
+        return tuple(
+            dict.fromkeys(
+                (
+                    *self.trigger_fields,
+                    *self.depends_on,
+                    *field_names_from_layout(self.fields),
+                )
+            )
+        )
+
     def get_wrapper_id(self, form: forms.Form) -> str:
         prefix = getattr(form, "prefix", None)
         pieces = ["sbadmin-dynamic-region"]
@@ -225,9 +244,56 @@ class SBDynamicRegion:
         )
 
 
+class SBDynamicRegionGraph:
+    """Regions of one fieldset layout, indexed for the dynamic-region endpoint.
+
+    Built from the fieldsets alone (no form instance), so the endpoint can
+    work out which regions a request re-renders and which fields their form
+    needs before constructing it.
+    """
+
+    def __init__(self, fieldsets: Iterable[tuple[Any, dict[str, Any]]]) -> None:
+        self.fieldsets = fieldsets
+        self.regions = tuple(
+            region
+            for _name, data in fieldsets
+            for region in SBAdminDynamicFormMixin.get_fieldset_dynamic_regions(data)
+        )
+        self.regions_by_name = {region.name: region for region in self.regions}
+
+    def get_region(self, name: str) -> SBDynamicRegion | None:
+        return self.regions_by_name.get(name)
+
+    def regions_for_request(
+        self, region: SBDynamicRegion, request: HttpRequest
+    ) -> tuple[SBDynamicRegion, ...]:
+        """Mirror of ``SBAdminDynamicFormMixin.dynamic_regions_for_request``."""
+        trigger_name = request.headers.get("HX-Trigger-Name")
+        if not trigger_name:
+            return (region,)
+        related_regions = tuple(
+            candidate
+            for candidate in self.regions
+            if any(
+                dynamic_region_matches_trigger(trigger_name, field_name)
+                for field_name in candidate.trigger_fields
+            )
+        )
+        return related_regions or (region,)
+
+    @staticmethod
+    def get_field_names(regions: Iterable[SBDynamicRegion]) -> tuple[str, ...]:
+        field_names: dict[str, None] = {}
+        for region in regions:
+            field_names.update(dict.fromkeys(region.get_scope_field_names()))
+        return tuple(field_names)
+
+
 class SBAdminDynamicFormMixin:
     sbadmin_dynamic_region_source = None
     sbadmin_dynamic_region_endpoint = None
+    # Region names a region-scoped form is limited to; None means all regions.
+    sbadmin_dynamic_region_names = None
 
     def __init__(self, *args, **kwargs):
         self.view = kwargs.pop("view", getattr(self, "view", None))
@@ -259,18 +325,36 @@ class SBAdminDynamicFormMixin:
         if not trigger_name:
             return [region]
 
-        def matches_trigger(field_name):
-            return trigger_name == field_name or trigger_name.endswith(f"-{field_name}")
-
         related_regions = [
             candidate
             for candidate in form.get_dynamic_regions(request)
             if any(
-                matches_trigger(field_name) for field_name in candidate.trigger_fields
+                dynamic_region_matches_trigger(trigger_name, field_name)
+                for field_name in candidate.trigger_fields
             )
         ]
         return related_regions or [region]
 
+    @classmethod
+    def scoped_to_dynamic_regions(
+        cls, regions: Iterable[SBDynamicRegion]
+    ) -> type["SBAdminDynamicFormMixin"]:
+        """Subclass that only resolves and binds ``regions``.
+
+        Used with a form class built for those regions' fields only, so the
+        other regions' callbacks never read fields the form does not have.
+        """
+        return type(
+            f"SBAdminRegionScoped{cls.__name__}",
+            (cls,),
+            {
+                "__module__": cls.__module__,
+                "sbadmin_dynamic_region_names": frozenset(
+                    region.name for region in regions
+                ),
+            },
+        )
+
     @staticmethod
     def get_fieldset_fields(
         fieldset_data: dict[str, Any],
@@ -325,6 +409,9 @@ class SBAdminDynamicFormMixin:
         for _name, data in fieldsets:
             regions.extend(self.get_fieldset_dynamic_regions(data))
 
+        region_names = getattr(self, "sbadmin_dynamic_region_names", None)
+        if region_names is not None:
+            regions = [region for region in regions if region.name in region_names]
         return tuple(regions)
 
     def get_dynamic_region(
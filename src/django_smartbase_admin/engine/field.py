@@ -12,12 +12,15 @@ from django.db.models import (
     DateTimeField,
     BooleanField,
     FilteredRelation,
+    IntegerField,
+    OuterRef,
+    Subquery,
 )
-from django.db.models.functions import Concat
 from django_smartbase_admin.engine.const import ANNOTATE_KEY, Formatter
 from django_smartbase_admin.engine.field_formatter import (
     boolean_formatter,
     build_choice_formatter_for_field,
+    build_relation_count_formatter,
     date_formatter,
     datetime_formatter,
 )
@@ -50,6 +53,21 @@ NUMERIC_INTERNAL_TYPES = frozenset(
 )
 
 
+def get_relation_count_annotate(model, model_field) -> Subquery:
+    """Number of rows related through ``model_field`` (M2M or reverse FK),
+    as a subquery correlated on the row's pk. Unlike ``Count`` on the main
+    query it neither joins the relation into the list query nor multiplies
+    sibling aggregates."""
+    counted = (
+        model._base_manager.filter(pk=OuterRef("pk"))
+        .order_by()
+        .values("pk")
+        .annotate(count=Count(model_field.name))
+        .values("count")
+    )
+    return Subquery(counted, output_field=IntegerField())
+
+
 class TabulatorFieldOptions(JSONSerializableMixin):
     headerFilter = False
     headerSort = False
@@ -140,6 +158,9 @@ class SBAdminField(JSONSerializableMixin):
     list_visible = None
     list_collapsed = None
     annotate = None
+    # Compute ``annotate`` in a second query for the fetched page only,
+    # unless the list is filtered, sorted or searched by this column.
+    annotate_page_only = None
     supporting_annotates = None
     auto_created = None
     formatter = None
@@ -161,6 +182,7 @@ class SBAdminField(JSONSerializableMixin):
         filter_disabled=None,
         annotate=None,
         annotate_function=None,
+        annotate_page_only=None,
         supporting_annotates=None,
         list_visible=None,
         list_collapsed=None,
@@ -182,6 +204,11 @@ class SBAdminField(JSONSerializableMixin):
         self.filter_disabled = filter_disabled or self.filter_disabled or False
         self.annotate = annotate
         self.annotate_function = annotate_function
+        self.annotate_page_only = (
+            annotate_page_only
+            if annotate_page_only is not None
+            else self.annotate_page_only
+        )
         self.supporting_annotates = supporting_annotates
         self.list_visible = (
             list_visible
@@ -292,11 +319,13 @@ class SBAdminField(JSONSerializableMixin):
             and self.model_field
             and (self.model_field.many_to_many or self.model_field.one_to_many)
         ):
-            self.annotate = Concat(
-                Count(self.model_field.name),
-                Value(" - "),
-                Value(str(self.model_field.related_model._meta.verbose_name_plural)),
-                output_field=CharField(),
+            self.annotate = get_relation_count_annotate(
+                self.view.model, self.model_field
+            )
+            if self.annotate_page_only is None:
+                self.annotate_page_only = True
+            self.python_formatter = self.python_formatter or (
+                build_relation_count_formatter(self.model_field)
             )
             self.filter_field = self.filter_field or self.model_field.name
             if self.auto_created:
@@ -105,6 +105,20 @@ def build_choice_formatter_for_field(
     return formatter
 
 
+def build_relation_count_formatter(model_field: Field) -> Callable[[Any, Any], Any]:
+    """Formatter for the default count column of a to-many relation
+    (``"3 - tags"``); the label is added here so the SQL stays a plain
+    count."""
+    label = model_field.related_model._meta.verbose_name_plural
+
+    def formatter(object_id, value):
+        if value is None:
+            return None
+        return f"{value} - {label}"
+
+    return formatter
+
+
 # Built-in formatters that produce locale-dependent strings. The MCP
 # layer bypasses these when ``request_data.is_mcp`` is set so agents
 # always see one canonical wire format (ISO 8601 for dates, native
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 from django import forms
 from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.contrib.postgres.fields import ArrayField
-from django.db.models import Field, Q, fields, FilteredRelation, Count
+from django.db.models import Field, Q, fields, FilteredRelation
 from django.http import JsonResponse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _, pgettext_lazy
@@ -27,8 +27,10 @@ from django_smartbase_admin.engine.const import (
     Action,
     AUTOCOMPLETE_PAGE_NUM,
     AUTOCOMPLETE_FORWARD_NAME,
+    AUTOCOMPLETE_CURSOR_NAME,
     SELECT_ALL_KEYWORD,
 )
+from django_smartbase_admin.engine.distinct_values import SBAdminDistinctValuesEngine
 from django_smartbase_admin.services.translations import SBAdminTranslationsService
 from django_smartbase_admin.services.views import SBAdminViewService
 from django_smartbase_admin.templatetags.sb_admin_tags import SBAdminJSONEncoder
@@ -862,7 +864,7 @@ class AutocompleteFilterWidget(
             Action.AUTOCOMPLETE.value, modifier=self.get_id()
         )
 
-    @sbadmin_action(permission="view")
+    @sbadmin_action(permission="view", read_only=True)
     def action_autocomplete(self, request, modifier, object_id=None):
         result = self.search(request, request.request_data.request_post)
         return JsonResponse({"data": result})
@@ -1032,6 +1034,15 @@ class AutocompleteFilterWidget(
 
 
 class FromValuesAutocompleteWidget(AutocompleteFilterWidget):
+    # Matching, paging and optional value dictionaries (``engine.distinct_values``).
+    distinct_values_engine = SBAdminDistinctValuesEngine()
+
+    def __init__(self, *args, distinct_values_engine=None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.distinct_values_engine = (
+            distinct_values_engine or self.distinct_values_engine
+        )
+
     def init_filter_widget_static(self, field, view, configuration):
         self.model = field.view.model
         super().init_filter_widget_static(field, view, configuration)
@@ -1041,22 +1052,45 @@ class FromValuesAutocompleteWidget(AutocompleteFilterWidget):
         qs = qs.annotate(**self.field.get_field_annotates(values=[]))
         return qs
 
+    @sbadmin_action(permission="view", read_only=True)
+    def action_autocomplete(self, request, modifier, object_id=None):
+        page = self.search_page(request, request.request_data.request_post)
+        return JsonResponse(
+            {
+                "data": self.format_values(request, page.values),
+                "next_cursor": page.next_cursor,
+            }
+        )
+
     def search(self, request, post_data):
-        search_term = post_data.get(AUTOCOMPLETE_SEARCH_NAME)
+        return self.format_values(request, self.search_page(request, post_data).values)
+
+    def search_page(self, request, post_data):
+        search_term = post_data.get(AUTOCOMPLETE_SEARCH_NAME) or ""
         forward_data = json.loads(post_data.get(AUTOCOMPLETE_FORWARD_NAME, "{}"))
+        cursor = post_data.get(AUTOCOMPLETE_CURSOR_NAME)
         page_num = int(post_data.get(AUTOCOMPLETE_PAGE_NUM, 1))
-        from_item = (page_num - 1) * AUTOCOMPLETE_PAGE_SIZE
-        to_item = (page_num) * AUTOCOMPLETE_PAGE_SIZE
+        offset = (page_num - 1) * AUTOCOMPLETE_PAGE_SIZE
+        engine = self.distinct_values_engine
         qs = self.get_queryset(request)
+        if not self.filter_search_lambda:
+            # The dictionary cannot hold values filtered by the search term.
+            values = engine.get_value_dictionary(request, self, qs, self.field.name)
+            if values is not None:
+                page = engine.search_dictionary(
+                    values, search_term, AUTOCOMPLETE_PAGE_SIZE, cursor, offset
+                )
+                if page is not None:
+                    return page
         qs = self.filter_search_queryset(request, qs, search_term, forward_data)
-        qs = (
-            qs.filter(**{f"{self.field.name}__icontains": search_term})
-            .values(self.field.name)
-            .annotate(remove_duplicates_count=Count(self.field.name))
-            .order_by(self.field.name)[from_item:to_item]
+        return engine.search(
+            qs, self.field.name, search_term, AUTOCOMPLETE_PAGE_SIZE, cursor, offset
         )
+
+    def format_values(self, request, values):
         result = []
-        for item in qs:
+        for value in values:
+            item = {self.field.name: value}
             result.append(
                 {
                     "value": self.get_value(request, item),
@@ -1065,6 +1099,11 @@ class FromValuesAutocompleteWidget(AutocompleteFilterWidget):
             )
         return result
 
+    def to_json(self):
+        data = super().to_json()
+        data["constants"]["autocomplete_cursor"] = AUTOCOMPLETE_CURSOR_NAME
+        return data
+
     def get_value(self, request, item):
         return item.get(self.field.name)
 
@@ -1113,7 +1152,7 @@ class SBAdminTreeWidgetMixin:
             self.template_name = "sb_admin/widgets/tree_select_inline.html"
         super().__init__(*args, **kwargs)
 
-    @sbadmin_action(permission="view")
+    @sbadmin_action(permission="view", read_only=True)
     def action_autocomplete(self, request, modifier, object_id=None):
         result = self.format_tree_data(request, self.get_queryset(request))
         return JsonResponse(data=result, safe=False)
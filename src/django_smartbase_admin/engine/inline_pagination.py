@@ -5,11 +5,15 @@ from typing import Any
 from django.contrib.admin import StackedInline, TabularInline
 from django.contrib.admin.views.main import ChangeList
 from django.contrib.contenttypes.admin import GenericTabularInline
+from django.core.cache import cache
 from django.core.paginator import Paginator
 from django.db.models import QuerySet
 from django.http import HttpRequest
 
 SBADMIN_INLINE_PREFIX_HEADER = "X-SBAdmin-Inline-Prefix"
+SBADMIN_INLINE_COUNT_CACHE_PREFIX = "sbadmin_inline_count"
+# Posted by a placeholder whose rows were never loaded.
+SBADMIN_INLINE_DEFERRED_FIELD = "DEFERRED"
 
 
 def get_inline_partial_prefix(request: HttpRequest) -> str | None:
@@ -38,6 +42,65 @@ class InlineChangeList:
         self.params = dict(request.GET.items())
 
 
+class DeferredFormSetBase:
+    """Formset rendered as a placeholder on the full change form page.
+
+    The rows are fetched only when the placeholder requests its own HTMX
+    partial (``get_inline_partial_prefix``). Bound formsets are deferred
+    only when the placeholder itself was posted: its empty management form
+    leaves the existing rows untouched, and a change form re-rendered after
+    a validation error shows the placeholder again.
+    """
+
+    request: HttpRequest | None = None
+    count_cache_timeout = 60
+    is_deferred = False
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        data = args[0] if args else kwargs.get("data")
+        self.is_deferred = self.should_defer(
+            prefix=kwargs.get("prefix") or self.get_default_prefix(),
+            instance=kwargs.get("instance"),
+            is_bound=data is not None,
+            data=data,
+        )
+        super().__init__(*args, **kwargs)
+        if self.is_deferred:
+            self.deferred_count = self.get_deferred_count()
+            self._queryset = self.queryset.none()
+            self.extra = 0
+            self.min_num = 0
+
+    @property
+    def deferred_field_name(self) -> str:
+        return f"{self.prefix}-{SBADMIN_INLINE_DEFERRED_FIELD}"
+
+    def should_defer(self, prefix: str, instance, is_bound: bool, data=None) -> bool:
+        if is_bound:
+            return data.get(f"{prefix}-{SBADMIN_INLINE_DEFERRED_FIELD}") == "1"
+        if self.request is None or self.validate_min:
+            return False
+        if instance is None or instance.pk is None:
+            return False
+        return get_inline_partial_prefix(self.request) != prefix
+
+    def get_count_cache_key(self) -> str:
+        user = getattr(self.request, "user", None)
+        return (
+            f"{SBADMIN_INLINE_COUNT_CACHE_PREFIX}_{getattr(user, 'pk', None)}"
+            f"_{self.prefix}_{self.instance.pk}"
+        )
+
+    def get_deferred_count(self) -> int:
+        if not self.count_cache_timeout:
+            return self.queryset.count()
+        return cache.get_or_set(
+            self.get_count_cache_key(),
+            self.queryset.count,
+            timeout=self.count_cache_timeout,
+        )
+
+
 class PaginationFormSetBase:
     queryset: QuerySet | None = None
     request: HttpRequest | None = None
@@ -47,6 +110,8 @@ class PaginationFormSetBase:
 
     def __init__(self, *args: Any, **kwargs: Any):
         super().__init__(*args, **kwargs)
+        if getattr(self, "is_deferred", False):
+            return
         self.mount_paginator()
         self.mount_queryset()
 
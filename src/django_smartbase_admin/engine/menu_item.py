@@ -46,7 +46,8 @@ class SBAdminMenuItem(object):
     def init_menu_item_static_cls(cls, menu_item, view_id, view_map):
         if not view_id:
             return
-        menu_item.view = view_map.get(view_id, None)
+        # Menu items only need the view object, not its static init.
+        menu_item.view = view_map.peek(view_id)
         if not menu_item.view:
             raise ImproperlyConfigured(
                 f"Menu item {menu_item} is missing view {view_id}"
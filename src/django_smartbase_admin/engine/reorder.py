@@ -0,0 +1,288 @@
+"""Drag-and-drop reorder engines for ``sbadmin_list_reorder_field``.
+
+``action_table_reorder`` receives the moved row and the row it now sits
+in front of (``None`` when dropped at the end) and delegates to the
+admin's engine (``sbadmin_list_reorder_engine``):
+
+* :class:`SBAdminRankReorderEngine` (default) keeps the historical
+  contract — the field holds the dense 1-based rank of the row — but only
+  shifts the rows between the old and the new position.
+* :class:`SBAdminSparseReorderEngine` keeps gaps between keys so a move
+  usually rewrites the moved row alone, rebalancing when a gap runs out.
+
+Both expect the list to be ordered by the reorder field ascending and
+write every affected row with a single ``CASE`` UPDATE.
+"""
+
+from decimal import Decimal
+from typing import Any, TYPE_CHECKING
+
+from django.db.models import (
+    Case,
+    DecimalField,
+    F,
+    FloatField,
+    Max,
+    PositiveBigIntegerField,
+    PositiveIntegerField,
+    PositiveSmallIntegerField,
+    Value,
+    When,
+)
+
+from django_smartbase_admin.services.views import SBAdminViewService
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+#: Max ``WHEN`` branches per UPDATE when a whole list is rewritten.
+REORDER_UPDATE_CHUNK_SIZE = 500
+
+
+class SBAdminReorderEngine:
+    def move(
+        self,
+        queryset: "QuerySet",
+        reorder_field: str,
+        current_row_id: Any,
+        replaced_row_id: Any = None,
+        ordering=None,
+    ) -> int:
+        """Place ``current_row_id`` right before ``replaced_row_id`` (at the
+        end when it's ``None``); returns the number of rows written."""
+        raise NotImplementedError
+
+    @staticmethod
+    def get_pk_name(queryset: "QuerySet") -> str:
+        return SBAdminViewService.get_pk_field_for_model(queryset.model).name
+
+    def get_ordering(self, queryset: "QuerySet", reorder_field: str, ordering=None):
+        return [*(ordering or [reorder_field]), self.get_pk_name(queryset)]
+
+    def get_keys(self, queryset: "QuerySet", reorder_field: str, *pks) -> dict:
+        pk_name = self.get_pk_name(queryset)
+        return dict(
+            queryset.filter(**{f"{pk_name}__in": [pk for pk in pks if pk is not None]})
+            .order_by()
+            .values_list(pk_name, reorder_field)
+        )
+
+    def update_keys(
+        self, queryset: "QuerySet", reorder_field: str, new_keys: dict
+    ) -> int:
+        """Write ``{pk: key}`` with one ``CASE`` UPDATE per chunk."""
+        pk_name = self.get_pk_name(queryset)
+        items = list(new_keys.items())
+        updated = 0
+        for start in range(0, len(items), REORDER_UPDATE_CHUNK_SIZE):
+            chunk = items[start : start + REORDER_UPDATE_CHUNK_SIZE]
+            updated += queryset.filter(
+                **{f"{pk_name}__in": [pk for pk, _key in chunk]}
+            ).update(
+                **{
+                    reorder_field: Case(
+                        *[When(**{pk_name: pk}, then=Value(key)) for pk, key in chunk],
+                        default=F(reorder_field),
+                    )
+                }
+            )
+        return updated
+
+    def get_moved_order(
+        self, queryset, reorder_field, current_row_id, replaced_row_id, ordering=None
+    ) -> list[tuple[Any, Any]]:
+        """Full ``[(pk, old_key), ...]`` list with the move applied."""
+        pk_name = self.get_pk_name(queryset)
+        rows = list(
+            queryset.order_by(
+                *self.get_ordering(queryset, reorder_field, ordering)
+            ).values_list(pk_name, reorder_field)
+        )
+        current = next((row for row in rows if row[0] == current_row_id), None)
+        if current is None:
+            return rows
+        rows.remove(current)
+        target_index = next(
+            (index for index, row in enumerate(rows) if row[0] == replaced_row_id),
+            len(rows),
+        )
+        rows.insert(target_index, current)
+        return rows
+
+    def renumber(
+        self,
+        queryset,
+        reorder_field,
+        current_row_id,
+        replaced_row_id,
+        ordering=None,
+        start=1,
+        step=1,
+    ) -> int:
+        """Rewrite keys as ``start + index * step``, touching only rows whose
+        key changes."""
+        new_keys = {}
+        rows = self.get_moved_order(
+            queryset, reorder_field, current_row_id, replaced_row_id, ordering
+        )
+        for index, (pk, old_key) in enumerate(rows):
+            key = start + index * step
+            if old_key != key:
+                new_keys[pk] = key
+        return self.update_keys(queryset, reorder_field, new_keys)
+
+
+class SBAdminRankReorderEngine(SBAdminReorderEngine):
+    """Dense 1-based integer ranks (compatibility mode).
+
+    A move shifts only the rows between the old and the new rank by one.
+    When the stored ranks are not dense and unique in that window (e.g. a
+    freshly added column full of zeros) the whole list is renumbered
+    once, which is what the historical implementation did on every move.
+    """
+
+    def move(
+        self,
+        queryset,
+        reorder_field,
+        current_row_id,
+        replaced_row_id=None,
+        ordering=None,
+    ) -> int:
+        keys = self.get_keys(queryset, reorder_field, current_row_id, replaced_row_id)
+        current_key = keys.get(current_row_id)
+        if current_key is None:
+            return 0
+        if replaced_row_id is None:
+            target_key = queryset.aggregate(max_key=Max(reorder_field))["max_key"]
+        else:
+            target_key = keys.get(replaced_row_id)
+            if target_key is None:
+                return 0
+            if target_key > current_key:
+                # Inserted in front of a row further down: it takes the rank
+                # right above that row.
+                target_key -= 1
+
+        if target_key is None or target_key == current_key:
+            if replaced_row_id is not None and keys[replaced_row_id] == current_key:
+                return self.renumber(
+                    queryset, reorder_field, current_row_id, replaced_row_id, ordering
+                )
+            return 0
+
+        low, high = sorted((current_key, target_key))
+        window = queryset.filter(
+            **{f"{reorder_field}__gte": low, f"{reorder_field}__lte": high}
+        )
+        if window.count() != high - low + 1:
+            return self.renumber(
+                queryset, reorder_field, current_row_id, replaced_row_id, ordering
+            )
+
+        pk_name = self.get_pk_name(queryset)
+        shift = 1 if target_key < current_key else -1
+        return window.update(
+            **{
+                reorder_field: Case(
+                    When(**{pk_name: current_row_id}, then=Value(target_key)),
+                    default=F(reorder_field) + shift,
+                )
+            }
+        )
+
+
+class SBAdminSparseReorderEngine(SBAdminReorderEngine):
+    """Gap-based keys: a moved row gets the midpoint between its new
+    neighbours, so most moves write a single row.
+
+    Works with integer fields (``step`` sized gaps) as well as
+    ``FloatField``/``DecimalField`` (fractional midpoints). When two
+    neighbours have no room left between them — or share a key — the list
+    is rebalanced to ``step`` spaced keys.
+    """
+
+    def __init__(self, step: int = 1024) -> None:
+        self.step = step
+
+    @staticmethod
+    def is_positive(field) -> bool:
+        return isinstance(
+            field,
+            (PositiveIntegerField, PositiveSmallIntegerField, PositiveBigIntegerField),
+        )
+
+    def midpoint(self, field, low, high):
+        if isinstance(field, DecimalField):
+            quantum = Decimal(1).scaleb(-field.decimal_places)
+            return ((Decimal(low) + Decimal(high)) / 2).quantize(quantum)
+        if isinstance(field, FloatField):
+            return (low + high) / 2
+        return (low + high) // 2
+
+    def is_gap_exhausted(self, field, lower, upper, new_key) -> bool:
+        """No free key strictly between ``lower`` and ``upper``: neighbours
+        one apart (or equal) on integer fields, or a midpoint that rounds
+        onto a neighbour."""
+        if upper - lower <= (0 if self.is_fractional(field) else 1):
+            return True
+        return not lower < new_key < upper
+
+    @staticmethod
+    def is_fractional(field) -> bool:
+        return isinstance(field, (DecimalField, FloatField))
+
+    def rebalance(
+        self, queryset, reorder_field, current_row_id, replaced_row_id, ordering=None
+    ) -> int:
+        return self.renumber(
+            queryset,
+            reorder_field,
+            current_row_id,
+            replaced_row_id,
+            ordering,
+            start=self.step,
+            step=self.step,
+        )
+
+    def move(
+        self,
+        queryset,
+        reorder_field,
+        current_row_id,
+        replaced_row_id=None,
+        ordering=None,
+    ) -> int:
+        field = queryset.model._meta.get_field(reorder_field)
+        pk_name = self.get_pk_name(queryset)
+        keys = self.get_keys(queryset, reorder_field, current_row_id, replaced_row_id)
+        if current_row_id not in keys:
+            return 0
+        others = queryset.exclude(**{pk_name: current_row_id})
+
+        if replaced_row_id is None:
+            last_key = others.aggregate(max_key=Max(reorder_field))["max_key"]
+            new_key = self.step if last_key is None else last_key + self.step
+            return self.update_keys(queryset, reorder_field, {current_row_id: new_key})
+
+        upper = keys.get(replaced_row_id)
+        if upper is None:
+            return 0
+        lower = (
+            others.filter(**{f"{reorder_field}__lt": upper})
+            .aggregate(max_key=Max(reorder_field))
+            .get("max_key")
+        )
+        if lower is None:
+            lower = 0 if self.is_positive(field) else upper - 2 * self.step
+        has_tie = (
+            others.filter(**{reorder_field: upper})
+            .exclude(**{pk_name: replaced_row_id})
+            .exists()
+        )
+        new_key = self.midpoint(field, lower, upper)
+        if has_tie or self.is_gap_exhausted(field, lower, upper, new_key):
+            return self.rebalance(
+                queryset, reorder_field, current_row_id, replaced_row_id, ordering
+            )
+        return self.update_keys(queryset, reorder_field, {current_row_id: new_key})
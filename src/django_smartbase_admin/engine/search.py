@@ -0,0 +1,268 @@
+"""Pluggable list-view search engines.
+
+The default list search (``SBAdminListAction.get_search_results``) ORs one
+``icontains`` lookup per configured search field and ANDs the result per
+term. Admins opt into a different engine by setting
+``sbadmin_search_engine`` (or overriding ``get_sbadmin_search_engine``)::
+
+    class ProductAdmin(SBAdmin):
+        search_fields = ["name", "^sku", "=ean", "@description"]
+        sbadmin_search_engine = SBAdminPostgresSearchEngine(
+            config="simple",
+            vector_column="sb_search_vector",
+        )
+
+An engine that reports itself unavailable for the queryset's database
+(e.g. the Postgres engine on SQLite) falls back to the default lookups.
+"""
+
+from typing import Any, TYPE_CHECKING
+
+from django.contrib.postgres.search import (
+    CombinedSearchVector,
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorCombinable,
+    SearchVectorField,
+)
+from django.db import connections
+from django.db.models import Expression, F, Q
+
+if TYPE_CHECKING:
+    from django.db.models import QuerySet
+
+    from django_smartbase_admin.actions.admin_action_list import SBAdminListAction
+
+#: Query alias holding the rank of a row for the active search.
+SEARCH_RANK_ALIAS = "_sb_search_rank"
+#: Query alias of the row's search vector; also the prefix of the
+#: per-prefix-group vectors it concatenates.
+SEARCH_VECTOR_ALIAS = "_sb_search_vector"
+
+SEARCH_KIND_PREFIX = "prefix"
+SEARCH_KIND_PHRASE = "phrase"
+SEARCH_KIND_WEBSEARCH = "websearch"
+
+#: ``search_fields`` prefix -> tsquery semantics. Plain fields and ``^``
+#: become lexeme-prefix matches (``term:*``) as the closest index-friendly
+#: stand-in for ``icontains``/``istartswith``; ``=`` requires the exact
+#: lexemes in order and ``@`` keeps Django's full-text meaning.
+SEARCH_PREFIX_KINDS = {
+    "": SEARCH_KIND_PREFIX,
+    "^": SEARCH_KIND_PREFIX,
+    "=": SEARCH_KIND_PHRASE,
+    "@": SEARCH_KIND_WEBSEARCH,
+}
+
+
+class SearchVectorColumn(Expression):
+    """Reference to a ``tsvector`` column that exists only in the database.
+
+    Used for the stored generated column created by
+    :class:`~django_smartbase_admin.operations.AddSearchVectorColumn`. The
+    column is not a model field, so Django never tries to write it.
+    """
+
+    output_field = SearchVectorField()
+
+    def __init__(self, column: str) -> None:
+        super().__init__()
+        self.column = column
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.column!r})"
+
+    def as_sql(self, compiler, connection):
+        alias = compiler.query.get_initial_alias()
+        return (
+            f"{compiler.quote_name_unless_alias(alias)}."
+            f"{connection.ops.quote_name(self.column)}",
+            [],
+        )
+
+
+class SBAdminSearchEngine:
+    """Base class for list search engines.
+
+    ``search_field_specs`` passed to the hooks is the list of
+    ``(prefix, lookup)`` pairs resolved by
+    :meth:`SBAdminListAction.get_search_field_specs`; ``terms`` are the
+    already-split search terms.
+    """
+
+    def is_available(self, queryset: "QuerySet") -> bool:
+        return True
+
+    def filter_queryset(
+        self,
+        action: "SBAdminListAction",
+        request,
+        queryset: "QuerySet",
+        search_field_specs: list[tuple[str, str]],
+        terms: list[str],
+    ) -> "QuerySet":
+        raise NotImplementedError
+
+    def order_queryset(
+        self,
+        action: "SBAdminListAction",
+        request,
+        queryset: "QuerySet",
+        search_field_specs: list[tuple[str, str]],
+        terms: list[str],
+    ) -> "QuerySet":
+        """Reorder the filtered data queryset while a search is active.
+
+        Only called when the user has not picked an explicit sort."""
+        return queryset
+
+
+class SBAdminPostgresSearchEngine(SBAdminSearchEngine):
+    """Full-text search through ``SearchVector``/``SearchQuery``.
+
+    :param config: text search configuration (``"simple"``, ``"english"``,
+        or a custom one, e.g. with ``unaccent``).
+    :param vector_column: name of a stored generated ``tsvector`` column
+        (see :class:`~django_smartbase_admin.operations.AddSearchVectorColumn`).
+        When set, the whole search is a single GIN-indexable ``@@`` on that
+        column; per-field prefixes then only decide the query semantics.
+        Otherwise vectors are computed on the fly from the search fields.
+    :param weights: optional ``{lookup: "A" | "B" | "C" | "D"}`` used for
+        on-the-fly vectors, so matches in e.g. the name rank higher.
+    :param rank_ordering: order results by rank while a search is active and
+        the user has not chosen a sort.
+    """
+
+    def __init__(
+        self,
+        config: str = "simple",
+        vector_column: str | None = None,
+        weights: dict[str, str] | None = None,
+        rank_ordering: bool = True,
+    ) -> None:
+        self.config = config
+        self.vector_column = vector_column
+        self.weights = weights or {}
+        self.rank_ordering = rank_ordering
+
+    def is_available(self, queryset: "QuerySet") -> bool:
+        return connections[queryset.db].vendor == "postgresql"
+
+    @staticmethod
+    def quote_lexeme(term: str) -> str:
+        escaped = term.replace("\\", "\\\\").replace("'", "''")
+        return f"'{escaped}'"
+
+    def build_term_query(self, term: str, kind: str) -> SearchQuery:
+        if kind == SEARCH_KIND_PREFIX:
+            return SearchQuery(
+                f"{self.quote_lexeme(term)}:*", search_type="raw", config=self.config
+            )
+        return SearchQuery(term, search_type=kind, config=self.config)
+
+    def build_query(self, terms: list[str], kinds) -> SearchQuery | None:
+        """AND over terms of (OR over the requested kinds for the term)."""
+        kinds = sorted(set(kinds))
+        query = None
+        for term in terms:
+            term_query = None
+            for kind in kinds:
+                kind_query = self.build_term_query(term, kind)
+                term_query = (
+                    kind_query if term_query is None else term_query | kind_query
+                )
+            if term_query is None:
+                continue
+            query = term_query if query is None else query & term_query
+        return query
+
+    @staticmethod
+    def group_lookups_by_kind(
+        search_field_specs: list[tuple[str, str]],
+    ) -> dict[str, list[str]]:
+        groups: dict[str, list[str]] = {}
+        for prefix, lookup in search_field_specs:
+            kind = SEARCH_PREFIX_KINDS.get(prefix, SEARCH_KIND_PREFIX)
+            lookups = groups.setdefault(kind, [])
+            if lookup not in lookups:
+                lookups.append(lookup)
+        return groups
+
+    def build_vector(self, lookups: list[str]) -> Any:
+        if self.vector_column:
+            return SearchVectorColumn(self.vector_column)
+        vector = None
+        for lookup in lookups:
+            lookup_vector = SearchVector(
+                lookup, config=self.config, weight=self.weights.get(lookup)
+            )
+            vector = lookup_vector if vector is None else vector + lookup_vector
+        return vector
+
+    def filter_queryset(
+        self, action, request, queryset, search_field_specs, terms
+    ) -> "QuerySet":
+        groups = self.group_lookups_by_kind(search_field_specs)
+        if not groups or not terms:
+            return queryset
+        if self.vector_column:
+            query = self.build_query(terms, groups.keys())
+            if query is None:
+                return queryset
+            return queryset.alias(
+                **{SEARCH_VECTOR_ALIAS: self.build_vector([])}
+            ).filter(**{SEARCH_VECTOR_ALIAS: query})
+
+        vector_aliases = {}
+        for index, (kind, lookups) in enumerate(sorted(groups.items())):
+            vector_aliases[kind] = f"{SEARCH_VECTOR_ALIAS}_{index}"
+            queryset = queryset.alias(
+                **{vector_aliases[kind]: self.build_vector(lookups)}
+            )
+        term_queries = []
+        for term in terms:
+            term_queries.append(
+                Q.create(
+                    [
+                        (vector_alias, self.build_term_query(term, kind))
+                        for kind, vector_alias in vector_aliases.items()
+                    ],
+                    connector=Q.OR,
+                )
+            )
+        # The rank (``order_queryset``) reuses these vectors.
+        vector = None
+        for vector_alias in vector_aliases.values():
+            vector = (
+                F(vector_alias)
+                if vector is None
+                else CombinedSearchVector(
+                    vector,
+                    SearchVectorCombinable.ADD,
+                    F(vector_alias),
+                    self.config,
+                )
+            )
+        queryset = queryset.alias(**{SEARCH_VECTOR_ALIAS: vector})
+        return queryset.filter(Q.create(term_queries))
+
+    def order_queryset(
+        self, action, request, queryset, search_field_specs, terms
+    ) -> "QuerySet":
+        if not self.rank_ordering:
+            return queryset
+        groups = self.group_lookups_by_kind(search_field_specs)
+        query = self.build_query(terms, groups.keys())
+        if query is None:
+            return queryset
+        if SEARCH_VECTOR_ALIAS in queryset.query.annotations:
+            # Built by ``filter_queryset`` for the same search.
+            vector = F(SEARCH_VECTOR_ALIAS)
+        else:
+            lookups = [lookup for _prefix, lookup in search_field_specs]
+            vector = self.build_vector(list(dict.fromkeys(lookups)))
+        rank = SearchRank(vector, query)
+        return queryset.alias(**{SEARCH_RANK_ALIAS: rank}).order_by(
+            F(SEARCH_RANK_ALIAS).desc(), *queryset.query.order_by
+        )
@@ -0,0 +1,192 @@
+"""
+Lazy ``view_map`` of a role configuration.
+
+Building a configuration only registers a descriptor per view (the view
+object, its model, whether it contributes sub views). The view's
+``init_view_static`` — inline instances, widgets, sub views — runs the first
+time the view is looked up, under a lock. Ids that no descriptor announces
+(inlines, widgets, sub views) are found by initializing the pending views in
+registration order until one of them registers the id.
+
+What a view registers during its static init is remembered on the view
+object, so a model admin shared by several role configurations is
+initialized once per process and the other configurations copy its entries.
+
+Settings:
+
+- ``SB_ADMIN_VIEW_WARM_UP`` (default ``False``): initialize every view of a
+  configuration in a background thread once the configuration is built
+- ``python manage.py sbadmin_view_init_report`` prints the per-view cost
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from django.db import connections
+
+from django_smartbase_admin.admin.site import sb_admin_site
+
+# Attribute on a view object holding ``{view_id: view}`` registered by its
+# static init; shared by every configuration the view is part of.
+STATIC_ENTRIES_ATTR = "_sbadmin_static_view_entries"
+
+
+@dataclass
+class SBAdminViewDescriptor:
+    view: Any
+    model: Any = None
+    # Registered views contribute ``get_sub_views`` after their static init.
+    with_sub_views: bool = False
+
+
+class SBAdminViewMap(dict):
+    """``{view_id: view}`` whose views are statically initialized on first
+    access. Iterating or sizing the map initializes every pending view."""
+
+    def __init__(self, configuration) -> None:
+        super().__init__()
+        self.configuration = configuration
+        self.pending: dict[str, SBAdminViewDescriptor] = {}
+        # Seconds spent in ``init_view_static`` per view id, for the report.
+        self.init_costs: dict[str, float] = {}
+        self._lock = threading.RLock()
+        self._recording: list[dict] = []
+
+    def register(self, view, model=None, with_sub_views=False) -> None:
+        view_id = view.get_id()
+        if dict.get(self, view_id) is view:
+            return
+        descriptor = self.pending.get(view_id)
+        if descriptor is not None and descriptor.view is view:
+            descriptor.model = model or descriptor.model
+            descriptor.with_sub_views = descriptor.with_sub_views or with_sub_views
+            return
+        dict.pop(self, view_id, None)
+        self.pending[view_id] = SBAdminViewDescriptor(view, model, with_sub_views)
+
+    def peek(self, view_id, default=None):
+        """The view registered under ``view_id`` without initializing it."""
+        descriptor = self.pending.get(view_id)
+        if descriptor is not None:
+            return descriptor.view
+        if dict.__contains__(self, view_id):
+            return dict.__getitem__(self, view_id)
+        return self.get(view_id, default)
+
+    def __getitem__(self, view_id):
+        if view_id in self.pending:
+            self.initialize(view_id)
+        if not dict.__contains__(self, view_id):
+            self.initialize_until(view_id)
+        return dict.__getitem__(self, view_id)
+
+    def get(self, view_id, default=None):
+        if view_id in self:
+            return self[view_id]
+        return default
+
+    def __contains__(self, view_id) -> bool:
+        if dict.__contains__(self, view_id) or view_id in self.pending:
+            return True
+        return self.initialize_until(view_id)
+
+    def __setitem__(self, view_id, view) -> None:
+        with self._lock:
+            if self._recording:
+                # Published once the view's static init has finished.
+                self._recording[-1][view_id] = view
+                return
+            self.pending.pop(view_id, None)
+            dict.__setitem__(self, view_id, view)
+
+    def __bool__(self) -> bool:
+        return bool(self.pending) or dict.__len__(self) > 0
+
+    def __len__(self) -> int:
+        self.initialize_all()
+        return dict.__len__(self)
+
+    def __iter__(self):
+        self.initialize_all()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self.initialize_all()
+        return dict.keys(self)
+
+    def values(self):
+        self.initialize_all()
+        return dict.values(self)
+
+    def items(self):
+        self.initialize_all()
+        return dict.items(self)
+
+    def initialize(self, view_id, shared=True) -> None:
+        with self._lock:
+            descriptor = self.pending.get(view_id)
+            if descriptor is None:
+                return
+            view = descriptor.view
+            entries = getattr(view, STATIC_ENTRIES_ATTR, None) if shared else None
+            if entries is None:
+                started = time.perf_counter()
+                entries = self._run_static_init(descriptor)
+                self.init_costs[view_id] = time.perf_counter() - started
+                setattr(view, STATIC_ENTRIES_ATTR, entries)
+            # A re-registration during init replaced the descriptor.
+            if self.pending.get(view_id) is descriptor:
+                del self.pending[view_id]
+            for entry_id, entry in entries.items():
+                self.pending.pop(entry_id, None)
+                dict.__setitem__(self, entry_id, entry)
+
+    def _run_static_init(self, descriptor) -> dict:
+        view = descriptor.view
+        configuration = self.configuration
+        self._recording.append({})
+        try:
+            view.init_view_static(configuration, descriptor.model, sb_admin_site)
+        finally:
+            entries = self._recording.pop()
+        if descriptor.with_sub_views:
+            for sub_view in view.get_sub_views(configuration) or []:
+                entries[sub_view.get_id()] = sub_view
+                if sub_view not in configuration.registered_views:
+                    configuration.registered_views.append(sub_view)
+        entries[view.get_id()] = view
+        return entries
+
+    def initialize_until(self, view_id) -> bool:
+        """Initialize pending views until one of them registers ``view_id``."""
+        while not dict.__contains__(self, view_id):
+            # One view per lock hold, so concurrent lookups interleave.
+            with self._lock:
+                if not self.pending:
+                    break
+                self.initialize(next(iter(self.pending)))
+        return dict.__contains__(self, view_id)
+
+    def initialize_all(self, shared=True) -> None:
+        while True:
+            with self._lock:
+                if not self.pending:
+                    return
+                self.initialize(next(iter(self.pending)), shared=shared)
+
+    def warm_up(self) -> threading.Thread:
+        """Initialize every pending view in a daemon thread."""
+
+        def run():
+            try:
+                self.initialize_all()
+            finally:
+                connections.close_all()
+
+        thread = threading.Thread(target=run, name="sbadmin-view-warm-up", daemon=True)
+        thread.start()
+        return thread
@@ -0,0 +1,49 @@
+"""
+Load ``sbadmin_prune_logs`` archives back into their log table, e.g. to
+investigate an old incident. Rows whose id still exists are skipped.
+Re-imported audit entries are re-indexed with ``sbadmin_audit_index_objects``
+when ``SB_ADMIN_AUDIT_OBJECT_INDEX`` is in use.
+
+Usage:
+    python manage.py sbadmin_import_log_archive sb_admin_audit.AdminAuditLog \
+        /var/archive/sb_admin_audit.adminauditlog/2025-01.jsonl.gz
+"""
+
+from pathlib import Path
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from django_smartbase_admin.services.retention import (
+    RETENTION_BATCH_SIZE,
+    SBAdminRetentionService,
+)
+
+
+class Command(BaseCommand):
+    help = "Import gzip JSONL log archives written by sbadmin_prune_logs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "model", help="Model label, e.g. sb_admin_audit.AdminAuditLog."
+        )
+        parser.add_argument("paths", nargs="+", help="Archive files to import.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=RETENTION_BATCH_SIZE,
+            help="Rows inserted per transaction.",
+        )
+
+    def handle(self, *args, model, paths, batch_size, **options):
+        try:
+            model_class = apps.get_model(model)
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e))
+        for path in paths:
+            if not Path(path).is_file():
+                raise CommandError(f"{path} does not exist.")
+            count = SBAdminRetentionService.import_archive(
+                model_class, path, batch_size=max(1, batch_size)
+            )
+            self.stdout.write(self.style.SUCCESS(f"{path}: read {count} rows."))
@@ -0,0 +1,100 @@
+"""
+Apply retention to the SBAdmin log tables (audit log, MCP request log).
+
+Each model keeps ``<setting>`` days (``SB_ADMIN_AUDIT_RETENTION_DAYS``,
+``SB_ADMIN_MCP_REQUEST_LOG_RETENTION_DAYS``); unset means keep forever.
+Partitioned Postgres tables are rotated by month, others are pruned in
+chunks. With ``--archive-dir`` (or ``SB_ADMIN_RETENTION_ARCHIVE_DIR``)
+rows are exported to gzip JSONL before they are dropped.
+
+Usage:
+    python manage.py sbadmin_prune_logs
+    python manage.py sbadmin_prune_logs --model sb_admin_audit.AdminAuditLog --days 365
+"""
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from django_smartbase_admin.services.retention import (
+    RETENTION_BATCH_SIZE,
+    SBAdminRetentionService,
+)
+
+
+class Command(BaseCommand):
+    help = "Delete, or rotate out, log rows older than their retention period."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            dest="models",
+            help="Limit to this model label (repeatable).",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            help="Override the retention setting of the selected models.",
+        )
+        parser.add_argument("--archive-dir", help="Export rows here before dropping.")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=RETENTION_BATCH_SIZE,
+            help="Rows deleted per transaction (non-partitioned tables).",
+        )
+        parser.add_argument(
+            "--months-ahead",
+            type=int,
+            default=2,
+            help="Monthly partitions to create ahead (partitioned tables).",
+        )
+
+    def get_models(self, labels):
+        models = SBAdminRetentionService.get_retention_models()
+        if not labels:
+            return models
+        selected = []
+        for label in labels:
+            try:
+                model = apps.get_model(label)
+            except (LookupError, ValueError) as e:
+                raise CommandError(str(e))
+            if model not in models:
+                raise CommandError(f"{label} has no retention setting.")
+            selected.append(model)
+        return selected
+
+    def handle(self, *args, **options):
+        archive_dir = (
+            options["archive_dir"] or SBAdminRetentionService.get_archive_dir()
+        )
+        for model in self.get_models(options["models"]):
+            days = options["days"]
+            if days is None:
+                days = SBAdminRetentionService.get_retention_days(model)
+            if days is None:
+                self.stdout.write(
+                    f"{model._meta.label}: {model.sbadmin_retention_days_setting} "
+                    "not set, skipped."
+                )
+                continue
+            result = SBAdminRetentionService.apply_retention(
+                model,
+                days,
+                archive_dir=archive_dir,
+                batch_size=max(1, options["batch_size"]),
+                months_ahead=options["months_ahead"],
+            )
+            if result.created_partitions or result.dropped_partitions:
+                summary = (
+                    f"created partitions {list(result.created_partitions)}, "
+                    f"dropped partitions {list(result.dropped_partitions)}"
+                )
+            else:
+                summary = f"deleted {result.deleted} rows"
+            if archive_dir:
+                summary += f", archived {result.archived} rows"
+            self.stdout.write(
+                self.style.SUCCESS(f"{model._meta.label} ({days} days): {summary}.")
+            )
@@ -0,0 +1,43 @@
+"""
+Report the static initialization cost (``init_view_static``) of every view
+of a role configuration, slowest first. Views are initialized lazily on
+first access at runtime; this command initializes all of them up front and
+times each one.
+
+Usage:
+    python manage.py sbadmin_view_init_report
+    python manage.py sbadmin_view_init_report --role editors --limit 20
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils.module_loading import import_string
+
+
+class Command(BaseCommand):
+    help = "Time the static initialization of every SBAdmin view."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--role",
+            action="append",
+            dest="roles",
+            help="Role passed to get_configuration_for_roles (repeatable).",
+        )
+        parser.add_argument("--limit", type=int, help="Only list the slowest N views.")
+
+    def handle(self, *args, roles, limit, **options):
+        configuration_class = import_string(settings.SB_ADMIN_CONFIGURATION)
+        configuration = configuration_class().get_configuration_for_roles(roles or [])
+        configuration.init_configuration_static()
+        view_map = configuration.view_map
+        view_map.initialize_all(shared=False)
+        costs = sorted(view_map.init_costs.items(), key=lambda item: -item[1])
+        for view_id, seconds in costs[:limit]:
+            self.stdout.write(f"{seconds * 1000:10.1f} ms  {view_id}")
+        total = sum(view_map.init_costs.values())
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(costs)} views initialized in {total * 1000:.1f} ms."
+            )
+        )
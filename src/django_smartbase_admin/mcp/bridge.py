@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import json
 import numbers
 
+from django.core.serializers.json import DjangoJSONEncoder
 from django.http import QueryDict
 from django.utils.datastructures import MultiValueDict
 
@@ -244,6 +246,12 @@ def ensure_messages_storage(request) -> None:
         request._messages = MCPMessageStorage()
 
 
+def reset_messages_storage(request) -> None:
+    """Drop messages captured so far, keeping the capturing storage bound."""
+    if isinstance(getattr(request, "_messages", None), MCPMessageStorage):
+        request._messages = MCPMessageStorage()
+
+
 def captured_messages(request) -> list[dict]:
     """Return messages captured during this request, or ``[]`` if storage
     isn't an :class:`MCPMessageStorage` (so callers can call this
@@ -254,6 +262,30 @@ def captured_messages(request) -> list[dict]:
     return []
 
 
+_json_encoder = DjangoJSONEncoder()
+
+
+def _json_key(key) -> str:
+    if isinstance(key, str):
+        return key
+    if key is None or isinstance(key, (bool, int, float)):
+        return json.dumps(key)
+    return str(key)
+
+
+def to_json_native(value):
+    """Coerce a list-action payload to what a ``JsonResponse`` round trip
+    yields (dates / decimals / lazy strings via ``DjangoJSONEncoder``,
+    tuples to lists, keys to ``str``) without encoding it to text."""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, dict):
+        return {_json_key(key): to_json_native(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json_native(item) for item in value]
+    return to_json_native(_json_encoder.default(value))
+
+
 def strip_html_cells(admin, request, rows: list[dict]) -> None:
     """Plain-text the ``Formatter.HTML`` cells in-place. Numbers / bools pass
     through; same classification the xlsx exporter uses."""
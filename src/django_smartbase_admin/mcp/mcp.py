@@ -15,15 +15,20 @@ whoever ``DJANGO_MCP_AUTHENTICATION_CLASSES`` resolved.
 
 from __future__ import annotations
 
+import hashlib
 import json
 
+from django.conf import settings
+from django.core import signing
 from django.core.exceptions import PermissionDenied
+from django.db import transaction
 from django.http import Http404
 from mcp_server import MCPToolset, mcp_server as global_mcp_server
 
 from django_smartbase_admin.admin.site import sb_admin_site
 from django_smartbase_admin.engine.admin_base_view import SBAdminBaseListView
 from django_smartbase_admin.engine.dashboard import SBAdminDashboardWidget
+from django_smartbase_admin.engine.request import SBAdminViewRequestData
 from django_smartbase_admin.engine.const import (
     Action,
     ADVANCED_FILTER_DATA_NAME,
@@ -34,7 +39,6 @@ from django_smartbase_admin.engine.const import (
     COLUMNS_DATA_NAME,
     FILTER_DATA_NAME,
     TABLE_PARAMS_SELECTED_FILTER_TYPE,
-    SB_ADMIN_AJAX_NOTIFICATIONS_KEY,
     TABLE_PARAMS_FULL_TEXT_SEARCH,
     TABLE_PARAMS_NAME,
     TABLE_PARAMS_PAGE_NAME,
@@ -50,21 +54,28 @@ from django_smartbase_admin.mcp.bridge import (
     bind_sbadmin_request_data,
     build_columns_data,
     ensure_sbadmin_request_data,
+    reset_messages_storage,
     set_request_payload,
     strip_html_cells,
+    to_json_native,
 )
 from django_smartbase_admin.mcp.inlines import attach_inlines
 from django_smartbase_admin.mcp.resolvers import resolve_admin
 from django_smartbase_admin.mcp.actions import ACTION_INVOKERS
 from django_smartbase_admin.mcp.schema import (
+    admin_dynamic_entry,
     admin_entry,
     detail_action_entries,
+    get_schema_cache_key,
     get_widget_shapes,
+    schema_digest,
+    static_admin_digest,
 )
 from django_smartbase_admin.mcp.widgets import (
     ensure_dashboard_widget,
     require_widget_parent_context,
 )
+from django_smartbase_admin.services.db_routing import SBAdminDatabaseRoutingService
 from django_smartbase_admin.services.thread_local import SBAdminThreadLocalService
 from django_smartbase_admin.services.views import SBAdminViewService
 
@@ -253,6 +264,58 @@ def _decode_preset_url_params(url_params) -> dict:
     return decoded
 
 
+LIST_ROWS_DEFAULT_MAX_PAGE_SIZE = 1000
+BATCH_DEFAULT_MAX_CALLS = 50
+LIST_ROWS_CURSOR_SALT = "django_smartbase_admin.mcp.list_rows"
+
+
+def _list_rows_max_page_size() -> int:
+    return int(
+        getattr(
+            settings,
+            "SBADMIN_MCP_LIST_ROWS_MAX_PAGE_SIZE",
+            LIST_ROWS_DEFAULT_MAX_PAGE_SIZE,
+        )
+    )
+
+
+def _list_rows_fingerprint(*query_args) -> str:
+    """Digest of the ``list_rows`` arguments that decide the row set, so a
+    cursor only continues the listing it was issued for."""
+    return hashlib.sha1(
+        json.dumps(query_args, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def _dump_list_rows_cursor(request, page: int, page_size: int, fingerprint) -> str:
+    return signing.dumps(
+        {"page": page, "size": page_size, "query": fingerprint},
+        salt=f"{LIST_ROWS_CURSOR_SALT}.{request.user.pk}",
+        compress=True,
+    )
+
+
+def _load_list_rows_cursor(request, cursor: str, fingerprint) -> tuple[int, int]:
+    """``(page, page_size)`` the cursor continues with.
+
+    Cursors are signed per user and carry the digest of the arguments they
+    were issued for; anything else is rejected instead of paging a
+    different listing.
+    """
+    try:
+        payload = signing.loads(
+            cursor, salt=f"{LIST_ROWS_CURSOR_SALT}.{request.user.pk}"
+        )
+    except signing.BadSignature:
+        raise ValueError("Invalid cursor; restart the listing without one.")
+    if payload.get("query") != fingerprint:
+        raise ValueError(
+            "cursor belongs to a list_rows call with different arguments; "
+            "repeat the original fields / filter_data / sort with it."
+        )
+    return int(payload["page"]), int(payload["size"])
+
+
 def _guarded_tool_call(method):
     """Tool entry/exit wrapper.
 
@@ -273,19 +336,27 @@ def _guarded_tool_call(method):
     from functools import wraps
 
     from django_smartbase_admin.mcp.signals import mcp_tool_called
+    from django_smartbase_admin.services.instrumentation import (
+        SBAdminInstrumentationService,
+    )
 
     @wraps(method)
     def wrapper(self, *args, **kwargs):
         start = time.perf_counter()
         result = None
         error = None
+        measurement = SBAdminInstrumentationService.start("mcp", "mcp", method.__name__)
         try:
             if not sb_admin_site.has_permission(self.request):
                 raise PermissionDenied
             result = method(self, *args, **kwargs)
+            # Before the ``finally`` below, so a blown query budget is
+            # reported like any other tool error.
+            SBAdminInstrumentationService.finish(measurement)
             return result
         except Exception as exc:
             error = exc
+            SBAdminInstrumentationService.finish(measurement, error=True)
             raise
         finally:
             # Clear the bound request BEFORE notifying listeners so a logging
@@ -333,15 +404,32 @@ class SBAdminTools(MCPToolset):
     raise ``PermissionError``; invisible objects raise ``LookupError``.
     """
 
+    # Tools ``batch`` may run; ``None`` allows every tool. The REST surface
+    # narrows it to the tools it exposes on their own.
+    batch_allowed_tools: frozenset[str] | None = None
+
     @_guarded_tool_call
-    def list_admins(self) -> dict[str, list[dict] | dict[str, dict] | dict[str, str]]:
+    def list_admins(
+        self,
+        view_ids: list[str] | None = None,
+        if_schema_version: str | None = None,
+    ) -> dict[str, list[dict] | dict[str, dict] | dict[str, str] | str | bool]:
         """List the admins the current user can view.
 
         Use this to discover the handles every other tool accepts —
         ``view_id``, field/filter names, ``widget_id``s, inline names,
         and ``action_id``s.
 
-        Returns ``{"admin_views": [...], "widget_shapes": {...}}``.
+        Args:
+          view_ids: only describe these admins (ids the user can't view
+            are left out). Omit for the full registry.
+          if_schema_version: ``schema_version`` from an earlier call with
+            the same ``view_ids``. When nothing changed the reply is just
+            ``{"schema_version": ..., "unchanged": true}`` — keep using
+            the payload you already have.
+
+        Returns ``{"admin_views": [...], "widget_shapes": {...},
+        "schema_version": str}``.
         ``widget_shapes`` is a legend keyed by widget category (the
         ``widget`` value on every filter entry); each value is
         ``{"value_shape": str, "example": <example value>}`` describing
@@ -396,19 +484,47 @@ class SBAdminTools(MCPToolset):
         """
         request = self.request
         ensure_sbadmin_request_data(request)
+        wanted = set(view_ids) if view_ids is not None else None
+        schema_cache_key = get_schema_cache_key(request)
 
-        admins: list[dict] = []
+        permitted = []
         for admin in sb_admin_site._registry.values():
             if not isinstance(admin, SBAdminBaseListView):
                 continue
+            if wanted is not None and admin.get_id() not in wanted:
+                continue
             try:
                 if not admin.has_view_permission(request):
                     continue
             except Exception:
                 continue  # one broken admin shouldn't break discovery
-            admins.append(admin_entry(admin, request))
+            permitted.append(admin)
+        permitted.sort(key=lambda admin: admin.get_id())
+        dynamic_entries = [admin_dynamic_entry(admin, request) for admin in permitted]
+        try:
+            whoami = request.request_data.configuration.get_whoami_target(request)
+        except LookupError:
+            whoami = None
+
+        schema_version = None
+        if schema_cache_key is not None:
+            # Known before the payload is built: memoized static entries
+            # stand in by their digests, the per-call parts by value.
+            schema_version = schema_digest(
+                [
+                    [
+                        static_admin_digest(admin, request, schema_cache_key)
+                        for admin in permitted
+                    ],
+                    dynamic_entries,
+                    get_widget_shapes(),
+                    ACTION_INVOKERS,
+                    whoami,
+                ]
+            )
+            if if_schema_version == schema_version:
+                return {"schema_version": schema_version, "unchanged": True}
 
-        admins.sort(key=lambda entry: entry["view_id"])
         # ``widget_shapes`` is the legend keyed by the ``widget`` field
         # reported on every filter entry. Emitting it once at the top
         # level keeps each per-field filter block to ``filter_field`` +
@@ -418,17 +534,20 @@ class SBAdminTools(MCPToolset):
         # keyed by action-list name, value is the MCP tool to call.
         # Saves repeating ``invoke_with`` on every individual action.
         result = {
-            "admin_views": admins,
+            "admin_views": [
+                admin_entry(admin, request, schema_cache_key, dynamic)
+                for admin, dynamic in zip(permitted, dynamic_entries)
+            ],
             "widget_shapes": get_widget_shapes(),
             "action_invokers": ACTION_INVOKERS,
         }
-        try:
-            whoami = request.request_data.configuration.get_whoami_target(request)
-        except LookupError:
-            pass
-        else:
-            if whoami is not None:
-                result["whoami"] = whoami
+        if whoami is not None:
+            result["whoami"] = whoami
+        if schema_version is None:
+            schema_version = schema_digest(result)
+            if if_schema_version == schema_version:
+                return {"schema_version": schema_version, "unchanged": True}
+        result["schema_version"] = schema_version
         return result
 
     @_guarded_tool_call
@@ -542,6 +661,7 @@ class SBAdminTools(MCPToolset):
         aggregate: list | None = None,
         group_by: list | None = None,
         parent_object_id: str | None = None,
+        cursor: str | None = None,
     ) -> dict:
         """List rows for one admin — same data the UI list shows.
 
@@ -581,10 +701,9 @@ class SBAdminTools(MCPToolset):
             Unknown keys are rejected — misspellings raise instead of
             silently returning every row.
           page: 1-indexed page number (default 1).
-          page_size: rows per page (default 20). No enforced maximum —
-            set it high to pull the whole filtered set in one call (use
-            ``last_row`` from a first probe to size it). Mind context cost
-            on large sets.
+          page_size: rows per page (default 20), capped server-side at
+            ``SBADMIN_MCP_LIST_ROWS_MAX_PAGE_SIZE`` (default 1000). To pull
+            a larger set, follow ``next_cursor`` instead of raising it.
           sort: list of ``{"field": <name>, "dir": "asc"|"desc"}``
             entries, applied in order. ``field`` is a column name from
             ``list_admins["admin_views"][].fields[].name``; unknown
@@ -630,16 +749,33 @@ class SBAdminTools(MCPToolset):
             name equals an aggregate alias can't collide. A column grouped on a
             foreign key comes back as the bare pk (resolve names with
             ``autocomplete``).
+          cursor: opaque ``next_cursor`` from a previous call. Repeat the
+            previous call's arguments unchanged (``page`` / ``page_size``
+            are taken from the cursor); a cursor replayed with different
+            fields, filters or sort is rejected.
 
         Returns ``{"data": [...], "last_page": int, "last_row": int}``
-        plus any pagination metadata the list view emits, ``aggregates``
-        when ``aggregate`` is supplied without ``group_by``, and ``groups``
-        when ``group_by`` is supplied.
+        plus any pagination metadata the list view emits, ``next_cursor``
+        while more pages follow, ``aggregates`` when ``aggregate`` is
+        supplied without ``group_by``, and ``groups`` when ``group_by`` is
+        supplied.
         """
         request = self.request
         parent_object_id = (
             str(parent_object_id) if parent_object_id is not None else None
         )
+        fingerprint = _list_rows_fingerprint(
+            view_id,
+            fields,
+            filter_data,
+            sort,
+            full_text_search,
+            include_inlines,
+            parent_object_id,
+        )
+        if cursor:
+            page, page_size = _load_list_rows_cursor(request, cursor, fingerprint)
+        page_size = min(int(page_size), _list_rows_max_page_size())
         admin = resolve_admin(view_id, request=request)
         bind_sbadmin_request_data(
             request,
@@ -704,43 +840,56 @@ class SBAdminTools(MCPToolset):
             method="GET",
         )
 
-        # Totals over the whole filtered set, validated before the page fetch.
-        aggregates = None
-        if group_by and aggregate is None:
-            raise ValueError("group_by requires aggregate.")
-        if aggregate is not None:
-            action = admin.sbadmin_list_action_class(admin, request)
-            aggregates = action.get_aggregates(
-                aggregate, field_map=field_map, group_by=group_by
-            )
-
-        # Route through the same action dispatch as the browser so
-        # ``has_permission_for_action`` stays the single gate, then unwrap
-        # the JSON and drop UI-only payload (notifications, per-row action
-        # buttons advertised once via ``list_admins["admin_views"][].row_actions``,
-        # HTML markup in cell values).
-        response = SBAdminViewService.delegate_to_action(
+        # Read-only like the browser's list JSON, so it may use the replica.
+        with SBAdminDatabaseRoutingService.route_action(
             request,
-            view=admin.get_id(),
-            action=Action.LIST_JSON.value,
-            modifier="template",
-            object_id=parent_object_id,
-        )
-        result = json.loads(response.content.decode())
-        result.pop(SB_ADMIN_AJAX_NOTIFICATIONS_KEY, None)
-        rows = result.get("data") or []
-        # Mirror the pk to a stable ``"id"`` key (the list action keys it
-        # under the model's pk name, e.g. ``"emergency_uuid"``).
-        pk_attname = admin.model._meta.pk.attname
-        for row in rows:
-            row.pop("_row_actions", None)
-            if pk_attname != "id" and "id" not in row and pk_attname in row:
-                row["id"] = row[pk_attname]
-        strip_html_cells(admin, request, rows)
-        if include_inlines:
-            attach_inlines(admin, request, rows, include_inlines)
+            admin,
+            Action.LIST_JSON.value,
+            getattr(admin.action_list_json, "_sbadmin_action_attrs", None),
+        ):
+            # Totals over the whole filtered set, validated before the page fetch.
+            aggregates = None
+            if group_by and aggregate is None:
+                raise ValueError("group_by requires aggregate.")
+            if aggregate is not None:
+                action = admin.sbadmin_list_action_class(admin, request)
+                aggregates = action.get_aggregates(
+                    aggregate, field_map=field_map, group_by=group_by
+                )
+
+            # Same request data and permission gate as the browser's
+            # ``action_list_json`` dispatch, but the rows are taken straight
+            # from the list action instead of being rendered to a
+            # ``JsonResponse`` and parsed back. UI-only payload (per-row action
+            # buttons advertised once via ``list_admins["admin_views"][].row_actions``,
+            # HTML markup in cell values) is dropped.
+            request_data = SBAdminViewRequestData.from_request_and_kwargs(
+                request,
+                view=admin.get_id(),
+                action=Action.LIST_JSON.value,
+                modifier="template",
+                object_id=parent_object_id,
+            )
+            admin.init_view_dynamic(request, request_data)
+            SBAdminViewService.get_permitted_action_function(request, request_data)
+            result = to_json_native(admin.get_list_json_data(request))
+            rows = result.get("data") or []
+            # Mirror the pk to a stable ``"id"`` key (the list action keys it
+            # under the model's pk name, e.g. ``"emergency_uuid"``).
+            pk_attname = admin.model._meta.pk.attname
+            for row in rows:
+                row.pop("_row_actions", None)
+                if pk_attname != "id" and "id" not in row and pk_attname in row:
+                    row["id"] = row[pk_attname]
+            strip_html_cells(admin, request, rows)
+            if include_inlines:
+                attach_inlines(admin, request, rows, include_inlines)
         if aggregates is not None:
             result["groups" if group_by else "aggregates"] = aggregates
+        if int(page) < (result.get("last_page") or 0):
+            result["next_cursor"] = _dump_list_rows_cursor(
+                request, int(page) + 1, page_size, fingerprint
+            )
         return result
 
     def _fetch_detail_payload(
@@ -1637,6 +1786,79 @@ class SBAdminTools(MCPToolset):
             ) from exc
         return json.loads(response.content.decode())["data"]
 
+    @_guarded_tool_call
+    def batch(self, calls: list[dict]) -> dict:
+        """Run several tool calls in one round trip, in order.
+
+        Use it for chatty sequences — ``fetch_detail`` for a handful of
+        ids, a few ``autocomplete`` lookups — instead of one call each.
+        The calls share this request's context, so the admin gate, request
+        bootstrap and request log run once for the whole batch.
+
+        Args:
+          calls: list of ``{"tool": <tool name>, "arguments": {...}}``.
+            ``arguments`` are exactly what the tool takes on its own.
+            ``batch`` itself can't be nested. At most
+            ``SBADMIN_MCP_BATCH_MAX_CALLS`` (default 50) calls.
+
+        Each call runs in its own savepoint: a failing call rolls back its
+        own writes and doesn't stop the ones after it.
+
+        Returns ``{"results": [...], "errors": int}`` with one entry per
+        call, in order: ``{"tool", "ok": true, "result"}`` or
+        ``{"tool", "ok": false, "error": {"type", "message"}}``.
+        """
+        if not isinstance(calls, list):
+            raise ValueError("calls must be a list of {tool, arguments}.")
+        max_calls = int(
+            getattr(settings, "SBADMIN_MCP_BATCH_MAX_CALLS", BATCH_DEFAULT_MAX_CALLS)
+        )
+        if len(calls) > max_calls:
+            raise ValueError(f"batch accepts at most {max_calls} calls.")
+        ensure_sbadmin_request_data(self.request)
+
+        results = []
+        for call in calls:
+            tool_name = call.get("tool") if isinstance(call, dict) else None
+            try:
+                result = self._run_batch_call(call)
+            except Exception as exc:
+                results.append(
+                    {
+                        "tool": tool_name,
+                        "ok": False,
+                        "error": {"type": type(exc).__name__, "message": str(exc)},
+                    }
+                )
+            else:
+                results.append({"tool": tool_name, "ok": True, "result": result})
+        return {
+            "results": results,
+            "errors": sum(1 for entry in results if not entry["ok"]),
+        }
+
+    def _run_batch_call(self, call):
+        if not isinstance(call, dict) or not isinstance(call.get("tool"), str):
+            raise ValueError("Each call must be {tool, arguments}.")
+        tool_name = call["tool"]
+        arguments = call.get("arguments") or {}
+        if not isinstance(arguments, dict):
+            raise ValueError("Tool arguments must be a JSON object.")
+        method = getattr(self, tool_name, None)
+        if tool_name == "batch" or not getattr(method, "sbadmin_mcp_tool", False):
+            raise LookupError(f"Unknown tool {tool_name!r}.")
+        if (
+            self.batch_allowed_tools is not None
+            and tool_name not in self.batch_allowed_tools
+        ):
+            raise PermissionDenied(f"{tool_name!r} can't run in this batch.")
+        # Messages are reported per call, not accumulated over the batch.
+        reset_messages_storage(self.request)
+        with transaction.atomic():
+            # The unguarded body: gate, thread-local cleanup and the
+            # ``mcp_tool_called`` log belong to the enclosing ``batch`` call.
+            return method.__wrapped__(self, **arguments)
+
 
 @global_mcp_server.resource(
     "dashboard://blueprint",
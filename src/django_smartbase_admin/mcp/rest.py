@@ -56,6 +56,11 @@ def resolve_sbadmin_mcp_rest_authenticator(
     return authenticator
 
 
+# Tools reachable over REST, on their own and inside ``batch``. Everything
+# else (the write tools in particular) stays on the MCP transport.
+REST_TOOLS = frozenset({"list_rows"})
+
+
 def is_guarded_mcp_tool(method) -> bool:
     return callable(method) and bool(getattr(method, "sbadmin_mcp_tool", False))
 
@@ -73,6 +78,7 @@ def call_sbadmin_mcp_tool(
     tool_name: str,
     arguments: dict | None = None,
     toolset_cls=SBAdminTools,
+    batch_allowed_tools=REST_TOOLS,
 ):
     if arguments is None:
         arguments = {}
@@ -80,6 +86,7 @@ def call_sbadmin_mcp_tool(
         raise ParseError("Tool arguments must be a JSON object.")
 
     toolset = toolset_cls(request=request)
+    toolset.batch_allowed_tools = frozenset(batch_allowed_tools)
     method = resolve_guarded_mcp_tool(toolset, tool_name)
     return method(**arguments)
 
@@ -98,6 +105,7 @@ class SBAdminMCPToolAPIView(APIView):
     permission_classes: tuple = ()
     authenticator: SBAdminMCPRestAuthenticator | None = None
     toolset_cls = SBAdminTools
+    batch_allowed_tools = REST_TOOLS
 
     def get_authenticator(self) -> SBAdminMCPRestAuthenticator:
         return resolve_sbadmin_mcp_rest_authenticator(self.authenticator)
@@ -130,6 +138,7 @@ class SBAdminMCPToolAPIView(APIView):
                 tool_name=tool_name,
                 arguments=request.data,
                 toolset_cls=self.toolset_cls,
+                batch_allowed_tools=self.batch_allowed_tools,
             )
         except (PermissionDenied, PermissionError):
             return Response(
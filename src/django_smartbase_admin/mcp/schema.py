@@ -10,10 +10,15 @@ here so all action types are assembled in one place.
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
 import logging
+from weakref import WeakKeyDictionary
 
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
 
 from django_smartbase_admin.engine.const import ROW_CLASS_FIELD
 from django_smartbase_admin.engine.fake_inline import is_fake_inline_batch_safe
@@ -369,24 +374,15 @@ def _detail_field_entries(admin, request) -> list[str]:
 # ---------------------------------------------------------------------------
 
 
-def _filter_preset_entries(admin, request) -> list[dict]:
-    """Static + saved filter presets available to the user, in display order.
+def _static_filter_preset_entries(admin, request) -> list[dict]:
+    """Admin-defined presets (``sbadmin_list_view_config`` + the implicit
+    ``"All"`` reset), surfaced as ``{name, source}``.
 
-    Static presets are admin-defined named bundles of url_params
-    (``sbadmin_list_view_config`` + the implicit ``"All"`` reset). Saved
-    presets are per-user rows in ``SBAdminListViewConfiguration``. Both
-    are surfaced as ``{name, source, id?}``; the filter/sort params
-    themselves are fetched on demand via ``fetch_filter_preset`` so this
-    discovery payload stays small even when admins ship many presets.
-
-    Errors in either source are swallowed (logged) so a broken preset
-    config can't take down ``list_admins`` — the agent still sees the
-    rest of the admin.
+    The filter/sort params themselves are fetched on demand via
+    ``fetch_filter_preset`` so this discovery payload stays small even when
+    admins ship many presets. Errors are swallowed (logged) so a broken
+    preset config can't take down ``list_admins``.
     """
-    from django_smartbase_admin.services.configuration import (  # local import: avoids settings touch at module load
-        SBAdminUserConfigurationService,
-    )
-
     entries: list[dict] = []
     try:
         # ``get_base_config`` returns ``{name, url_params, ...}`` for the
@@ -399,6 +395,16 @@ def _filter_preset_entries(admin, request) -> list[dict]:
             admin.__class__.__name__,
             exc_info=True,
         )
+    return entries
+
+
+def _saved_filter_preset_entries(admin, request) -> list[dict]:
+    """Per-user presets (rows in ``SBAdminListViewConfiguration``), surfaced
+    as ``{name, source, id}``, fail-soft like the static ones."""
+    from django_smartbase_admin.services.configuration import (  # local import: avoids settings touch at module load
+        SBAdminUserConfigurationService,
+    )
+
     try:
         saved = SBAdminUserConfigurationService.get_saved_views(
             request, view_id=admin.get_id()
@@ -410,6 +416,7 @@ def _filter_preset_entries(admin, request) -> list[dict]:
             exc_info=True,
         )
         saved = []
+    entries: list[dict] = []
     for preset in saved or []:
         entry = {"name": str(preset.get("name", "")), "source": "saved"}
         # ``id`` is the only stable handle for saved presets (the name is
@@ -420,8 +427,53 @@ def _filter_preset_entries(admin, request) -> list[dict]:
     return entries
 
 
-def admin_entry(admin, request) -> dict:
-    """Schema entry for one registered SBAdmin admin."""
+def get_schema_cache_key(request) -> str | None:
+    """Permission fingerprint the static schema part is memoized under, or
+    ``None`` when discovery must be rebuilt (``SBADMIN_MCP_SCHEMA_CACHE``
+    off, or no configuration bound to the request)."""
+    if not getattr(settings, "SBADMIN_MCP_SCHEMA_CACHE", True):
+        return None
+    request_data = getattr(request, "request_data", None)
+    configuration = getattr(request_data, "configuration", None)
+    if configuration is None:
+        return None
+    try:
+        key = configuration.get_mcp_schema_cache_key(request)
+    except Exception:
+        logger.warning("MCP schema: cache key failed", exc_info=True)
+        return None
+    return key if isinstance(key, str) else None
+
+
+# admin instance -> {schema cache key: (static entry, digest)}. Weak so
+# re-registering an admin drops its entries along with the old instance.
+_static_admin_entries: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def clear_schema_cache(**kwargs) -> None:
+    """Drop every memoized static entry.
+
+    The cache lives as long as the process and has no other invalidation:
+    static entries only change with code (a deploy restarts the workers)
+    or with what ``get_mcp_schema_cache_key`` covers. Call this after
+    changing admins or permission logic at runtime; ``setting_changed``
+    (``override_settings``) calls it too.
+    """
+    _static_admin_entries.clear()
+
+
+setting_changed.connect(clear_schema_cache, dispatch_uid="sbadmin_mcp_schema_cache")
+
+
+def schema_digest(payload) -> str:
+    return hashlib.sha1(
+        json.dumps(payload, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def _static_admin_entry(admin, request) -> dict:
+    """The part of an admin's entry that depends on its code and the caller's
+    permissions only — not on per-user data."""
     model = admin.model
     opts = model._meta
 
@@ -433,8 +485,8 @@ def admin_entry(admin, request) -> dict:
         "verbose_name_plural": str(opts.verbose_name_plural),
         "detail_fields": _detail_field_entries(admin, request),
         "inlines": _inline_entries(admin, request),
-        "filter_presets": _filter_preset_entries(admin, request),
-        **list_view_entry(admin, request),
+        "filter_presets": _static_filter_preset_entries(admin, request),
+        **_static_list_view_entry(admin, request),
     }
     if admin.mcp_description:
         entry["description"] = str(admin.mcp_description)
@@ -444,13 +496,68 @@ def admin_entry(admin, request) -> dict:
     return entry
 
 
-def list_view_entry(view, request) -> dict:
-    """Return MCP schema shared by regular list views and list widgets."""
-    entry = {
+def _get_cached_static_admin_entry(admin, request, cache_key) -> tuple[dict, str]:
+    entries = _static_admin_entries.setdefault(admin, {})
+    if cache_key not in entries:
+        entry = _static_admin_entry(admin, request)
+        entries[cache_key] = (entry, schema_digest(entry))
+    return entries[cache_key]
+
+
+def _get_static_admin_entry(admin, request, cache_key) -> dict:
+    if cache_key is None:
+        return _static_admin_entry(admin, request)
+    entry, _digest = _get_cached_static_admin_entry(admin, request, cache_key)
+    # Callers own the result; nested lists stay shared with the cache otherwise.
+    return copy.deepcopy(entry)
+
+
+def static_admin_digest(admin, request, cache_key) -> str:
+    """Digest of an admin's memoized static entry, so ``schema_version``
+    is known without copying or serializing the entry."""
+    return _get_cached_static_admin_entry(admin, request, cache_key)[1]
+
+
+def admin_dynamic_entry(admin, request) -> dict:
+    """The part of an admin's entry resolved on every call: saved presets
+    and request-aware ``mcp_actions``."""
+    dynamic = {"saved_filter_presets": _saved_filter_preset_entries(admin, request)}
+    mcp_actions = collect_mcp_method_action_entries(admin, request)
+    if mcp_actions:
+        dynamic["mcp_actions"] = mcp_actions
+    return dynamic
+
+
+def admin_entry(admin, request, cache_key, dynamic=None) -> dict:
+    """Schema entry for one registered SBAdmin admin.
+
+    The static part is built once per permission fingerprint ``cache_key``
+    (``get_schema_cache_key``, computed once per discovery call); the
+    ``admin_dynamic_entry`` part is layered on top for every call.
+    """
+    if dynamic is None:
+        dynamic = admin_dynamic_entry(admin, request)
+    entry = _get_static_admin_entry(admin, request, cache_key)
+    entry["filter_presets"] = [
+        *entry["filter_presets"],
+        *dynamic["saved_filter_presets"],
+    ]
+    if "mcp_actions" in dynamic:
+        entry["mcp_actions"] = dynamic["mcp_actions"]
+    return entry
+
+
+def _static_list_view_entry(view, request) -> dict:
+    return {
         "fields": list_field_entries(view, request),
         "search_fields": list(view.get_search_fields(request) or []),
         **list_action_entries(view, request),
     }
+
+
+def list_view_entry(view, request) -> dict:
+    """Return MCP schema shared by regular list views and list widgets."""
+    entry = _static_list_view_entry(view, request)
     mcp_actions = collect_mcp_method_action_entries(view, request)
     if mcp_actions:
         entry["mcp_actions"] = mcp_actions
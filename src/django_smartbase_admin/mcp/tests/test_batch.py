@@ -0,0 +1,139 @@
+"""``batch`` — several tool calls under one guarded request."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from django.contrib import messages
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.test import TestCase
+
+from django_smartbase_admin.mcp.bridge import captured_messages, ensure_messages_storage
+from django_smartbase_admin.mcp.mcp import SBAdminTools, _guarded_tool_call
+from django_smartbase_admin.mcp.rest import call_sbadmin_mcp_tool
+from django_smartbase_admin.mcp.signals import mcp_tool_called
+from django_smartbase_admin.mcp.tests._common import build_mcp_request
+
+
+def _staff_user():
+    return MagicMock(is_active=True, is_staff=True, is_authenticated=True)
+
+
+class BatchTools(SBAdminTools):
+    @_guarded_tool_call
+    def ping(self, value: str) -> dict:
+        ensure_messages_storage(self.request)
+        messages.info(self.request, f"pinged {value}")
+        return {"value": value, "messages": captured_messages(self.request)}
+
+    @_guarded_tool_call
+    def create_then_fail(self, name: str) -> dict:
+        Group.objects.create(name=name)
+        raise ValueError("Invalid payload.")
+
+
+class BatchTests(TestCase):
+    def setUp(self):
+        self.tool_calls = []
+
+        def receiver(sender, tool_name, **kwargs):
+            self.tool_calls.append(tool_name)
+
+        mcp_tool_called.connect(
+            receiver, weak=False, dispatch_uid="test_batch_receiver"
+        )
+        self.addCleanup(mcp_tool_called.disconnect, dispatch_uid="test_batch_receiver")
+        user = get_user_model().objects.create_user(
+            "batch", is_staff=True, is_superuser=True
+        )
+        self.tools = BatchTools(request=build_mcp_request(user))
+
+    def test_calls_run_in_order_with_per_call_results(self):
+        result = self.tools.batch(
+            [
+                {"tool": "ping", "arguments": {"value": "a"}},
+                {"tool": "ping", "arguments": {"value": "b"}},
+            ]
+        )
+
+        self.assertEqual(result["errors"], 0)
+        self.assertEqual(
+            [entry["result"]["value"] for entry in result["results"]], ["a", "b"]
+        )
+        # Messages don't leak from one call into the next.
+        self.assertEqual(
+            result["results"][1]["result"]["messages"],
+            [{"level": "info", "message": "pinged b"}],
+        )
+        # One guarded call, so one log entry for the whole batch.
+        self.assertEqual(self.tool_calls, ["batch"])
+
+    def test_failing_call_is_rolled_back_and_reported(self):
+        result = self.tools.batch(
+            [
+                {"tool": "create_then_fail", "arguments": {"name": "ghost"}},
+                {"tool": "ping", "arguments": {"value": "after"}},
+            ]
+        )
+
+        self.assertEqual(result["errors"], 1)
+        self.assertEqual(
+            result["results"][0],
+            {
+                "tool": "create_then_fail",
+                "ok": False,
+                "error": {"type": "ValueError", "message": "Invalid payload."},
+            },
+        )
+        self.assertTrue(result["results"][1]["ok"])
+        self.assertFalse(Group.objects.filter(name="ghost").exists())
+
+    def test_unknown_nested_and_malformed_calls_are_rejected_per_item(self):
+        result = self.tools.batch(
+            [
+                {"tool": "_run_batch_call"},
+                {"tool": "batch", "arguments": {"calls": []}},
+                {"tool": "ping", "arguments": ["a"]},
+            ]
+        )
+
+        self.assertEqual(
+            [entry["error"]["type"] for entry in result["results"]],
+            ["LookupError", "LookupError", "ValueError"],
+        )
+
+    def test_batch_size_is_capped(self):
+        with self.settings(SBADMIN_MCP_BATCH_MAX_CALLS=1):
+            with self.assertRaises(ValueError):
+                self.tools.batch([{"tool": "ping"}, {"tool": "ping"}])
+
+    def test_rest_dispatch_runs_batch(self):
+        result = call_sbadmin_mcp_tool(
+            request=build_mcp_request(_staff_user()),
+            tool_name="batch",
+            arguments={"calls": [{"tool": "ping", "arguments": {"value": "x"}}]},
+            toolset_cls=BatchTools,
+            batch_allowed_tools={"ping"},
+        )
+
+        self.assertEqual(result["results"][0]["result"]["value"], "x")
+
+    def test_rest_batch_rejects_tools_outside_the_rest_surface(self):
+        result = call_sbadmin_mcp_tool(
+            request=build_mcp_request(_staff_user()),
+            tool_name="batch",
+            arguments={
+                "calls": [
+                    {"tool": "create_then_fail", "arguments": {"name": "ghost"}},
+                    {"tool": "update_detail", "arguments": {}},
+                ]
+            },
+            toolset_cls=BatchTools,
+        )
+
+        self.assertEqual(
+            [entry["error"]["type"] for entry in result["results"]],
+            ["PermissionDenied", "PermissionDenied"],
+        )
+        self.assertFalse(Group.objects.filter(name="ghost").exists())
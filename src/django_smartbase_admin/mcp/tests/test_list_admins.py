@@ -9,7 +9,7 @@ through ``MCPToolset._add_tools_to`` — minus the JSON-RPC framing.
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from django.test import TestCase, override_settings
 from django.urls import path
@@ -26,6 +26,7 @@ from django_smartbase_admin.engine.filter_widgets import (
     AutocompleteFilterWidget,
     MultipleChoiceFilterWidget,
 )
+from django_smartbase_admin.mcp import schema
 from django_smartbase_admin.mcp.mcp import SBAdminTools
 from django_smartbase_admin.mcp.tests._common import (
     MCPToolTestConfig,
@@ -412,3 +413,87 @@ class ListAdminsTests(TestCase):
             "DynamicPermissionInline",
             {inline["inline_name"] for inline in entry["inlines"]},
         )
+
+    def _count_static_builds(self, tools, **kwargs):
+        folder_admin = sb_admin_site._registry[Folder]
+        with patch.object(
+            schema, "_static_admin_entry", wraps=schema._static_admin_entry
+        ) as build:
+            tools.list_admins(**kwargs)
+        return sum(1 for call in build.call_args_list if call.args[0] is folder_admin)
+
+    def test_static_schema_is_reused_per_permission_fingerprint(self):
+        user = MagicMock(is_authenticated=True, is_superuser=True)
+        tools = SBAdminTools(request=build_mcp_request(user))
+
+        self.assertEqual(self._count_static_builds(tools), 1)
+        self.assertEqual(self._count_static_builds(tools), 0)
+        with override_settings(SBADMIN_MCP_SCHEMA_CACHE=False):
+            self.assertEqual(self._count_static_builds(tools), 1)
+
+    def test_schema_cache_key_is_computed_once_per_discovery(self):
+        user = MagicMock(is_authenticated=True, is_superuser=True)
+        tools = SBAdminTools(request=build_mcp_request(user))
+
+        with patch.object(
+            MCPToolTestConfig,
+            "get_mcp_schema_cache_key",
+            autospec=True,
+            return_value="fingerprint",
+        ) as get_key:
+            result = tools.list_admins()
+        self.assertGreater(len(result["admin_views"]), 1)
+        self.assertEqual(get_key.call_count, 1)
+
+    def test_cached_schema_is_not_shared_with_callers(self):
+        user = MagicMock(is_authenticated=True, is_superuser=True)
+        tools = SBAdminTools(request=build_mcp_request(user))
+
+        def folder_entry():
+            result = tools.list_admins(view_ids=["filer_folder"])
+            return result["admin_views"][0]
+
+        folder_entry()["fields"].clear()
+        self.assertTrue(folder_entry()["fields"])
+
+    def test_view_ids_limits_discovery_to_requested_admins(self):
+        user = MagicMock(is_authenticated=True, is_superuser=True)
+        tools = SBAdminTools(request=build_mcp_request(user))
+
+        result = tools.list_admins(view_ids=["filer_folder"])
+
+        self.assertEqual(
+            [entry["view_id"] for entry in result["admin_views"]], ["filer_folder"]
+        )
+        self.assertIn("widget_shapes", result)
+
+    def test_unchanged_schema_version_skips_payload(self):
+        user = MagicMock(is_authenticated=True, is_superuser=True)
+        tools = SBAdminTools(request=build_mcp_request(user))
+        version = tools.list_admins(view_ids=["filer_folder"])["schema_version"]
+
+        self.assertEqual(
+            tools.list_admins(view_ids=["filer_folder"], if_schema_version=version),
+            {"schema_version": version, "unchanged": True},
+        )
+        self.assertIn("admin_views", tools.list_admins(if_schema_version=version))
+
+    def test_unchanged_schema_version_skips_building_the_payload(self):
+        user = MagicMock(is_authenticated=True, is_superuser=True)
+        tools = SBAdminTools(request=build_mcp_request(user))
+        version = tools.list_admins()["schema_version"]
+
+        with patch.object(schema, "_static_admin_entry") as build, patch.object(
+            schema, "_get_static_admin_entry"
+        ) as copy_entry:
+            result = tools.list_admins(if_schema_version=version)
+        self.assertEqual(result, {"schema_version": version, "unchanged": True})
+        build.assert_not_called()
+        copy_entry.assert_not_called()
+
+    def test_schema_version_matches_with_and_without_cache_hits(self):
+        user = MagicMock(is_authenticated=True, is_superuser=True)
+        tools = SBAdminTools(request=build_mcp_request(user))
+        first = tools.list_admins(view_ids=["filer_folder"])
+        second = tools.list_admins(view_ids=["filer_folder"])
+        self.assertEqual(first, second)
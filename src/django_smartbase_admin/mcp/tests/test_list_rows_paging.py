@@ -0,0 +1,82 @@
+"""``list_rows`` in-process rows, page-size cap and ``next_cursor`` paging."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase, override_settings
+from django.urls import path
+from filer.models import Folder
+
+from django_smartbase_admin.admin.admin_base import SBAdmin
+from django_smartbase_admin.admin.site import sb_admin_site
+from django_smartbase_admin.mcp.mcp import SBAdminTools
+from django_smartbase_admin.mcp.tests._common import (
+    MCPToolTestConfig,
+    build_mcp_request,
+)
+from django_smartbase_admin.services.views import SBAdminViewService
+
+urlpatterns = [path("sb-admin/", sb_admin_site.urls)]
+
+
+class _Admin(SBAdmin):
+    model = Folder
+    sbadmin_list_display = ("id", "name", "created_at")
+
+
+@override_settings(
+    ROOT_URLCONF=__name__,
+    SB_ADMIN_CONFIGURATION="tests.sbadmin_config.MCPSBAdminConfiguration",
+)
+class ListRowsPagingTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self._original = sb_admin_site._registry.pop(Folder, None)
+        sb_admin_site.register(Folder, _Admin)
+        MCPToolTestConfig().init_view_map()
+        self.ids = [Folder.objects.create(name=f"f{n}").pk for n in range(5)]
+        user = MagicMock(is_authenticated=True, is_superuser=True)
+        self.tools = SBAdminTools(request=build_mcp_request(user))
+
+    def tearDown(self):
+        sb_admin_site._registry.pop(Folder, None)
+        if self._original is not None:
+            sb_admin_site._registry[Folder] = self._original
+        super().tearDown()
+
+    def list_rows(self, **kwargs):
+        kwargs.setdefault("fields", ["id", "name", "created_at"])
+        kwargs.setdefault("sort", [{"field": "id", "dir": "asc"}])
+        return self.tools.list_rows("filer_folder", **kwargs)
+
+    def test_rows_are_built_in_process_as_json_values(self):
+        with patch.object(SBAdminViewService, "delegate_to_action") as delegate:
+            result = self.list_rows(page_size=2)
+        delegate.assert_not_called()
+        self.assertEqual([row["id"] for row in result["data"]], self.ids[:2])
+        # Same wire shape the JsonResponse round trip produced.
+        self.assertIsInstance(result["data"][0]["created_at"], str)
+        self.assertNotIn("_row_actions", result["data"][0])
+
+    @override_settings(SBADMIN_MCP_LIST_ROWS_MAX_PAGE_SIZE=2)
+    def test_page_size_is_capped(self):
+        result = self.list_rows(page_size=100)
+        self.assertEqual(len(result["data"]), 2)
+        self.assertEqual(result["last_page"], 3)
+
+    def test_cursor_walks_every_page_once(self):
+        seen = []
+        result = self.list_rows(page_size=2)
+        seen += [row["id"] for row in result["data"]]
+        while "next_cursor" in result:
+            result = self.list_rows(page_size=2, cursor=result["next_cursor"])
+            seen += [row["id"] for row in result["data"]]
+        self.assertEqual(seen, self.ids)
+
+    def test_cursor_rejects_different_arguments(self):
+        cursor = self.list_rows(page_size=2)["next_cursor"]
+        with self.assertRaises(ValueError):
+            self.list_rows(page_size=2, cursor=cursor, filter_data={"name": "f1"})
+        with self.assertRaises(ValueError):
+            self.list_rows(page_size=2, cursor=cursor + "x")
@@ -206,3 +206,9 @@ class RestURLTests(SimpleTestCase):
             reverse("sbadmin_mcp_rest_tool"),
             "/mcp/rest/tools/list_rows/",
         )
+
+    def test_main_urls_include_mcp_prefixed_batch_rest_route(self):
+        self.assertEqual(
+            reverse("sbadmin_mcp_rest_batch"),
+            "/mcp/rest/tools/batch/",
+        )
@@ -5,9 +5,10 @@ Authentication is selected by the host project via
 ``DJANGO_MCP_AUTHENTICATION_CLASSES`` (any DRF ``BaseAuthentication``
 subclass).
 
-The optional REST surface is intentionally narrow: only ``list_rows`` is
-exposed, under the same URLconf, with acting-user resolution selected by
-``SBADMIN_MCP_REST_AUTHENTICATOR``.
+The optional REST surface is intentionally narrow: only ``list_rows`` and
+``batch`` are exposed, under the same URLconf, with acting-user resolution
+selected by ``SBADMIN_MCP_REST_AUTHENTICATOR``. A REST ``batch`` runs only
+``list_rows`` calls; other tools are reported as per-call errors.
 
 For the bundled OAuth 2.1 Authorization Server (Cursor / Claude / IDE
 clients), additionally include ``django_smartbase_admin.mcp.oauth.urls``.
@@ -20,11 +21,7 @@ from django_smartbase_admin.mcp.rest import SBAdminMCPToolAPIView
 
 _mcp_endpoint = getattr(settings, "DJANGO_MCP_ENDPOINT", "mcp")
 _mcp_endpoint = _mcp_endpoint.strip("/")
-_rest_list_rows_path = (
-    f"{_mcp_endpoint}/rest/tools/list_rows/"
-    if _mcp_endpoint
-    else "rest/tools/list_rows/"
-)
+_rest_tools_path = f"{_mcp_endpoint}/rest/tools/" if _mcp_endpoint else "rest/tools/"
 
 urlpatterns = [
     # Delegate the complete transport wiring to django-mcp-server. Keep
@@ -32,9 +29,15 @@ urlpatterns = [
     # the MCP resource to /mcp and do not replay the POST across a 301.
     path("", include("mcp_server.urls")),
     path(
-        _rest_list_rows_path,
+        f"{_rest_tools_path}list_rows/",
         SBAdminMCPToolAPIView.as_view(),
         {"tool_name": "list_rows"},
         name="sbadmin_mcp_rest_tool",
     ),
+    path(
+        f"{_rest_tools_path}batch/",
+        SBAdminMCPToolAPIView.as_view(),
+        {"tool_name": "batch"},
+        name="sbadmin_mcp_rest_batch",
+    ),
 ]
@@ -6,7 +6,8 @@ class MCPLogConfig(AppConfig):
 
     Opt-in via ``INSTALLED_APPS``; ``ready()`` connects the logger to
     ``mcp_tool_called`` and registers the admin view. The host project
-    schedules retention (``MCPRequestLog.prune``).
+    schedules retention (``sbadmin_prune_logs`` with
+    ``SB_ADMIN_MCP_REQUEST_LOG_RETENTION_DAYS``).
     """
 
     name = "django_smartbase_admin.mcp_log"
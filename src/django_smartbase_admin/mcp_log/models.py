@@ -1,6 +1,5 @@
 from django.conf import settings
 from django.db import models
-from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 
@@ -57,6 +56,9 @@ class MCPRequestLog(models.Model):
     error_type = models.CharField(_("Error type"), max_length=128, blank=True)
     error_message = models.TextField(_("Error message"), blank=True)
 
+    # Days to keep, see ``SBAdminRetentionService`` / ``sbadmin_prune_logs``.
+    sbadmin_retention_days_setting = "SB_ADMIN_MCP_REQUEST_LOG_RETENTION_DAYS"
+
     class Meta:
         app_label = "sbadmin_mcp_log"
         db_table = "sbadmin_mcp_log_request"
@@ -75,7 +77,11 @@ class MCPRequestLog(models.Model):
 
     @classmethod
     def prune(cls, days):
-        """Delete rows older than ``days``; return the count deleted."""
-        cutoff = timezone.now() - timezone.timedelta(days=days)
-        qs = cls.objects.filter(timestamp__lt=cutoff)
-        return qs._raw_delete(qs.db)
+        """Delete rows older than ``days`` in bounded chunks; return the
+        count deleted."""
+        from django_smartbase_admin.services.retention import (
+            SBAdminRetentionService,
+        )
+
+        cutoff = SBAdminRetentionService.get_cutoff(days)
+        return SBAdminRetentionService.prune(cls, cutoff).deleted
@@ -3,7 +3,7 @@ AppConfig for the messaging app.
 
 Mirrors ``django_smartbase_admin.audit`` — a self-contained, self-registering
 feature module. On ``ready()`` it registers the management and per-user inbox
-admins with the SBAdmin site.
+admins with the SBAdmin site and connects the broadcast watermark rewind.
 """
 
 from django.apps import AppConfig
@@ -22,6 +22,21 @@ class SBAdminMessagingConfig(AppConfig):
 
     def ready(self):
         self._register_sb_admin()
+        self._connect_signals()
+
+    def _connect_signals(self):
+        from django.db.models.signals import post_save
+
+        from django_smartbase_admin.messaging.models import Message
+        from django_smartbase_admin.messaging.services import (
+            SBAdminMessagingService,
+        )
+
+        post_save.connect(
+            SBAdminMessagingService.on_message_saved,
+            sender=Message,
+            dispatch_uid="sbadmin_messaging_broadcast_rewind",
+        )
 
     def _register_sb_admin(self):
         """Register Message + MessageRecipient with SBAdmin."""
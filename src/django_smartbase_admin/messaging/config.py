@@ -9,7 +9,9 @@ to its ``SBAdminRoleConfiguration`` via the ``messaging_config`` attribute
   (small toast vs. large modal, whether the modal must be acknowledged).
 - ``audiences``: pluggable recipient sources. Built-in providers cover concrete
   users, Django groups, and "all users"; a project adds a custom-model audience
-  by subclassing :class:`SBAdminMessageAudience`.
+  by subclassing :class:`SBAdminMessageAudience`. A ``broadcast`` audience
+  ("all users") is stored once as a predicate instead of one recipient row
+  per user.
 
 All model imports are done lazily (inside methods), because this module is
 imported while Django settings load — before the app registry is ready.
@@ -66,6 +68,9 @@ class SBAdminMessageAudience:
 
     key = None
     label = None
+    # Broadcast audiences are matched per user at read time through
+    # ``get_broadcast_q`` instead of being resolved into recipient rows.
+    broadcast = False
 
     def get_form_field(self, request):
         """Return the ``forms.Field`` for selecting within this audience.
@@ -87,6 +92,11 @@ class SBAdminMessageAudience:
         """Return a queryset/iterable of users for a stored targeting value."""
         raise NotImplementedError
 
+    def get_broadcast_q(self, user, request):
+        """Return a ``Q`` over ``Message`` matching the stored targeting values
+        of this audience that include ``user``. Only used when ``broadcast``."""
+        raise NotImplementedError
+
 
 class UsersAudience(SBAdminMessageAudience):
     """Target explicitly selected users."""
@@ -152,6 +162,7 @@ class AllUsersAudience(SBAdminMessageAudience):
 
     key = "all_users"
     label = _("All users")
+    broadcast = True
 
     def get_form_field(self, request):
         from django import forms
@@ -168,6 +179,11 @@ class AllUsersAudience(SBAdminMessageAudience):
             return get_user_model().objects.none()
         return get_user_model().objects.filter(is_active=True)
 
+    def get_broadcast_q(self, user, request):
+        if not user.is_active:
+            return models.Q(pk__in=[])
+        return models.Q(**{f"targeting__{self.key}": True})
+
 
 # Sensible defaults — projects can override either list wholesale.
 DEFAULT_MESSAGE_TYPES = [
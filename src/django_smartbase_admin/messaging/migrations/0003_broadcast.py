@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-19 18:43
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('sb_admin_messaging', '0002_alter_messageattachment_file'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MessageBroadcastWatermark',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='+', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('seen_up_to', models.BigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Broadcast watermark',
+                'verbose_name_plural': 'Broadcast watermarks',
+            },
+        ),
+        migrations.AddField(
+            model_name='message',
+            name='broadcast',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+    ]
@@ -23,6 +23,9 @@ class Message(models.Model):
     content = RichTextField(verbose_name=_("Content"), blank=True)
     # {audience_key: <serialized selection>} — kept for re-edit and re-resolution.
     targeting = models.JSONField(default=dict, blank=True)
+    # Targets a broadcast audience (e.g. "all users"): those users get no
+    # recipient rows up front — see ``MessageBroadcastWatermark``.
+    broadcast = models.BooleanField(default=False, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     created_by = models.ForeignKey(
@@ -142,3 +145,30 @@ class MessageRecipient(models.Model):
 
     def __str__(self):
         return self.message.title if self.message_id else _("Message")
+
+
+class MessageBroadcastWatermark(models.Model):
+    """Per-user "seen up to" mark over broadcast messages.
+
+    Broadcast messages are matched against their audience predicate at read
+    time; a user's ``MessageRecipient`` row is only created once the message
+    reaches them (poll, inbox). Every broadcast with a pk up to
+    ``seen_up_to`` already has that row, so only newer ones are matched.
+    Saving a broadcast message moves marks past it back before its pk.
+    """
+
+    user = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    seen_up_to = models.BigIntegerField(default=0)
+
+    class Meta:
+        app_label = "sb_admin_messaging"
+        verbose_name = _("Broadcast watermark")
+        verbose_name_plural = _("Broadcast watermarks")
+
+    def __str__(self):
+        return f"{self.user_id} → {self.seen_up_to}"
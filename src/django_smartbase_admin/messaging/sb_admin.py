@@ -112,7 +112,12 @@ class MessageAttachmentInline(SBAdminTableInline):
 
 
 class MessageRecipientStatusInline(SBAdminTableInlinePaginated):
-    """Read-only listing of recipients + their read status ("who hasn't read")."""
+    """Read-only listing of recipients + their read status ("who hasn't read").
+
+    Broadcast audiences ("All users") get a row only once the message reaches
+    a user (poll or inbox), so for broadcast messages this lists the users
+    who opened the admin since, not the whole audience.
+    """
 
     model = MessageRecipient
     fields = ["user", "notified", "read"]
@@ -155,6 +160,8 @@ class MessageAdmin(_MessageTypeBadgeMixin, SBAdminNoHistoryDetailMixin, SBAdmin)
             filter_disabled=True,
         ),
         SBAdminField(name="created_at", title=_("Created")),
+        # Counts recipient rows: broadcast audiences only include users the
+        # message has reached (see ``MessageRecipientStatusInline``).
         SBAdminField(
             name="unread_count",
             title=_("Unread"),
@@ -277,6 +284,9 @@ class MessageAdmin(_MessageTypeBadgeMixin, SBAdminNoHistoryDetailMixin, SBAdmin)
             obj.created_by = user if (user and user.is_authenticated) else None
         if messaging_config:
             obj.targeting = self._build_targeting(form, messaging_config)
+            obj.broadcast = SBAdminMessagingService.is_broadcast_targeting(
+                obj.targeting, messaging_config
+            )
         super().save_model(request, obj, form, change)
         if messaging_config:
             target_ids = SBAdminMessagingService.resolve_target_user_ids(
@@ -376,6 +386,10 @@ class MessageInboxAdmin(_MessageTypeBadgeMixin, SBAdminNoHistoryDetailMixin, SBA
 
     @sbadmin_action(permission="view")
     def action_list(self, request, *args, **kwargs):
+        # Broadcast messages reach the inbox as recipient rows created now.
+        SBAdminMessagingService.sync_broadcast_recipients(
+            request, SBAdminMessagingService.get_messaging_config(request)
+        )
         response = super().action_list(request, *args, **kwargs)
         # Title the list like its menu entry ("My messages") rather than the
         # MessageRecipient model's verbose name.
@@ -458,6 +472,7 @@ class MessageInboxAdmin(_MessageTypeBadgeMixin, SBAdminNoHistoryDetailMixin, SBA
         if not messaging_config or not (user and user.is_authenticated):
             return HttpResponse("")
 
+        SBAdminMessagingService.sync_broadcast_recipients(request, messaging_config)
         # Only surface messages that are still unread *and* not yet shown.
         # Filtering on ``read_at`` too means a message read by other means
         # (e.g. opening it in the inbox) never pops a stale toast/modal.
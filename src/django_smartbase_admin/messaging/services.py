@@ -1,11 +1,14 @@
 """Messaging service: config access, badges, recipient resolution + read state."""
 
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
 from django.utils import timezone
 
 from django_smartbase_admin.engine.field_formatter import format_badge
 from django_smartbase_admin.messaging.models import (
     Message,
     MessageAttachment,
+    MessageBroadcastWatermark,
     MessageRecipient,
 )
 
@@ -75,7 +78,11 @@ class SBAdminMessagingService:
         user = getattr(request, "user", None)
         if not (user and user.is_authenticated):
             return 0
-        return MessageRecipient.objects.filter(user=user, read_at__isnull=True).count()
+        messaging_config = cls.get_messaging_config(request)
+        return (
+            MessageRecipient.objects.filter(user=user, read_at__isnull=True).count()
+            + cls.get_pending_broadcasts(request, messaging_config).count()
+        )
 
     @classmethod
     def get_poller_context(cls, request):
@@ -113,11 +120,15 @@ class SBAdminMessagingService:
 
     @classmethod
     def resolve_target_user_ids(cls, message, request, messaging_config):
-        """Resolve a message's ``targeting`` blob into a set of user ids."""
+        """Resolve a message's ``targeting`` blob into a set of user ids.
+
+        Broadcast audiences are skipped: their users get recipient rows
+        lazily through :meth:`sync_broadcast_recipients`.
+        """
         user_ids = set()
         for audience_key, stored_value in (message.targeting or {}).items():
             audience = messaging_config.get_audience(audience_key)
-            if audience is None:
+            if audience is None or audience.broadcast:
                 continue
             user_ids.update(
                 audience.resolve_users(stored_value, request).values_list(
@@ -126,6 +137,108 @@ class SBAdminMessagingService:
             )
         return user_ids
 
+    @classmethod
+    def is_broadcast_targeting(cls, targeting, messaging_config):
+        """Whether ``targeting`` selects any broadcast audience."""
+        if not messaging_config:
+            return False
+        for audience_key, stored_value in (targeting or {}).items():
+            audience = messaging_config.get_audience(audience_key)
+            if audience is not None and audience.broadcast and stored_value:
+                return True
+        return False
+
+    @classmethod
+    def get_pending_broadcasts(cls, request, messaging_config):
+        """Broadcast messages reaching the request's user that have no
+        recipient row for them yet.
+
+        Only messages past the user's ``seen_up_to`` watermark are matched
+        against the broadcast audiences' predicates, and only messages sent
+        after the user joined, mirroring an up-front resolution of the
+        audience at send time.
+        """
+        user = getattr(request, "user", None)
+        audiences = [
+            audience
+            for audience in (messaging_config.audiences if messaging_config else [])
+            if audience.broadcast
+        ]
+        if not (audiences and user and user.is_authenticated):
+            return Message.objects.none()
+        audience_q = Q()
+        for audience in audiences:
+            audience_q |= audience.get_broadcast_q(user, request)
+        seen_up_to = (
+            MessageBroadcastWatermark.objects.filter(user=user)
+            .values_list("seen_up_to", flat=True)
+            .first()
+        )
+        pending = Message.objects.filter(
+            audience_q, broadcast=True, pk__gt=seen_up_to or 0
+        ).exclude(
+            Exists(MessageRecipient.objects.filter(message=OuterRef("pk"), user=user))
+        )
+        date_joined = getattr(user, "date_joined", None)
+        if date_joined is not None:
+            pending = pending.filter(created_at__gte=date_joined)
+        return pending
+
+    @classmethod
+    def sync_broadcast_recipients(cls, request, messaging_config):
+        """Create the request user's recipient rows for pending broadcast
+        messages and move their watermark past them.
+
+        Called where the user's rows are about to be read — the notification
+        poll and the inbox — so users who never open the admin never get rows.
+        Returns the number of rows created.
+        """
+        message_ids = list(
+            cls.get_pending_broadcasts(request, messaging_config).values_list(
+                "pk", flat=True
+            )
+        )
+        if not message_ids:
+            return 0
+        user = request.user
+        MessageRecipient.objects.bulk_create(
+            [
+                MessageRecipient(message_id=message_id, user=user)
+                for message_id in message_ids
+            ],
+            batch_size=cls.RECIPIENT_SYNC_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+        MessageBroadcastWatermark.objects.update_or_create(
+            user=user, defaults={"seen_up_to": max(message_ids)}
+        )
+        return len(message_ids)
+
+    @classmethod
+    def on_message_saved(cls, sender, instance, **kwargs):
+        """``post_save`` of ``Message``: rewind the watermarks once a
+        broadcast message commits (see :meth:`rewind_broadcast_watermarks`)."""
+        if instance.broadcast:
+            message_pk = instance.pk
+            transaction.on_commit(
+                lambda: cls.rewind_broadcast_watermarks(message_pk),
+                using=kwargs.get("using"),
+            )
+
+    @classmethod
+    def rewind_broadcast_watermarks(cls, message_pk):
+        """Move watermarks at or past ``message_pk`` back before it.
+
+        Pending broadcasts are matched by ``pk > seen_up_to``, so a message
+        that becomes broadcast after users moved past its pk (an edit, or an
+        insert committed after a later one) would never reach them. Their
+        next sync re-matches from here; messages they already have a row
+        for are skipped.
+        """
+        return MessageBroadcastWatermark.objects.filter(
+            seen_up_to__gte=message_pk
+        ).update(seen_up_to=message_pk - 1)
+
     @classmethod
     def add_recipients(cls, message, user_ids):
         """Create ``MessageRecipient`` rows for ``user_ids`` that don't have one.
@@ -178,6 +291,9 @@ class SBAdminMessagingService:
           ``resolve_users`` and may be required by custom audiences; pass
           explicit ``user_ids`` instead when no request/config is available.
 
+        A broadcast audience in ``targeting`` (e.g. ``{"all_users": True}``)
+        marks the message ``broadcast``; its users get recipient rows lazily.
+
         ``attachments`` is an optional iterable of Django ``File`` objects (each
         must carry a name, e.g. an ``UploadedFile`` or a named ``ContentFile``).
 
@@ -188,6 +304,7 @@ class SBAdminMessagingService:
             type=type,
             content=content or "",
             targeting=targeting or {},
+            broadcast=cls.is_broadcast_targeting(targeting, messaging_config),
             created_by=created_by,
         )
         recipient_ids = set(user_ids or [])
@@ -0,0 +1,136 @@
+"""Tests for broadcast delivery: "all users" messages are stored once and
+recipient rows are created per user only when the message reaches them.
+"""
+
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from django_smartbase_admin.messaging.config import (
+    AllUsersAudience,
+    SBAdminMessagingConfig,
+    UsersAudience,
+)
+from django_smartbase_admin.messaging.models import (
+    Message,
+    MessageBroadcastWatermark,
+    MessageRecipient,
+)
+from django_smartbase_admin.messaging.services import SBAdminMessagingService
+from django_smartbase_admin.messaging.tests.test_unread_badge import _request
+
+
+class BroadcastMessageTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.config = SBAdminMessagingConfig(
+            audiences=[UsersAudience(), AllUsersAudience()]
+        )
+        cls.u1 = User.objects.create_user(username="u1")
+        cls.u2 = User.objects.create_user(username="u2")
+        cls.inactive = User.objects.create_user(username="inactive", is_active=False)
+
+    def broadcast(self, **targeting):
+        return SBAdminMessagingService.create_message(
+            title="Announcement",
+            type="info",
+            targeting={"all_users": True, **targeting},
+            messaging_config=self.config,
+        )
+
+    def unread(self, user):
+        return SBAdminMessagingService.get_unread_count(_request(user, self.config))
+
+    def test_broadcast_creates_no_recipient_rows(self):
+        message = self.broadcast()
+        self.assertTrue(message.broadcast)
+        self.assertFalse(MessageRecipient.objects.filter(message=message).exists())
+        self.assertEqual(self.unread(self.u1), 1)
+        self.assertEqual(self.unread(self.u2), 1)
+        self.assertEqual(self.unread(self.inactive), 0)
+
+    def test_users_joining_later_do_not_receive_earlier_broadcasts(self):
+        self.broadcast()
+        newcomer = User.objects.create_user(
+            username="newcomer", date_joined=timezone.now() + timedelta(minutes=1)
+        )
+        self.assertEqual(self.unread(newcomer), 0)
+
+    def test_sync_creates_rows_once_and_advances_watermark(self):
+        first = self.broadcast()
+        second = self.broadcast()
+        request = _request(self.u1, self.config)
+
+        created = SBAdminMessagingService.sync_broadcast_recipients(
+            request, self.config
+        )
+
+        self.assertEqual(created, 2)
+        self.assertEqual(
+            set(
+                MessageRecipient.objects.filter(user=self.u1).values_list(
+                    "message_id", flat=True
+                )
+            ),
+            {first.pk, second.pk},
+        )
+        self.assertEqual(
+            MessageBroadcastWatermark.objects.get(user=self.u1).seen_up_to, second.pk
+        )
+        self.assertEqual(
+            SBAdminMessagingService.sync_broadcast_recipients(request, self.config), 0
+        )
+        self.assertFalse(MessageRecipient.objects.filter(user=self.u2).exists())
+        # The materialized rows are counted once, and reading one drops it.
+        self.assertEqual(self.unread(self.u1), 2)
+        recipient = MessageRecipient.objects.get(user=self.u1, message=first)
+        SBAdminMessagingService.mark_read(request, recipient.pk)
+        self.assertEqual(self.unread(self.u1), 1)
+
+    def test_explicit_recipient_of_a_broadcast_is_counted_once(self):
+        message = self.broadcast(users=[str(self.u1.pk)])
+        self.assertEqual(
+            list(
+                MessageRecipient.objects.filter(message=message).values_list(
+                    "user_id", flat=True
+                )
+            ),
+            [self.u1.pk],
+        )
+        self.assertEqual(self.unread(self.u1), 1)
+        self.assertEqual(
+            SBAdminMessagingService.sync_broadcast_recipients(
+                _request(self.u1, self.config), self.config
+            ),
+            0,
+        )
+
+    def test_message_becoming_broadcast_reaches_users_past_its_pk(self):
+        earlier = SBAdminMessagingService.create_message(
+            title="Earlier",
+            type="info",
+            targeting={"users": [str(self.u2.pk)]},
+            messaging_config=self.config,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            later = self.broadcast()
+        request = _request(self.u1, self.config)
+        SBAdminMessagingService.sync_broadcast_recipients(request, self.config)
+        self.assertEqual(
+            MessageBroadcastWatermark.objects.get(user=self.u1).seen_up_to, later.pk
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            earlier.targeting = {"all_users": True}
+            earlier.broadcast = True
+            earlier.save()
+
+        self.assertEqual(self.unread(self.u1), 2)
+        self.assertEqual(
+            SBAdminMessagingService.sync_broadcast_recipients(request, self.config), 1
+        )
+        self.assertTrue(
+            MessageRecipient.objects.filter(user=self.u1, message=earlier).exists()
+        )
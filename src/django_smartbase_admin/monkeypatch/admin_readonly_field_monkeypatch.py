@@ -60,7 +60,9 @@ class SBAdminReadonlyField(django.contrib.admin.helpers.AdminReadonlyField):
             else:
                 base_field = self.form.fields.get(
                     field
-                ) or model_admin.all_base_fields_form.base_fields.get(field)
+                ) or model_admin.get_all_base_fields_form(request).base_fields.get(
+                    field
+                )
                 if isinstance(f.remote_field, ManyToManyRel) and value is not None:
                     # get label from widget if has base_field
                     if base_field:
@@ -0,0 +1,119 @@
+from django.db.migrations.operations.base import Operation
+
+
+class AddSearchVectorColumn(Operation):
+    """Create a stored generated ``tsvector`` column with a GIN index.
+
+    Companion of :class:`~django_smartbase_admin.engine.search.SBAdminPostgresSearchEngine`
+    ``vector_column``. The column lives only in the database — the model
+    state is untouched, so Django never writes it and ``makemigrations``
+    never sees it. A no-op on backends other than PostgreSQL::
+
+        operations = [
+            AddSearchVectorColumn(
+                model_name="product",
+                fields=["name", "sku", "description"],
+                weights={"name": "A", "sku": "A"},
+                config="simple",
+            ),
+        ]
+
+    Only text columns can be listed: the generated expression must be
+    immutable, which rules out casts of dates, numbers with locale, etc.
+    """
+
+    reversible = True
+
+    def __init__(
+        self,
+        model_name,
+        fields,
+        column="sb_search_vector",
+        config="simple",
+        weights=None,
+        index_name=None,
+    ):
+        self.model_name = model_name
+        self.fields = list(fields)
+        self.column = column
+        self.config = config
+        self.weights = dict(weights or {})
+        self.index_name = index_name
+
+    def deconstruct(self):
+        kwargs = {
+            "model_name": self.model_name,
+            "fields": self.fields,
+        }
+        if self.column != "sb_search_vector":
+            kwargs["column"] = self.column
+        if self.config != "simple":
+            kwargs["config"] = self.config
+        if self.weights:
+            kwargs["weights"] = self.weights
+        if self.index_name:
+            kwargs["index_name"] = self.index_name
+        return self.__class__.__qualname__, [], kwargs
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def get_index_name(self, model):
+        return self.index_name or f"{model._meta.db_table}_{self.column}_gin"[:63]
+
+    def get_vector_sql(self, model, schema_editor):
+        quote_name = schema_editor.quote_name
+        config = schema_editor.quote_value(self.config)
+        parts = []
+        for field_name in self.fields:
+            column = quote_name(model._meta.get_field(field_name).column)
+            vector = f"to_tsvector({config}::regconfig, coalesce({column}::text, ''))"
+            weight = self.weights.get(field_name)
+            if weight:
+                vector = f"setweight({vector}, {schema_editor.quote_value(weight)})"
+            parts.append(vector)
+        return " || ".join(parts)
+
+    def get_create_sql(self, model, schema_editor):
+        quote_name = schema_editor.quote_name
+        table = quote_name(model._meta.db_table)
+        column = quote_name(self.column)
+        return [
+            f"ALTER TABLE {table} ADD COLUMN {column} tsvector "
+            f"GENERATED ALWAYS AS ({self.get_vector_sql(model, schema_editor)}) STORED",
+            f"CREATE INDEX {quote_name(self.get_index_name(model))} "
+            f"ON {table} USING GIN ({column})",
+        ]
+
+    def get_drop_sql(self, model, schema_editor):
+        quote_name = schema_editor.quote_name
+        return [
+            f"DROP INDEX IF EXISTS {quote_name(self.get_index_name(model))}",
+            f"ALTER TABLE {quote_name(model._meta.db_table)} "
+            f"DROP COLUMN IF EXISTS {quote_name(self.column)}",
+        ]
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        for sql in self.get_create_sql(model, schema_editor):
+            schema_editor.execute(sql)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if not self.allow_migrate_model(schema_editor.connection.alias, model):
+            return
+        for sql in self.get_drop_sql(model, schema_editor):
+            schema_editor.execute(sql)
+
+    def describe(self):
+        return f"Add search vector column {self.column} to {self.model_name}"
+
+    @property
+    def migration_name_fragment(self):
+        return f"{self.model_name.lower()}_{self.column}"
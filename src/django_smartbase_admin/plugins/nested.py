@@ -1,4 +1,4 @@
-"""Tabulator nested (one-level) data plugin.
+"""Tabulator nested data plugin.
 
 Admins opt in by declaring :attr:`sbadmin_nested` on the admin and
 registering :class:`TabulatorNestedPlugin` on
@@ -12,6 +12,7 @@ registering :class:`TabulatorNestedPlugin` on
         "start_expanded": False,                  # optional
         "only_show_filtered_children": True,      # optional, default True
         "parent_field_guarantees_root": False,    # optional, default False
+        "lazy_children": False,                   # optional, default False
     }
 
 Why the pipeline looks the way it does:
@@ -37,17 +38,41 @@ Only one level is rendered. Grandchildren and deeper rows are
 dropped at the parent-group step (see ``_build_parent_group_qs``) so they
 don't surface as bogus single-row top-level groups unless
 ``parent_field_guarantees_root=True`` opts out of that guard.
+
+``lazy_children=True`` switches to an arbitrary-depth tree loaded on
+demand:
+
+* Only the roots are counted and paged. Every row carries its number of
+  children (``CHILD_COUNT_FIELD``), one grouped ``COUNT`` over the parent
+  FK index for the whole page, and an empty ``_children`` list when it
+  has any so Tabulator draws the toggle.
+
+* Expanding a row calls ``action_list_json_children`` with the row pk in
+  ``CHILDREN_PARENT_PARAM``. It runs the same list pipeline narrowed to
+  that row's direct children, paged by primary-key keyset
+  (``CHILDREN_CURSOR_PARAM`` holds the last pk already loaded). The client
+  loads one page per expand and ends a partly loaded level with a "load
+  more" row (``LOAD_MORE_FIELD``) that fetches the next page.
+
+* Under active filters or search a row stays in the tree when it or any
+  of its descendants matches: a recursive CTE walks from the matching
+  rows up the parent FK and the tree levels keep only that ancestor
+  closure. The XLSX export skips the lazy tree and exports the matching
+  rows flat.
 """
 
 from typing import TYPE_CHECKING, Any
 
 from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
-from django.db.models import F, OuterRef, Subquery
+from django.db import connections
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.expressions import RawSQL
 
+from django_smartbase_admin.engine.const import Action
 from django_smartbase_admin.plugins.base import SBAdminPlugin
 
 if TYPE_CHECKING:
-    from django.db.models import QuerySet
+    from django.db.models import Q, QuerySet
     from django.http import HttpRequest
 
     from django_smartbase_admin.actions.admin_action_list import SBAdminListAction
@@ -58,6 +83,11 @@ CHILDREN_FIELD = "_children"
 PARENT_REAL_ID = "parent_real_id"
 CHILDREN_IDS = "children_ids"
 LAST_CHILD_FIELD = "_sbadmin_tree_last_child"
+CHILD_COUNT_FIELD = "_sbadmin_tree_child_count"
+# Marks the client-side "load more" child row of a partly loaded level.
+LOAD_MORE_FIELD = "_sbadmin_tree_load_more"
+CHILDREN_PARENT_PARAM = "nested_parent"
+CHILDREN_CURSOR_PARAM = "nested_after"
 
 _KNOWN_KEYS = {
     "parent_field",
@@ -65,6 +95,7 @@ _KNOWN_KEYS = {
     "start_expanded",
     "only_show_filtered_children",
     "parent_field_guarantees_root",
+    "lazy_children",
 }
 
 
@@ -104,6 +135,28 @@ def _resolve_element_column(view, request, nested: dict) -> str | None:
     return configured
 
 
+def _resolve_list_nested(view, request) -> dict | None:
+    """``resolve_nested`` for the list pipeline hooks. The XLSX export of a
+    lazily loaded tree gets ``None`` and exports the matching rows flat."""
+    nested = resolve_nested(view, request)
+    if (
+        nested is not None
+        and nested.get("lazy_children", False)
+        and request.request_data.action == Action.XLSX_EXPORT.value
+    ):
+        return None
+    return nested
+
+
+def _get_children_parent_id(request) -> str | None:
+    """Pk of the row whose children a children request loads, ``None``
+    for the root level."""
+    request_data = request.request_data
+    if request_data.action != Action.LIST_JSON_CHILDREN.value:
+        return None
+    return request_data.request_get.get(CHILDREN_PARENT_PARAM) or None
+
+
 class TabulatorNestedPlugin(SBAdminPlugin):
     """DB-level group-by plugin for Tabulator ``dataTree`` rendering."""
 
@@ -115,7 +168,7 @@ class TabulatorNestedPlugin(SBAdminPlugin):
         definition: dict[str, Any],
         **kwargs: Any,
     ) -> dict[str, Any]:
-        """Tell Tabulator to render returned rows as a one-level tree."""
+        """Tell Tabulator to render returned rows as a tree."""
         nested = resolve_nested(view, request)
         if nested is None:
             return definition
@@ -128,6 +181,19 @@ class TabulatorNestedPlugin(SBAdminPlugin):
         }
         if element_column:
             options["dataTreeElementColumn"] = element_column
+        if nested.get("lazy_children", False):
+            options.update(
+                {
+                    "dataTreeStartExpanded": False,
+                    "sbadminTreeChildCountField": CHILD_COUNT_FIELD,
+                    "sbadminTreeChildrenUrl": view.get_action_url(
+                        Action.LIST_JSON_CHILDREN.value
+                    ),
+                    "sbadminTreeChildrenParentParam": CHILDREN_PARENT_PARAM,
+                    "sbadminTreeChildrenCursorParam": CHILDREN_CURSOR_PARAM,
+                    "sbadminTreeLoadMoreField": LOAD_MORE_FIELD,
+                }
+            )
         definition.setdefault("tabulatorOptions", {}).update(options)
         return definition
 
@@ -141,16 +207,20 @@ class TabulatorNestedPlugin(SBAdminPlugin):
         **kwargs: Any,
     ) -> "QuerySet":
         """Remember the unfiltered row queryset used later for hydration."""
-        nested = resolve_nested(action.view, request)
+        nested = _resolve_list_nested(action.view, request)
         if nested is None:
             return qs
+        store = cls.get_request_data_plugin_store(request)
+        if nested.get("lazy_children", False):
+            # Filtered tree levels re-select from the unfiltered rows.
+            store["base_qs"] = qs
+            return qs
         # parent_field has to be in the values list so
         # ``modify_raw_data`` can map each row back to its parent.
         parent_field: str = nested["parent_field"]
         hydration_values = list(values)
         if parent_field not in hydration_values:
             hydration_values.append(parent_field)
-        store = cls.get_request_data_plugin_store(request)
         store["base_qs"] = qs.values(*hydration_values)
         store["values"] = hydration_values
         return qs
@@ -164,9 +234,18 @@ class TabulatorNestedPlugin(SBAdminPlugin):
         **kwargs: Any,
     ) -> "QuerySet":
         """Count parent groups, not raw package/category rows."""
-        nested = resolve_nested(action.view, request)
+        nested = _resolve_list_nested(action.view, request)
         if nested is None:
             return qs
+        if nested.get("lazy_children", False):
+            return cls._build_lazy_level_qs(
+                action,
+                request,
+                qs,
+                action.view.get_queryset(action.threadsafe_request),
+                nested,
+                kwargs.get("additional_filter"),
+            )
         # Count needs distinct parent groups only.
         return cls._build_parent_group_qs(
             action, qs, nested, include_sort_columns=False
@@ -183,9 +262,13 @@ class TabulatorNestedPlugin(SBAdminPlugin):
         **kwargs: Any,
     ) -> "QuerySet":
         """Return the parent-group page and stash child ids for hydration."""
-        nested = resolve_nested(action.view, request)
+        nested = _resolve_list_nested(action.view, request)
         if nested is None:
             return qs
+        if nested.get("lazy_children", False):
+            return cls._build_lazy_page_qs(
+                action, request, qs, nested, kwargs.get("additional_filter")
+            )
         # Stash caller ordering so ``modify_raw_data`` can apply it
         # to child rows too — otherwise groups sort correctly but
         # children land in whatever order the hydration query returned.
@@ -215,9 +298,12 @@ class TabulatorNestedPlugin(SBAdminPlugin):
         **kwargs: Any,
     ) -> list[dict[str, Any]]:
         """Replace page-group rows with raw hydrated parents and children."""
-        nested = resolve_nested(action.view, request)
+        nested = _resolve_list_nested(action.view, request)
         if nested is None:
             return data
+        if nested.get("lazy_children", False):
+            cls._add_child_counts(action, request, data, nested)
+            return data
         pk_name = action.get_pk_field().name
         parent_field: str = nested["parent_field"]
         only_filtered = nested.get("only_show_filtered_children", True)
@@ -274,9 +360,16 @@ class TabulatorNestedPlugin(SBAdminPlugin):
         **kwargs: Any,
     ) -> list[dict[str, Any]]:
         """Assemble finalized parent and child rows into ``_children``."""
-        nested = resolve_nested(action.view, request)
+        nested = _resolve_list_nested(action.view, request)
         if nested is None:
             return data
+        if nested.get("lazy_children", False):
+            # An empty list is enough for Tabulator to draw the toggle;
+            # the rows arrive from the children endpoint on expand.
+            for row in data:
+                if row.get(CHILD_COUNT_FIELD):
+                    row[CHILDREN_FIELD] = []
+            return data
         pk_name = action.get_pk_field().name
         parent_field: str = nested["parent_field"]
         store = cls.get_request_data_plugin_store(request)
@@ -327,7 +420,7 @@ class TabulatorNestedPlugin(SBAdminPlugin):
         order — the caller's sort was already applied during
         hydration, so sibling order is preserved.
         """
-        nested = resolve_nested(action.view, request)
+        nested = _resolve_list_nested(action.view, request)
         if nested is None:
             return data
         flattened: list[dict[str, Any]] = []
@@ -340,6 +433,126 @@ class TabulatorNestedPlugin(SBAdminPlugin):
             flattened.extend(children)
         return flattened
 
+    @classmethod
+    def _build_lazy_level_qs(
+        cls,
+        action: "SBAdminListAction",
+        request: "HttpRequest",
+        filtered_qs: "QuerySet",
+        unfiltered_qs: "QuerySet",
+        nested: dict,
+        additional_filter: "Q | None" = None,
+    ) -> "QuerySet":
+        """Rows of one tree level: the roots, or the direct children of the
+        row a children request expands.
+
+        Without filters that is ``filtered_qs`` itself. With filters a row
+        is kept when it or any descendant matches, so the level is
+        re-selected from ``unfiltered_qs`` and limited to the ancestor
+        closure of the matching rows.
+        """
+        parent_field: str = nested["parent_field"]
+        pk_name = action.get_pk_field().name
+        store = cls.get_request_data_plugin_store(request)
+        parent_id = _get_children_parent_id(request)
+        if parent_id is None:
+            level_filter = {f"{parent_field}__isnull": True}
+        else:
+            level_filter = {parent_field: parent_id}
+        if not cls._is_filtered(action, additional_filter):
+            store["tree_match_ids"] = None
+            return filtered_qs.filter(**level_filter)
+        tree_match_ids = _ancestor_closure_sql(
+            action.view.model, parent_field, filtered_qs.order_by().values(pk_name)
+        )
+        store["tree_match_ids"] = tree_match_ids
+        level_qs = unfiltered_qs.filter(**level_filter)
+        if parent_id is None or nested.get("only_show_filtered_children", True):
+            level_qs = level_qs.filter(**{f"{pk_name}__in": tree_match_ids})
+        return level_qs
+
+    @classmethod
+    def _build_lazy_page_qs(
+        cls,
+        action: "SBAdminListAction",
+        request: "HttpRequest",
+        qs: "QuerySet",
+        nested: dict,
+        additional_filter: "Q | None" = None,
+    ) -> "QuerySet":
+        """Ordered tree level the list pipeline slices into a page.
+
+        Roots keep the caller's sort and page by offset. Children page by
+        primary-key keyset, continuing after ``CHILDREN_CURSOR_PARAM``.
+        """
+        pk_name = action.get_pk_field().name
+        store = cls.get_request_data_plugin_store(request)
+        base_qs = store.get("base_qs", qs)
+        level_qs = cls._build_lazy_level_qs(
+            action, request, qs, base_qs, nested, additional_filter
+        )
+        if _get_children_parent_id(request) is not None:
+            level_qs = level_qs.order_by(pk_name)
+            cursor = request.request_data.request_get.get(CHILDREN_CURSOR_PARAM)
+            if cursor:
+                level_qs = level_qs.filter(**{f"{pk_name}__gt": cursor})
+            return level_qs
+        # A re-selected level lacks the search-rank and filter-only
+        # annotations; keep the sort keys it can still resolve.
+        order_by = [
+            expr
+            for expr in qs.query.order_by
+            if isinstance(expr, str)
+            and _is_direct_parent_sort_source(action.view.model, level_qs, expr)
+        ]
+        return level_qs.order_by(*order_by)
+
+    @classmethod
+    def _add_child_counts(
+        cls,
+        action: "SBAdminListAction",
+        request: "HttpRequest",
+        data: list[dict[str, Any]],
+        nested: dict,
+    ) -> None:
+        """Set ``CHILD_COUNT_FIELD`` on the page rows with one query grouped
+        by the (indexed) parent FK."""
+        action.allowed_framework_keys.add(CHILD_COUNT_FIELD)
+        if not data:
+            return
+        parent_field: str = nested["parent_field"]
+        pk_name = action.get_pk_field().name
+        children_qs = action.view.get_queryset(action.threadsafe_request).filter(
+            **{f"{parent_field}__in": [row[pk_name] for row in data]}
+        )
+        tree_match_ids = cls.get_request_data_plugin_store(request).get(
+            "tree_match_ids"
+        )
+        if tree_match_ids is not None and nested.get(
+            "only_show_filtered_children", True
+        ):
+            children_qs = children_qs.filter(**{f"{pk_name}__in": tree_match_ids})
+        counts = dict(
+            children_qs.order_by()
+            .values(parent_field)
+            .annotate(child_count=Count(pk_name))
+            .values_list(parent_field, "child_count")
+        )
+        for row in data:
+            row[CHILD_COUNT_FIELD] = counts.get(row[pk_name], 0)
+
+    @classmethod
+    def _is_filtered(
+        cls, action: "SBAdminListAction", additional_filter: "Q | None" = None
+    ) -> bool:
+        """Whether the request's filters, search or an additional filter
+        (e.g. an export selection) narrow the list."""
+        return bool(
+            action.is_search_query()
+            or action.get_filter_from_request()
+            or additional_filter
+        )
+
     @classmethod
     def _build_parent_group_qs(
         cls,
@@ -480,6 +693,30 @@ def _is_direct_parent_sort_source(model, base_qs: "QuerySet", source: str) -> bo
     return True
 
 
+def _ancestor_closure_sql(model, parent_field: str, seed_qs: "QuerySet") -> RawSQL:
+    """Subquery selecting the pks of ``seed_qs`` and of all their ancestors.
+
+    The recursive CTE walks up the self-referential FK; ``UNION`` rather
+    than ``UNION ALL`` drops revisited rows, so cyclic data terminates.
+    """
+    field = model._meta.get_field(parent_field)
+    opts = field.model._meta
+    quote_name = connections[seed_qs.db].ops.quote_name
+    table = quote_name(opts.db_table)
+    pk_column = quote_name(opts.pk.column)
+    parent_column = quote_name(field.column)
+    seed_sql, seed_params = seed_qs.query.get_compiler(seed_qs.db).as_sql()
+    sql = (
+        f"WITH RECURSIVE sbadmin_tree(node_id, parent_id) AS ("
+        f"SELECT {pk_column}, {parent_column} FROM {table} "
+        f"WHERE {pk_column} IN ({seed_sql}) "
+        f"UNION SELECT t.{pk_column}, t.{parent_column} FROM {table} t "
+        f"INNER JOIN sbadmin_tree ON t.{pk_column} = sbadmin_tree.parent_id"
+        f") SELECT node_id FROM sbadmin_tree"
+    )
+    return RawSQL(sql, seed_params)
+
+
 def _validate(view, nested: dict) -> None:
     """Validate nested plugin config once per resolved view."""
     if not isinstance(nested, dict):
@@ -16,6 +16,7 @@ from unittest.mock import MagicMock
 from django.core.exceptions import ImproperlyConfigured
 from django.db import connection
 from django.db.models import IntegerField, Q, Value
+from django.http import QueryDict
 from django.test import RequestFactory, TestCase, override_settings
 from django.test.utils import CaptureQueriesContext
 from django.urls import path
@@ -24,9 +25,14 @@ from filer.models import Folder
 from django_smartbase_admin.admin.admin_base import SBAdmin
 from django_smartbase_admin.admin.site import sb_admin_site
 from django_smartbase_admin.engine.actions import SBAdminRowAction
+from django_smartbase_admin.engine.const import Action
 from django_smartbase_admin.engine.request import SBAdminViewRequestData
 from django_smartbase_admin.plugins.nested import (
+    CHILD_COUNT_FIELD,
+    CHILDREN_CURSOR_PARAM,
+    CHILDREN_PARENT_PARAM,
     LAST_CHILD_FIELD,
+    LOAD_MORE_FIELD,
     TabulatorNestedPlugin,
     _is_direct_parent_sort_source,
     resolve_nested,
@@ -436,3 +442,139 @@ class TabulatorNestedPluginTests(TestCase):
         child_row = parent_row["_children"][0]
         self.assertEqual(len(parent_row["_row_actions"]), 1)
         self.assertEqual(len(child_row["_row_actions"]), 1)
+
+
+LAZY_NESTED = {"parent_field": "parent", "lazy_children": True}
+
+
+@override_settings(ROOT_URLCONF=__name__)
+class TabulatorNestedLazyChildrenTests(TestCase):
+    """``lazy_children=True``: roots are paged, children load per row
+    through ``action_list_json_children``."""
+
+    @classmethod
+    def setUpTestData(cls):
+        # Same tree as above, one level deeper under child_a2.
+        cls.root_a = Folder.objects.create(name="root_a")
+        cls.root_b = Folder.objects.create(name="root_b")
+        cls.child_a1 = Folder.objects.create(name="child_a1", parent=cls.root_a)
+        cls.child_a2 = Folder.objects.create(name="child_a2", parent=cls.root_a)
+        cls.grandchild = Folder.objects.create(name="grandchild", parent=cls.child_a2)
+        cls.great_grandchild = Folder.objects.create(
+            name="great_grandchild", parent=cls.grandchild
+        )
+
+    _make_view_and_request = TabulatorNestedPluginTests._make_view_and_request
+
+    def _children_request(self, request, parent, after=None):
+        params = QueryDict(mutable=True)
+        params[CHILDREN_PARENT_PARAM] = parent.pk
+        if after is not None:
+            params[CHILDREN_CURSOR_PARAM] = after.pk
+        request.request_data.action = Action.LIST_JSON_CHILDREN.value
+        request.request_data.request_get = params
+        return request
+
+    def _rows_by_id(self, payload):
+        return {row["id"]: row for row in payload["data"]}
+
+    def test_tabulator_definition_points_at_children_endpoint(self):
+        view, request = self._make_view_and_request(sbadmin_nested=LAZY_NESTED)
+        opts = view.get_tabulator_definition(request)["tabulatorOptions"]
+        self.assertFalse(opts["dataTreeStartExpanded"])
+        self.assertEqual(opts["sbadminTreeChildCountField"], CHILD_COUNT_FIELD)
+        self.assertIn(Action.LIST_JSON_CHILDREN.value, opts["sbadminTreeChildrenUrl"])
+        self.assertEqual(opts["sbadminTreeLoadMoreField"], LOAD_MORE_FIELD)
+
+    def test_roots_are_paged_with_child_counts(self):
+        view, request = self._make_view_and_request(sbadmin_nested=LAZY_NESTED)
+
+        with CaptureQueriesContext(connection) as captured:
+            payload = json.loads(
+                view.action_list_json(request, modifier="template").content
+            )
+
+        self.assertEqual(payload["last_row"], 2)
+        rows = self._rows_by_id(payload)
+        self.assertEqual(set(rows), {self.root_a.pk, self.root_b.pk})
+        self.assertEqual(rows[self.root_a.pk][CHILD_COUNT_FIELD], 2)
+        self.assertEqual(rows[self.root_a.pk]["_children"], [])
+        self.assertEqual(rows[self.root_b.pk][CHILD_COUNT_FIELD], 0)
+        self.assertNotIn("_children", rows[self.root_b.pk])
+        # count, page and one grouped child count — no eager hydration.
+        self.assertEqual(len(captured.captured_queries), 3)
+
+    def test_children_endpoint_returns_direct_children_by_keyset(self):
+        view, request = self._make_view_and_request(sbadmin_nested=LAZY_NESTED)
+        self._children_request(request, self.root_a)
+
+        payload = json.loads(
+            view.action_list_json_children(request, modifier="json").content
+        )
+
+        self.assertEqual(payload["last_row"], 2)
+        rows = self._rows_by_id(payload)
+        self.assertEqual(list(rows), [self.child_a1.pk, self.child_a2.pk])
+        self.assertEqual(rows[self.child_a2.pk][CHILD_COUNT_FIELD], 1)
+        self.assertEqual(rows[self.child_a2.pk]["_children"], [])
+
+        self._children_request(request, self.root_a, after=self.child_a1)
+        action = view.sbadmin_list_action_class(view, request, page_size=1)
+        payload = action.get_json_data(page_num=1, remember_page_window=False)
+        self.assertEqual([row["id"] for row in payload["data"]], [self.child_a2.pk])
+
+    def test_filter_keeps_ancestor_chain_of_matching_descendants(self):
+        """A match three levels down keeps every ancestor on the way up,
+        and only that branch."""
+        view, request = self._make_view_and_request(sbadmin_nested=LAZY_NESTED)
+        match = Q(pk=self.great_grandchild.pk)
+
+        action = view.sbadmin_list_action_class(view, request)
+        payload = action.get_data(additional_filter=match)
+        self.assertEqual(payload["last_row"], 1)
+        (root_row,) = payload["data"]
+        self.assertEqual(root_row["id"], self.root_a.pk)
+        self.assertEqual(root_row[CHILD_COUNT_FIELD], 1)
+
+        self._children_request(request, self.root_a)
+        action = view.sbadmin_list_action_class(view, request)
+        payload = action.get_data(page_num=1, additional_filter=match)
+        self.assertEqual([row["id"] for row in payload["data"]], [self.child_a2.pk])
+
+        self._children_request(request, self.grandchild)
+        action = view.sbadmin_list_action_class(view, request)
+        payload = action.get_data(page_num=1, additional_filter=match)
+        self.assertEqual(
+            [row["id"] for row in payload["data"]], [self.great_grandchild.pk]
+        )
+        self.assertEqual(payload["data"][0][CHILD_COUNT_FIELD], 0)
+
+    def test_restricted_queryset_alone_is_not_filtered(self):
+        """Only the request's filters, search or additional filter select
+        the filtered tree; restricting the view's rows does not."""
+        view, request = self._make_view_and_request(
+            sbadmin_nested=LAZY_NESTED,
+            restrict=lambda qs, **kwargs: qs.exclude(name="root_b"),
+        )
+        action = view.sbadmin_list_action_class(view, request)
+        payload = action.get_data()
+        self.assertEqual([row["id"] for row in payload["data"]], [self.root_a.pk])
+        store = TabulatorNestedPlugin.get_request_data_plugin_store(request)
+        self.assertIsNone(store["tree_match_ids"])
+
+        action = view.sbadmin_list_action_class(view, request)
+        action.get_data(additional_filter=Q(pk=self.child_a1.pk))
+        self.assertIsNotNone(store["tree_match_ids"])
+
+    def test_xlsx_export_keeps_matching_rows_flat(self):
+        from django_smartbase_admin.engine.const import IGNORE_LIST_SELECTION
+
+        view, request = self._make_view_and_request(sbadmin_nested=LAZY_NESTED)
+        view.ordering = ("name",)
+        request.request_data.action = Action.XLSX_EXPORT.value
+        request.request_data.modifier = IGNORE_LIST_SELECTION
+        action = view.sbadmin_list_action_class(view, request)
+
+        _, data_list, _, _ = action.get_xlsx_data(request)
+
+        self.assertEqual(len(data_list), Folder.objects.count())
@@ -0,0 +1,200 @@
+"""
+Read-replica routing for read-only admin actions.
+
+Actions declared ``@sbadmin_action(read_only=True)`` — or listed in the
+view's ``sbadmin_read_only_actions`` — run their reads against the replica
+alias: list JSON, xlsx export, autocomplete, dashboard widget data and the
+MCP ``list_rows`` tool. Writes always go to the primary.
+
+A user whose request saved, deleted or bulk-wrote a model (model signals
+and ``services.write_signals``) is pinned to the primary for
+``SB_ADMIN_READ_REPLICA_STICKY_SECONDS``, so they never read a replica
+that has not caught up with their own edit. Bookkeeping writes don't pin:
+sessions, ``SB_ADMIN_READ_REPLICA_IGNORED_MODELS`` and anything written
+without a model signal (``DatabaseCache``). The pin is kept in the session
+and in the default cache (MCP requests have no persistent session); use a
+cache shared between workers.
+
+Enable by adding the router after the project's own routers::
+
+    DATABASE_ROUTERS = [..., "django_smartbase_admin.services.db_routing.SBAdminReplicaRouter"]
+    SB_ADMIN_READ_REPLICA_DATABASE = "replica"
+
+Settings:
+
+- ``SB_ADMIN_READ_REPLICA_DATABASE``: replica alias; ``None`` (default)
+  disables routing
+- ``SB_ADMIN_READ_REPLICA_STICKY_SECONDS`` (default ``10``)
+- ``SB_ADMIN_READ_REPLICA_IGNORED_MODELS``: ``app_label.model`` labels
+  whose writes don't pin (default ``()``)
+"""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.contrib.sessions.base_session import AbstractBaseSession
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from django_smartbase_admin.services.thread_local import SBAdminThreadLocalService
+from django_smartbase_admin.services.write_signals import queryset_written
+
+PRIMARY_PIN_SESSION_KEY = "sb_admin_primary_pinned_until"
+PRIMARY_PIN_CACHE_KEY = "sb_admin_primary_pin:{user_pk}"
+WRITE_RECORDED_ATTR = "_sbadmin_write_recorded"
+
+sb_admin_read_alias: ContextVar = ContextVar("sb_admin_read_alias", default=None)
+
+
+class SBAdminDatabaseRoutingService(object):
+    @classmethod
+    def get_replica_alias(cls) -> str | None:
+        return getattr(settings, "SB_ADMIN_READ_REPLICA_DATABASE", None)
+
+    @classmethod
+    def get_sticky_seconds(cls) -> int:
+        return getattr(settings, "SB_ADMIN_READ_REPLICA_STICKY_SECONDS", 10)
+
+    @classmethod
+    def get_read_alias(cls) -> str | None:
+        return sb_admin_read_alias.get()
+
+    @classmethod
+    def is_read_only_action(cls, request, view, action_name, action_attrs=None):
+        read_only = (action_attrs or {}).get("read_only")
+        if read_only is None:
+            is_read_only = getattr(view, "is_sbadmin_read_only_action", None)
+            read_only = callable(is_read_only) and is_read_only(request, action_name)
+        return read_only is True
+
+    # ─── Read-your-writes ───
+
+    @classmethod
+    def get_user_pk(cls, request):
+        user = getattr(request, "user", None)
+        if user is None or not user.is_authenticated:
+            return None
+        return user.pk
+
+    @classmethod
+    def is_pinned_to_primary(cls, request) -> bool:
+        user_pk = cls.get_user_pk(request)
+        if user_pk is None:
+            return False
+        session = getattr(request, "session", None)
+        if (
+            session is not None
+            and session.get(PRIMARY_PIN_SESSION_KEY, 0) > time.time()
+        ):
+            return True
+        return cache.get(PRIMARY_PIN_CACHE_KEY.format(user_pk=user_pk)) is not None
+
+    @classmethod
+    def pin_to_primary(cls, request) -> None:
+        user_pk = cls.get_user_pk(request)
+        if user_pk is None:
+            return
+        seconds = cls.get_sticky_seconds()
+        session = getattr(request, "session", None)
+        if session is not None:
+            session[PRIMARY_PIN_SESSION_KEY] = time.time() + seconds
+        cache.set(PRIMARY_PIN_CACHE_KEY.format(user_pk=user_pk), True, seconds)
+
+    @classmethod
+    def connect_write_signals(cls) -> None:
+        uid = "sbadmin_replica_pin"
+        post_save.connect(cls.on_model_write, dispatch_uid=uid)
+        post_delete.connect(cls.on_model_write, dispatch_uid=uid)
+        queryset_written.connect(cls.on_model_write, dispatch_uid=uid)
+        m2m_changed.connect(cls.on_m2m_write, dispatch_uid=uid)
+
+    @classmethod
+    def is_ignored_model(cls, model) -> bool:
+        if issubclass(model, AbstractBaseSession):
+            return True
+        ignored = getattr(settings, "SB_ADMIN_READ_REPLICA_IGNORED_MODELS", ())
+        return model._meta.label_lower in {label.lower() for label in ignored}
+
+    @classmethod
+    def on_model_write(cls, sender, **kwargs) -> None:
+        if not cls.is_ignored_model(sender):
+            cls.record_write()
+
+    @classmethod
+    def on_m2m_write(cls, sender, action, **kwargs) -> None:
+        if action.startswith("post_"):
+            cls.on_model_write(sender)
+
+    @classmethod
+    def record_write(cls) -> None:
+        """Called after every model write: pins the bound request's user
+        (once per request) and sends the rest of the request's reads to the
+        primary."""
+        if not cls.get_replica_alias():
+            return
+        sb_admin_read_alias.set(None)
+        request = SBAdminThreadLocalService.get_request()
+        if request is None or getattr(request, WRITE_RECORDED_ATTR, False):
+            return
+        setattr(request, WRITE_RECORDED_ATTR, True)
+        cls.pin_to_primary(request)
+
+    # ─── Routing scopes ───
+
+    @classmethod
+    @contextmanager
+    def use_replica(cls, request):
+        alias = cls.get_replica_alias()
+        if not alias or cls.is_pinned_to_primary(request):
+            yield None
+            return
+        token = sb_admin_read_alias.set(alias)
+        try:
+            yield alias
+        finally:
+            sb_admin_read_alias.reset(token)
+
+    @classmethod
+    def route_action(cls, request, view, action_name, action_attrs=None):
+        """Context manager routing the reads of one action call."""
+        if cls.is_read_only_action(request, view, action_name, action_attrs):
+            return cls.use_replica(request)
+        return nullcontext()
+
+
+class SBAdminReplicaRouter(object):
+    def db_for_read(self, model, **hints):
+        alias = SBAdminDatabaseRoutingService.get_read_alias()
+        if alias and SBAdminDatabaseRoutingService.is_ignored_model(model):
+            # Bookkeeping written right before (the session) is read back
+            # from the primary.
+            return None
+        return alias
+
+    def db_for_write(self, model, **hints):
+        # Not a write yet: Django also asks for session and cache saves,
+        # get_or_create and select_for_update. The pin is recorded from the
+        # write signals instead (``connect_write_signals``).
+        # Without a router answer Django writes an instance back to the
+        # database it was read from, which may be the replica.
+        instance = hints.get("instance")
+        replica = SBAdminDatabaseRoutingService.get_replica_alias()
+        if replica and instance is not None and instance._state.db == replica:
+            return DEFAULT_DB_ALIAS
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        replica = SBAdminDatabaseRoutingService.get_replica_alias()
+        if replica and {obj1._state.db, obj2._state.db} <= {DEFAULT_DB_ALIAS, replica}:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == SBAdminDatabaseRoutingService.get_replica_alias():
+            return False
+        return None
@@ -0,0 +1,261 @@
+"""
+Conditional responses for list JSON and autocomplete.
+
+Admins opt in with ``sbadmin_http_cache = True`` (plus
+``sbadmin_http_cache_models`` for related models their rows read). Every
+tracked model has a change watermark in the default cache, replaced after
+each committed save, delete or m2m change (Django signals) and after
+``QuerySet.update`` / ``delete`` / ``bulk_create`` / ``bulk_update``
+(``services.write_signals``).
+
+The watermarks never expire, so the default cache must be shared by every
+worker (Redis, Memcached, database). With a process-local backend
+(``LocMemCache``) a write in one worker never reaches the others, which keep
+answering 304 with stale data; system check ``sbadmin.W006`` flags opted-in
+admins on such a backend. Without a cache (``DummyCache``) responses are
+never cached.
+
+A response's ``ETag`` is derived from the watermarks, the normalized request
+params, the current date and the configuration's
+``get_http_cache_fingerprint``. The date keeps relative date filters
+("Last 7 days", resolved against ``timezone.now()``) from being answered
+for a window that has moved on. A matching
+``If-None-Match`` is answered with 304 before any queryset is built, and
+bodies are kept server-side for a short while so identical requests from
+other tabs are served without running the pipeline.
+
+Browsers revalidate GET responses (list JSON) on their own; autocomplete is
+a POST, so it is served from the server-side cache only.
+
+Settings:
+
+- ``SB_ADMIN_HTTP_CACHE_TIMEOUT``: seconds a body stays in the cache
+  (default ``60``; ``0`` keeps no bodies, ETags still apply)
+- ``SB_ADMIN_HTTP_CACHE_MAX_BYTES``: larger bodies are not kept
+  (default ``524288``)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import uuid
+from collections.abc import Callable, Iterable
+
+from django.conf import settings
+from django.contrib import messages
+from django.core.cache import cache
+from django.db import router, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.utils.translation import get_language
+
+from django_smartbase_admin.services.write_signals import queryset_written
+
+VERSION_CACHE_KEY = "sb_admin_http_cache_version:{label}"
+RESPONSE_CACHE_KEY = "sb_admin_http_cache_response:{etag}"
+
+# Labels of the models whose watermark is maintained in this process.
+_tracked_models: set[str] = set()
+
+
+class _WatermarkBump(object):
+    """``on_commit`` callback; one per model and savepoint level."""
+
+    def __init__(self, label) -> None:
+        self.label = label
+
+    def __call__(self) -> None:
+        SBAdminHttpCacheService.bump(self.label)
+
+
+class SBAdminHttpCacheService(object):
+    @classmethod
+    def get_timeout(cls) -> int:
+        return getattr(settings, "SB_ADMIN_HTTP_CACHE_TIMEOUT", 60)
+
+    @classmethod
+    def get_max_bytes(cls) -> int:
+        return getattr(settings, "SB_ADMIN_HTTP_CACHE_MAX_BYTES", 512 * 1024)
+
+    # ─── Watermarks ───
+
+    @classmethod
+    def track_models(cls, models: Iterable) -> None:
+        for model in models:
+            label = model._meta.label_lower
+            if label in _tracked_models:
+                continue
+            _tracked_models.add(label)
+            uid = f"sbadmin_http_cache:{label}"
+            post_save.connect(cls.on_model_signal, sender=model, dispatch_uid=uid)
+            post_delete.connect(cls.on_model_signal, sender=model, dispatch_uid=uid)
+            queryset_written.connect(
+                cls.on_model_signal, sender=model, dispatch_uid=uid
+            )
+            for field in model._meta.many_to_many:
+                through = field.remote_field.through
+                m2m_changed.connect(
+                    cls.on_m2m_signal,
+                    sender=through,
+                    dispatch_uid=f"sbadmin_http_cache:{through._meta.label_lower}",
+                )
+
+    @classmethod
+    def track_registered_views(cls, admin_site) -> None:
+        """Track the models of every opted-in admin, and of admins whose
+        previous/next windows are keyed by the watermark; run once the
+        admins are registered, so each process maintains the same
+        watermarks."""
+        for view in admin_site._registry.values():
+            get_models = getattr(view, "get_sbadmin_http_cache_models", None)
+            if callable(get_models):
+                cls.track_models(get_models())
+            if getattr(view, "sbadmin_previous_next_buttons_enabled", False):
+                cls.track_models([view.model])
+
+    @classmethod
+    def is_tracked(cls, model) -> bool:
+        return model is not None and model._meta.label_lower in _tracked_models
+
+    @classmethod
+    def on_model_signal(cls, sender, using=None, **kwargs) -> None:
+        cls.model_changed(sender, using=using)
+
+    @classmethod
+    def on_m2m_signal(cls, sender, instance, model, action, using=None, **kwargs):
+        if not action.startswith("post_"):
+            return
+        cls.model_changed(type(instance), using=using)
+        cls.model_changed(model, using=using)
+
+    @classmethod
+    def model_changed(cls, model, using=None) -> None:
+        """Replace the watermark of ``model`` once the current transaction
+        commits (immediately in autocommit). Readers never see the new
+        watermark with the old data."""
+        label = model._meta.label_lower
+        if label not in _tracked_models:
+            return
+        connection = transaction.get_connection(using or router.db_for_write(model))
+        if not connection.in_atomic_block:
+            cls.bump(label)
+            return
+        savepoint_ids = set(connection.savepoint_ids)
+        for callback_savepoint_ids, callback, _robust in connection.run_on_commit:
+            # Reuse only a bump queued at the same savepoint level, so every
+            # block owns one (an extra bump is harmless).
+            if (
+                isinstance(callback, _WatermarkBump)
+                and callback.label == label
+                and callback_savepoint_ids == savepoint_ids
+            ):
+                return
+        transaction.on_commit(_WatermarkBump(label), using=connection.alias)
+
+    @classmethod
+    def bump(cls, label: str) -> None:
+        cache.set(VERSION_CACHE_KEY.format(label=label), uuid.uuid4().hex, None)
+
+    @classmethod
+    def get_versions(cls, models: Iterable) -> dict[str, str]:
+        keys = {
+            VERSION_CACHE_KEY.format(label=model._meta.label_lower): model
+            for model in models
+        }
+        versions = cache.get_many(keys)
+        for key in keys.keys() - versions.keys():
+            # First use, or evicted: a fresh token never matches an old ETag.
+            cache.add(key, uuid.uuid4().hex, None)
+            versions[key] = cache.get(key)
+        return versions
+
+    # ─── Conditional responses ───
+
+    @classmethod
+    def get_request_params(cls, request):
+        params = {"get": sorted(request.GET.lists())}
+        if request.method == "POST":
+            if request.content_type == "application/json":
+                try:
+                    params["post"] = json.loads(request.body)
+                except ValueError:
+                    params["post"] = request.body.decode(errors="replace")
+            else:
+                params["post"] = sorted(request.POST.lists())
+        return params
+
+    @classmethod
+    def get_etag(cls, request, view, models) -> str | None:
+        """``None`` when the response must not be cached."""
+        if len(messages.get_messages(request)):
+            # Pending notifications are rendered into the response.
+            return None
+        request_data = request.request_data
+        fingerprint = request_data.configuration.get_http_cache_fingerprint(request)
+        if fingerprint is None:
+            return None
+        versions = cls.get_versions(models)
+        if None in versions.values():
+            # No cache to keep watermarks in (``DummyCache``).
+            return None
+        key = [
+            view.get_id(),
+            request_data.action,
+            request_data.modifier,
+            request_data.object_id,
+            get_language(),
+            # Relative date shortcuts resolve to whole days from now.
+            timezone.now().date(),
+            fingerprint,
+            request_data.global_filter,
+            sorted(versions.items()),
+            cls.get_request_params(request),
+        ]
+        digest = hashlib.sha1(
+            json.dumps(key, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f'"{digest}"'
+
+    @classmethod
+    def respond(
+        cls, request, view, models, build_response: Callable[[], HttpResponse]
+    ) -> HttpResponse:
+        """``build_response()`` unless the client or the server-side cache
+        already holds the response for the current watermarks."""
+        models = list(models)
+        if not models or not all(cls.is_tracked(model) for model in models):
+            return build_response()
+        etag = cls.get_etag(request, view, models)
+        if etag is None:
+            return build_response()
+        if_none_match = request.headers.get("If-None-Match", "")
+        if etag in [tag.strip() for tag in if_none_match.split(",")]:
+            response = HttpResponseNotModified()
+            return cls.patch_response(response, etag)
+        cache_key = RESPONSE_CACHE_KEY.format(etag=etag.strip('"'))
+        cached = cache.get(cache_key) if cls.get_timeout() else None
+        if cached is not None:
+            content, content_type = cached
+            return cls.patch_response(
+                HttpResponse(content, content_type=content_type), etag
+            )
+        response = build_response()
+        if response.status_code != 200 or response.streaming:
+            return response
+        if cls.get_timeout() and len(response.content) <= cls.get_max_bytes():
+            cache.set(
+                cache_key,
+                (response.content, response["Content-Type"]),
+                cls.get_timeout(),
+            )
+        return cls.patch_response(response, etag)
+
+    @classmethod
+    def patch_response(cls, response, etag):
+        response["ETag"] = etag
+        # Revalidate on every use; never shared between users.
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
@@ -0,0 +1,401 @@
+"""
+Per-action performance instrumentation and query budgets.
+
+``delegate_to_action``, dashboard widget data and MCP tools run inside
+``SBAdminInstrumentationService.measure``, which records wall time, DB
+queries (count and time, through ``connection.execute_wrapper``), rows and
+response bytes per ``(kind, view, action)``. Code inside a
+measurement breaks it into stages with ``stage(name)`` — the list action
+reports ``queryset``, ``count``, ``fetch``, ``format`` and ``serialize``;
+template responses add ``render``.
+
+Totals are aggregated per process and exposed as Prometheus text
+(``render_prometheus``, served at ``<admin>/metrics/``) and on the
+``SBAdminPerformanceDashboardView``.
+
+Budgets come from ``@sbadmin_action(max_queries=N)`` or the view's
+``sbadmin_query_budgets``. An exceeded budget is logged as a warning, and
+raises ``SBAdminQueryBudgetExceeded`` under the test runner (or when
+``SB_ADMIN_QUERY_BUDGET_MODE = "raise"``).
+
+Settings:
+
+- ``SB_ADMIN_INSTRUMENTATION_ENABLED`` (default ``True``)
+- ``SB_ADMIN_QUERY_BUDGET_MODE``: ``"warn"`` / ``"raise"``; defaults to
+  ``"raise"`` while tests run and ``"warn"`` otherwise
+- ``SB_ADMIN_METRICS_TOKEN``: bearer token accepted by the metrics
+  endpoint next to superuser sessions
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.core import mail
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+BUDGET_MODE_WARN = "warn"
+BUDGET_MODE_RAISE = "raise"
+
+_current_measurement: ContextVar["SBAdminMeasurement | None"] = ContextVar(
+    "sbadmin_current_measurement", default=None
+)
+# Outermost measurement waiting for its template response to render; closed
+# by the post-render callback, or by the next measurement on the same thread
+# when the response never rendered.
+_pending = threading.local()
+
+
+class SBAdminQueryBudgetExceeded(AssertionError):
+    pass
+
+
+@dataclass
+class SBAdminStageStats:
+    seconds: float = 0.0
+    query_count: int = 0
+    query_seconds: float = 0.0
+
+
+@dataclass
+class SBAdminMeasurement:
+    kind: str
+    view: str
+    action: str
+    modifier: str = ""
+    max_queries: int | None = None
+    started: float = field(default_factory=time.perf_counter)
+    wall_seconds: float = 0.0
+    query_count: int = 0
+    query_seconds: float = 0.0
+    rows: int = 0
+    response_bytes: int = 0
+    error: bool = False
+    stages: dict[str, SBAdminStageStats] = field(default_factory=dict)
+    stage_stack: list[str] = field(default_factory=list)
+    closed: bool = False
+    is_outermost: bool = field(default=True, repr=False)
+    wrapper: object = field(default=None, repr=False)
+    token: object = field(default=None, repr=False)
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        # The modifier only names the budget in messages: it can carry
+        # arbitrary values, which would grow the metrics without bound.
+        return self.kind, self.view, self.action
+
+    def get_stage(self, name: str) -> SBAdminStageStats:
+        return self.stages.setdefault(name, SBAdminStageStats())
+
+    def record_query(self, seconds: float) -> None:
+        self.query_count += 1
+        self.query_seconds += seconds
+        if self.stage_stack:
+            stage = self.get_stage(self.stage_stack[-1])
+            stage.query_count += 1
+            stage.query_seconds += seconds
+
+
+@dataclass
+class SBAdminMetric:
+    calls: int = 0
+    errors: int = 0
+    budget_exceeded: int = 0
+    wall_seconds: float = 0.0
+    wall_seconds_max: float = 0.0
+    query_count: int = 0
+    query_seconds: float = 0.0
+    rows: int = 0
+    response_bytes: int = 0
+    stages: dict[str, SBAdminStageStats] = field(default_factory=dict)
+
+
+class SBAdminInstrumentationService(object):
+    _lock = threading.Lock()
+    _metrics: dict[tuple[str, str, str], SBAdminMetric] = {}
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return getattr(settings, "SB_ADMIN_INSTRUMENTATION_ENABLED", True)
+
+    @classmethod
+    def get_budget_mode(cls) -> str:
+        mode = getattr(settings, "SB_ADMIN_QUERY_BUDGET_MODE", None)
+        if mode:
+            return mode
+        # ``setup_test_environment`` installs the locmem outbox.
+        return BUDGET_MODE_RAISE if hasattr(mail, "outbox") else BUDGET_MODE_WARN
+
+    @classmethod
+    def get_current(cls) -> SBAdminMeasurement | None:
+        return _current_measurement.get()
+
+    # ─── Measuring ───
+
+    @classmethod
+    def start(
+        cls, kind, view, action, modifier=None, max_queries=None
+    ) -> SBAdminMeasurement | None:
+        if not cls.is_enabled():
+            return None
+        parent = cls.get_current()
+        if parent is None:
+            cls._close_pending()
+        measurement = SBAdminMeasurement(
+            kind=kind,
+            view=str(view),
+            action=str(action),
+            modifier=str(modifier or ""),
+            max_queries=max_queries,
+        )
+
+        def wrapper(execute, sql, params, many, context):
+            if measurement.closed:
+                return execute(sql, params, many, context)
+            start = time.perf_counter()
+            try:
+                return execute(sql, params, many, context)
+            finally:
+                measurement.record_query(time.perf_counter() - start)
+
+        measurement.wrapper = wrapper
+        measurement.token = _current_measurement.set(measurement)
+        measurement.is_outermost = parent is None
+        for connection in connections.all():
+            connection.execute_wrappers.append(wrapper)
+        return measurement
+
+    @classmethod
+    def finish(cls, measurement, response=None, error=False):
+        """Close ``measurement``; an unrendered template response of the
+        outermost measurement keeps it open until rendering finishes."""
+        if measurement is None or measurement.closed:
+            return response
+        measurement.error = measurement.error or error
+        _current_measurement.reset(measurement.token)
+        if (
+            response is not None
+            and measurement.is_outermost
+            and not getattr(response, "is_rendered", True)
+        ):
+            measurement.stage_stack.append("render")
+            render_started = time.perf_counter()
+
+            def on_rendered(rendered):
+                measurement.stage_stack.pop()
+                measurement.get_stage("render").seconds += (
+                    time.perf_counter() - render_started
+                )
+                _pending.measurement = None
+                cls._close(measurement, rendered)
+
+            _pending.measurement = measurement
+            response.add_post_render_callback(on_rendered)
+            return response
+        cls._close(measurement, response)
+        return response
+
+    @classmethod
+    def _close_pending(cls):
+        pending = getattr(_pending, "measurement", None)
+        if pending is not None:
+            _pending.measurement = None
+            pending.stage_stack.clear()
+            # Left over by an earlier request: record it, but don't fail
+            # the request that happens to start next.
+            cls._close(pending, None, check_budget=False)
+
+    @classmethod
+    def _close(cls, measurement, response, check_budget=True):
+        measurement.closed = True
+        for connection in connections.all():
+            if measurement.wrapper in connection.execute_wrappers:
+                connection.execute_wrappers.remove(measurement.wrapper)
+        measurement.wall_seconds = time.perf_counter() - measurement.started
+        measurement.response_bytes = cls.get_response_bytes(response)
+        exceeded = (
+            measurement.max_queries is not None
+            and measurement.query_count > measurement.max_queries
+        )
+        cls.aggregate(measurement, budget_exceeded=exceeded)
+        # A failing call already propagates its own exception.
+        if exceeded and check_budget and not measurement.error:
+            cls.handle_budget_exceeded(measurement)
+
+    @classmethod
+    @contextmanager
+    def measure(cls, kind, view, action, modifier=None, max_queries=None):
+        measurement = cls.start(kind, view, action, modifier, max_queries)
+        try:
+            yield measurement
+        except BaseException:
+            cls.finish(measurement, error=True)
+            raise
+        cls.finish(measurement)
+
+    @classmethod
+    @contextmanager
+    def stage(cls, name: str):
+        measurement = cls.get_current()
+        if measurement is None:
+            yield
+            return
+        measurement.stage_stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            measurement.stage_stack.pop()
+            measurement.get_stage(name).seconds += time.perf_counter() - start
+
+    @classmethod
+    def record_rows(cls, count: int) -> None:
+        measurement = cls.get_current()
+        if measurement is not None:
+            measurement.rows += count
+
+    @classmethod
+    def get_response_bytes(cls, response) -> int:
+        if response is None or getattr(response, "streaming", False):
+            return 0
+        if not getattr(response, "is_rendered", True):
+            return 0
+        content = getattr(response, "content", None)
+        return len(content) if content is not None else 0
+
+    # ─── Budgets ───
+
+    @classmethod
+    def get_query_budget(cls, request, view, action_name, action_attrs=None):
+        max_queries = (action_attrs or {}).get("max_queries")
+        if max_queries is None:
+            get_budget = getattr(view, "get_sbadmin_query_budget", None)
+            if callable(get_budget):
+                max_queries = get_budget(request, action_name)
+        return max_queries if isinstance(max_queries, int) else None
+
+    @classmethod
+    def handle_budget_exceeded(cls, measurement: SBAdminMeasurement) -> None:
+        message = (
+            f"Query budget exceeded for {measurement.view}.{measurement.action}"
+            f"{'/' + measurement.modifier if measurement.modifier else ''}: "
+            f"{measurement.query_count} queries, budget {measurement.max_queries}."
+        )
+        if cls.get_budget_mode() == BUDGET_MODE_RAISE:
+            raise SBAdminQueryBudgetExceeded(message)
+        logger.warning(message)
+
+    # ─── Aggregation ───
+
+    @classmethod
+    def aggregate(cls, measurement: SBAdminMeasurement, budget_exceeded=False):
+        with cls._lock:
+            metric = cls._metrics.setdefault(measurement.key, SBAdminMetric())
+            metric.calls += 1
+            metric.errors += int(measurement.error)
+            metric.budget_exceeded += int(budget_exceeded)
+            metric.wall_seconds += measurement.wall_seconds
+            metric.wall_seconds_max = max(
+                metric.wall_seconds_max, measurement.wall_seconds
+            )
+            metric.query_count += measurement.query_count
+            metric.query_seconds += measurement.query_seconds
+            metric.rows += measurement.rows
+            metric.response_bytes += measurement.response_bytes
+            for name, stats in measurement.stages.items():
+                total = metric.stages.setdefault(name, SBAdminStageStats())
+                total.seconds += stats.seconds
+                total.query_count += stats.query_count
+                total.query_seconds += stats.query_seconds
+
+    @classmethod
+    def get_metrics(cls) -> dict[tuple[str, str, str], SBAdminMetric]:
+        with cls._lock:
+            return {
+                key: SBAdminMetric(
+                    **{
+                        **metric.__dict__,
+                        "stages": {
+                            name: SBAdminStageStats(**stats.__dict__)
+                            for name, stats in metric.stages.items()
+                        },
+                    }
+                )
+                for key, metric in cls._metrics.items()
+            }
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._metrics.clear()
+
+    # ─── Prometheus ───
+
+    PROMETHEUS_METRICS = (
+        ("calls", "counter", "Measured calls."),
+        ("errors", "counter", "Calls that raised."),
+        ("budget_exceeded", "counter", "Calls over their query budget."),
+        ("wall_seconds", "counter", "Wall time spent in calls."),
+        ("wall_seconds_max", "gauge", "Slowest call."),
+        ("query_count", "counter", "DB queries executed."),
+        ("query_seconds", "counter", "Time spent executing DB queries."),
+        ("rows", "counter", "Rows returned."),
+        ("response_bytes", "counter", "Response body bytes."),
+    )
+    PROMETHEUS_STAGE_METRICS = (
+        ("seconds", "counter", "Wall time spent per stage."),
+        ("query_count", "counter", "DB queries executed per stage."),
+        ("query_seconds", "counter", "Time spent executing DB queries per stage."),
+    )
+
+    @staticmethod
+    def _prometheus_labels(labels: dict) -> str:
+        def escape(value):
+            return (
+                str(value)
+                .replace("\\", "\\\\")
+                .replace("\n", "\\n")
+                .replace('"', '\\"')
+            )
+
+        return ",".join(f'{key}="{escape(value)}"' for key, value in labels.items())
+
+    @classmethod
+    def render_prometheus(cls, prefix="sbadmin") -> str:
+        metrics = sorted(cls.get_metrics().items())
+        lines = []
+        for name, metric_type, help_text in cls.PROMETHEUS_METRICS:
+            metric_name = f"{prefix}_{name}"
+            if metric_type == "counter":
+                metric_name = f"{metric_name}_total"
+            lines.append(f"# HELP {metric_name} {help_text}")
+            lines.append(f"# TYPE {metric_name} {metric_type}")
+            for (kind, view, action), metric in metrics:
+                labels = cls._prometheus_labels(
+                    {"kind": kind, "view": view, "action": action}
+                )
+                lines.append(f"{metric_name}{{{labels}}} {getattr(metric, name)}")
+        for name, metric_type, help_text in cls.PROMETHEUS_STAGE_METRICS:
+            metric_name = f"{prefix}_stage_{name}_total"
+            lines.append(f"# HELP {metric_name} {help_text}")
+            lines.append(f"# TYPE {metric_name} {metric_type}")
+            for (kind, view, action), metric in metrics:
+                for stage, stats in sorted(metric.stages.items()):
+                    labels = cls._prometheus_labels(
+                        {
+                            "kind": kind,
+                            "view": view,
+                            "action": action,
+                            "stage": stage,
+                        }
+                    )
+                    lines.append(f"{metric_name}{{{labels}}} {getattr(stats, name)}")
+        return "\n".join(lines) + "\n"
@@ -27,6 +27,18 @@ class RequestCacheKey:
             )
         )
 
+    @classmethod
+    def autocomplete_related_values(cls, model_label: str, value_field: str) -> str:
+        return ":".join(
+            ("admin.widgets.autocomplete.related_values", model_label, value_field)
+        )
+
+    @classmethod
+    def autocomplete_related_pks(cls, model_label: str, value_field: str) -> str:
+        return ":".join(
+            ("admin.widgets.autocomplete.related_pks", model_label, value_field)
+        )
+
 
 def get_request():
     try:
@@ -35,14 +47,35 @@ def get_request():
         return None
 
 
+def _get_request_cache(request, create=False):
+    cache = getattr(request, _REQUEST_CACHE_ATTR, None)
+    if cache is None and create:
+        cache = {}
+        setattr(request, _REQUEST_CACHE_ATTR, cache)
+    return cache
+
+
+def get_cached_on_request(key: str, default=None, request=None):
+    """Peek at ``key`` without computing it."""
+    request = request or get_request()
+    cache = _get_request_cache(request) if request is not None else None
+    if cache is None:
+        return default
+    return cache.get(key, default)
+
+
+def set_on_request(key: str, value, request=None) -> None:
+    request = request or get_request()
+    if request is None:
+        return
+    _get_request_cache(request, create=True)[key] = value
+
+
 def cache_on_request(key: str, factory: Callable[[], T], request=None) -> T:
     request = request or get_request()
     if request is None:
         return factory()
-    cache = getattr(request, _REQUEST_CACHE_ATTR, None)
-    if cache is None:
-        cache = {}
-        setattr(request, _REQUEST_CACHE_ATTR, cache)
+    cache = _get_request_cache(request, create=True)
     cached = cache.get(key, _MISSING)
     if cached is not _MISSING:
         return cached
@@ -0,0 +1,344 @@
+"""
+Retention for append-only log tables (``AdminAuditLog``, ``MCPRequestLog``).
+
+A model takes part by naming the setting that holds its retention in days
+(``sbadmin_retention_days_setting``); ``sbadmin_prune_logs`` runs it.
+
+* Postgres tables that are declared ``PARTITION BY RANGE (timestamp)`` are
+  rotated by month: partitions ahead of time are created, expired ones are
+  detached and dropped — no mass ``DELETE``. Declaring the table
+  partitioned (primary key ``(id, timestamp)``) is a one-off project
+  migration; this service only manages the monthly partitions.
+* Every other table is pruned with keyset-ordered chunked deletes, one
+  bounded transaction per chunk.
+
+Before rows go away they can be exported to gzip-compressed JSONL files
+(``<archive_dir>/<app_label>.<model_name>/<YYYY-MM>.jsonl.gz``), which
+``import_archive`` loads back for investigations. A model can restore
+derived rows for each imported batch in a classmethod
+``sbadmin_after_archive_import(objs)`` (the audit object index does).
+"""
+
+from __future__ import annotations
+
+import datetime
+import gzip
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+from django.apps import apps
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, router, transaction
+from django.db.models.constants import OnConflict
+from django.utils import timezone
+
+RETENTION_BATCH_SIZE = 1000
+PARTITION_NAME_FORMAT = "{table}_p{year:04d}{month:02d}"
+
+
+class ArchiveJSONEncoder(DjangoJSONEncoder):
+    """Keeps full microsecond precision, which DjangoJSONEncoder rounds."""
+
+    def default(self, o):
+        if isinstance(o, datetime.datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+@dataclass
+class SBAdminRetentionResult:
+    model: type
+    deleted: int = 0
+    archived: int = 0
+    created_partitions: tuple = ()
+    dropped_partitions: tuple = ()
+
+
+def month_start(value: datetime.datetime) -> datetime.datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(value: datetime.datetime, months: int) -> datetime.datetime:
+    month_index = value.month - 1 + months
+    return value.replace(
+        year=value.year + month_index // 12, month=month_index % 12 + 1, day=1
+    )
+
+
+class SBAdminRetentionService(object):
+    date_field = "timestamp"
+
+    @classmethod
+    def get_retention_models(cls) -> list:
+        return [
+            model
+            for model in apps.get_models()
+            if getattr(model, "sbadmin_retention_days_setting", None)
+        ]
+
+    @classmethod
+    def get_retention_days(cls, model) -> int | None:
+        return getattr(settings, model.sbadmin_retention_days_setting, None)
+
+    @classmethod
+    def get_archive_dir(cls) -> str | None:
+        return getattr(settings, "SB_ADMIN_RETENTION_ARCHIVE_DIR", None)
+
+    @classmethod
+    def get_cutoff(cls, days: int) -> datetime.datetime:
+        return timezone.now() - datetime.timedelta(days=days)
+
+    @classmethod
+    def get_db_alias(cls, model) -> str:
+        return router.db_for_write(model)
+
+    # ─── Entry point ───
+
+    @classmethod
+    def apply_retention(
+        cls,
+        model,
+        days: int,
+        archive_dir: str | None = None,
+        batch_size: int = RETENTION_BATCH_SIZE,
+        months_ahead: int = 2,
+    ) -> SBAdminRetentionResult:
+        cutoff = cls.get_cutoff(days)
+        if cls.is_partitioned(model):
+            return cls.rotate_partitions(model, cutoff, archive_dir, months_ahead)
+        return cls.prune(model, cutoff, archive_dir, batch_size)
+
+    # ─── Chunked deletion ───
+
+    @classmethod
+    def prune(
+        cls,
+        model,
+        cutoff: datetime.datetime,
+        archive_dir: str | None = None,
+        batch_size: int = RETENTION_BATCH_SIZE,
+    ) -> SBAdminRetentionResult:
+        """Delete rows older than ``cutoff`` in pk order, ``batch_size`` rows
+        per transaction, so locks and WAL stay bounded."""
+        result = SBAdminRetentionResult(model=model)
+        using = cls.get_db_alias(model)
+        manager = model._base_manager.db_manager(using)
+        expired = manager.filter(**{f"{cls.date_field}__lt": cutoff}).order_by("pk")
+        last_pk = None
+        while True:
+            chunk = expired if last_pk is None else expired.filter(pk__gt=last_pk)
+            pks = list(chunk.values_list("pk", flat=True)[:batch_size])
+            if not pks:
+                break
+            with transaction.atomic(using=using):
+                batch = manager.filter(pk__in=pks)
+                if archive_dir:
+                    result.archived += cls.archive_rows(
+                        model, batch.order_by("pk").values(), archive_dir
+                    )
+                # Cascades still run; the rows themselves are read as pks only.
+                _total, per_model = batch.only("pk").delete()
+                result.deleted += per_model.get(model._meta.label, 0)
+            last_pk = pks[-1]
+        return result
+
+    # ─── Postgres monthly partitions ───
+
+    @classmethod
+    def is_partitioned(cls, model) -> bool:
+        connection = connections[cls.get_db_alias(model)]
+        if connection.vendor != "postgresql":
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM pg_partitioned_table pt "
+                "JOIN pg_class c ON c.oid = pt.partrelid "
+                "WHERE c.relname = %s AND pg_table_is_visible(c.oid)",
+                [model._meta.db_table],
+            )
+            return cursor.fetchone() is not None
+
+    @classmethod
+    def get_partition_name(cls, model, start: datetime.datetime) -> str:
+        return PARTITION_NAME_FORMAT.format(
+            table=model._meta.db_table, year=start.year, month=start.month
+        )
+
+    @classmethod
+    def get_partitions(cls, model) -> dict[str, datetime.datetime]:
+        """``{partition name: month start}`` of the partitions this service
+        manages (others attached to the table are left alone)."""
+        connection = connections[cls.get_db_alias(model)]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT child.relname FROM pg_inherits i "
+                "JOIN pg_class parent ON parent.oid = i.inhparent "
+                "JOIN pg_class child ON child.oid = i.inhrelid "
+                "WHERE parent.relname = %s AND pg_table_is_visible(parent.oid)",
+                [model._meta.db_table],
+            )
+            names = [row[0] for row in cursor.fetchall()]
+        prefix = f"{model._meta.db_table}_p"
+        partitions = {}
+        for name in names:
+            suffix = name[len(prefix) :]
+            if not name.startswith(prefix) or len(suffix) != 6 or not suffix.isdigit():
+                continue
+            partitions[name] = datetime.datetime(
+                int(suffix[:4]), int(suffix[4:]), 1, tzinfo=datetime.timezone.utc
+            )
+        return partitions
+
+    @classmethod
+    def ensure_partitions(cls, model, months_ahead: int = 2) -> list[str]:
+        """Create the partitions for the current and the next
+        ``months_ahead`` months; returns the names created."""
+        connection = connections[cls.get_db_alias(model)]
+        existing = cls.get_partitions(model)
+        quote = connection.ops.quote_name
+        start = month_start(timezone.now().astimezone(datetime.timezone.utc))
+        created = []
+        for offset in range(months_ahead + 1):
+            lower = add_months(start, offset)
+            name = cls.get_partition_name(model, lower)
+            if name in existing:
+                continue
+            # DDL takes no bind parameters; the bounds are generated values.
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"CREATE TABLE IF NOT EXISTS {quote(name)} "
+                    f"PARTITION OF {quote(model._meta.db_table)} "
+                    f"FOR VALUES FROM ('{lower.isoformat()}') "
+                    f"TO ('{add_months(lower, 1).isoformat()}')"
+                )
+            created.append(name)
+        return created
+
+    @classmethod
+    def rotate_partitions(
+        cls,
+        model,
+        cutoff: datetime.datetime,
+        archive_dir: str | None = None,
+        months_ahead: int = 2,
+    ) -> SBAdminRetentionResult:
+        """Create upcoming partitions, then export (optionally), detach and
+        drop every partition that ends before ``cutoff``."""
+        result = SBAdminRetentionResult(model=model)
+        result.created_partitions = tuple(cls.ensure_partitions(model, months_ahead))
+        connection = connections[cls.get_db_alias(model)]
+        quote = connection.ops.quote_name
+        dropped = []
+        for name, lower in sorted(cls.get_partitions(model).items()):
+            upper = add_months(lower, 1)
+            if upper > cutoff:
+                continue
+            if archive_dir:
+                rows = (
+                    model._base_manager.db_manager(connection.alias)
+                    .filter(
+                        **{
+                            f"{cls.date_field}__gte": lower,
+                            f"{cls.date_field}__lt": upper,
+                        }
+                    )
+                    .order_by("pk")
+                    .values()
+                )
+                result.archived += cls.archive_rows(model, rows, archive_dir)
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"ALTER TABLE {quote(model._meta.db_table)} "
+                    f"DETACH PARTITION {quote(name)}"
+                )
+                cursor.execute(f"DROP TABLE {quote(name)}")
+            dropped.append(name)
+        result.dropped_partitions = tuple(dropped)
+        return result
+
+    # ─── Archives ───
+
+    @classmethod
+    def get_archive_path(cls, model, archive_dir: str, month: datetime.datetime):
+        return (
+            Path(archive_dir)
+            / model._meta.label_lower
+            / f"{month.year:04d}-{month.month:02d}.jsonl.gz"
+        )
+
+    @classmethod
+    def archive_rows(cls, model, rows, archive_dir: str) -> int:
+        """Append ``rows`` (``values()`` dicts) to the monthly archives.
+
+        Each call appends a gzip member, which gzip readers concatenate."""
+        files = {}
+        count = 0
+        try:
+            for row in rows.iterator() if hasattr(rows, "iterator") else rows:
+                stamp = row[cls.date_field]
+                if timezone.is_aware(stamp):
+                    stamp = stamp.astimezone(datetime.timezone.utc)
+                path = cls.get_archive_path(model, archive_dir, stamp)
+                archive = files.get(path)
+                if archive is None:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    archive = files[path] = gzip.open(path, "at", encoding="utf-8")
+                archive.write(json.dumps(row, cls=ArchiveJSONEncoder) + "\n")
+                count += 1
+        finally:
+            for archive in files.values():
+                archive.close()
+        return count
+
+    @classmethod
+    def iter_archive(cls, path):
+        with gzip.open(path, "rt", encoding="utf-8") as archive:
+            for line in archive:
+                if line.strip():
+                    yield json.loads(line)
+
+    @classmethod
+    def import_archive(cls, model, path, batch_size: int = RETENTION_BATCH_SIZE):
+        """Load an archive back into ``model``'s table; rows whose pk already
+        exists are skipped. Returns the number of rows read."""
+        using = cls.get_db_alias(model)
+        fields = model._meta.concrete_fields
+        attnames = {field.attname for field in fields}
+        after_import = getattr(model, "sbadmin_after_archive_import", None)
+        count = 0
+        batch = []
+
+        def flush():
+            if not batch:
+                return
+            # raw=True keeps archived values for auto_now(_add) fields.
+            with transaction.atomic(using=using):
+                model._base_manager.db_manager(using)._insert(
+                    batch,
+                    fields=fields,
+                    raw=True,
+                    using=using,
+                    on_conflict=OnConflict.IGNORE,
+                )
+                if after_import is not None:
+                    after_import(list(batch))
+            batch.clear()
+
+        for row in cls.iter_archive(path):
+            obj = model(**{key: value for key, value in row.items() if key in attnames})
+            for field in fields:
+                value = getattr(obj, field.attname)
+                if isinstance(value, str):
+                    # Dates, UUIDs and decimals come back as JSON strings.
+                    setattr(obj, field.attname, field.to_python(value))
+            if hasattr(obj, "set_object_keys"):
+                # Archives written before the audit typed keys lack them.
+                obj.set_object_keys()
+            batch.append(obj)
+            count += 1
+            if len(batch) >= batch_size:
+                flush()
+        flush()
+        return count
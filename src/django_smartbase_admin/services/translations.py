@@ -1,5 +1,16 @@
 from django.conf import settings
-from django.db.models import Value, IntegerField, Q, When, Case, FilteredRelation, F
+from django.db.models import (
+    Value,
+    IntegerField,
+    Q,
+    When,
+    Case,
+    FilteredRelation,
+    OuterRef,
+    Subquery,
+    Sum,
+)
+from django.db.models.functions import Coalesce
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
@@ -42,42 +53,97 @@ class SBAdminTranslationsService(object):
     def get_annotate_name(cls, translation_model, language_code):
         return str(f"{translation_model._meta.db_table}_{language_code}")
 
+    @classmethod
+    def get_filled_fields_count_expression(cls, translated_fields):
+        """Number of non-empty ``translated_fields`` on one translation row."""
+        filled_count = None
+        for model_field in translated_fields:
+            lookup = model_field.name
+            field_filled = Case(
+                When(
+                    Q(**{f"{lookup}__isnull": False}) & ~Q(**{lookup: ""}),
+                    then=Value(1),
+                ),
+                default=Value(0),
+                output_field=IntegerField(),
+            )
+            filled_count = (
+                field_filled if filled_count is None else filled_count + field_filled
+            )
+        return filled_count if filled_count is not None else Value(0)
+
+    @classmethod
+    def get_translations_count_subquery(
+        cls, translation_model, language_code, translated_fields
+    ):
+        """Filled-field count of the ``language_code`` translation of the
+        outer row, resolved through the ``(master, language_code)`` unique
+        index instead of a join per language."""
+        return Coalesce(
+            Subquery(
+                translation_model._default_manager.filter(
+                    master=OuterRef("pk"), language_code=language_code
+                ).values(
+                    filled_count=cls.get_filled_fields_count_expression(
+                        translated_fields
+                    )
+                )[
+                    :1
+                ],
+                output_field=IntegerField(),
+            ),
+            Value(0),
+        )
+
     @classmethod
     def annotate_queryset_with_translations_count(
         cls, queryset, model, language_codes_to_annotate
     ):
         annotates = {}
-        for translation_model in model._parler_meta.get_all_models():
+        translated_fields_dict = cls.get_translated_fields_for_model(model)
+        for translation_model, translated_fields in translated_fields_dict.items():
+            rel_name = model._parler_meta[translation_model].rel_name
             for language_code in language_codes_to_annotate:
                 annotate_name = cls.get_annotate_name(translation_model, language_code)
-                rel_name = model._parler_meta[translation_model].rel_name
+                # only joined when a field reads through it (e.g. the main
+                # language values in the translations list)
                 annotates[annotate_name] = FilteredRelation(
                     rel_name,
                     condition=Q(**{f"{rel_name}__language_code": language_code}),
                 )
-                field_val_bools = None
-                translated_fields_dict = (
-                    SBAdminTranslationsService.get_translated_fields_for_model(model)
-                )
-                for model_field in translated_fields_dict.get(translation_model, []):
-                    field_val_bool = str(f"{annotate_name}_{model_field.name}_bool")
-                    annotates[field_val_bool] = Case(
-                        When(
-                            Q(**{f"{annotate_name}__{model_field.name}__isnull": False})
-                            & ~Q(**{f"{annotate_name}__{model_field.name}": ""}),
-                            then=Value(1),
-                        ),
-                        default=Value(0),
-                        output_field=IntegerField(),
+                annotates[f"{annotate_name}_count"] = (
+                    cls.get_translations_count_subquery(
+                        translation_model, language_code, translated_fields
                     )
-                    if not field_val_bools:
-                        field_val_bools = F(field_val_bool)
-                    else:
-                        field_val_bools += F(field_val_bool)
-                annotates[f"{annotate_name}_count"] = field_val_bools
+                )
         queryset = queryset.annotate(**annotates)
         return queryset
 
+    @classmethod
+    def get_translations_count(cls, model, object_ids, language_codes):
+        """``{(translation_model, object_id, language_code): filled_count}``
+        computed with one grouped aggregate per translation table."""
+        counts = {}
+        translated_fields_dict = cls.get_translated_fields_for_model(model)
+        for translation_model, translated_fields in translated_fields_dict.items():
+            rows = (
+                translation_model._default_manager.filter(
+                    master__in=object_ids, language_code__in=language_codes
+                )
+                .order_by()
+                .values("master_id", "language_code")
+                .annotate(
+                    filled_count=Sum(
+                        cls.get_filled_fields_count_expression(translated_fields)
+                    )
+                )
+            )
+            for row in rows:
+                counts[(translation_model, row["master_id"], row["language_code"])] = (
+                    row["filled_count"]
+                )
+        return counts
+
     @classmethod
     def is_translated_model(cls, model):
         return bool(getattr(model, "_parler_meta", None))
@@ -22,6 +22,10 @@ from django_smartbase_admin.engine.const import (
 )
 from django_smartbase_admin.engine.actions import SBAdminCustomAction
 from django_smartbase_admin.engine.request import SBAdminViewRequestData
+from django_smartbase_admin.services.db_routing import SBAdminDatabaseRoutingService
+from django_smartbase_admin.services.instrumentation import (
+    SBAdminInstrumentationService,
+)
 from django_smartbase_admin.services.translations import SBAdminTranslationsService
 from django_smartbase_admin.services.thread_local import SBAdminThreadLocalService
 from django_smartbase_admin.services.url_params_codec import (
@@ -215,6 +219,36 @@ class SBAdminViewService(object):
         if request_data.selected_view and not request_data.action:
             return redirect(request_data.selected_view.get_menu_view_url(request))
 
+        action_function = cls.get_permitted_action_function(request, request_data)
+        action_attrs = getattr(action_function, "_sbadmin_action_attrs", None)
+        view = request_data.selected_view
+        measurement = SBAdminInstrumentationService.start(
+            "action",
+            view.get_id(),
+            request_data.action,
+            request_data.modifier,
+            max_queries=SBAdminInstrumentationService.get_query_budget(
+                request, view, request_data.action, action_attrs
+            ),
+        )
+        try:
+            with SBAdminDatabaseRoutingService.route_action(
+                request, view, request_data.action, action_attrs
+            ):
+                response = action_function(
+                    request,
+                    request_data.modifier,
+                    request_data.object_id,
+                )
+        except BaseException:
+            SBAdminInstrumentationService.finish(measurement, error=True)
+            raise
+        return SBAdminInstrumentationService.finish(measurement, response)
+
+    @classmethod
+    def get_permitted_action_function(cls, request, request_data):
+        """The ``request_data.action`` method of the selected view, after the
+        same checks ``delegate_to_action`` runs before dispatching to it."""
         view = request_data.selected_view
         action_name = request_data.action
 
@@ -233,12 +267,7 @@ class SBAdminViewService(object):
             action_attrs=action_attrs,
         ):
             raise PermissionDenied
-
-        return action_function(
-            request,
-            request_data.modifier,
-            request_data.object_id,
-        )
+        return action_function
 
     @classmethod
     def apply_global_filter_to_queryset(
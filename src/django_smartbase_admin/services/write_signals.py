@@ -0,0 +1,40 @@
+"""
+``queryset_written``: sent after ``QuerySet.update`` / ``delete`` /
+``bulk_create`` / ``bulk_update``, which bypass the model signals.
+
+Installed by ``SBAdminConfig.ready()`` independently of the audit app, so
+the HTTP cache watermarks (``services.http_cache``) and the read-replica
+pin (``services.db_routing``) see bulk writes in every project. Receivers
+get ``sender`` (the model) and ``using`` (the database alias).
+"""
+
+from __future__ import annotations
+
+import functools
+
+from django.db.models.query import QuerySet
+from django.dispatch import Signal
+
+queryset_written = Signal()
+
+_HOOKED_METHODS = ("update", "delete", "bulk_create", "bulk_update")
+# Marks the wrappers installed here, so installing twice is a no-op.
+_WRAPPED_ATTR = "_sbadmin_sends_queryset_written"
+
+
+def _sends_queryset_written(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        queryset_written.send(sender=self.model, using=self.db)
+        return result
+
+    setattr(wrapper, _WRAPPED_ATTR, True)
+    return wrapper
+
+
+def install_queryset_write_signals() -> None:
+    for name in _HOOKED_METHODS:
+        method = getattr(QuerySet, name)
+        if not getattr(method, _WRAPPED_ATTR, False):
+            setattr(QuerySet, name, _sends_queryset_written(method))
@@ -263,6 +263,10 @@ export default class Autocomplete {
         }
         autocompleteRequestData.set(autocompleteData.constants.autocomplete_forward, JSON.stringify(autocompleteForwardData))
         autocompleteRequestData.set(autocompleteData.constants.autocomplete_requested_page, requestedPage)
+        if (autocompleteData.constants.autocomplete_cursor && requestedPage !== 1 && choicesJS.SBnextCursor) {
+            // keyset continuation for widgets that return next_cursor
+            autocompleteRequestData.set(autocompleteData.constants.autocomplete_cursor, choicesJS.SBnextCursor)
+        }
         autocompleteRequestData.set(autocompleteData.constants.autocomplete_term, searchTerm)
         fetch(autocompleteData.autocomplete_url, {
             method: 'POST',
@@ -327,6 +331,12 @@ export default class Autocomplete {
                 if (responseChoices.length === 0) {
                     choicesJS.SBhasNextPage = false
                 }
+                if ('next_cursor' in res) {
+                    choicesJS.SBnextCursor = res.next_cursor
+                    if (!res.next_cursor) {
+                        choicesJS.SBhasNextPage = false
+                    }
+                }
                 choicesJS.SBcurrentPage = requestedPage
             })
     }
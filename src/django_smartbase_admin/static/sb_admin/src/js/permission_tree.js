@@ -5,6 +5,10 @@ export default class PermissionTree {
 
         document.addEventListener('change', (e) => this.handleChange(e))
         document.addEventListener('input', (e) => this.handleSearch(e))
+        document.addEventListener('show.bs.collapse', (e) => {
+            const app = e.target.closest('[data-permission-tree-app]')
+            if (app) this.hydrateSection(app)
+        })
 
         document.addEventListener('formset:added', (event) => {
             this.initTrees(event.target)
@@ -29,6 +33,25 @@ export default class PermissionTree {
         this.updateEmptyState(container)
     }
 
+    hydrateSection(app) {
+        // ``lazy_sections``: rows of a collapsed section ship in a <template>
+        // and are only built on first expand, search or select-all.
+        const template = app.querySelector('template[data-permission-tree-lazy-body]')
+        if (!template) return
+        template.replaceWith(template.content.cloneNode(true))
+        delete app.dataset.permissionTreeLazySelected
+        this.initBootstrapOverlays(app)
+        this.prepareSearchIndexes(app)
+    }
+
+    hydrateSections(container) {
+        container.querySelectorAll('[data-permission-tree-app]').forEach(app => this.hydrateSection(app))
+    }
+
+    isHydrated(app) {
+        return !app.querySelector('template[data-permission-tree-lazy-body]')
+    }
+
     prepareSearchIndexes(container) {
         container.querySelectorAll('[data-permission-tree-text]').forEach(el => {
             this.searchIndexForTextElement(el)
@@ -64,6 +87,7 @@ export default class PermissionTree {
 
         if (checkbox.matches('[data-permission-tree-select-all]')) {
             const appDiv = checkbox.closest('[data-permission-tree-app]')
+            this.hydrateSection(appDiv)
             appDiv.querySelectorAll('[data-permission-tree-checkbox]').forEach(cb => {
                 cb.checked = checkbox.checked
             })
@@ -78,6 +102,9 @@ export default class PermissionTree {
         if (!input) return
         const container = input.closest('[data-permission-tree]')
         const query = this.normalizeSearchText(input.value.trim())
+        if (query) {
+            this.hydrateSections(container)
+        }
 
         container.querySelectorAll('[data-permission-tree-perm]').forEach(perm => {
             const textElements = perm.querySelectorAll('[data-permission-tree-text]')
@@ -236,6 +263,8 @@ export default class PermissionTree {
 
     updateCounts(container) {
         container.querySelectorAll('[data-permission-tree-app]').forEach(appDiv => {
+            // Not built yet: keep the server-rendered count.
+            if (!this.isHydrated(appDiv)) return
             const checkboxes = appDiv.querySelectorAll('[data-permission-tree-checkbox]')
             const checked = appDiv.querySelectorAll('[data-permission-tree-checkbox]:checked')
             const countEl = appDiv.querySelector('[data-permission-tree-count]')
@@ -263,6 +292,9 @@ export default class PermissionTree {
                 this.permissionIdsForCheckbox(cb).forEach(id => checked.add(id))
             }
         })
+        container.querySelectorAll('[data-permission-tree-lazy-selected]').forEach(app => {
+            this.parseIds(app.dataset.permissionTreeLazySelected).forEach(id => checked.add(id))
+        })
         const hidden = container.querySelector('[data-permission-tree-value]')
         if (hidden) {
             hidden.value = JSON.stringify(Array.from(checked))
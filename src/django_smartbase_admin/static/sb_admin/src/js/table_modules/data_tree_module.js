@@ -1,8 +1,17 @@
 import { SBAdminTableModule } from "./base_module"
+import { decodeParamsFromUrl } from "../url_params_codec"
 
 
 export class DataTreeModule extends SBAdminTableModule {
 
+    constructor(table) {
+        super(table)
+        // Pks of the rows whose lazily loaded children were fetched.
+        this.loadedTreeRows = new Set()
+        // "Load more" child row index -> {parent row, keyset cursor}.
+        this.loadMoreRows = new Map()
+    }
+
     freezeTableHeight() {
         this.table.tabulator.element.style.height = `${this.table.tabulator.element.offsetHeight}px`
     }
@@ -18,12 +27,17 @@ export class DataTreeModule extends SBAdminTableModule {
         if (!tabulatorOptions['dataTree'] || !lastChildField) {
             return tabulatorOptions
         }
+        const loadMoreField = tabulatorOptions['sbadminTreeLoadMoreField']
         const existingRowFormatter = tabulatorOptions['rowFormatter']
         tabulatorOptions['rowFormatter'] = (row) => {
             row.getElement().classList.toggle(
                 'tabulator-tree-child-last',
                 Boolean(row.getData()?.[lastChildField]),
             )
+            if (loadMoreField && row.getData()?.[loadMoreField]) {
+                this.formatLoadMoreRow(row)
+                return
+            }
             if (typeof existingRowFormatter === 'function') {
                 existingRowFormatter(row)
             }
@@ -43,20 +57,146 @@ export class DataTreeModule extends SBAdminTableModule {
             this.freezeTableHeight()
         }, true)
 
-        const processRowTree = (row) => {
-            const el = row.getElement()
-            if (el) {
-                window.htmx?.process(el)
-            }
-            row.getTreeChildren().forEach(processRowTree)
-        }
-
         const onTreeToggle = (row) => {
             this.restoreTableHeight()
-            processRowTree(row)
+            this.processRowTree(row)
         }
 
         this.table.tabulator.on("dataTreeRowExpanded", onTreeToggle)
         this.table.tabulator.on("dataTreeRowCollapsed", onTreeToggle)
+
+        if (this.table.tabulatorOptions['sbadminTreeChildrenUrl']) {
+            this.table.tabulator.on("dataProcessed", () => {
+                this.loadedTreeRows.clear()
+                this.loadMoreRows.clear()
+            })
+            this.table.tabulator.on("dataTreeRowExpanded", (row) => this.loadTreeChildren(row))
+            this.table.tabulator.element.addEventListener('click', (e) => {
+                const button = e.target.closest('.js-tree-load-more')
+                if (!button) {
+                    return
+                }
+                e.preventDefault()
+                e.stopPropagation()
+                this.loadMoreTreeChildren(button)
+            }, true)
+        }
+    }
+
+    formatLoadMoreRow(row) {
+        const cell = row.getCells()[0]?.getElement()
+        if (!cell || cell.querySelector('.js-tree-load-more')) {
+            return
+        }
+        row.getElement().classList.add('tabulator-tree-load-more')
+        const button = document.createElement('button')
+        button.type = 'button'
+        button.classList.add('js-tree-load-more', 'text-primary', 'text-14')
+        button.dataset.treeLoadMore = row.getIndex()
+        button.textContent = window.sb_admin_translation_strings?.load_more || 'Load more'
+        cell.appendChild(button)
+    }
+
+    processRowTree(row) {
+        const el = row.getElement()
+        if (el) {
+            window.htmx?.process(el)
+        }
+        row.getTreeChildren().forEach((child) => this.processRowTree(child))
+    }
+
+    fetchTreeChildren(parentId, cursor) {
+        const options = this.table.tabulatorOptions
+        const childParams = new URLSearchParams({[options['sbadminTreeChildrenParentParam']]: parentId})
+        if (cursor !== null) {
+            childParams.set(options['sbadminTreeChildrenCursorParam'], cursor)
+        }
+        const url = `${options['sbadminTreeChildrenUrl']}?${childParams}`
+        const params = this.table.getUrlParamsString()
+        const headers = {...(options['ajaxConfig']['headers'] || {})}
+        let request
+        if (options['ajaxConfig']['method'] === 'POST') {
+            const urlParams = new URLSearchParams(params)
+            headers['Content-Type'] = 'application/json'
+            request = fetch(url, {
+                method: 'POST',
+                headers: headers,
+                body: JSON.stringify(decodeParamsFromUrl(urlParams.get(this.table.constants.BASE_PARAMS_NAME))),
+            })
+        } else {
+            request = fetch(`${url}&${params.slice(1)}`, {headers: headers})
+        }
+        return request.then((response) => {
+            if (!response.ok) {
+                throw new Error("Network response was not ok " + response.statusText)
+            }
+            return response.json()
+        })
+    }
+
+    async loadTreeChildren(row) {
+        const options = this.table.tabulatorOptions
+        const parentId = row.getIndex()
+        if (!row.getData()[options['sbadminTreeChildCountField']] || this.loadedTreeRows.has(parentId)) {
+            return
+        }
+        this.loadedTreeRows.add(parentId)
+        try {
+            await this.loadTreeChildrenPage(row, null)
+        } catch (error) {
+            this.loadedTreeRows.delete(parentId)
+            console.error("There was a problem loading the tree children:", error)
+        }
+    }
+
+    async loadMoreTreeChildren(button) {
+        const loadMore = this.loadMoreRows.get(button.dataset.treeLoadMore)
+        if (!loadMore || button.disabled) {
+            return
+        }
+        button.disabled = true
+        try {
+            await this.loadTreeChildrenPage(loadMore.row, loadMore.cursor)
+        } catch (error) {
+            button.disabled = false
+            console.error("There was a problem loading the tree children:", error)
+        }
+    }
+
+    async loadTreeChildrenPage(row, cursor) {
+        // Children are paged by pk keyset: one page per expand, then a
+        // "load more" child row carries the cursor of the next one.
+        const options = this.table.tabulatorOptions
+        const indexField = this.table.tabulator.options.index
+        const loadMoreField = options['sbadminTreeLoadMoreField']
+        const lastChildField = options['sbadminTreeLastChildField']
+        const parentId = row.getIndex()
+        const response = await this.fetchTreeChildren(parentId, cursor)
+        const rows = response.data || []
+
+        let children = row.getTreeChildren()
+        const previous = children[children.length - 1]
+        if (previous?.getData()[loadMoreField]) {
+            this.loadMoreRows.delete(previous.getIndex())
+            previous.delete()
+            children = row.getTreeChildren()
+        }
+        if (children.length && lastChildField) {
+            children[children.length - 1].update({[lastChildField]: false})
+        }
+        rows.forEach((child) => row.addTreeChild(child))
+
+        const loaded = row.getTreeChildren().length
+        if (rows.length && loaded < response.last_row) {
+            const loadMoreId = `sbadmin-tree-more-${parentId}`
+            const nextCursor = rows[rows.length - 1][indexField]
+            this.loadMoreRows.set(loadMoreId, {row: row, cursor: nextCursor})
+            row.addTreeChild({[indexField]: loadMoreId, [loadMoreField]: true})
+        }
+        children = row.getTreeChildren()
+        if (children.length && lastChildField) {
+            children[children.length - 1].update({[lastChildField]: true})
+        }
+        this.processRowTree(row)
     }
 }
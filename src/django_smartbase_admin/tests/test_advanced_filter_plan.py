@@ -0,0 +1,169 @@
+"""Advanced filters compiled into cached plans: ``OR`` chains of equal rules
+merged into ``__in`` and aggregate annotates filtered through ``EXISTS``."""
+
+import json
+
+from django.contrib.auth.models import Group, Permission, User
+from django.core.exceptions import PermissionDenied
+from django.db import connection
+from django.db.models import Count
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from django_smartbase_admin.actions import advanced_filters
+from django_smartbase_admin.actions.advanced_filters import (
+    AdvancedFilterInRule,
+    QueryBuilderService,
+)
+from django_smartbase_admin.admin.admin_base import SBAdmin
+from django_smartbase_admin.admin.site import sb_admin_site
+from django_smartbase_admin.engine.const import (
+    ADVANCED_FILTER_DATA_NAME,
+    FILTER_DATA_NAME,
+    TABLE_PARAMS_NAME,
+    TABLE_PARAMS_PAGE_NAME,
+    TABLE_PARAMS_SIZE_NAME,
+)
+from django_smartbase_admin.engine.field import SBAdminField
+from django_smartbase_admin.engine.filter_widgets import StringFilterWidget
+from django_smartbase_admin.tests import test_previous_next_window
+
+
+class AdvancedFilterGroupAdmin(SBAdmin):
+    model = Group
+    sbadmin_list_display = (
+        "name",
+        SBAdminField(
+            name="permission_total",
+            title="Permissions",
+            annotate=Count("permissions"),
+            filter_widget=StringFilterWidget(),
+        ),
+    )
+
+
+class AdvancedFilterPlanTests(TestCase):
+    def build_request(self):
+        # Same request fixture as the previous/next window tests, keeping the
+        # declared filter widgets.
+        request = test_previous_next_window.PreviousNextWindowTests.build_request(self)
+        request.request_data.configuration.get_filter_widget = (
+            lambda field, filter_widget: filter_widget
+        )
+        return request
+
+    @classmethod
+    def setUpTestData(cls):
+        permissions = list(Permission.objects.order_by("pk")[:3])
+        cls.alpha = Group.objects.create(name="alpha")
+        cls.alpha.permissions.set(permissions)
+        cls.beta = Group.objects.create(name="beta")
+        cls.beta.permissions.set(permissions[:1])
+        cls.gamma = Group.objects.create(name="gamma")
+
+    def setUp(self):
+        advanced_filters.clear_plan_cache()
+        self.view = AdvancedFilterGroupAdmin(Group, sb_admin_site)
+        self.user = User(pk=1, is_superuser=True)
+
+    def rule(self, field, operator, value):
+        return {
+            "field": f"{self.view.get_id()}-{field}",
+            "operator": operator,
+            "value": value,
+        }
+
+    def build_action(self, query):
+        return self.view.sbadmin_list_action_class(
+            self.view,
+            self.build_request(),
+            all_params={
+                self.view.get_id(): {
+                    FILTER_DATA_NAME: {},
+                    ADVANCED_FILTER_DATA_NAME: query,
+                    TABLE_PARAMS_NAME: {
+                        TABLE_PARAMS_PAGE_NAME: 1,
+                        TABLE_PARAMS_SIZE_NAME: 10,
+                    },
+                }
+            },
+        )
+
+    def load_names(self, query):
+        action = self.build_action(query)
+        with CaptureQueriesContext(connection) as queries:
+            rows = action.get_data()["data"]
+        return {row["name"] for row in rows}, queries[0]["sql"]
+
+    def test_plan_is_compiled_once_per_normalized_query(self):
+        query = {"condition": "AND", "rules": [self.rule("name", "equal", "alpha")]}
+        action = self.build_action(query)
+        column_fields = {field.field: field for field in action.column_fields}
+        plan = QueryBuilderService.get_plan(self.view.get_id(), column_fields, query)
+        reordered = json.loads(json.dumps(query))
+        reordered["rules"] = [dict(reversed(reordered["rules"][0].items()))]
+        self.assertIs(
+            QueryBuilderService.get_plan(self.view.get_id(), column_fields, reordered),
+            plan,
+        )
+
+    def test_or_chain_of_equal_rules_is_merged_into_in(self):
+        query = {
+            "condition": "OR",
+            "rules": [
+                self.rule("name", "equal", "alpha"),
+                self.rule("name", "equal", "gamma"),
+            ],
+        }
+        action = self.build_action(query)
+        plan = QueryBuilderService.get_plan(
+            self.view.get_id(),
+            {field.field: field for field in action.column_fields},
+            query,
+        )
+        self.assertEqual(
+            plan.root.children,
+            (AdvancedFilterInRule(field="name", values=("alpha", "gamma")),),
+        )
+        names, count_sql = self.load_names(query)
+        self.assertEqual(names, {"alpha", "gamma"})
+        self.assertIn(" IN (", count_sql)
+
+    def test_aggregate_filter_runs_as_exists(self):
+        query = {
+            "condition": "AND",
+            "rules": [self.rule("permission_total", "greater", "0")],
+        }
+        names, count_sql = self.load_names(query)
+        self.assertEqual(names, {"alpha", "beta"})
+        # The outer query is a plain ``WHERE``; grouping stays inside the
+        # per-row subquery.
+        outer_sql, subquery_sql = count_sql.split("EXISTS", 1)
+        self.assertNotIn("GROUP BY", outer_sql)
+        self.assertIn("HAVING", subquery_sql)
+        self.assertTrue(subquery_sql.endswith("LIMIT 1)"))
+
+    def test_aggregate_filter_combined_with_or(self):
+        query = {
+            "condition": "OR",
+            "rules": [
+                self.rule("permission_total", "greater", "2"),
+                self.rule("name", "equal", "gamma"),
+            ],
+        }
+        names, _count_sql = self.load_names(query)
+        self.assertEqual(names, {"alpha", "gamma"})
+
+    def test_debug_output_requires_setting_and_superuser(self):
+        query = {"condition": "AND", "rules": [self.rule("name", "equal", "beta")]}
+        action = self.build_action(query)
+        request = action.threadsafe_request
+        with override_settings(SB_ADMIN_ADVANCED_FILTER_DEBUG=False):
+            self.assertFalse(QueryBuilderService.is_debug_enabled(request))
+        with override_settings(SB_ADMIN_ADVANCED_FILTER_DEBUG=True):
+            data = QueryBuilderService.get_debug_data_for_list_action(action)
+            self.assertEqual(data["plan"]["fields"], ("name",))
+            self.assertIn("beta", data["sql"])
+            self.user.is_superuser = False
+            with self.assertRaises(PermissionDenied):
+                self.view.action_advanced_filter_plan(request, None)
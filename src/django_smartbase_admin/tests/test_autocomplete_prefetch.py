@@ -0,0 +1,128 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from django import forms
+from django.test import RequestFactory, TestCase
+from filer.models import Folder
+
+from django_smartbase_admin.admin.admin_base import SBAdmin
+from django_smartbase_admin.admin.site import sb_admin_site
+from django_smartbase_admin.admin.widgets import SBAdminAutocompleteWidget
+from django_smartbase_admin.services.thread_local import SBAdminThreadLocalService
+from django_smartbase_admin.tests.test_autocomplete_forward_create import (
+    AutocompleteParentPreselectConfiguration,
+)
+
+
+class FolderLinksForm(forms.Form):
+    parent = forms.CharField(required=False)
+    sibling = forms.CharField(required=False)
+
+
+class AutocompletePrefetchTest(TestCase):
+    def setUp(self):
+        self.folders = [Folder.objects.create(name=f"folder{i}") for i in range(4)]
+        self.view = SimpleNamespace(get_id=lambda: "folder")
+        self.request = RequestFactory().get("/")
+        self.request.request_data = SimpleNamespace(
+            configuration=AutocompleteParentPreselectConfiguration(),
+            request_post={},
+        )
+        SBAdminThreadLocalService.set_request(self.request)
+
+    def tearDown(self):
+        SBAdminThreadLocalService.clear_request()
+
+    def _form(self, initial, formset=None, value_field=None):
+        form = FolderLinksForm(initial=initial)
+        if formset is not None:
+            form._sbadmin_formset = formset
+        for field_name, field in form.fields.items():
+            widget = SBAdminAutocompleteWidget(
+                form_field=field,
+                model=Folder,
+                value_field=value_field,
+                multiselect=False,
+                attrs={"id": f"id_{field_name}"},
+            )
+            widget.initialised = True
+            widget.field_name = field_name
+            widget.view = self.view
+            widget.form = widget.bound_form = form
+            field.widget = widget
+        return form
+
+    def _forms(self, value_field=None):
+        def value(folder):
+            return getattr(folder, value_field or "pk")
+
+        main = self._form(
+            {"parent": value(self.folders[0]), "sibling": value(self.folders[1])},
+            value_field=value_field,
+        )
+        formset = SimpleNamespace(prefix="children", forms=[])
+        formset.forms = [
+            self._form({"parent": value(folder)}, formset, value_field=value_field)
+            for folder in self.folders[2:]
+        ]
+        return [main, *formset.forms]
+
+    def _render(self, form, field_name):
+        widget = form.fields[field_name].widget
+        return widget.get_context(field_name, form[field_name].value(), {})
+
+    def test_main_form_and_inline_values_resolve_in_one_query(self):
+        forms_ = self._forms()
+        with self.assertNumQueries(1):
+            SBAdminAutocompleteWidget.prefetch_selected_options(self.request, forms_)
+        with self.assertNumQueries(0):
+            labels = [
+                self._render(form, field_name)["widget"]["value_list"]
+                for form in forms_
+                for field_name in ("parent", "sibling")
+                if form["parent"].value() and form[field_name].value()
+            ]
+        self.assertEqual(
+            [[option["label"] for option in options] for options in labels],
+            [[str(folder)] for folder in self.folders],
+        )
+
+    def test_changed_value_falls_back_to_own_query(self):
+        forms_ = self._forms()
+        SBAdminAutocompleteWidget.prefetch_selected_options(self.request, forms_)
+        extra = Folder.objects.create(name="extra")
+        widget = forms_[0].fields["parent"].widget
+        with self.assertNumQueries(1):
+            context = widget.get_context("parent", extra.pk, {})
+        self.assertEqual(context["widget"]["value_list"][0]["label"], str(extra))
+
+    def test_related_edit_urls_for_value_field_resolve_in_one_query(self):
+        self.request.request_data.configuration = (
+            AutocompleteParentPreselectConfiguration(show_related_buttons=True)
+        )
+        original_admin = sb_admin_site._registry.pop(Folder, None)
+        folder_admin = MagicMock(spec=SBAdmin)
+        folder_admin.has_view_or_change_permission.return_value = True
+        folder_admin.get_queryset.return_value = Folder.objects.all()
+        folder_admin.get_detail_url.side_effect = lambda pk: f"/folders/{pk}/change/"
+        folder_admin.has_add_permission.return_value = False
+        sb_admin_site._registry[Folder] = folder_admin
+        if original_admin:
+            self.addCleanup(sb_admin_site._registry.__setitem__, Folder, original_admin)
+        self.addCleanup(sb_admin_site._registry.pop, Folder, None)
+
+        forms_ = self._forms(value_field="name")
+        with self.assertNumQueries(2):
+            SBAdminAutocompleteWidget.prefetch_selected_options(self.request, forms_)
+            urls = [
+                self._render(form, "parent")["widget"]["attrs"]["related_edit_url"]
+                for form in forms_
+            ]
+        self.assertEqual(
+            urls,
+            [
+                f"/folders/{folder.pk}/change/"
+                for folder in (self.folders[0], *self.folders[2:])
+            ],
+        )
+        folder_admin.get_queryset.assert_called_once_with(self.request)
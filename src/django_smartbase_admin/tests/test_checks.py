@@ -1,4 +1,4 @@
-"""Tests for the SBAdmin system checks (sbadmin.W001..W005).
+"""Tests for the SBAdmin system checks (sbadmin.W001..W006).
 
 Each per-admin helper is invoked directly with fabricated admin classes so we
 don't depend on the global ``sb_admin_site`` registry or full Django admin
@@ -10,11 +10,13 @@ from __future__ import annotations
 from unittest import TestCase
 
 from django.contrib import admin as django_admin
+from django.test import override_settings
 
 from django_smartbase_admin.checks import (
     check_admin_display_ordering_filter_field_for_admin,
     check_duplicate_filter_field_for_admin,
     check_fake_inline_filter_override_for_admin,
+    check_http_cache_backend_for_admin,
     check_ordering_columns_for_admin,
     check_view_config_filter_keys_for_admin,
 )
@@ -332,3 +334,33 @@ class TestW005AdminDisplayOrderingFilterField(TestCase):
         self.assertEqual(len(result), 1)
         self.assertEqual(result[0].id, "sbadmin.W005")
         self.assertIn("'status_lookup'", result[0].msg)
+
+
+class _HttpCacheAdmin:
+    sbadmin_http_cache = True
+
+
+class TestW006HttpCacheBackend(TestCase):
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_process_local_cache_warns(self):
+        result = check_http_cache_backend_for_admin(_HttpCacheAdmin())
+        self.assertEqual([warning.id for warning in result], ["sbadmin.W006"])
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    )
+    def test_admin_without_http_cache_no_warning(self):
+        self.assertEqual(check_http_cache_backend_for_admin(_FakeAdmin()), [])
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://localhost:6379",
+            }
+        }
+    )
+    def test_shared_cache_no_warning(self):
+        self.assertEqual(check_http_cache_backend_for_admin(_HttpCacheAdmin()), [])
@@ -0,0 +1,142 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.contrib.auth.models import Group, User
+from django.contrib.sessions.backends.db import SessionStore
+from django.core.cache import cache, caches
+from django.core.management import call_command
+from django.db import router
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from django_smartbase_admin.engine.actions import sbadmin_action
+from django_smartbase_admin.engine.admin_base_view import SBAdminBaseView
+from django_smartbase_admin.services.db_routing import (
+    SBAdminDatabaseRoutingService,
+    SBAdminReplicaRouter,
+)
+from django_smartbase_admin.services.thread_local import SBAdminThreadLocalService
+from django_smartbase_admin.services.views import SBAdminViewService
+
+ROUTER = "django_smartbase_admin.services.db_routing.SBAdminReplicaRouter"
+
+
+class RoutedView(SBAdminBaseView):
+    sbadmin_read_only_actions = ("action_view_default",)
+
+    def get_id(self):
+        return "routed"
+
+    def init_view_dynamic(self, request, request_data=None, **kwargs):
+        pass
+
+    def has_permission_for_action(self, request, action) -> bool:
+        return True
+
+    def read_alias_response(self):
+        return HttpResponse(router.db_for_read(Group))
+
+    @sbadmin_action(read_only=True)
+    def action_read(self, request, modifier, object_id=None):
+        return self.read_alias_response()
+
+    @sbadmin_action
+    def action_write(self, request, modifier, object_id=None):
+        return self.read_alias_response()
+
+    @sbadmin_action
+    def action_view_default(self, request, modifier, object_id=None):
+        return self.read_alias_response()
+
+    @sbadmin_action(read_only=True)
+    def action_read_with_bookkeeping(self, request, modifier, object_id=None):
+        # What a list request writes besides the data: its session and the
+        # response / watermark caches.
+        SessionStore().save()
+        caches["db"].set("list-response", "cached")
+        return self.read_alias_response()
+
+    @sbadmin_action(read_only=True)
+    def action_read_after_write(self, request, modifier, object_id=None):
+        before = router.db_for_read(Group)
+        Group.objects.create(name="written")
+        return HttpResponse(f"{before},{router.db_for_read(Group)}")
+
+
+@override_settings(
+    DATABASE_ROUTERS=[ROUTER],
+    SB_ADMIN_READ_REPLICA_DATABASE="replica",
+)
+class ReplicaRoutingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.addCleanup(SBAdminThreadLocalService.clear_request)
+        self.user = User.objects.create_user("reader")
+
+    def build_request(self):
+        request = RequestFactory().get("/")
+        request.user = self.user
+        request.session = {}
+        return request
+
+    def delegate(self, action, request=None):
+        request = request or self.build_request()
+        request.request_data = SimpleNamespace(
+            selected_view=RoutedView(),
+            action=action,
+            modifier="json",
+            object_id=None,
+        )
+        SBAdminThreadLocalService.set_request(request)
+        with patch(
+            "django_smartbase_admin.services.views."
+            "SBAdminViewRequestData.from_request_and_kwargs",
+            return_value=request.request_data,
+        ):
+            return SBAdminViewService.delegate_to_action(request).content.decode()
+
+    def test_read_only_actions_read_from_replica(self):
+        self.assertEqual(self.delegate("action_read"), "replica")
+        self.assertEqual(self.delegate("action_view_default"), "replica")
+        self.assertEqual(self.delegate("action_write"), "default")
+        self.assertIsNone(SBAdminDatabaseRoutingService.get_read_alias())
+
+    @override_settings(SB_ADMIN_READ_REPLICA_DATABASE=None)
+    def test_disabled_without_replica_alias(self):
+        self.assertEqual(self.delegate("action_read"), "default")
+
+    def test_write_pins_user_to_primary(self):
+        self.assertEqual(self.delegate("action_read_after_write"), "replica,default")
+        # A later request (fresh session) is pinned through the cache.
+        self.assertEqual(self.delegate("action_read"), "default")
+        cache.clear()
+        self.assertEqual(self.delegate("action_read"), "replica")
+
+    @override_settings(
+        CACHES={
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+            "db": {
+                "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+                "LOCATION": "sb_admin_routing_test_cache",
+            },
+        }
+    )
+    def test_session_and_cache_writes_do_not_pin(self):
+        call_command("createcachetable", "sb_admin_routing_test_cache", verbosity=0)
+        self.assertEqual(self.delegate("action_read_with_bookkeeping"), "replica")
+        self.assertEqual(self.delegate("action_read"), "replica")
+
+    def test_pin_expires(self):
+        request = self.build_request()
+        with override_settings(SB_ADMIN_READ_REPLICA_STICKY_SECONDS=-1):
+            SBAdminDatabaseRoutingService.pin_to_primary(request)
+        self.assertFalse(SBAdminDatabaseRoutingService.is_pinned_to_primary(request))
+
+    def test_replica_instances_are_written_to_primary(self):
+        group = Group(name="from replica")
+        group._state.db = "replica"
+        replica_router = SBAdminReplicaRouter()
+        self.assertEqual(replica_router.db_for_write(Group, instance=group), "default")
+        self.assertFalse(replica_router.allow_migrate("replica", "auth"))
+        self.assertIsNone(replica_router.allow_migrate("default", "auth"))
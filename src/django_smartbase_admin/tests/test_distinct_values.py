@@ -0,0 +1,141 @@
+"""Distinct-values autocomplete: prefix matches first, ``DISTINCT`` pages
+continued by keyset cursors, and cached value dictionaries."""
+
+import json
+
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_smartbase_admin.admin.admin_base import SBAdmin
+from django_smartbase_admin.admin.site import sb_admin_site
+from django_smartbase_admin.engine.const import (
+    AUTOCOMPLETE_PAGE_NUM,
+    AUTOCOMPLETE_SEARCH_NAME,
+)
+from django_smartbase_admin.engine.distinct_values import SBAdminDistinctValuesEngine
+from django_smartbase_admin.engine.field import SBAdminField
+from django_smartbase_admin.engine.filter_widgets import FromValuesAutocompleteWidget
+from django_smartbase_admin.services.http_cache import SBAdminHttpCacheService
+from django_smartbase_admin.tests import test_previous_next_window
+
+NAMES = ["bravo", "alpha", "alphabet", "delta-alpha", "charlie", "zalpha", "gamma"]
+
+
+class DistinctValuesGroupAdmin(SBAdmin):
+    model = Group
+    sbadmin_list_display = (
+        SBAdminField(name="name", filter_widget=FromValuesAutocompleteWidget()),
+    )
+
+
+class DictionaryGroupAdmin(SBAdmin):
+    model = Group
+    sbadmin_http_cache = True
+    sbadmin_list_display = (
+        SBAdminField(
+            name="name",
+            filter_widget=FromValuesAutocompleteWidget(
+                distinct_values_engine=SBAdminDistinctValuesEngine(
+                    value_dictionary=True
+                ),
+            ),
+        ),
+    )
+
+
+class DistinctValuesTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        for name in NAMES:
+            Group.objects.create(name=name)
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.user = User(pk=1, is_superuser=True)
+        self.engine = SBAdminDistinctValuesEngine()
+
+    def page(self, term, page_size, cursor=None, offset=0):
+        return self.engine.search(
+            Group.objects.all(), "name", term, page_size, cursor, offset
+        )
+
+    def test_prefix_matches_come_first(self):
+        page = self.page("alpha", 10)
+        self.assertEqual(page.values, ["alpha", "alphabet", "delta-alpha", "zalpha"])
+        self.assertIsNone(page.next_cursor)
+
+    def test_keyset_pages_cross_phases_without_offset(self):
+        values = []
+        cursor = None
+        while True:
+            with CaptureQueriesContext(connection) as queries:
+                page = self.page("alpha", 1, cursor)
+            for query in queries:
+                self.assertIn("DISTINCT", query["sql"])
+                self.assertNotIn("OFFSET", query["sql"])
+                self.assertNotIn("GROUP BY", query["sql"])
+            values.extend(page.values)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        self.assertEqual(values, self.page("alpha", 10).values)
+
+    def test_page_numbers_still_page_through_phases(self):
+        values = [self.page("alpha", 3, offset=offset).values for offset in (0, 3)]
+        self.assertEqual(values, [["alpha", "alphabet", "delta-alpha"], ["zalpha"]])
+
+    def build_widget(self, admin_class):
+        self.view = admin_class(Group, sb_admin_site)
+        request = test_previous_next_window.PreviousNextWindowTests.build_request(self)
+        configuration = request.request_data.configuration
+        configuration.get_filter_widget = lambda field, filter_widget: filter_widget
+        configuration.get_http_cache_fingerprint = lambda request: "user-1"
+        widget = self.view.get_field_map(request)["name"].filter_widget
+        return widget, request
+
+    def load(self, widget, request, **post_data):
+        request.request_data.request_post = post_data
+        return json.loads(widget.action_autocomplete(request, widget.get_id()).content)
+
+    def test_widget_returns_next_cursor(self):
+        widget, request = self.build_widget(DistinctValuesGroupAdmin)
+        first = self.load(widget, request, **{AUTOCOMPLETE_SEARCH_NAME: "a"})
+        self.assertEqual(first["data"][0], {"value": "alpha", "label": "alpha"})
+        self.assertIsNone(first["next_cursor"])
+        # Page-number clients get the second page by offset.
+        second = self.load(
+            widget, request, **{AUTOCOMPLETE_SEARCH_NAME: "a", AUTOCOMPLETE_PAGE_NUM: 2}
+        )
+        self.assertEqual(second["data"], [])
+
+    def test_value_dictionary_is_served_from_cache_until_a_write(self):
+        SBAdminHttpCacheService.track_models([Group])
+        widget, request = self.build_widget(DictionaryGroupAdmin)
+        post_data = {AUTOCOMPLETE_SEARCH_NAME: "alpha"}
+        first = self.load(widget, request, **post_data)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.load(widget, request, **post_data), first)
+        self.assertEqual(
+            [item["value"] for item in first["data"]],
+            ["alpha", "alphabet", "delta-alpha", "zalpha"],
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            Group.objects.create(name="alpine-alpha")
+        refreshed = self.load(widget, request, **post_data)
+        self.assertIn("alpine-alpha", [item["value"] for item in refreshed["data"]])
+
+    def test_large_columns_fall_back_to_sql(self):
+        widget, request = self.build_widget(DictionaryGroupAdmin)
+        widget.distinct_values_engine = SBAdminDistinctValuesEngine(
+            value_dictionary=True, max_values=3
+        )
+        post_data = {AUTOCOMPLETE_SEARCH_NAME: "alpha"}
+        self.load(widget, request, **post_data)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.load(widget, request, **post_data)
+        self.assertTrue(queries)
+        self.assertEqual(len(response["data"]), 4)
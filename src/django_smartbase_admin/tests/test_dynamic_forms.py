@@ -9,7 +9,7 @@ from django.contrib.auth.models import User
 from django.db import models
 from django.http import HttpResponse, JsonResponse, QueryDict
 from django.template.loader import render_to_string
-from django.test import RequestFactory, SimpleTestCase, override_settings
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
 from django.urls import path
 from django.utils.translation import gettext_lazy as _
 from django_smartbase_admin.admin.admin_base import (
@@ -39,6 +39,7 @@ from django_smartbase_admin.engine.dynamic_forms import (
     SBADMIN_DYNAMIC_REGION_PREFIX_PARAM,
     SBAdminDynamicFormMixin,
     SBDynamicRegion,
+    SBDynamicRegionGraph,
     SBDynamicRegionSource,
     SBInactiveFieldPolicy,
 )
@@ -1010,6 +1011,14 @@ class InlineDynamicRegionParentAdmin(AdminFieldsetsDynamicRegionAdmin):
         return url
 
 
+class ScopedDynamicRegionUserAdmin(AdminFieldsetsDynamicRegionAdmin):
+    sbadmin_dynamic_region_scoped = True
+    sbadmin_fieldsets = (
+        AdminFieldsetsDynamicRegionAdmin.sbadmin_fieldsets[0],
+        ("Contact", {"fields": ("email", "is_staff")}),
+    )
+
+
 dynamic_region_admin_site.register(
     DynamicRegionDemoModel, AdminFieldsetsDynamicRegionAdmin
 )
@@ -2534,3 +2543,102 @@ class SBDynamicRegionWrapperIdTests(SimpleTestCase):
             wrapper_id,
             "sbadmin-dynamic-region-settings-shipper-mappings-0-carrier-type-region",
         )
+
+
+class ScopedDynamicRegionEndpointTests(TestCase):
+    def setUp(self):
+        self.model_admin = ScopedDynamicRegionUserAdmin(User, dynamic_region_admin_site)
+        self.user = User.objects.create(
+            username="company", last_name="Smartbase", email="info@example.com"
+        )
+
+    def post_region(self, data, object_id=None, **headers):
+        request = RequestFactory().post("/", data=data, **headers)
+        request.request_data = SimpleNamespace(
+            configuration=DynamicRegionTestConfiguration(),
+            global_filter_instance=None,
+        )
+        request.user = User(username="test", is_staff=True, is_superuser=True)
+        request_token = sb_admin_request.set(request)
+        try:
+            return request, self.model_admin.sbadmin_dynamic_region(
+                request, "add", object_id
+            )
+        finally:
+            sb_admin_request.reset(request_token)
+
+    def test_scoped_form_only_builds_region_fields(self):
+        with patch.object(
+            self.model_admin,
+            "get_dynamic_region_form_class",
+            wraps=self.model_admin.get_dynamic_region_form_class,
+        ) as get_form_class:
+            request, response = self.post_region(
+                {SBADMIN_DYNAMIC_REGION_PARAM: "profile", "username": "company"},
+                HTTP_HX_TRIGGER_NAME="username",
+            )
+        html = response.content.decode()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            get_form_class.call_args.kwargs["fields"],
+            ("username", "first_name", "last_name"),
+        )
+        self.assertEqual(
+            list(self.model_admin.get_all_base_fields_form(request).base_fields),
+            ["username", "first_name", "last_name"],
+        )
+        self.assertIn('name="last_name"', html)
+        self.assertNotIn('name="first_name"', html)
+
+    def test_scoped_base_fields_form_is_not_shared(self):
+        # What a concurrent full change-form render left on the view.
+        full_form = self.model_admin.all_base_fields_form = type(
+            "FullBaseFieldsForm", (forms.Form,), {"email": forms.CharField()}
+        )
+        full_request = RequestFactory().get("/")
+        self.post_region(
+            {SBADMIN_DYNAMIC_REGION_PARAM: "profile", "username": "company"},
+            HTTP_HX_TRIGGER_NAME="username",
+        )
+        self.assertIs(self.model_admin.all_base_fields_form, full_form)
+        self.assertIs(
+            self.model_admin.get_all_base_fields_form(full_request), full_form
+        )
+        self.assertIn("email", full_form.base_fields)
+
+    def test_scoped_object_loads_region_columns_only(self):
+        request, response = self.post_region(
+            {SBADMIN_DYNAMIC_REGION_PARAM: "profile", "username": "company"},
+            object_id=str(self.user.pk),
+        )
+        obj = self.model_admin.get_dynamic_region_object(
+            request,
+            "add",
+            str(self.user.pk),
+            field_names=("username", "first_name", "last_name"),
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('value="Smartbase"', response.content.decode())
+        self.assertIn("email", obj.get_deferred_fields())
+        self.assertNotIn("last_name", obj.get_deferred_fields())
+
+    def test_unknown_region_falls_back_to_full_form(self):
+        request = RequestFactory().get("/")
+
+        self.assertIsNone(self.model_admin.get_dynamic_region_scope(request, "missing"))
+        with patch.object(self.model_admin, "sbadmin_dynamic_region_scoped", False):
+            self.assertIsNone(
+                self.model_admin.get_dynamic_region_scope(request, "profile")
+            )
+
+    def test_region_graph_is_cached_per_form_class(self):
+        request = RequestFactory().get("/")
+        graph = self.model_admin.get_dynamic_region_graph(request)
+
+        self.assertIs(self.model_admin.get_dynamic_region_graph(request), graph)
+        self.assertEqual(
+            SBDynamicRegionGraph.get_field_names(graph.regions),
+            ("username", "first_name", "last_name"),
+        )
@@ -0,0 +1,128 @@
+"""Conditional list JSON responses: ETags from model watermarks, 304 before
+the queryset is built, and the short-lived server-side response cache."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.db import transaction
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from django_smartbase_admin.admin.admin_base import SBAdmin
+from django_smartbase_admin.admin.site import sb_admin_site
+from django_smartbase_admin.audit.manager import (
+    install_manager_hooks,
+    uninstall_manager_hooks,
+)
+from django_smartbase_admin.services.http_cache import SBAdminHttpCacheService
+from django_smartbase_admin.tests import test_previous_next_window
+
+
+class CachedGroupAdmin(SBAdmin):
+    model = Group
+    list_display = ("id", "name")
+    sbadmin_http_cache = True
+
+
+class UncachedGroupAdmin(SBAdmin):
+    model = Group
+    list_display = ("id", "name")
+
+
+class HttpCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.group = Group.objects.create(name="editors")
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.view = CachedGroupAdmin(Group, sb_admin_site)
+        SBAdminHttpCacheService.track_models(self.view.get_sbadmin_http_cache_models())
+        self.user = User(pk=1, is_superuser=True)
+
+    def build_request(self, view, **headers):
+        request = test_previous_next_window.PreviousNextWindowTests.build_request(self)
+        request.META.update(RequestFactory().get("/", headers=headers).META)
+        request.request_data.view = view.get_id()
+        request.request_data.configuration.get_http_cache_fingerprint = (
+            lambda request: "user-1"
+        )
+        return request
+
+    def load(self, view=None, **headers):
+        view = view or self.view
+        return view.action_list_json(self.build_request(view, **headers), "json")
+
+    def test_matching_etag_is_answered_before_querying(self):
+        response = self.load()
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+        self.assertIn("no-cache", response["Cache-Control"])
+        with self.assertNumQueries(0):
+            not_modified = self.load(if_none_match=etag)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified["ETag"], etag)
+
+    def test_identical_request_is_served_from_the_server_cache(self):
+        response = self.load()
+        with self.assertNumQueries(0):
+            cached = self.load()
+        self.assertEqual(cached.status_code, 200)
+        self.assertEqual(cached.content, response.content)
+        self.assertEqual(cached["ETag"], response["ETag"])
+
+    def test_committed_changes_replace_the_etag(self):
+        etag = self.load()["ETag"]
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            Group.objects.create(name="viewers")
+            Group.objects.create(name="authors")
+        # One watermark bump per model and transaction.
+        self.assertEqual(len(callbacks), 1)
+        response = self.load(if_none_match=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertIn(b"viewers", response.content)
+
+    def test_etag_changes_with_the_date(self):
+        etag = self.load()["ETag"]
+        tomorrow = timezone.now() + timedelta(days=1)
+        with patch("django.utils.timezone.now", return_value=tomorrow):
+            response = self.load(if_none_match=etag)
+        # Relative date filters now cover a different window.
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_nested_block_queues_its_own_bump(self):
+        Group.objects.create(name="outer")
+        with self.captureOnCommitCallbacks() as callbacks:
+            with transaction.atomic():
+                Group.objects.create(name="inner")
+        # The bump queued outside does not cover the savepoint's changes.
+        self.assertEqual(len(callbacks), 1)
+
+    def test_queryset_update_replaces_the_etag(self):
+        etag = self.load()["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            Group.objects.filter(pk=self.group.pk).update(name="renamed")
+        response = self.load(if_none_match=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"renamed", response.content)
+
+    def test_bulk_writes_replace_the_etag_without_the_audit_app(self):
+        uninstall_manager_hooks()
+        self.addCleanup(install_manager_hooks)
+        etag = self.load()["ETag"]
+        self.group.name = "bulk"
+        with self.captureOnCommitCallbacks(execute=True):
+            Group.objects.bulk_update([self.group], ["name"])
+        response = self.load(if_none_match=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"bulk", response.content)
+
+    def test_views_without_opt_in_are_not_cached(self):
+        view = UncachedGroupAdmin(Group, sb_admin_site)
+        response = self.load(view)
+        self.assertFalse(response.has_header("ETag"))
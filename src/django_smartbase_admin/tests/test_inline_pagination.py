@@ -1,3 +1,6 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
 from django.apps import apps
 from django.conf import settings
 from django.test import RequestFactory, SimpleTestCase
@@ -14,7 +17,10 @@ if not apps.ready:
 
     django.setup()
 
+from django.core.cache import cache
+
 from django_smartbase_admin.engine.inline_pagination import (
+    DeferredFormSetBase,
     InlinePaginated,
     PaginationFormSetBase,
     get_inline_admin_formset_by_prefix,
@@ -143,3 +149,91 @@ class InlinePaginationTests(SimpleTestCase):
             context["inline_admin_formsets"][0],
         )
         self.assertIsNone(get_inline_admin_formset_by_prefix(context, "other"))
+
+
+class FakeInlineFormSet:
+    validate_min = False
+
+    def __init__(self, data=None, instance=None, prefix=None, queryset=None):
+        self.prefix = prefix or self.get_default_prefix()
+        self.instance = instance
+        self.queryset = queryset
+
+    @classmethod
+    def get_default_prefix(cls):
+        return "prices"
+
+
+class DeferredFormSetTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.queryset = MagicMock()
+        self.queryset.count.return_value = 7
+        self.formset_class = type(
+            "DeferredFormSet", (DeferredFormSetBase, FakeInlineFormSet), {}
+        )
+        self.formset_class.request = RequestFactory().get("/admin/")
+
+    def build(self, **kwargs):
+        kwargs.setdefault("instance", SimpleNamespace(pk=1))
+        return self.formset_class(queryset=self.queryset, **kwargs)
+
+    def test_unbound_change_form_formset_is_deferred(self):
+        formset = self.build()
+
+        self.assertTrue(formset.is_deferred)
+        self.assertEqual(formset.deferred_count, 7)
+        self.assertIs(formset._queryset, self.queryset.none.return_value)
+        self.assertEqual((formset.extra, formset.min_num), (0, 0))
+
+    def test_deferred_count_is_cached(self):
+        self.build()
+        self.build()
+
+        self.assertEqual(self.queryset.count.call_count, 1)
+
+    def test_bound_formset_is_never_deferred(self):
+        formset = self.build(data={"prices-TOTAL_FORMS": "0"})
+
+        self.assertFalse(formset.is_deferred)
+        self.queryset.count.assert_not_called()
+
+    def test_posted_placeholder_stays_deferred(self):
+        formset = self.build(
+            data={
+                "prices-TOTAL_FORMS": "0",
+                "prices-INITIAL_FORMS": "0",
+                "prices-DEFERRED": "1",
+            }
+        )
+
+        # Re-rendered after a validation error: placeholder, not empty rows.
+        self.assertTrue(formset.is_deferred)
+        self.assertEqual(formset.deferred_count, 7)
+        self.assertEqual(formset.deferred_field_name, "prices-DEFERRED")
+
+    def test_add_view_formset_is_not_deferred(self):
+        self.assertFalse(self.build(instance=SimpleNamespace(pk=None)).is_deferred)
+
+    def test_htmx_partial_loads_requested_inline_only(self):
+        self.formset_class.request = RequestFactory().get(
+            "/admin/",
+            HTTP_HX_REQUEST="true",
+            HTTP_X_SBADMIN_INLINE_PREFIX="prices",
+        )
+
+        self.assertFalse(self.build().is_deferred)
+        self.assertTrue(self.build(prefix="other").is_deferred)
+
+    def test_deferred_paginated_formset_skips_paginator(self):
+        formset_class = type(
+            "DeferredPaginationFormSet",
+            (DeferredFormSetBase, PaginationFormSetBase, FakeInlineFormSet),
+            {"request": RequestFactory().get("/admin/")},
+        )
+
+        formset = formset_class(queryset=self.queryset, instance=SimpleNamespace(pk=1))
+
+        self.assertTrue(formset.is_deferred)
+        self.assertFalse(hasattr(formset, "paginator"))
+        self.assertEqual(self.queryset.count.call_count, 1)
@@ -47,6 +47,9 @@ class InlineReadonlyDemoAdmin:
     admin_site = sb_admin_site
     all_base_fields_form = forms.Form
 
+    def get_all_base_fields_form(self, request=None):
+        return self.all_base_fields_form
+
     def get_empty_value_display(self):
         return "-"
 
@@ -0,0 +1,206 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth.models import Group
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse
+from django.template import engines
+from django.template.response import TemplateResponse
+from django.test import RequestFactory, TestCase, override_settings
+
+from django_smartbase_admin.admin.site import sb_admin_site
+from django_smartbase_admin.engine.actions import sbadmin_action
+from django_smartbase_admin.engine.admin_base_view import SBAdminBaseView
+from django_smartbase_admin.services.instrumentation import (
+    SBAdminInstrumentationService,
+    SBAdminQueryBudgetExceeded,
+)
+from django_smartbase_admin.services.views import SBAdminViewService
+from django_smartbase_admin.tests import test_previous_next_window
+from django_smartbase_admin.tests.test_previous_next_window import (
+    PreviousNextGroupAdmin,
+)
+from django_smartbase_admin.views.metrics_view import SBAdminMetricsView
+
+
+class BudgetView(SBAdminBaseView):
+    sbadmin_query_budgets = {"action_view_budget": 1}
+
+    def get_id(self):
+        return "budget"
+
+    def init_view_dynamic(self, request, request_data=None, **kwargs):
+        pass
+
+    def has_permission_for_action(self, request, action) -> bool:
+        return True
+
+    @sbadmin_action(max_queries=1)
+    def action_two_queries(self, request, modifier, object_id=None):
+        Group.objects.count()
+        Group.objects.exists()
+        return HttpResponse("ok")
+
+    @sbadmin_action
+    def action_view_budget(self, request, modifier, object_id=None):
+        return self.action_two_queries(request, modifier, object_id)
+
+    @sbadmin_action
+    def action_render(self, request, modifier, object_id=None):
+        return self.render_groups(request)
+
+    @sbadmin_action(max_queries=0)
+    def action_render_budget(self, request, modifier, object_id=None):
+        return self.render_groups(request)
+
+    def render_groups(self, request):
+        template = engines["django"].from_string(
+            "{% for group in groups %}{{ group.name }};{% endfor %}"
+        )
+        return TemplateResponse(
+            request, template, context={"groups": Group.objects.order_by("pk")}
+        )
+
+
+class InstrumentationTestBase(TestCase):
+    def setUp(self):
+        SBAdminInstrumentationService.reset()
+        self.addCleanup(SBAdminInstrumentationService.reset)
+
+    def metric(self, kind, view, action):
+        return SBAdminInstrumentationService.get_metrics()[(kind, view, action)]
+
+
+class ListStagesTests(InstrumentationTestBase):
+    # Reuses the list fixture of the previous/next window tests.
+    window_tests = test_previous_next_window.PreviousNextWindowTests
+    build_params = window_tests.build_params
+    build_request = window_tests.build_request
+    load_list_page = window_tests.load_list_page
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.window_tests.setUpTestData.__func__(cls)
+
+    def setUp(self):
+        super().setUp()
+        self.view = PreviousNextGroupAdmin(Group, sb_admin_site)
+        self.user = MagicMock(pk=1, is_authenticated=True, is_superuser=True)
+
+    def test_list_data_is_split_into_stages(self):
+        with SBAdminInstrumentationService.measure("action", "group", "list"):
+            self.load_list_page(1)
+
+        metric = self.metric("action", "group", "list")
+        self.assertEqual(metric.calls, 1)
+        self.assertEqual(metric.rows, 2)
+        self.assertEqual(metric.query_count, 2)
+        self.assertEqual(metric.stages["count"].query_count, 1)
+        self.assertEqual(metric.stages["fetch"].query_count, 1)
+        self.assertEqual(metric.stages["queryset"].query_count, 0)
+        self.assertIn("format", metric.stages)
+
+
+class DelegateToActionTests(InstrumentationTestBase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.groups = [Group.objects.create(name=f"group{index}") for index in range(2)]
+
+    def delegate(self, action):
+        request = RequestFactory().get("/")
+        request.request_data = SimpleNamespace(
+            selected_view=BudgetView(),
+            action=action,
+            modifier="template",
+            object_id=None,
+        )
+        with patch(
+            "django_smartbase_admin.services.views."
+            "SBAdminViewRequestData.from_request_and_kwargs",
+            return_value=request.request_data,
+        ):
+            return SBAdminViewService.delegate_to_action(request)
+
+    def test_budget_fails_under_test_runner(self):
+        with self.assertRaisesMessage(
+            SBAdminQueryBudgetExceeded, "budget.action_two_queries/template"
+        ):
+            self.delegate("action_two_queries")
+        metric = self.metric("action", "budget", "action_two_queries")
+        self.assertEqual((metric.query_count, metric.budget_exceeded), (2, 1))
+
+    @override_settings(SB_ADMIN_QUERY_BUDGET_MODE="warn")
+    def test_budget_warns_in_production_mode(self):
+        with self.assertLogs(
+            "django_smartbase_admin.services.instrumentation", "WARNING"
+        ) as logs:
+            response = self.delegate("action_view_budget")
+        self.assertEqual(response.content, b"ok")
+        self.assertIn("2 queries, budget 1", logs.output[0])
+        metric = self.metric("action", "budget", "action_view_budget")
+        self.assertEqual(metric.response_bytes, 2)
+
+    def test_template_render_counts_towards_the_action(self):
+        response = self.delegate("action_render")
+        self.assertEqual(SBAdminInstrumentationService.get_metrics(), {})
+
+        response.render()
+        metric = self.metric("action", "budget", "action_render")
+        self.assertEqual(metric.query_count, 1)
+        self.assertEqual(metric.stages["render"].query_count, 1)
+        self.assertEqual(metric.response_bytes, len(b"group0;group1;"))
+
+    def test_stale_measurement_never_fails_the_next_request(self):
+        # Never rendered; queries run meanwhile still count towards it.
+        self.delegate("action_render_budget")
+        Group.objects.count()
+
+        with SBAdminInstrumentationService.measure("action", "budget", "next"):
+            pass
+
+        metric = self.metric("action", "budget", "action_render_budget")
+        self.assertEqual((metric.query_count, metric.budget_exceeded), (1, 1))
+        self.assertEqual(self.metric("action", "budget", "next").calls, 1)
+
+    def test_modifiers_share_one_metric(self):
+        for modifier in ("template", "json", "a3f9c1"):
+            with SBAdminInstrumentationService.measure(
+                "action", "budget", "list", modifier
+            ):
+                pass
+        self.assertEqual(
+            list(SBAdminInstrumentationService.get_metrics()),
+            [("action", "budget", "list")],
+        )
+        self.assertEqual(self.metric("action", "budget", "list").calls, 3)
+
+
+@override_settings(SB_ADMIN_METRICS_TOKEN="s3cret")
+class MetricsEndpointTests(InstrumentationTestBase):
+    def get(self, **headers):
+        request = RequestFactory().get("/metrics/", headers=headers)
+        request.user = MagicMock(is_active=True, is_superuser=False)
+        return SBAdminMetricsView.as_view()(request)
+
+    def test_prometheus_text_requires_token_or_superuser(self):
+        with SBAdminInstrumentationService.measure("mcp", "mcp", "list_rows"):
+            with SBAdminInstrumentationService.stage("fetch"):
+                Group.objects.count()
+
+        with self.assertRaises(PermissionDenied):
+            self.get(authorization="Bearer wrong")
+        body = self.get(authorization="Bearer s3cret").content.decode()
+
+        labels = 'kind="mcp",view="mcp",action="list_rows"'
+        self.assertIn(f"sbadmin_calls_total{{{labels}}} 1", body)
+        self.assertIn(f"sbadmin_query_count_total{{{labels}}} 1", body)
+        self.assertIn(
+            f'sbadmin_stage_query_count_total{{{labels},stage="fetch"}} 1', body
+        )
+        self.assertIn("# TYPE sbadmin_wall_seconds_max gauge", body)
+
+    def test_metrics_url_is_registered_on_the_site(self):
+        self.assertIn(
+            "metrics",
+            {getattr(pattern, "name", None) for pattern in sb_admin_site.get_urls()},
+        )
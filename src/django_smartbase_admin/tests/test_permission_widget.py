@@ -10,6 +10,7 @@ from django_smartbase_admin.admin.permission_widget import (
     PermissionGroup,
     PermissionOption,
     SBAdminPermissionWidget,
+    invalidate_permission_catalogue,
 )
 
 
@@ -211,12 +212,44 @@ class PermissionWidgetContextTests(TestCase):
             preselect_all=True,
         )
 
-        with self.assertNumQueries(1):
+        invalidate_permission_catalogue()
+        # Catalogue version + catalogue rows; preselection adds nothing.
+        with self.assertNumQueries(2):
             context = widget.get_context("permissions", None, {"id": "id_permissions"})
 
         stored = set(json.loads(context["widget"]["selected_values"]))
         self.assertEqual(stored, expected_ids)
 
+    def test_catalogue_is_cached_and_selection_overlaid(self):
+        queryset = Permission.objects.filter(codename__endswith="testmodel")
+        view_perm = Permission.objects.get(codename="view_testmodel")
+        invalidate_permission_catalogue()
+        SBAdminPermissionWidget(queryset=queryset).get_context(
+            "permissions", [view_perm.pk], {"id": "id_permissions"}
+        )
+
+        # Only the version check runs for the next widget on the same queryset.
+        with self.assertNumQueries(1):
+            context = SBAdminPermissionWidget(queryset=queryset).get_context(
+                "permissions", [], {"id": "id_permissions"}
+            )
+        rows = context["widget"]["permission_sections"][0].models[0].custom_perms
+        self.assertEqual(
+            [row.selected for row in rows if row.codename == "view_testmodel"], [False]
+        )
+
+    def test_catalogue_is_invalidated_by_permission_save(self):
+        queryset = Permission.objects.filter(codename__endswith="testmodel")
+        widget = SBAdminPermissionWidget(queryset=queryset)
+        widget.get_context("permissions", [], {"id": "id_permissions"})
+        perm = Permission.objects.get(codename="view_testmodel")
+        perm.name = "Can peek at test model"
+        perm.save()
+
+        context = widget.get_context("permissions", [], {"id": "id_permissions"})
+        rows = context["widget"]["permission_sections"][0].models[0].custom_perms
+        self.assertIn("Can peek at test model", [row.name for row in rows])
+
     def test_selected_perm_has_selected_flag(self):
         widget = SBAdminPermissionWidget(queryset=Permission.objects.all())
         perm = Permission.objects.get(codename="view_testmodel")
@@ -342,6 +375,21 @@ class PermissionWidgetRenderingTests(TestCase):
         self.assertNotIn('id="perm-', html)
         self.assertNotIn('for="perm-', html)
 
+    def test_lazy_sections_render_collapsed_templates(self):
+        perm = Permission.objects.first()
+
+        class TestForm(forms.Form):
+            permissions = forms.ModelMultipleChoiceField(
+                queryset=Permission.objects.all(),
+                widget=SBAdminPermissionWidget(lazy_sections=True),
+            )
+
+        html = TestForm(initial={"permissions": [perm.pk]}).as_p()
+
+        self.assertIn("<template data-permission-tree-lazy-body>", html)
+        self.assertNotIn("collapse show", html)
+        self.assertIn(f'data-permission-tree-lazy-selected="[{perm.pk}]"', html)
+
     def test_widget_has_sbadmin_flag(self):
         widget = SBAdminPermissionWidget()
         self.assertTrue(widget.sb_admin_widget)
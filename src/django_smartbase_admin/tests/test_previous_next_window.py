@@ -0,0 +1,186 @@
+import json
+import urllib.parse
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_smartbase_admin.admin.admin_base import SBAdmin
+from django_smartbase_admin.admin.site import sb_admin_site
+from django_smartbase_admin.engine.const import (
+    FILTER_DATA_NAME,
+    TABLE_PARAMS_FULL_TEXT_SEARCH,
+    TABLE_PARAMS_NAME,
+    TABLE_PARAMS_PAGE_NAME,
+    TABLE_PARAMS_SIZE_NAME,
+    TABLE_PARAMS_SORT_NAME,
+)
+from django_smartbase_admin.engine.request import SBAdminViewRequestData
+from django_smartbase_admin.engine.search import SBAdminSearchEngine
+from django_smartbase_admin.services.http_cache import SBAdminHttpCacheService
+
+
+class PreviousNextGroupAdmin(SBAdmin):
+    model = Group
+    list_display = ("id", "name")
+    sbadmin_previous_next_buttons_enabled = True
+
+
+class ReverseNameSearchEngine(SBAdminSearchEngine):
+    def filter_queryset(self, action, request, queryset, search_field_specs, terms):
+        return queryset.filter(name__icontains=terms[0])
+
+    def order_queryset(self, action, request, queryset, search_field_specs, terms):
+        return queryset.order_by("-name")
+
+
+class RankedGroupAdmin(PreviousNextGroupAdmin):
+    search_fields = ("name",)
+
+    def get_sbadmin_search_engine(self, request):
+        return ReverseNameSearchEngine()
+
+
+class PreviousNextWindowTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.groups = [Group.objects.create(name=f"group{index}") for index in range(5)]
+
+    def setUp(self):
+        cache.clear()
+        self.view = PreviousNextGroupAdmin(Group, sb_admin_site)
+        self.user = MagicMock(pk=1, is_authenticated=True, is_superuser=True)
+        patcher = patch.object(
+            PreviousNextGroupAdmin,
+            "get_detail_url",
+            lambda view, object_id=None: f"/group/{object_id}/",
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def build_params(self, page):
+        return {
+            self.view.get_id(): {
+                FILTER_DATA_NAME: {},
+                TABLE_PARAMS_NAME: {
+                    TABLE_PARAMS_PAGE_NAME: page,
+                    TABLE_PARAMS_SIZE_NAME: 2,
+                    TABLE_PARAMS_SORT_NAME: [{"field": "name", "dir": "asc"}],
+                },
+            }
+        }
+
+    def build_request(self, get=None):
+        request = RequestFactory().get("/", get or {})
+        request.user = self.user
+        request_data = SBAdminViewRequestData(
+            view=self.view.get_id(),
+            action=None,
+            modifier=None,
+            user=self.user,
+            request_get=request.GET,
+            request_method="GET",
+        )
+        request_data.additional_data = {}
+        config = MagicMock()
+        config.restrict_queryset = lambda qs, **kwargs: qs
+        config.apply_global_filter_to_queryset = lambda qs, *a, **kw: qs
+        config.plugins = []
+        request_data.configuration = config
+        request.request_data = request_data
+        request.LANGUAGE_CODE = "en"
+        return request
+
+    def load_list_page(self, page):
+        action = self.view.sbadmin_list_action_class(
+            self.view, self.build_request(), all_params=self.build_params(page)
+        )
+        return action.get_json_data()
+
+    def open_detail(self, group, page):
+        raw_filters = urllib.parse.urlencode(
+            {"params": json.dumps(self.build_params(page), separators=(",", ":"))}
+        )
+        request = self.build_request({"_changelist_filters": raw_filters})
+        return self.view.get_previous_next_context(request, str(group.pk))
+
+    def test_detail_reuses_page_window_from_list(self):
+        self.load_list_page(1)
+        with self.assertNumQueries(0):
+            context = self.open_detail(self.groups[0], page=1)
+        self.assertIsNone(context["previous_url"])
+        self.assertTrue(context["next_url"].startswith(f"/group/{self.groups[1].pk}/"))
+        self.assertEqual(context["current_index"], 1)
+        self.assertEqual(context["all_objects_count"], 5)
+
+    def test_walking_off_the_page_fetches_only_next_window(self):
+        self.load_list_page(1)
+        with self.assertNumQueries(1):
+            context = self.open_detail(self.groups[1], page=1)
+        self.assertTrue(context["next_url"].startswith(f"/group/{self.groups[2].pk}/"))
+        with self.assertNumQueries(0):
+            context = self.open_detail(self.groups[2], page=2)
+        self.assertTrue(
+            context["previous_url"].startswith(f"/group/{self.groups[1].pk}/")
+        )
+        self.assertEqual(context["current_index"], 3)
+
+    def test_cache_miss_queries_window_and_count(self):
+        # window + count for the page, then the previous page for its last row
+        with self.assertNumQueries(3):
+            context = self.open_detail(self.groups[4], page=3)
+        self.assertTrue(
+            context["previous_url"].startswith(f"/group/{self.groups[3].pk}/")
+        )
+        self.assertIsNone(context["next_url"])
+        self.assertEqual(context["all_objects_count"], 5)
+        self.assertEqual(context["current_index"], 5)
+
+    def test_stale_window_falls_back_to_query(self):
+        self.load_list_page(1)
+        with self.assertNumQueries(2):
+            context = self.open_detail(self.groups[3], page=1)
+        self.assertEqual(context, {})
+
+    def test_cache_miss_selects_only_the_pks(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.open_detail(self.groups[2], page=2)
+        window_sql = next(query["sql"] for query in queries if "LIMIT" in query["sql"])
+        select_clause = window_sql.split(" FROM ")[0]
+        self.assertIn('"auth_group"."id"', select_clause)
+        self.assertNotIn('"auth_group"."name"', select_clause)
+
+    def test_writes_invalidate_the_remembered_window(self):
+        SBAdminHttpCacheService.track_models([Group])
+        self.load_list_page(1)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.groups[1].delete()
+        context = self.open_detail(self.groups[0], page=1)
+        self.assertTrue(context["next_url"].startswith(f"/group/{self.groups[2].pk}/"))
+        self.assertEqual(context["all_objects_count"], 4)
+
+    def test_window_follows_search_rank_ordering(self):
+        self.view = RankedGroupAdmin(Group, sb_admin_site)
+        params = self.build_params(1)
+        params[self.view.get_id()][FILTER_DATA_NAME] = {
+            TABLE_PARAMS_FULL_TEXT_SEARCH: "group"
+        }
+        del params[self.view.get_id()][TABLE_PARAMS_NAME][TABLE_PARAMS_SORT_NAME]
+        raw_filters = urllib.parse.urlencode(
+            {"params": json.dumps(params, separators=(",", ":"))}
+        )
+        request = self.build_request({"_changelist_filters": raw_filters})
+
+        context = self.view.get_previous_next_context(request, str(self.groups[4].pk))
+
+        self.assertIsNone(context["previous_url"])
+        self.assertTrue(context["next_url"].startswith(f"/group/{self.groups[3].pk}/"))
+
+    def test_non_numeric_page_falls_back_to_the_first(self):
+        data = self.load_list_page("abc")
+        self.assertEqual(
+            [row["id"] for row in data["data"]], [group.pk for group in self.groups[:2]]
+        )
@@ -0,0 +1,109 @@
+"""Default count columns of to-many relations: correlated subqueries
+computed for the fetched page only, with the label added in Python."""
+
+from django.contrib.auth.models import Group, Permission, User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_smartbase_admin.admin.admin_base import SBAdmin
+from django_smartbase_admin.admin.site import sb_admin_site
+from django_smartbase_admin.engine.const import (
+    ANNOTATE_KEY,
+    FILTER_DATA_NAME,
+    TABLE_PARAMS_NAME,
+    TABLE_PARAMS_PAGE_NAME,
+    TABLE_PARAMS_SIZE_NAME,
+    TABLE_PARAMS_SORT_NAME,
+)
+from django_smartbase_admin.engine.field import SBAdminField
+from django_smartbase_admin.plugins.base import SBAdminPlugin
+from django_smartbase_admin.tests import test_previous_next_window
+
+PERMISSIONS = f"permissions{ANNOTATE_KEY}"
+USERS = f"user{ANNOTATE_KEY}"
+
+
+class RelationCountGroupAdmin(SBAdmin):
+    model = Group
+    sbadmin_list_display = (
+        "name",
+        SBAdminField(name="permissions", list_visible=True),
+        SBAdminField(name="user", list_visible=True),
+    )
+
+
+class RawRowsRecordingPlugin(SBAdminPlugin):
+    rows = []
+
+    @classmethod
+    def modify_raw_data(cls, action, request, data, **kwargs):
+        cls.rows = [dict(row) for row in data]
+        return data
+
+
+class RelationCountTests(TestCase):
+    # Same request fixture as the previous/next window tests.
+    build_request = test_previous_next_window.PreviousNextWindowTests.build_request
+
+    @classmethod
+    def setUpTestData(cls):
+        permissions = list(Permission.objects.order_by("pk")[:3])
+        cls.busy = Group.objects.create(name="busy")
+        cls.busy.permissions.set(permissions)
+        for index in range(2):
+            User.objects.create(username=f"member{index}").groups.add(cls.busy)
+        cls.empty = Group.objects.create(name="empty")
+
+    def setUp(self):
+        self.view = RelationCountGroupAdmin(Group, sb_admin_site)
+        self.user = User(pk=1, is_superuser=True)
+
+    def load_rows(self, sort=None, plugins=()):
+        table_params = {TABLE_PARAMS_PAGE_NAME: 1, TABLE_PARAMS_SIZE_NAME: 10}
+        if sort:
+            table_params[TABLE_PARAMS_SORT_NAME] = sort
+        request = self.build_request()
+        request.request_data.configuration.plugins = list(plugins)
+        action = self.view.sbadmin_list_action_class(
+            self.view,
+            request,
+            all_params={
+                self.view.get_id(): {
+                    FILTER_DATA_NAME: {},
+                    TABLE_PARAMS_NAME: table_params,
+                }
+            },
+        )
+        with CaptureQueriesContext(connection) as queries:
+            rows = action.get_data()["data"]
+        return {row["name"]: row for row in rows}, [q["sql"] for q in queries]
+
+    def test_counts_do_not_multiply_and_are_labelled_in_python(self):
+        rows, _queries = self.load_rows()
+        self.assertEqual(rows["busy"][PERMISSIONS], "3 - permissions")
+        self.assertEqual(rows["busy"][USERS], "2 - users")
+        self.assertEqual(rows["empty"][PERMISSIONS], "0 - permissions")
+
+    def test_counts_are_computed_for_the_page_only(self):
+        _rows, queries = self.load_rows()
+        count_sql, page_sql, counts_sql = queries
+        for sql in (count_sql, page_sql):
+            self.assertNotIn("auth_group_permissions", sql)
+        self.assertIn("auth_group_permissions", counts_sql)
+        self.assertIn(" IN (", counts_sql)
+
+    def test_sorted_column_stays_in_the_page_query(self):
+        rows, queries = self.load_rows(sort=[{"field": PERMISSIONS, "dir": "desc"}])
+        _count_sql, page_sql, counts_sql = queries
+        self.assertIn("auth_group_permissions", page_sql)
+        self.assertNotIn("auth_group_permissions", counts_sql)
+        self.assertIn("auth_user_groups", counts_sql)
+        self.assertEqual(list(rows), ["busy", "empty"])
+        self.assertEqual(rows["busy"][PERMISSIONS], "3 - permissions")
+
+    def test_plugins_see_page_only_counts(self):
+        self.load_rows(plugins=[RawRowsRecordingPlugin])
+        rows = {row["name"]: row for row in RawRowsRecordingPlugin.rows}
+        self.assertEqual(rows["busy"][PERMISSIONS], 3)
+        self.assertEqual(rows["empty"][USERS], 0)
@@ -0,0 +1,169 @@
+from django.db import connection, models
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_smartbase_admin.engine.reorder import (
+    SBAdminRankReorderEngine,
+    SBAdminSparseReorderEngine,
+)
+
+
+class ReorderDemoModel(models.Model):
+    name = models.CharField(max_length=20)
+    position = models.IntegerField(default=0)
+    weight = models.FloatField(default=0)
+
+    class Meta:
+        app_label = "django_smartbase_admin"
+
+
+class ReorderEngineTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(ReorderDemoModel)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(ReorderDemoModel)
+
+    def create_rows(self, field, keys):
+        return [
+            ReorderDemoModel.objects.create(name=f"row{index}", **{field: key})
+            for index, key in enumerate(keys)
+        ]
+
+    def names_in_order(self, field):
+        return list(
+            ReorderDemoModel.objects.order_by(field, "pk").values_list(
+                "name", flat=True
+            )
+        )
+
+
+class RankReorderEngineTests(ReorderEngineTestCase):
+    def setUp(self):
+        self.rows = self.create_rows("position", range(1, 11))
+        self.engine = SBAdminRankReorderEngine()
+        self.qs = ReorderDemoModel.objects.all()
+
+    def positions(self):
+        return list(
+            ReorderDemoModel.objects.order_by("position").values_list(
+                "name", "position"
+            )
+        )
+
+    def test_move_up_shifts_only_window_in_one_update(self):
+        with CaptureQueriesContext(connection) as queries:
+            updated = self.engine.move(
+                self.qs, "position", self.rows[6].pk, self.rows[2].pk
+            )
+        self.assertEqual(updated, 5)
+        updates = [q for q in queries.captured_queries if q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(updates), 1)
+        self.assertIn("CASE", updates[0]["sql"])
+        self.assertEqual(
+            [name for name, _position in self.positions()],
+            [
+                "row0",
+                "row1",
+                "row6",
+                "row2",
+                "row3",
+                "row4",
+                "row5",
+                "row7",
+                "row8",
+                "row9",
+            ],
+        )
+        self.assertEqual(
+            [position for _name, position in self.positions()], list(range(1, 11))
+        )
+
+    def test_move_down_takes_rank_above_replaced_row(self):
+        updated = self.engine.move(
+            self.qs, "position", self.rows[1].pk, self.rows[4].pk
+        )
+        self.assertEqual(updated, 3)
+        self.assertEqual(
+            self.names_in_order("position")[:5],
+            ["row0", "row2", "row3", "row1", "row4"],
+        )
+
+    def test_move_to_end(self):
+        self.engine.move(self.qs, "position", self.rows[0].pk, None)
+        self.assertEqual(self.names_in_order("position")[-1], "row0")
+        self.assertEqual(
+            [position for _name, position in self.positions()], list(range(1, 11))
+        )
+
+    def test_non_dense_ranks_are_renumbered(self):
+        ReorderDemoModel.objects.update(position=0)
+        self.engine.move(self.qs, "position", self.rows[3].pk, self.rows[0].pk)
+        self.assertEqual(self.names_in_order("position")[:2], ["row3", "row0"])
+        self.assertEqual(
+            [position for _name, position in self.positions()], list(range(1, 11))
+        )
+
+
+class SparseReorderEngineTests(ReorderEngineTestCase):
+    def setUp(self):
+        self.engine = SBAdminSparseReorderEngine(step=4)
+        self.qs = ReorderDemoModel.objects.all()
+
+    def test_move_writes_single_row_at_midpoint(self):
+        rows = self.create_rows("position", [4, 8, 12, 16])
+        updated = self.engine.move(self.qs, "position", rows[3].pk, rows[1].pk)
+        self.assertEqual(updated, 1)
+        rows[3].refresh_from_db()
+        self.assertEqual(rows[3].position, 6)
+        self.assertEqual(
+            self.names_in_order("position"), ["row0", "row3", "row1", "row2"]
+        )
+
+    def test_move_to_first_and_last(self):
+        rows = self.create_rows("position", [4, 8, 12])
+        self.engine.move(self.qs, "position", rows[2].pk, rows[0].pk)
+        self.engine.move(self.qs, "position", rows[0].pk, None)
+        self.assertEqual(self.names_in_order("position"), ["row2", "row1", "row0"])
+
+    def test_exhausted_gap_rebalances(self):
+        rows = self.create_rows("position", [4, 5, 6])
+        updated = self.engine.move(self.qs, "position", rows[2].pk, rows[1].pk)
+        # row0 already sits on the first rebalanced key
+        self.assertEqual(updated, 2)
+        self.assertEqual(
+            list(
+                ReorderDemoModel.objects.order_by("position").values_list(
+                    "name", "position"
+                )
+            ),
+            [("row0", 4), ("row2", 8), ("row1", 12)],
+        )
+
+    def test_duplicate_keys_rebalance(self):
+        rows = self.create_rows("position", [4, 8, 8, 12])
+        self.engine.move(self.qs, "position", rows[3].pk, rows[2].pk)
+        self.assertEqual(
+            self.names_in_order("position"), ["row0", "row1", "row3", "row2"]
+        )
+        positions = ReorderDemoModel.objects.values_list("position", flat=True)
+        self.assertEqual(len(set(positions)), 4)
+
+    def test_neighbours_one_apart_are_exhausted(self):
+        field = ReorderDemoModel._meta.get_field("position")
+        self.assertTrue(self.engine.is_gap_exhausted(field, 7, 8, 7))
+        self.assertTrue(self.engine.is_gap_exhausted(field, 8, 8, 8))
+        self.assertFalse(self.engine.is_gap_exhausted(field, 6, 8, 7))
+
+    def test_fractional_keys_use_midpoint(self):
+        rows = self.create_rows("weight", [1.0, 2.0, 3.0])
+        updated = self.engine.move(self.qs, "weight", rows[2].pk, rows[1].pk)
+        self.assertEqual(updated, 1)
+        rows[2].refresh_from_db()
+        self.assertEqual(rows[2].weight, 1.5)
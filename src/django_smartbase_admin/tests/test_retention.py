@@ -0,0 +1,131 @@
+import datetime
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth.models import Group
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from django_smartbase_admin.audit.models import AdminAuditLog, AdminAuditLogObject
+from django_smartbase_admin.audit.utils.object_index import get_object_history_q
+from django_smartbase_admin.services.retention import SBAdminRetentionService
+
+
+class RetentionTests(TestCase):
+    def setUp(self):
+        content_type = ContentType.objects.get_for_model(Group)
+        now = timezone.now()
+        self.old_stamps = [now - datetime.timedelta(days=400 + day) for day in range(5)]
+        for index, stamp in enumerate([*self.old_stamps, now]):
+            log = AdminAuditLog.objects.create(
+                content_type=content_type,
+                object_id=str(index),
+                object_repr=f"group{index}",
+                action_type=AdminAuditLog.ActionType.UPDATE,
+                changes={"name": {"old": "a", "new": "b"}},
+            )
+            AdminAuditLog.objects.filter(pk=log.pk).update(timestamp=stamp)
+        archive_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(archive_dir.cleanup)
+        self.archive_dir = archive_dir.name
+
+    def test_prune_deletes_expired_rows_in_bounded_chunks(self):
+        cutoff = SBAdminRetentionService.get_cutoff(365)
+        # 3 chunks of: pk window, savepoint, pk read, object index cascade,
+        # delete, release — plus the final empty window
+        with self.assertNumQueries(3 * 6 + 1):
+            result = SBAdminRetentionService.prune(AdminAuditLog, cutoff, batch_size=2)
+        self.assertEqual(result.deleted, 5)
+        self.assertEqual(
+            list(AdminAuditLog.objects.values_list("object_id", flat=True)), ["5"]
+        )
+
+    def test_archive_round_trip_restores_rows(self):
+        expected = list(
+            AdminAuditLog.objects.filter(object_id__in="01234")
+            .order_by("pk")
+            .values("pk", "timestamp", "changes", "object_repr")
+        )
+        result = SBAdminRetentionService.apply_retention(
+            AdminAuditLog, 365, archive_dir=self.archive_dir, batch_size=2
+        )
+        self.assertEqual((result.deleted, result.archived), (5, 5))
+        archives = sorted(
+            Path(self.archive_dir).glob("sb_admin_audit.adminauditlog/*.jsonl.gz")
+        )
+        self.assertTrue(archives)
+
+        for path in archives:
+            SBAdminRetentionService.import_archive(AdminAuditLog, path)
+        # importing again skips rows that exist
+        SBAdminRetentionService.import_archive(AdminAuditLog, archives[0])
+
+        restored = list(
+            AdminAuditLog.objects.filter(object_id__in="01234")
+            .order_by("pk")
+            .values("pk", "timestamp", "changes", "object_repr")
+        )
+        self.assertEqual(restored, expected)
+
+    def test_import_stores_typed_object_keys(self):
+        # Rows archived before the typed keys existed.
+        AdminAuditLog.objects.update(object_key_int=None)
+        SBAdminRetentionService.apply_retention(
+            AdminAuditLog, 365, archive_dir=self.archive_dir
+        )
+        for path in Path(self.archive_dir).glob("*/*.jsonl.gz"):
+            SBAdminRetentionService.import_archive(AdminAuditLog, path)
+
+        restored = AdminAuditLog.objects.filter(object_id__in="01234")
+        self.assertEqual(
+            sorted(restored.values_list("object_key_int", flat=True)), [0, 1, 2, 3, 4]
+        )
+
+    @override_settings(SB_ADMIN_AUDIT_OBJECT_INDEX=True)
+    def test_import_indexes_restored_rows(self):
+        SBAdminRetentionService.apply_retention(
+            AdminAuditLog, 365, archive_dir=self.archive_dir
+        )
+        for path in Path(self.archive_dir).glob("*/*.jsonl.gz"):
+            SBAdminRetentionService.import_archive(AdminAuditLog, path, batch_size=2)
+
+        restored = AdminAuditLog.objects.filter(object_id__in="01234")
+        self.assertEqual(
+            AdminAuditLogObject.objects.filter(log__in=restored).count(), 5
+        )
+        content_type = ContentType.objects.get_for_model(Group)
+        history = AdminAuditLog.objects.filter(
+            get_object_history_q([(content_type.pk, "3")])
+        )
+        self.assertEqual(list(history.values_list("object_id", flat=True)), ["3"])
+
+    def test_command_uses_model_retention_setting(self):
+        out = StringIO()
+        call_command("sbadmin_prune_logs", stdout=out)
+        self.assertIn("SB_ADMIN_AUDIT_RETENTION_DAYS not set", out.getvalue())
+        self.assertEqual(AdminAuditLog.objects.count(), 6)
+
+        out = StringIO()
+        with override_settings(SB_ADMIN_AUDIT_RETENTION_DAYS=365):
+            call_command(
+                "sbadmin_prune_logs",
+                model=["sb_admin_audit.AdminAuditLog"],
+                archive_dir=self.archive_dir,
+                stdout=out,
+            )
+        self.assertIn("deleted 5 rows, archived 5 rows", out.getvalue())
+        self.assertEqual(AdminAuditLog.objects.count(), 1)
+
+        archive = next(Path(self.archive_dir).rglob("*.jsonl.gz"))
+        out = StringIO()
+        call_command(
+            "sbadmin_import_log_archive",
+            "sb_admin_audit.AdminAuditLog",
+            str(archive),
+            stdout=out,
+        )
+        self.assertIn("read", out.getvalue())
+        self.assertGreater(AdminAuditLog.objects.count(), 1)
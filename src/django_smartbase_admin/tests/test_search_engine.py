@@ -0,0 +1,194 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth.models import Group
+from django.db import connection
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from django_smartbase_admin.actions.admin_action_list import SBAdminListAction
+from django_smartbase_admin.admin.admin_base import SBAdmin
+from django_smartbase_admin.admin.site import sb_admin_site
+from django_smartbase_admin.engine.const import (
+    FILTER_DATA_NAME,
+    TABLE_PARAMS_FULL_TEXT_SEARCH,
+    TABLE_PARAMS_NAME,
+    TABLE_PARAMS_SORT_NAME,
+)
+from django_smartbase_admin.engine.request import SBAdminViewRequestData
+from django_smartbase_admin.engine.search import (
+    SEARCH_KIND_PHRASE,
+    SEARCH_VECTOR_ALIAS,
+    SEARCH_KIND_PREFIX,
+    SEARCH_KIND_WEBSEARCH,
+    SBAdminPostgresSearchEngine,
+)
+from django_smartbase_admin.operations import AddSearchVectorColumn
+
+
+class GroupSearchAdmin(SBAdmin):
+    model = Group
+    list_display = ("id", "name")
+    search_fields = ["name", "=id"]
+    sbadmin_search_engine = SBAdminPostgresSearchEngine()
+
+
+def build_list_action(view, search=None, sort=None):
+    view_id = view.get_id()
+    params = {view_id: {FILTER_DATA_NAME: {}, TABLE_PARAMS_NAME: {}}}
+    if search:
+        params[view_id][FILTER_DATA_NAME][TABLE_PARAMS_FULL_TEXT_SEARCH] = search
+    if sort:
+        params[view_id][TABLE_PARAMS_NAME][TABLE_PARAMS_SORT_NAME] = sort
+    request = RequestFactory().get("/")
+    request.user = MagicMock(is_authenticated=True, is_superuser=True)
+    request_data = SBAdminViewRequestData(
+        view=view_id,
+        action=None,
+        modifier=None,
+        user=request.user,
+        request_get=request.GET,
+        request_method="GET",
+    )
+    request_data.additional_data = {}
+    config = MagicMock()
+    config.restrict_queryset = lambda qs, **kwargs: qs
+    config.apply_global_filter_to_queryset = lambda qs, *a, **kw: qs
+    config.plugins = []
+    request_data.configuration = config
+    request.request_data = request_data
+    request.LANGUAGE_CODE = "en"
+    return SBAdminListAction(view, request, all_params=params)
+
+
+class PostgresSearchEngineQueryTests(SimpleTestCase):
+    def test_prefixes_map_onto_tsquery_semantics(self):
+        groups = SBAdminPostgresSearchEngine.group_lookups_by_kind(
+            [("", "name"), ("^", "code"), ("=", "ean"), ("@", "description")]
+        )
+        self.assertEqual(
+            groups,
+            {
+                SEARCH_KIND_PREFIX: ["name", "code"],
+                SEARCH_KIND_PHRASE: ["ean"],
+                SEARCH_KIND_WEBSEARCH: ["description"],
+            },
+        )
+
+    def test_prefix_term_is_quoted_raw_prefix_query(self):
+        engine = SBAdminPostgresSearchEngine(config="english")
+        query = engine.build_term_query("o'neil\\", SEARCH_KIND_PREFIX)
+        self.assertEqual(query.function, "to_tsquery")
+        self.assertEqual(query.get_source_expressions()[-1].value, "'o''neil\\\\':*")
+
+    def test_terms_are_anded_and_kinds_ored(self):
+        engine = SBAdminPostgresSearchEngine()
+        query = engine.build_query(
+            ["alpha", "beta"], [SEARCH_KIND_PREFIX, SEARCH_KIND_PHRASE]
+        )
+        self.assertEqual(query.connector, "&&")
+        for term_query in query.get_source_expressions():
+            self.assertEqual(term_query.connector, "||")
+
+    def test_engine_is_available_only_on_postgres(self):
+        self.assertEqual(
+            SBAdminPostgresSearchEngine().is_available(Group.objects.all()),
+            connection.vendor == "postgresql",
+        )
+
+
+class PostgresSearchEngineListTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        Group.objects.create(name="editors")
+        Group.objects.create(name="reviewers")
+
+    def setUp(self):
+        self.view = GroupSearchAdmin(Group, sb_admin_site)
+
+    def test_falls_back_to_lookups_without_postgres(self):
+        if connection.vendor == "postgresql":
+            self.skipTest("fallback only applies to non-Postgres backends")
+        action = build_list_action(self.view, search="edit")
+        data = action.get_data()
+        self.assertEqual([row["name"] for row in data["data"]], ["editors"])
+
+    def test_engine_filters_with_search_vector(self):
+        action = build_list_action(self.view, search="edit")
+        with patch.object(
+            SBAdminPostgresSearchEngine, "is_available", return_value=True
+        ):
+            qs = action.search_in_queryset(Group.objects.all())
+        sql = str(qs.query)
+        self.assertIn("@@", sql)
+        self.assertIn("to_tsvector", sql)
+        self.assertIn("to_tsquery", sql)
+        self.assertIn("phraseto_tsquery", sql)
+
+    def test_vector_column_filters_on_stored_column(self):
+        self.view.sbadmin_search_engine = SBAdminPostgresSearchEngine(
+            vector_column="sb_search_vector"
+        )
+        action = build_list_action(self.view, search="edit")
+        with patch.object(
+            SBAdminPostgresSearchEngine, "is_available", return_value=True
+        ):
+            qs = action.search_in_queryset(Group.objects.all())
+        sql = str(qs.query)
+        self.assertIn('"auth_group"."sb_search_vector" @@', sql)
+        self.assertNotIn("to_tsvector", sql)
+
+    def test_rank_orders_only_without_explicit_sort(self):
+        with patch.object(
+            SBAdminPostgresSearchEngine, "is_available", return_value=True
+        ):
+            ranked = build_list_action(self.view, search="edit").order_by_search_rank(
+                Group.objects.order_by("name")
+            )
+            sorted_qs = build_list_action(
+                self.view, search="edit", sort=[{"field": "name", "dir": "asc"}]
+            ).order_by_search_rank(Group.objects.order_by("name"))
+        self.assertIn("ts_rank", str(ranked.query))
+        self.assertEqual(len(ranked.query.order_by), 2)
+        self.assertNotIn("ts_rank", str(sorted_qs.query))
+
+    def test_rank_reuses_the_filter_vector(self):
+        action = build_list_action(self.view, search="edit")
+        with patch.object(
+            SBAdminPostgresSearchEngine, "is_available", return_value=True
+        ), patch.object(
+            SBAdminPostgresSearchEngine,
+            "build_vector",
+            autospec=True,
+            side_effect=SBAdminPostgresSearchEngine.build_vector,
+        ) as build_vector:
+            qs = action.order_by_search_rank(
+                action.search_in_queryset(Group.objects.order_by("name"))
+            )
+        # One vector per prefix group, none rebuilt for the rank.
+        self.assertEqual(build_vector.call_count, 2)
+        self.assertIn(SEARCH_VECTOR_ALIAS, qs.query.annotations)
+        sql = str(qs.query)
+        self.assertIn("@@", sql)
+        self.assertIn("ts_rank", sql)
+
+
+class AddSearchVectorColumnTests(SimpleTestCase):
+    def test_create_sql_builds_generated_column_and_gin_index(self):
+        operation = AddSearchVectorColumn(
+            model_name="group", fields=["name"], weights={"name": "A"}
+        )
+        schema_editor = SimpleNamespace(
+            quote_name=connection.ops.quote_name,
+            quote_value=lambda value: f"'{value}'",
+        )
+        create_sql = operation.get_create_sql(Group, schema_editor)
+        self.assertIn("GENERATED ALWAYS AS", create_sql[0])
+        self.assertIn("setweight(to_tsvector('simple'::regconfig", create_sql[0])
+        self.assertIn('USING GIN ("sb_search_vector")', create_sql[1])
+
+    def test_deconstruct_omits_defaults(self):
+        operation = AddSearchVectorColumn(model_name="group", fields=["name"])
+        self.assertEqual(
+            operation.deconstruct(),
+            ("AddSearchVectorColumn", [], {"model_name": "group", "fields": ["name"]}),
+        )
@@ -0,0 +1,146 @@
+from types import SimpleNamespace
+
+from django.db import connection, models
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from django_smartbase_admin.services.translations import SBAdminTranslationsService
+
+
+class CompletenessArticle(models.Model):
+    slug = models.CharField(max_length=50)
+
+    class Meta:
+        app_label = "django_smartbase_admin"
+
+
+class CompletenessArticleTranslation(models.Model):
+    master = models.ForeignKey(
+        CompletenessArticle, related_name="translations", on_delete=models.CASCADE
+    )
+    language_code = models.CharField(max_length=15)
+    title = models.CharField(max_length=100, blank=True, null=True)
+    perex = models.CharField(max_length=100, blank=True, null=True)
+    body = models.TextField(blank=True, null=True)
+
+    class Meta:
+        app_label = "django_smartbase_admin"
+        unique_together = [("master", "language_code")]
+
+
+class FakeParlerMeta:
+    def get_all_models(self):
+        return [CompletenessArticleTranslation]
+
+    def __getitem__(self, translation_model):
+        return SimpleNamespace(rel_name="translations")
+
+
+CompletenessArticle._parler_meta = FakeParlerMeta()
+
+
+class TranslationsCountTests(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        with connection.schema_editor() as schema_editor:
+            schema_editor.create_model(CompletenessArticle)
+            schema_editor.create_model(CompletenessArticleTranslation)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(CompletenessArticleTranslation)
+            schema_editor.delete_model(CompletenessArticle)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.complete = CompletenessArticle.objects.create(slug="complete")
+        cls.partial = CompletenessArticle.objects.create(slug="partial")
+        cls.missing = CompletenessArticle.objects.create(slug="missing")
+        for article in (cls.complete, cls.partial, cls.missing):
+            CompletenessArticleTranslation.objects.create(
+                master=article, language_code="en", title="t", perex="p", body="b"
+            )
+        CompletenessArticleTranslation.objects.create(
+            master=cls.complete, language_code="sk", title="t", perex="p", body="b"
+        )
+        CompletenessArticleTranslation.objects.create(
+            master=cls.partial, language_code="sk", title="t", perex="", body=None
+        )
+
+    def test_list_counts_use_subqueries_not_joins(self):
+        qs = SBAdminTranslationsService.annotate_queryset_with_translations_count(
+            CompletenessArticle.objects.order_by("pk"),
+            CompletenessArticle,
+            ["en", "sk"],
+        )
+        annotate_name = SBAdminTranslationsService.get_annotate_name(
+            CompletenessArticleTranslation, "sk"
+        )
+        main_annotate_name = SBAdminTranslationsService.get_annotate_name(
+            CompletenessArticleTranslation, "en"
+        )
+        with CaptureQueriesContext(connection) as queries:
+            rows = list(
+                qs.values(
+                    "slug", f"{main_annotate_name}_count", f"{annotate_name}_count"
+                )
+            )
+        self.assertEqual(
+            [
+                (
+                    row["slug"],
+                    row[f"{main_annotate_name}_count"],
+                    row[f"{annotate_name}_count"],
+                )
+                for row in rows
+            ],
+            [("complete", 3, 3), ("partial", 3, 1), ("missing", 3, 0)],
+        )
+        self.assertNotIn("JOIN", queries.captured_queries[0]["sql"])
+
+    def test_counts_are_filterable(self):
+        annotate_name = SBAdminTranslationsService.get_annotate_name(
+            CompletenessArticleTranslation, "sk"
+        )
+        qs = SBAdminTranslationsService.annotate_queryset_with_translations_count(
+            CompletenessArticle.objects.all(), CompletenessArticle, ["sk"]
+        )
+        self.assertEqual(
+            list(
+                qs.filter(**{f"{annotate_name}_count": 0}).values_list(
+                    "slug", flat=True
+                )
+            ),
+            ["missing"],
+        )
+
+    def test_main_language_values_still_readable_through_relation(self):
+        main_annotate_name = SBAdminTranslationsService.get_annotate_name(
+            CompletenessArticleTranslation, "en"
+        )
+        qs = SBAdminTranslationsService.annotate_queryset_with_translations_count(
+            CompletenessArticle.objects.filter(pk=self.partial.pk),
+            CompletenessArticle,
+            ["en", "sk"],
+        )
+        self.assertEqual(
+            qs.values_list(f"{main_annotate_name}__title", flat=True)[0], "t"
+        )
+
+    def test_grouped_counts_in_single_query(self):
+        with self.assertNumQueries(1):
+            counts = SBAdminTranslationsService.get_translations_count(
+                CompletenessArticle,
+                [self.complete.pk, self.partial.pk, self.missing.pk],
+                ["sk"],
+            )
+        self.assertEqual(
+            counts,
+            {
+                (CompletenessArticleTranslation, self.complete.pk, "sk"): 3,
+                (CompletenessArticleTranslation, self.partial.pk, "sk"): 1,
+            },
+        )
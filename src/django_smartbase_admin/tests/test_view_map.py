@@ -0,0 +1,119 @@
+"""Lazy view map: views are statically initialized on first lookup, once
+per process, and shared by every role configuration."""
+
+from io import StringIO
+
+from django.contrib.auth.models import Group, User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from django_smartbase_admin.admin.admin_base import SBAdmin, SBAdminTableInline
+from django_smartbase_admin.admin.site import sb_admin_site
+from django_smartbase_admin.engine.admin_view import SBAdminView
+from django_smartbase_admin.engine.configuration import (
+    SBAdminConfigurationBase,
+    SBAdminRoleConfiguration,
+    Singleton,
+)
+from django_smartbase_admin.engine.menu_item import SBAdminMenuItem
+
+
+class MembershipInline(SBAdminTableInline):
+    model = User.groups.through
+
+
+class CountingGroupAdmin(SBAdmin):
+    model = Group
+    inlines = [MembershipInline]
+    init_calls = 0
+
+    def init_view_static(self, configuration, model, admin_site):
+        type(self).init_calls += 1
+        super().init_view_static(configuration, model, admin_site)
+
+
+class ReportView(SBAdminView):
+    pass
+
+
+class ParentView(SBAdminView):
+    def get_sub_views(self, configuration):
+        return [ReportView(view_id="report_sub", label="Sub")]
+
+
+class FirstRoleConfiguration(SBAdminRoleConfiguration):
+    registered_views = [ParentView(view_id="report_parent", label="Parent")]
+    menu_items = [SBAdminMenuItem(view_id="report_parent")]
+
+
+class SecondRoleConfiguration(SBAdminRoleConfiguration):
+    pass
+
+
+class ReportConfiguration(SBAdminConfigurationBase):
+    def get_configuration_for_roles(self, user_roles):
+        return FirstRoleConfiguration()
+
+
+class LazyViewMapTests(TestCase):
+    def setUp(self):
+        self.original_admin = sb_admin_site._registry.pop(Group, None)
+        sb_admin_site.register(Group, CountingGroupAdmin)
+        self.admin = sb_admin_site._registry[Group]
+        CountingGroupAdmin.init_calls = 0
+        for configuration_class in (FirstRoleConfiguration, SecondRoleConfiguration):
+            Singleton._instances.pop(configuration_class, None)
+
+    def tearDown(self):
+        sb_admin_site._registry.pop(Group, None)
+        if self.original_admin is not None:
+            sb_admin_site._registry[Group] = self.original_admin
+        for configuration_class in (FirstRoleConfiguration, SecondRoleConfiguration):
+            Singleton._instances.pop(configuration_class, None)
+
+    def test_views_are_initialized_on_first_lookup(self):
+        view_map = FirstRoleConfiguration().view_map
+        self.assertEqual(CountingGroupAdmin.init_calls, 0)
+        self.assertIn(self.admin.get_id(), view_map.pending)
+        # Menu items resolve their view without initializing it.
+        self.assertIn("report_parent", view_map.pending)
+
+        self.assertIs(view_map[self.admin.get_id()], self.admin)
+        self.assertIs(view_map.get(self.admin.get_id()), self.admin)
+        self.assertEqual(CountingGroupAdmin.init_calls, 1)
+        self.assertNotIn(self.admin.get_id(), view_map.pending)
+
+    def test_ids_registered_during_static_init_are_found(self):
+        view_map = FirstRoleConfiguration().view_map
+        inline_id = MembershipInline(Group, sb_admin_site).get_id()
+        self.assertIsInstance(view_map[inline_id], MembershipInline)
+        self.assertIsInstance(view_map["report_sub"], ReportView)
+        self.assertIn(
+            "report_sub",
+            [view.get_id() for view in FirstRoleConfiguration().registered_views],
+        )
+        self.assertIsNone(view_map.get("missing"))
+        self.assertFalse(view_map.pending)
+
+    def test_static_init_is_shared_between_configurations(self):
+        first = FirstRoleConfiguration().view_map
+        second = SecondRoleConfiguration().view_map
+        inline_id = MembershipInline(Group, sb_admin_site).get_id()
+        first_inline = first[inline_id]
+        self.assertIs(second[inline_id], first_inline)
+        self.assertEqual(CountingGroupAdmin.init_calls, 1)
+
+    @override_settings(SB_ADMIN_VIEW_WARM_UP=True)
+    def test_warm_up_initializes_every_view(self):
+        view_map = FirstRoleConfiguration().view_map
+        view_map.warm_up().join()
+        self.assertFalse(view_map.pending)
+        self.assertEqual(CountingGroupAdmin.init_calls, 1)
+
+    @override_settings(SB_ADMIN_CONFIGURATION=f"{__name__}.ReportConfiguration")
+    def test_report_command_times_every_view(self):
+        out = StringIO()
+        call_command("sbadmin_view_init_report", stdout=out)
+        self.assertIn(self.admin.get_id(), out.getvalue())
+        self.assertIn("report_parent", out.getvalue())
+        self.assertIn("views initialized in", out.getvalue())
@@ -0,0 +1,40 @@
+import hmac
+
+from django.conf import settings
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse
+from django.views import View
+
+from django_smartbase_admin.services.instrumentation import (
+    SBAdminInstrumentationService,
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class SBAdminMetricsView(View):
+    """Prometheus text exposition of the per-process action metrics.
+
+    Readable by superusers, or by scrapers sending
+    ``Authorization: Bearer <SB_ADMIN_METRICS_TOKEN>``.
+    """
+
+    def has_access(self, request) -> bool:
+        token = getattr(settings, "SB_ADMIN_METRICS_TOKEN", None)
+        if token:
+            header = request.headers.get("Authorization", "")
+            scheme, _, value = header.partition(" ")
+            if scheme.lower() == "bearer" and hmac.compare_digest(
+                value.strip().encode(), str(token).encode()
+            ):
+                return True
+        user = getattr(request, "user", None)
+        return bool(user and user.is_active and user.is_superuser)
+
+    def get(self, request, *args, **kwargs):
+        if not self.has_access(request):
+            raise PermissionDenied
+        return HttpResponse(
+            SBAdminInstrumentationService.render_prometheus(),
+            content_type=PROMETHEUS_CONTENT_TYPE,
+        )
@@ -0,0 +1,100 @@
+"""Dashboard over the per-process action metrics of
+``SBAdminInstrumentationService``.
+
+Registered via the project's ``SBAdminConfiguration.registered_views``;
+reachable at ``/sb-admin/performance/performance/template/``. Every worker
+process keeps its own totals — scrape ``<admin>/metrics/`` to combine them.
+"""
+
+from django.template.response import TemplateResponse
+from django.utils.translation import gettext_lazy as _
+
+from django_smartbase_admin.engine.actions import sbadmin_action
+from django_smartbase_admin.engine.dashboard import SBAdminDashboardHtmlWidget
+from django_smartbase_admin.services.instrumentation import (
+    SBAdminInstrumentationService,
+)
+from django_smartbase_admin.views.dashboard_view import SBAdminDashboardView
+
+
+def _is_superuser(request) -> bool:
+    user = getattr(request, "user", None)
+    return bool(user and user.is_superuser)
+
+
+class SBAdminPerformanceWidget(SBAdminDashboardHtmlWidget):
+    name = _("Actions")
+    content_template_name = "sb_admin/dashboard/performance_widget_content.html"
+    cache_enabled = False
+
+    def has_view_permission(self, request, obj=None) -> bool:
+        return _is_superuser(request)
+
+    def has_permission_for_action(self, request, action) -> bool:
+        return _is_superuser(request)
+
+    @staticmethod
+    def _per_call(total, calls, scale=1):
+        return total * scale / calls if calls else 0
+
+    def get_rows(self, request) -> list[dict]:
+        rows = []
+        metrics = SBAdminInstrumentationService.get_metrics()
+        for (kind, view, action), metric in metrics.items():
+            calls = metric.calls
+            rows.append(
+                {
+                    "kind": kind,
+                    "view": view,
+                    "action": action,
+                    "calls": calls,
+                    "total_seconds": metric.wall_seconds,
+                    "avg_ms": self._per_call(metric.wall_seconds, calls, 1000),
+                    "max_ms": metric.wall_seconds_max * 1000,
+                    "avg_queries": self._per_call(metric.query_count, calls),
+                    "avg_query_ms": self._per_call(metric.query_seconds, calls, 1000),
+                    "avg_rows": self._per_call(metric.rows, calls),
+                    "avg_kb": self._per_call(metric.response_bytes, calls, 1 / 1024),
+                    "budget_exceeded": metric.budget_exceeded,
+                    "stages": [
+                        {
+                            "name": name,
+                            "avg_ms": self._per_call(stats.seconds, calls, 1000),
+                            "avg_queries": self._per_call(stats.query_count, calls),
+                        }
+                        for name, stats in metric.stages.items()
+                    ],
+                }
+            )
+        rows.sort(key=lambda row: row["total_seconds"], reverse=True)
+        return rows
+
+    def get_html_context_data(self, request):
+        return {"rows": self.get_rows(request)}
+
+
+class SBAdminPerformanceDashboardView(SBAdminDashboardView):
+    view_id = "performance"
+    label = _("Performance")
+    menu_action = "performance"
+
+    def __init__(self, title=None, widgets=None):
+        widgets = widgets or [SBAdminPerformanceWidget()]
+        super().__init__(title=title or str(self.label), widgets=widgets)
+
+    def has_view_permission(self, request, obj=None) -> bool:
+        return _is_superuser(request)
+
+    def has_permission_for_action(self, request, action) -> bool:
+        return _is_superuser(request)
+
+    @sbadmin_action
+    def performance(self, request, modifier, object_id=None):
+        context = self.get_global_context(request)
+        widget_views = self.get_widget_views(request, object_id)
+        context["direct_sub_views"] = widget_views
+        context["dashboard_media"] = self.get_dashboard_media(request, widget_views)
+        context["title"] = self.get_title()
+        return TemplateResponse(
+            request, "sb_admin/actions/dashboard.html", context=context
+        )